@@ -12,6 +12,7 @@ from rich.console import Console
 from machineconfig.utils.accessories import randstr, pprint
 from machineconfig.utils.io import save_json, read_json
 from machineconfig.utils.ssh import SSH
+from machineconfig.utils.ssh_utils.specs_cache import DEFAULT_SPECS_TTL_SECONDS, get_or_probe
 from machineconfig.cluster.remote.models import RemoteMachineConfig, WorkloadParams
 from machineconfig.cluster.remote.remote_machine import RemoteMachine
 
@@ -89,6 +90,12 @@ class MachineLoadCalculator:
         return result
 
 
+def _probe_cpu_ram(ssh: SSH) -> list[float]:
+    res = ssh.run_py_remotely(python_code="import psutil; print(psutil.cpu_count(), psutil.virtual_memory().total)", uv_with=None, uv_project_dir=None, description="get machine specs", verbose_output=False, strict_stderr=False, strict_return_code=False)
+    parts = res.op.strip().split()
+    return [float(parts[0]), float(parts[1])]
+
+
 class Cluster:
     def __init__(
         self,
@@ -101,6 +108,8 @@ class Cluster:
         description: str,
         job_id: str | None,
         base_dir: str | None,
+        specs_ttl_seconds: float = DEFAULT_SPECS_TTL_SECONDS,
+        refresh_specs: bool = False,
     ) -> None:
         self.job_id = job_id or randstr(noun=True)
         self.root_dir = _get_cluster_path(self.job_id, base_dir)
@@ -111,7 +120,7 @@ class Cluster:
         self.ssh_connections: list[SSH] = []
         for host in ssh_hosts:
             try:
-                self.ssh_connections.append(SSH.from_config_file(host=host))
+                self.ssh_connections.append(SSH(host=host, username=None, hostname=None, ssh_key_path=None, password=None, port=22, enable_compression=False, specs_ttl_seconds=specs_ttl_seconds, refresh_specs=refresh_specs))
             except Exception as ex:
                 print(f"Cannot connect to {host}")
                 if not ditch_unavailable:
@@ -124,6 +133,8 @@ class Cluster:
         self.description = description
         self.func = func
         self.func_kwargs = func_kwargs
+        self.specs_ttl_seconds = specs_ttl_seconds
+        self.refresh_specs = refresh_specs
 
     def __repr__(self) -> str:
         items = self.machines if self.machines else self.ssh_connections
@@ -136,10 +147,12 @@ class Cluster:
         cpus: list[float] = []
         rams: list[float] = []
         for ssh in self.ssh_connections:
-            res = ssh.run_py_remotely(python_code="import psutil; print(psutil.cpu_count(), psutil.virtual_memory().total)", uv_with=None, uv_project_dir=None, description="get machine specs", verbose_output=False, strict_stderr=False, strict_return_code=False)
-            parts = res.op.strip().split()
-            cpus.append(float(parts[0]))
-            rams.append(float(parts[1]) / 2**30)
+            cpu_ram = get_or_probe(
+                fingerprint=ssh.host_fingerprint, section="cpu_ram", ttl_seconds=self.specs_ttl_seconds, refresh=self.refresh_specs, probe=lambda: _probe_cpu_ram(ssh)
+            )
+            assert cpu_ram is not None
+            cpus.append(float(cpu_ram[0]))
+            rams.append(float(cpu_ram[1]) / 2**30)
         total_cpu = sum(cpus)
         total_ram = sum(rams)
         total_product = sum(c * r for c, r in zip(cpus, rams))
@@ -227,6 +240,8 @@ class Cluster:
         cluster.func_kwargs = dict(state.get("func_kwargs") or {})  # type: ignore[arg-type]
         cluster.func = None  # type: ignore[assignment]
         cluster.ssh_connections = []
+        cluster.specs_ttl_seconds = DEFAULT_SPECS_TTL_SECONDS
+        cluster.refresh_specs = False
         cluster.config = RemoteMachineConfig.from_dict(state["config"])  # type: ignore[arg-type]
         cluster.workload_params = [WorkloadParams.from_dict(d) for d in state.get("workload_params", [])]  # type: ignore[union-attr]
         cluster.machines_specs = [MachineSpecs(**d) for d in state.get("machines_specs", [])]  # type: ignore[arg-type]
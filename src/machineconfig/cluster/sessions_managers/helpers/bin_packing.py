@@ -0,0 +1,223 @@
+"""
+Weight-aware packing of tabs into super-tabs or layouts.
+
+Two problem shapes come up in `load_balancer.limit_tab_num`:
+* a fixed number of bins (`number` thresholds): minimise the heaviest bin (makespan). `lpt` assigns tabs heaviest-first
+  to the lightest bin; `ffd` runs MULTIFIT, i.e. a binary search for the smallest capacity that first-fit-decreasing
+  packs into that many bins.
+* a fixed capacity (`weight` thresholds): use as few bins as possible without exceeding it. `ffd` is first-fit-decreasing;
+  `lpt` spreads the same number of bins evenly and falls back to the `ffd` packing if that would overflow one.
+`greedy` keeps the historical list-order split. Weights may be learned from runtimes recorded by the monitoring routines.
+"""
+
+from typing import Any, Literal, Optional
+import heapq
+import json
+import math
+import random
+import time
+
+from machineconfig.utils.schemas.layouts.layout_types import TabConfig
+from machineconfig.utils.source_of_truth import CONFIG_ROOT
+
+
+PackingStrategy = Literal["greedy", "lpt", "ffd"]
+TAB_RUNTIMES_PATH = CONFIG_ROOT.joinpath("tab_runtimes.json")
+MULTIFIT_ITERATIONS = 20
+
+
+def _ordered(bins: list[list[int]]) -> list[list[int]]:
+    """Drop empty bins, keep each bin in original tab order, and order bins by their first tab (stable, readable layouts)."""
+    return sorted((sorted(a_bin) for a_bin in bins if a_bin), key=lambda a_bin: a_bin[0])
+
+
+def _greedy_into_bins(count: int, num_bins: int) -> list[list[int]]:
+    every = math.ceil(count / num_bins)
+    return [list(range(start, min(start + every, count))) for start in range(0, count, every)]
+
+
+def _greedy_by_capacity(weights: list[float], capacity: float) -> list[list[int]]:
+    bins: list[list[int]] = []
+    current: list[int] = []
+    load = 0.0
+    for index, weight in enumerate(weights):
+        if current and load + weight > capacity:
+            bins.append(current)
+            current, load = [], 0.0
+        current.append(index)
+        load += weight
+    if current:
+        bins.append(current)
+    return bins
+
+
+def _lpt(weights: list[float], num_bins: int, max_items: Optional[int]) -> list[list[int]]:
+    bins: list[list[int]] = [[] for _ in range(num_bins)]
+    heap = [(0.0, bin_index) for bin_index in range(num_bins)]  # callers guarantee num_bins * max_items >= len(weights).
+    for index in sorted(range(len(weights)), key=lambda i: -weights[i]):
+        load, bin_index = heapq.heappop(heap)
+        bins[bin_index].append(index)
+        if max_items is None or len(bins[bin_index]) < max_items:  # a full bin is simply not pushed back.
+            heapq.heappush(heap, (load + weights[index], bin_index))
+    return bins
+
+
+def _ffd(weights: list[float], capacity: float, max_items: Optional[int]) -> list[list[int]]:
+    bins: list[list[int]] = []
+    loads: list[float] = []
+    for index in sorted(range(len(weights)), key=lambda i: -weights[i]):
+        weight = weights[index]
+        for bin_index, load in enumerate(loads):
+            if load + weight <= capacity and (max_items is None or len(bins[bin_index]) < max_items):
+                bins[bin_index].append(index)
+                loads[bin_index] += weight
+                break
+        else:
+            bins.append([index])
+            loads.append(weight)
+    return bins
+
+
+def _multifit(weights: list[float], num_bins: int, max_items: Optional[int]) -> list[list[int]]:
+    """Smallest capacity for which first-fit-decreasing needs at most `num_bins` bins."""
+    total = sum(weights)
+    low = max(max(weights), total / num_bins)
+    high = max(max(weights), 2 * total / num_bins)
+    best = _lpt(weights, num_bins, max_items)  # always feasible; MULTIFIT only replaces it with something no worse.
+    for _ in range(MULTIFIT_ITERATIONS):
+        capacity = (low + high) / 2
+        candidate = _ffd(weights, capacity, max_items)
+        if len(candidate) <= num_bins:
+            if makespan(candidate, weights) <= makespan(best, weights):
+                best = candidate
+            high = capacity
+        else:
+            low = capacity
+    return best
+
+
+def pack_into_bins(weights: list[float], num_bins: int, max_items: Optional[int], strategy: PackingStrategy) -> list[list[int]]:
+    """Split tab indices into at most `num_bins` groups (each of at most `max_items` tabs, if given), balancing total weight."""
+    if num_bins <= 0:
+        raise ValueError("num_bins must be a positive integer.")
+    if len(weights) == 0:
+        return []
+    match strategy:
+        case "greedy":
+            return _greedy_into_bins(len(weights), num_bins)
+        case "lpt":
+            return _ordered(_lpt(weights, num_bins, max_items))
+        case "ffd":
+            return _ordered(_multifit(weights, num_bins, max_items))
+        case _:
+            raise ValueError(f"Unknown packing strategy: {strategy}")
+
+
+def pack_by_capacity(weights: list[float], capacity: float, strategy: PackingStrategy) -> list[list[int]]:
+    """Split tab indices into groups of total weight <= `capacity` (a heavier single tab gets a group of its own)."""
+    if len(weights) == 0:
+        return []
+    match strategy:
+        case "greedy":
+            return _greedy_by_capacity(weights, capacity)
+        case "ffd":
+            return _ordered(_ffd(weights, capacity, None))
+        case "lpt":
+            packed = _ffd(weights, capacity, None)
+            spread = _lpt(weights, len(packed), None)
+            fits = all(sum(weights[i] for i in a_bin) <= capacity or len(a_bin) == 1 for a_bin in spread)
+            return _ordered(spread if fits else packed)
+        case _:
+            raise ValueError(f"Unknown packing strategy: {strategy}")
+
+
+def makespan(bins: list[list[int]], weights: list[float]) -> float:
+    return max((sum(weights[i] for i in a_bin) for a_bin in bins), default=0.0)
+
+
+def effective_weights(tabs: list[TabConfig], learned_runtimes: Optional[dict[str, float]]) -> list[float]:
+    """
+    `tabWeight` of each tab, replaced by its recorded runtime where one is known.
+    Runtimes are rescaled so that, over the tabs that have one, they sum to the same total as their `tabWeight`s;
+    that keeps `weight` thresholds meaningful when only some tabs have history.
+    """
+    declared = [float(tab.get("tabWeight", 1)) for tab in tabs]
+    if not learned_runtimes:
+        return declared
+    known = [index for index, tab in enumerate(tabs) if learned_runtimes.get(tab["command"], 0.0) > 0.0]
+    if len(known) == 0:
+        return declared
+    scale = sum(declared[i] for i in known) / sum(learned_runtimes[tabs[i]["command"]] for i in known)
+    weights = list(declared)
+    for index in known:
+        weights[index] = learned_runtimes[tabs[index]["command"]] * scale
+    return weights
+
+
+def load_tab_runtimes() -> dict[str, float]:
+    """Runtimes (seconds) recorded by previous monitoring routines, keyed by tab command."""
+    try:
+        data = json.loads(TAB_RUNTIMES_PATH.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return {}
+    return {command: float(entry["seconds"]) for command, entry in data.items() if isinstance(entry, dict) and "seconds" in entry} if isinstance(data, dict) else {}
+
+
+def record_tab_runtimes(all_status: dict[str, Any], runtime_seconds_by_key: dict[tuple[str, str], float]) -> None:
+    """
+    Persist what a monitoring routine measured. A finished tab's runtime replaces the stored one;
+    a tab still running only raises it (its runtime so far is a lower bound).
+    """
+    try:
+        data = json.loads(TAB_RUNTIMES_PATH.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        data = {}
+    changed = False
+    for session_name, status in all_status.items():
+        for tab_name, cmd_status in status.get("commands_status", {}).items():
+            command = cmd_status.get("command")
+            seconds = runtime_seconds_by_key.get((session_name, tab_name), 0.0)
+            if not command or seconds <= 0.0:
+                continue
+            previous = data.get(command, {}).get("seconds", 0.0)
+            if cmd_status.get("running", False) and seconds <= previous:
+                continue
+            data[command] = {"seconds": seconds, "recorded_at": time.time()}
+            changed = True
+    if changed:
+        TAB_RUNTIMES_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = TAB_RUNTIMES_PATH.with_suffix(TAB_RUNTIMES_PATH.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        tmp_path.replace(TAB_RUNTIMES_PATH)
+
+
+def benchmark(num_tabs: int, num_bins: int, trials: int, seed: int) -> None:
+    """Print the average makespan of each strategy relative to the lower bound max(total / bins, heaviest tab) on synthetic workloads."""
+    from rich.console import Console
+    from rich.table import Table
+
+    rng = random.Random(seed)
+    workloads: dict[str, Any] = {
+        "uniform 1-10": lambda: [rng.uniform(1, 10) for _ in range(num_tabs)],
+        "lognormal": lambda: [rng.lognormvariate(0, 1.2) for _ in range(num_tabs)],
+        "few giants": lambda: [rng.uniform(50, 100) if rng.random() < 0.05 else rng.uniform(1, 5) for _ in range(num_tabs)],
+        "sorted ascending": lambda: sorted(rng.uniform(1, 20) for _ in range(num_tabs)),
+    }
+    strategies: list[PackingStrategy] = ["greedy", "lpt", "ffd"]
+    table = Table(title=f"Makespan / lower bound ({num_tabs} tabs into {num_bins} bins, {trials} trials)", show_header=True, header_style="bold cyan")
+    table.add_column("Workload", style="magenta")
+    for strategy in strategies:
+        table.add_column(strategy, justify="right")
+    for name, make_weights in workloads.items():
+        ratios = {strategy: 0.0 for strategy in strategies}
+        for _ in range(trials):
+            weights = make_weights()
+            bound = max(sum(weights) / num_bins, max(weights))
+            for strategy in strategies:
+                ratios[strategy] += makespan(pack_into_bins(weights, num_bins, None, strategy), weights) / bound / trials
+        table.add_row(name, *(f"{ratios[strategy]:.3f}" for strategy in strategies))
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    benchmark(num_tabs=60, num_bins=8, trials=50, seed=0)
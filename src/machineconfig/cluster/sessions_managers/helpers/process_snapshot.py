@@ -0,0 +1,219 @@
+"""
+One process table per monitoring cycle, shared by every tab of every session.
+
+`ProcessSnapshot.take()` walks `psutil.process_iter` once and indexes the result by process
+name / executable and by parent pid. `match_command` then narrows to the handful of candidate
+processes with dictionary lookups before applying the tab-matching heuristics, so a status
+check costs O(tabs) lookups instead of O(tabs x processes) scans.
+"""
+
+import os
+import shlex
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import psutil
+
+from machineconfig.cluster.sessions_managers.zellij.zellij_utils.monitoring_types import ProcessInfo
+
+
+SHELL_NAMES = {"bash", "sh", "zsh", "fish"}
+_GENERIC_ARGS = {"run", "python", "python3", "--with", "--project", "--directory", "-m", "--", "&&"}
+_SKIPPED_STATUSES = {"zombie", "dead", "stopped"}
+_ALIVE_STATUSES = {"running", "sleeping"}
+_SNAPSHOT_ATTRS = ["pid", "ppid", "name", "cmdline", "status", "create_time", "memory_info"]
+
+
+def normalize_cli_token(token: str) -> str:
+    stripped = token.strip().strip('"').strip("'")
+    return os.path.expanduser(os.path.expandvars(stripped))
+
+
+def basename_from_token(token: str) -> str:
+    normalized = normalize_cli_token(token)
+    if not normalized:
+        return ""
+    return Path(normalized).name
+
+
+def _exe_stem(name: str) -> str:
+    """`python.exe` and `python` are the same executable as far as matching goes (Windows process names carry the suffix)."""
+    return name[:-4] if name.lower().endswith(".exe") else name
+
+
+def _split_command(command: str) -> tuple[str, list[str]]:
+    try:
+        parts = shlex.split(command)
+    except ValueError:
+        parts = command.split()
+    return (parts[0], parts[1:]) if parts else ("", [])
+
+
+@dataclass(frozen=True)
+class ProcessRecord:
+    pid: int
+    ppid: int
+    name: str
+    status: str
+    create_time: float
+    memory_mb: Optional[float]
+    cmdline: tuple[str, ...]  # tokens already normalized with `normalize_cli_token`.
+
+    def to_process_info(self) -> ProcessInfo:
+        info: ProcessInfo = {"pid": self.pid, "name": self.name, "cmdline": list(self.cmdline), "status": self.status, "cmdline_str": " ".join(self.cmdline), "create_time": self.create_time}
+        if self.memory_mb is not None:
+            info["memory_mb"] = self.memory_mb
+        return info
+
+
+class ProcessSnapshot:
+    def __init__(self, records: list[ProcessRecord]) -> None:
+        self.taken_at = time.time()
+        self.by_pid: dict[int, ProcessRecord] = {}
+        self._children: dict[int, list[int]] = {}
+        self._by_exe: dict[str, list[ProcessRecord]] = {}  # process name, argv[0] and its basename -> live processes.
+        self._by_argv0: dict[str, list[ProcessRecord]] = {}
+        for record in records:
+            self.by_pid[record.pid] = record
+            self._children.setdefault(record.ppid, []).append(record.pid)
+            if not record.cmdline or record.status in _SKIPPED_STATUSES:
+                continue
+            for key in {_exe_stem(record.name), record.cmdline[0], _exe_stem(basename_from_token(record.cmdline[0]))}:
+                self._by_exe.setdefault(key, []).append(record)
+            self._by_argv0.setdefault(record.cmdline[0], []).append(record)
+
+    @classmethod
+    def take(cls) -> "ProcessSnapshot":
+        records: list[ProcessRecord] = []
+        own_pid = os.getpid()
+        for proc in psutil.process_iter(_SNAPSHOT_ATTRS):
+            info = proc.info
+            if info.get("pid") == own_pid:
+                continue
+            memory = info.get("memory_info")
+            records.append(
+                ProcessRecord(
+                    pid=info["pid"],
+                    ppid=info.get("ppid") or 0,
+                    name=str(info.get("name") or ""),
+                    status=str(info.get("status") or "unknown"),
+                    create_time=float(info.get("create_time") or 0.0),
+                    memory_mb=memory.rss / (1024 * 1024) if memory is not None else None,
+                    cmdline=tuple(normalize_cli_token(item) for item in (info.get("cmdline") or [])),
+                )
+            )
+        return cls(records)
+
+    def descendants(self, pid: int) -> list[ProcessRecord]:
+        found: list[ProcessRecord] = []
+        stack = list(self._children.get(pid, []))
+        while stack:
+            child_pid = stack.pop()
+            record = self.by_pid.get(child_pid)
+            if record is None:
+                continue
+            found.append(record)
+            stack.extend(self._children.get(child_pid, []))
+        return found
+
+    def _candidates(self, cmd: str, normalized_cmd: str, cmd_basename: str) -> list[ProcessRecord]:
+        candidates: dict[int, ProcessRecord] = {}
+        for key in {cmd, normalized_cmd, cmd_basename, _exe_stem(cmd_basename)}:
+            for record in self._by_exe.get(key, []):
+                candidates[record.pid] = record
+        if normalized_cmd and cmd_basename not in SHELL_NAMES:  # substring match on argv[0]: scan distinct executables, not processes.
+            for argv0, records in self._by_argv0.items():
+                if normalized_cmd in argv0:
+                    for record in records:
+                        candidates[record.pid] = record
+        return list(candidates.values())
+
+    def match_command(self, command: str) -> list[ProcessInfo]:
+        """Live processes that belong to a tab running `command`, excluding idle wrapper shells."""
+        cmd, args = _split_command(command)
+        normalized_cmd = normalize_cli_token(cmd)
+        cmd_basename = basename_from_token(cmd)
+        normalized_args = [normalize_cli_token(arg) for arg in args]
+        significant_args = [arg for arg in normalized_args if len(arg) > 4 and arg not in _GENERIC_ARGS and not arg.startswith("-")]
+
+        matched: list[ProcessRecord] = []
+        for record in self._candidates(cmd, normalized_cmd, cmd_basename):
+            proc_cmdline = record.cmdline
+            proc_name = record.name
+            proc_exec_basename = basename_from_token(proc_cmdline[0])
+            primary_cmd_match = (
+                _exe_stem(proc_name) in (cmd, normalized_cmd, cmd_basename, _exe_stem(cmd_basename))
+                or _exe_stem(proc_exec_basename) == _exe_stem(cmd_basename)
+                or (normalized_cmd != "" and normalized_cmd == proc_cmdline[0])
+            )
+            is_match = False
+            if primary_cmd_match and cmd_basename not in SHELL_NAMES:
+                # For non-shell commands, match if args appear in cmdline
+                if not normalized_args:
+                    is_match = True
+                elif significant_args and any(any(arg == item or arg in item for item in proc_cmdline) for arg in significant_args):
+                    is_match = True
+                elif any(any(arg == item or arg in item for item in proc_cmdline) for arg in normalized_args):
+                    is_match = True
+            elif primary_cmd_match and cmd_basename in SHELL_NAMES:
+                # For shell commands, every arg must appear as its own cmdline argument (not just a substring somewhere)
+                if normalized_args:
+                    args_found = sum(1 for arg in normalized_args if any(arg == item or (len(arg) > 3 and arg in item) for item in proc_cmdline[1:]))
+                    is_match = args_found >= len(normalized_args)
+            elif normalized_cmd and normalized_cmd in proc_cmdline[0] and cmd_basename not in SHELL_NAMES:
+                is_match = True
+
+            if is_match and proc_name in SHELL_NAMES and normalized_args:
+                # Don't match generic shell sessions just because they contain common paths
+                is_match = any(
+                    (len(arg) > 10 and arg in proc_cmdline[1:]) or (arg.endswith((".py", ".sh", ".rb")) and any(arg in item for item in proc_cmdline[1:]))
+                    for arg in normalized_args
+                )
+            if is_match and record.status in _ALIVE_STATUSES:
+                matched.append(record)
+
+        # Second pass: drop idle wrapper shells that have no meaningful (non-shell) descendants
+        active: list[ProcessRecord] = []
+        for record in matched:
+            if record.name in SHELL_NAMES:
+                meaningful = False
+                for child in self.descendants(record.pid):
+                    if child.status in _SKIPPED_STATUSES:
+                        continue
+                    child_cmdline = " ".join(child.cmdline)
+                    if child.name not in SHELL_NAMES or normalized_cmd in child_cmdline or any(arg in child_cmdline for arg in normalized_args):
+                        meaningful = True
+                        break
+                if not meaningful:
+                    continue
+            active.append(record)
+
+        if active and all(record.name in SHELL_NAMES for record in active) and self._only_stale_script_shells(active, args):
+            return []
+        return [record.to_process_info() for record in active]
+
+    def _only_stale_script_shells(self, shells: list[ProcessRecord], args: list[str]) -> bool:
+        """
+        A layout that launches `bash <script.sh>` leaves an idle shell whose cmdline still shows the script once it
+        finishes. Treat it as not running when the script predates the shell and no non-shell descendant is alive.
+        """
+        script_paths = [arg for arg in args if arg.endswith(".sh")]
+        stale_script_overall = False
+        for record in shells:
+            if any(child.name not in SHELL_NAMES and child.status not in _SKIPPED_STATUSES for child in self.descendants(record.pid)):
+                return False
+            cmdline_joined = " ".join(record.cmdline)
+            stale_script = False
+            for spath in script_paths:
+                script_file = Path(spath)
+                try:
+                    if script_file.exists() and record.create_time and script_file.stat().st_mtime < record.create_time:
+                        stale_script = True
+                except OSError:
+                    pass
+                if spath not in cmdline_joined:
+                    stale_script = False
+            stale_script_overall = stale_script_overall or stale_script
+        return stale_script_overall
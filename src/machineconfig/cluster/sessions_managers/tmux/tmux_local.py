@@ -9,11 +9,12 @@ from machineconfig.utils.schemas.layouts.layout_types import LayoutConfig
 from machineconfig.cluster.sessions_managers.tmux.tmux_utils.tmux_helpers import (
     build_tmux_script,
     check_tmux_session_status,
-    build_unknown_command_status,
+    build_command_status,
     validate_layout_config,
     TmuxSessionStatus,
 )
 from machineconfig.cluster.sessions_managers.zellij.zellij_utils.monitoring_types import CommandStatus
+from machineconfig.cluster.sessions_managers.helpers.process_snapshot import ProcessSnapshot
 
 
 console = Console()
@@ -56,12 +57,13 @@ class TmuxLayoutGenerator:
         console.print(f"[bold green]✅ Layout created successfully:[/bold green] [cyan]{self.script_path}[/cyan]")
         return True
 
-    def check_all_commands_status(self) -> dict[str, CommandStatus]:
+    def check_all_commands_status(self, snapshot: Optional[ProcessSnapshot] = None) -> dict[str, CommandStatus]:
         if not self.layout_config:
             return {}
+        snapshot = snapshot or ProcessSnapshot.take()
         status_report: dict[str, CommandStatus] = {}
         for tab in self.layout_config["layoutTabs"]:
-            status_report[tab["tabName"]] = build_unknown_command_status(tab)
+            status_report[tab["tabName"]] = build_command_status(tab, snapshot)
         return status_report
 
     def get_status_report(self) -> TmuxLayoutStatus:
@@ -7,7 +7,8 @@ from machineconfig.logger import get_logger
 from machineconfig.utils.scheduler import Scheduler
 from machineconfig.utils.schemas.layouts.layout_types import LayoutConfig
 from machineconfig.cluster.sessions_managers.tmux.tmux_local import TmuxLayoutGenerator, TmuxLayoutSummary
-from machineconfig.cluster.sessions_managers.tmux.tmux_utils.tmux_helpers import check_tmux_session_status, build_unknown_command_status, TmuxSessionStatus
+from machineconfig.cluster.sessions_managers.tmux.tmux_utils.tmux_helpers import check_tmux_session_status, TmuxSessionStatus
+from machineconfig.cluster.sessions_managers.helpers.process_snapshot import ProcessSnapshot
 from machineconfig.cluster.sessions_managers.zellij.zellij_utils.monitoring_types import StartResult, CommandStatus
 from machineconfig.cluster.sessions_managers.windows_terminal.wt_utils.status_reporting import calculate_global_summary_from_status
 
@@ -87,13 +88,11 @@ class TmuxLocalManager:
 
     def check_all_sessions_status(self) -> dict[str, TmuxSessionReport]:
         status_report: dict[str, TmuxSessionReport] = {}
+        snapshot = ProcessSnapshot.take()  # one process table for every window of every session in this cycle.
         for manager in self.managers:
             session_name = manager.session_name or "default"
             session_status = check_tmux_session_status(session_name)
-            commands_status: dict[str, CommandStatus] = {}
-            if manager.layout_config:
-                for tab in manager.layout_config["layoutTabs"]:
-                    commands_status[tab["tabName"]] = build_unknown_command_status(tab)
+            commands_status: dict[str, CommandStatus] = manager.check_all_commands_status(snapshot)
             summary: TmuxLayoutSummary = {
                 "total_commands": len(commands_status),
                 "running_commands": sum(1 for status in commands_status.values() if status.get("running", False)),
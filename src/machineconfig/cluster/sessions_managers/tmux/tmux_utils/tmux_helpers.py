@@ -8,6 +8,7 @@ from typing import NotRequired, TypedDict
 
 from machineconfig.utils.schemas.layouts.layout_types import LayoutConfig, TabConfig
 from machineconfig.cluster.sessions_managers.zellij.zellij_utils.monitoring_types import CommandStatus
+from machineconfig.cluster.sessions_managers.helpers.process_snapshot import ProcessSnapshot
 
 
 class TmuxSessionStatus(TypedDict):
@@ -120,11 +121,12 @@ def check_tmux_session_status(session_name: str) -> TmuxSessionStatus:
     }
 
 
-def build_unknown_command_status(tab_config: TabConfig) -> CommandStatus:
+def build_command_status(tab_config: TabConfig, snapshot: ProcessSnapshot) -> CommandStatus:
+    processes = snapshot.match_command(tab_config["command"])
     return {
-        "status": "unknown",
-        "running": False,
-        "processes": [],
+        "status": "running" if processes else "not_running",
+        "running": len(processes) > 0,
+        "processes": processes,
         "command": tab_config["command"],
         "tab_name": tab_config["tabName"],
         "cwd": tab_config["startDir"],
@@ -1,33 +1,34 @@
 
 from machineconfig.utils.schemas.layouts.layout_types import TabConfig, LayoutConfig
 # from machineconfig.utils.accessories import split_list
-from typing import Literal, Protocol
+from typing import Literal, Optional, Protocol
 from machineconfig.cluster.sessions_managers.helpers.load_balancer_helper import restrict_num_tabs_helper1, restrict_num_tabs_helper2, restrict_num_tabs_helper3, restrict_num_tabs_helper4
+from machineconfig.cluster.sessions_managers.helpers.bin_packing import PackingStrategy, effective_weights
 
 class COMMAND_SPLITTER(Protocol):
     def __call__(self, command: str, to: int) -> list[str]: ...
 
 
-def limit_tab_num(layout_configs: list[LayoutConfig], max_thresh: int, threshold_type: Literal["number", "weight"], breaking_method: Literal["moreLayouts", "combineTabs"]) -> list[LayoutConfig]:
+def limit_tab_num(layout_configs: list[LayoutConfig], max_thresh: int, threshold_type: Literal["number", "weight"], breaking_method: Literal["moreLayouts", "combineTabs"], strategy: PackingStrategy, learned_runtimes: Optional[dict[str, float]]) -> list[LayoutConfig]:
+    """`strategy` picks how tabs are packed ("greedy": list order, "lpt" / "ffd": weight-balanced); `learned_runtimes` (tab command -> seconds) overrides `tabWeight`."""
     match threshold_type, breaking_method:
         case "number", "moreLayouts":
-            return restrict_num_tabs_helper1(layout_configs=layout_configs, max_thresh=max_thresh, threshold_type="number", breaking_method="moreLayouts")
+            return restrict_num_tabs_helper1(layout_configs=layout_configs, max_thresh=max_thresh, threshold_type="number", breaking_method="moreLayouts", strategy=strategy, learned_runtimes=learned_runtimes)
         case "number", "combineTabs":
-            return restrict_num_tabs_helper2(layout_configs=layout_configs, max_thresh=max_thresh, threshold_type="number", breaking_method="combineTabs")
+            return restrict_num_tabs_helper2(layout_configs=layout_configs, max_thresh=max_thresh, threshold_type="number", breaking_method="combineTabs", strategy=strategy, learned_runtimes=learned_runtimes)
         case "weight", "moreLayouts":
-            return restrict_num_tabs_helper3(layout_configs=layout_configs, max_thresh=max_thresh, threshold_type="weight", breaking_method="moreLayouts")
+            return restrict_num_tabs_helper3(layout_configs=layout_configs, max_thresh=max_thresh, threshold_type="weight", breaking_method="moreLayouts", strategy=strategy, learned_runtimes=learned_runtimes)
         case "weight", "combineTabs":
-            return restrict_num_tabs_helper4(layout_configs=layout_configs, max_thresh=max_thresh, threshold_type="weight", breaking_method="combineTabs")
+            return restrict_num_tabs_helper4(layout_configs=layout_configs, max_thresh=max_thresh, threshold_type="weight", breaking_method="combineTabs", strategy=strategy, learned_runtimes=learned_runtimes)
         case _:
             raise NotImplementedError(f"The combination {threshold_type}, {breaking_method} is not implemented")
-def limit_tab_weight(layout_configs: list[LayoutConfig], max_weight: int, command_splitter: COMMAND_SPLITTER) -> list[LayoutConfig]:
+def limit_tab_weight(layout_configs: list[LayoutConfig], max_weight: int, command_splitter: COMMAND_SPLITTER, learned_runtimes: Optional[dict[str, float]]) -> list[LayoutConfig]:
     new_layout_configs: list[LayoutConfig] = []
     for a_layout_config in layout_configs:
         new_tabs: list[TabConfig] = []
-        for tab in a_layout_config["layoutTabs"]:
-            tab_weight = tab.get("tabWeight", 1)
+        for tab, tab_weight in zip(a_layout_config["layoutTabs"], effective_weights(a_layout_config["layoutTabs"], learned_runtimes)):
             if tab_weight > max_weight:
-                print(f"Tab '{tab['tabName']}' in layout '{a_layout_config['layoutName']}' has too much weight ({tab_weight} > {max_weight}). Splitting command.")
+                print(f"Tab '{tab['tabName']}' in layout '{a_layout_config['layoutName']}' has too much weight ({tab_weight:g} > {max_weight}). Splitting command.")
                 split_commands = command_splitter(tab["command"], to=max_weight)
                 for idx, cmd in enumerate(split_commands):
                     new_tabs.append({
@@ -18,6 +18,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from machineconfig.utils.schemas.layouts.layout_types import LayoutConfig
+from machineconfig.cluster.sessions_managers.helpers.process_snapshot import ProcessSnapshot
 from machineconfig.cluster.sessions_managers.windows_terminal.wt_utils.wt_helpers import (
     generate_random_suffix,
     # escape_for_wt,
@@ -74,15 +75,16 @@ class WTLayoutGenerator:
         validate_layout_config(layout_config)
         return generate_wt_command_string(layout_config, "preview")
 
-    def check_all_commands_status(self) -> dict[str, dict[str, Any]]:
+    def check_all_commands_status(self, snapshot: Optional[ProcessSnapshot] = None) -> dict[str, dict[str, Any]]:
         if not self.layout_config:
             logger.warning("No layout config tracked. Make sure to create a layout first.")
             return {}
 
+        snapshot = snapshot or ProcessSnapshot.take()
         status_report = {}
         for tab in self.layout_config["layoutTabs"]:
             tab_name = tab["tabName"]
-            status_report[tab_name] = check_command_status(tab_name, self.layout_config)
+            status_report[tab_name] = check_command_status(tab_name, self.layout_config, snapshot)
 
         return status_report
 
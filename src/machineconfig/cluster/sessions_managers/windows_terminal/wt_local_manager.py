@@ -10,6 +10,8 @@ from rich.console import Console
 from machineconfig.utils.scheduler import Scheduler, LoggerTemplate
 from machineconfig.cluster.sessions_managers.windows_terminal.wt_local import WTLayoutGenerator
 from machineconfig.cluster.sessions_managers.windows_terminal.wt_utils.wt_helpers import check_wt_session_status
+from machineconfig.cluster.sessions_managers.helpers.process_snapshot import ProcessSnapshot
+from machineconfig.cluster.sessions_managers.helpers.bin_packing import record_tab_runtimes
 from machineconfig.utils.schemas.layouts.layout_types import LayoutConfig
 from machineconfig.cluster.sessions_managers.zellij.zellij_utils.monitoring_types import StartResult, ActiveSessionInfo
 from machineconfig.cluster.sessions_managers.windows_terminal.wt_utils.manager_persistence import (
@@ -146,10 +148,11 @@ class WTLocalManager:
 
     def check_all_sessions_status(self) -> dict[str, dict[str, Any]]:
         status_report = {}
+        snapshot = ProcessSnapshot.take()  # one process table for every tab of every session in this cycle.
         for wt_manager in self.managers:
             session_name = wt_manager.session_name or "default"
             session_status = check_wt_session_status(session_name)
-            commands_status = wt_manager.check_all_commands_status()
+            commands_status = wt_manager.check_all_commands_status(snapshot)
             summary = calculate_session_summary(commands_status, session_status.get("session_exists", False))
             status_report[session_name] = {"session_status": session_status, "commands_status": commands_status, "summary": summary}
         return status_report
@@ -180,13 +183,15 @@ class WTLocalManager:
 
         runtime_seconds_by_key: dict[tuple[str, str], float] = {}
         last_runtime_update = time.monotonic()
+        last_status: dict[str, dict[str, Any]] = {}
 
         def routine(scheduler: Scheduler) -> None:
-            nonlocal last_runtime_update
+            nonlocal last_runtime_update, last_status
             print(f"\n⏰ Monitoring cycle {scheduler.cycle} at {datetime.now()}")
             print("-" * 50)
 
             all_status = self.check_all_sessions_status()
+            last_status = all_status
             now = time.monotonic()
             elapsed_seconds = max(0.0, now - last_runtime_update)
             last_runtime_update = now
@@ -209,7 +214,10 @@ class WTLocalManager:
 
         self.logger.info(f"Starting monitoring routine with {wait_ms}ms intervals")
         sched = Scheduler(routine=routine, wait_ms=wait_ms, logger=cast(LoggerTemplate, self.logger))
-        sched.run(max_cycles=None)
+        try:
+            sched.run(max_cycles=None)
+        finally:
+            record_tab_runtimes(last_status, runtime_seconds_by_key)  # feeds `balance-load --learn-weights`.
 
     def save(self, session_id: Optional[str] = None) -> str:
         if session_id is None:
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
 from pathlib import Path
@@ -152,20 +153,26 @@ class WTSessionManager:
     
         return results
 
+    @staticmethod
+    def _check_session_status(manager: WTRemoteLayoutGenerator) -> dict[str, Any]:
+        session_key = f"{manager.remote_name}:{manager.session_name}"
+        try:
+            wt_status = manager.session_manager.check_wt_session_status()
+            tabs = manager.layout_config["layoutTabs"]
+            commands_status = manager.process_monitor.check_all_commands_status(tabs)
+            summary = calculate_session_summary(commands_status, wt_status.get("wt_running", False))
+            return {"remote_name": manager.remote_name, "session_name": manager.session_name, "wt_status": wt_status, "commands_status": commands_status, "summary": summary}
+        except Exception as e:
+            logger.error(f"Error checking status for {session_key}: {e}")
+            return {"remote_name": manager.remote_name, "session_name": manager.session_name, "error": str(e), "summary": {"total_commands": 0, "running_commands": 0, "stopped_commands": 0, "session_healthy": False}}
+
     def check_all_sessions_status(self) -> dict[str, dict[str, Any]]:
-        status_report = {}
-        for manager in self.managers:
-            session_key = f"{manager.remote_name}:{manager.session_name}"
-            try:
-                wt_status = manager.session_manager.check_wt_session_status()
-                tabs = manager.layout_config["layoutTabs"]
-                commands_status = manager.process_monitor.check_all_commands_status(tabs)
-                summary = calculate_session_summary(commands_status, wt_status.get("wt_running", False))
-                status_report[session_key] = {"remote_name": manager.remote_name, "session_name": manager.session_name, "wt_status": wt_status, "commands_status": commands_status, "summary": summary}
-            except Exception as e:
-                status_report[session_key] = {"remote_name": manager.remote_name, "session_name": manager.session_name, "error": str(e), "summary": {"total_commands": 0, "running_commands": 0, "stopped_commands": 0, "session_healthy": False}}
-                logger.error(f"Error checking status for {session_key}: {e}")
-        return status_report
+        """Probe every machine concurrently; each probe is one batched round-trip over a shared SSH connection."""
+        if len(self.managers) == 0:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(self.managers), thread_name_prefix="wt-probe") as pool:
+            reports = list(pool.map(self._check_session_status, self.managers))
+        return {f"{manager.remote_name}:{manager.session_name}": report for manager, report in zip(self.managers, reports)}
 
     def get_global_summary(self) -> dict[str, Any]:
         all_status = self.check_all_sessions_status()
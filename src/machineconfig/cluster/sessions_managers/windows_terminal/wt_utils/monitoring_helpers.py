@@ -1,16 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 
+def _collect_status_data(manager: Any) -> dict[str, dict[str, Any]]:
+    tabs = manager.layout_config["layoutTabs"]
+    if hasattr(manager, "process_monitor"):
+        return manager.process_monitor.check_all_commands_status(tabs)
+    return manager.check_all_commands_status()
+
+
 def collect_status_data_from_managers(managers: list[Any]) -> list[dict[str, Any]]:
-    statuses = []
-    for manager in managers:
-        tabs = manager.layout_config["layoutTabs"]
-        if hasattr(manager, "process_monitor"):
-            a_status = manager.process_monitor.check_all_commands_status(tabs)
-        else:
-            a_status = manager.check_all_commands_status()
-        statuses.append(a_status)
-    return statuses
+    if len(managers) == 0:
+        return []
+    with ThreadPoolExecutor(max_workers=len(managers), thread_name_prefix="wt-probe") as pool:
+        return list(pool.map(_collect_status_data, managers))
 
 
 def flatten_status_data(statuses: list[dict[str, dict[str, Any]]]) -> list[dict[str, Any]]:
@@ -4,6 +4,7 @@ Process monitoring and status checking utilities for Windows Terminal commands.
 Adapted from zellij process monitor but focused on Windows processes.
 """
 
+import base64
 import json
 import logging
 import subprocess
@@ -35,6 +36,13 @@ class WTProcessMonitor:
                 raise ValueError("Remote executor is None but is_local is False")
             return self.remote_executor.run_command(command, timeout)
 
+    def _run_script(self, script: str, timeout: int) -> subprocess.CompletedProcess[str]:
+        """Run a multi-line PowerShell script verbatim; -EncodedCommand sidesteps quoting through ssh and `powershell -Command "..."`."""
+        encoded = base64.b64encode(script.encode("utf-16-le")).decode("ascii")
+        if self.is_local:
+            return subprocess.run(["powershell", "-NoProfile", "-EncodedCommand", encoded], capture_output=True, text=True, timeout=timeout)
+        return self._run_command(f"powershell -NoProfile -EncodedCommand {encoded}", timeout)
+
     def check_command_status(self, tab_name: str, tabs: List[TabConfig], use_verification: bool = True) -> Dict[str, Any]:
         """Check command status with optional process verification."""
         the_tab = next((t for t in tabs if t["tabName"] == tab_name), None)
@@ -288,16 +296,80 @@ Write-Output $result
 
         return status
 
+    def _create_batch_check_script(self, commands: Dict[str, str]) -> str:
+        """Create one PowerShell script that lists processes once (a single CIM query) and matches every tab command against it."""
+        payload = json.dumps(commands).replace("'", "''")
+        return f"""
+$commands = '{payload}' | ConvertFrom-Json
+$currentPid = $PID
+$checkTime = Get-Date
+$live = @(Get-CimInstance Win32_Process | Where-Object {{ $_.ProcessId -ne $currentPid -and $_.CommandLine -and $_.CommandLine -notlike "*EncodedCommand*" }})
+$tabs = @{{}}
+foreach ($tab in $commands.PSObject.Properties) {{
+    $fullCommand = $tab.Value
+    $cmdParts = @($fullCommand -split ' ' | Where-Object {{ $_.Length -gt 2 }})
+    $primaryCmd = if ($cmdParts.Count -gt 0) {{ $cmdParts[0] }} else {{ '' }}
+    $matching = @()
+    foreach ($proc in $live) {{
+        $cmdline = $proc.CommandLine
+        $matchesPrimary = $primaryCmd -ne '' -and $primaryCmd -ne 'powershell' -and $cmdline.Contains($primaryCmd)
+        $matchCount = 0
+        foreach ($part in ($cmdParts | Select-Object -Skip 1)) {{
+            if ($cmdline.Contains($part)) {{ $matchCount++ }}
+        }}
+        if (($matchesPrimary -and $matchCount -ge 2) -or $cmdline.Contains($fullCommand)) {{
+            $matching += @{{
+                "pid" = $proc.ProcessId
+                "name" = $proc.Name
+                "cmdline" = $cmdline
+                "status" = "Running"
+                "start_time" = $proc.CreationDate
+                "verified_alive" = $true
+            }}
+        }}
+    }}
+    $tabs[$tab.Name] = $matching
+}}
+@{{ "check_timestamp" = $checkTime; "tabs" = $tabs }} | ConvertTo-Json -Depth 5 -Compress
+"""
+
     def check_all_commands_status(self, tabs: List[TabConfig]) -> Dict[str, Dict[str, Any]]:
-        """Check status of all commands in the tab configuration."""
+        """
+        Check status of all commands in the tab configuration with a single PowerShell invocation:
+        one round-trip and one process query per machine, however many tabs it runs.
+        """
         if not tabs:
             logger.warning("No tab configuration provided.")
             return {}
 
-        status_report = {}
-        for the_tab in tabs:
-            tab_name = the_tab["tabName"]
-            status_report[tab_name] = self.check_command_status(tab_name, tabs)
+        commands = {the_tab["tabName"]: the_tab["command"] for the_tab in tabs}
+        try:
+            result = self._run_script(self._create_batch_check_script(commands), timeout=30)
+            if result.returncode != 0:
+                error = f"Command failed: {result.stderr}"
+                return {tab_name: {"status": "error", "error": error, "running": False, "command": command, "tab_name": tab_name, "location": self.location_name} for tab_name, command in commands.items()}
+            json_line = next(line.strip() for line in reversed(result.stdout.strip().splitlines()) if line.strip().startswith("{"))
+            check_result = json.loads(json_line)
+        except Exception as e:
+            logger.error(f"Error in batched process check on {self.location_name}: {e}")
+            return {tab_name: {"status": "error", "error": str(e), "running": False, "command": command, "tab_name": tab_name, "location": self.location_name} for tab_name, command in commands.items()}
+
+        status_report: Dict[str, Dict[str, Any]] = {}
+        for tab_name, command in commands.items():
+            matching_processes = check_result.get("tabs", {}).get(tab_name) or []
+            if isinstance(matching_processes, dict):  # ConvertTo-Json collapses single-element arrays.
+                matching_processes = [matching_processes]
+            status_report[tab_name] = {
+                "status": "running" if matching_processes else "not_running",
+                "running": bool(matching_processes),
+                "processes": matching_processes,
+                "command": command,
+                "tab_name": tab_name,
+                "location": self.location_name,
+                "check_timestamp": check_result.get("check_timestamp"),
+                "method": "batched_check",
+                "verification_method": "single_process_query",
+            }
         return status_report
 
     def get_windows_terminal_windows(self) -> Dict[str, Any]:
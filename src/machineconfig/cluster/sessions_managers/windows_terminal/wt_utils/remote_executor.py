@@ -8,6 +8,9 @@ import subprocess
 import logging
 from typing import Dict, Any, Optional, List
 
+from machineconfig.utils.ssh_utils.specs_cache import DEFAULT_SPECS_TTL_SECONDS
+from machineconfig.utils.ssh_utils.multiplex import ssh_multiplex_options
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,7 +28,7 @@ class WTRemoteExecutor:
             if not command.startswith("powershell"):
                 command = f'powershell -Command "{command}"'
 
-        ssh_cmd = ["ssh", self.remote_name, command]
+        ssh_cmd = ["ssh", *ssh_multiplex_options(), self.remote_name, command]
         try:
             result = subprocess.run(ssh_cmd, capture_output=True, text=True, timeout=timeout)
             return result
@@ -80,16 +83,23 @@ class WTRemoteExecutor:
         except Exception:
             return False
 
-    def get_remote_windows_info(self) -> Dict[str, Any]:
-        """Get information about the remote Windows system."""
-        try:
+    def get_remote_windows_info(self, ttl_seconds: float = DEFAULT_SPECS_TTL_SECONDS, refresh: bool = False) -> Dict[str, Any]:
+        """Get information about the remote Windows system, cached per host in the shared on-disk specs cache."""
+        from machineconfig.utils.ssh_utils.specs_cache import fingerprint_from_ssh_alias, get_or_probe
+
+        def probe() -> Optional[Dict[str, Any]]:
             # Get Windows version and terminal info
             version_cmd = "Get-ComputerInfo | Select-Object WindowsProductName, WindowsVersion"
             result = self.run_command(version_cmd, timeout=15)
+            if result.returncode != 0:
+                return None
+            return {"windows_info": result.stdout, "wt_available": self.check_wt_available()}
 
-            wt_available = self.check_wt_available()
-
-            return {"windows_info": result.stdout if result.returncode == 0 else "Unknown", "wt_available": wt_available, "remote_name": self.remote_name}
+        try:
+            info = get_or_probe(fingerprint=fingerprint_from_ssh_alias(self.remote_name), section="wt_windows_info", ttl_seconds=ttl_seconds, refresh=refresh, probe=probe)
+            if info is None:
+                return {"windows_info": "Unknown", "wt_available": self.check_wt_available(), "remote_name": self.remote_name}
+            return {**info, "remote_name": self.remote_name}
         except Exception as e:
             logger.error(f"Failed to get remote Windows info: {e}")
             return {"windows_info": "Error getting info", "wt_available": False, "remote_name": self.remote_name, "error": str(e)}
@@ -4,10 +4,11 @@ import string
 import json
 import shlex
 import logging
-from typing import Any
+from typing import Any, Optional
 from pathlib import Path
 
 from machineconfig.utils.schemas.layouts.layout_types import LayoutConfig
+from machineconfig.cluster.sessions_managers.helpers.process_snapshot import ProcessSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -134,8 +135,8 @@ try {
         return {"wt_running": False, "error": str(e), "session_name": session_name}
 
 
-def check_command_status(tab_name: str, layout_config: LayoutConfig) -> dict[str, Any]:
-    """Check if a command is running by looking for processes."""
+def check_command_status(tab_name: str, layout_config: LayoutConfig, snapshot: Optional[ProcessSnapshot] = None) -> dict[str, Any]:
+    """Check if a command is running by looking it up in a process snapshot (pass the cycle's `snapshot` when checking many tabs)."""
     tab_config = None
     for tab in layout_config["layoutTabs"]:
         if tab["tabName"] == tab_name:
@@ -146,54 +147,16 @@ def check_command_status(tab_name: str, layout_config: LayoutConfig) -> dict[str
         return {"status": "unknown", "error": f"Tab '{tab_name}' not found in layout config", "running": False, "pid": None, "command": None}
 
     command = tab_config["command"]
+    if not command.strip():
+        return {"status": "error", "error": "Empty command", "running": False, "command": command, "tab_name": tab_name}
 
     try:
-        primary_cmd = command.split()[0] if command.strip() else ""
-        if not primary_cmd:
-            return {"status": "error", "error": "Empty command", "running": False, "command": command, "tab_name": tab_name}
-
-        ps_script = f"""
-try {{
-    $processes = Get-Process -Name '{primary_cmd}' -ErrorAction SilentlyContinue
-    if ($processes) {{
-        $processes | ForEach-Object {{
-            $procInfo = @{{
-                "pid" = $_.Id
-                "name" = $_.ProcessName
-                "start_time" = $_.StartTime.ToString()
-            }}
-            Write-Output ($procInfo | ConvertTo-Json -Compress)
-        }}
-    }}
-}} catch {{
-    # No processes found or other error
-}}
-"""
-
-        result = subprocess.run([POWERSHELL_CMD, "-Command", ps_script], capture_output=True, text=True, timeout=5)
-
-        if result.returncode == 0:
-            output_lines = [line.strip() for line in result.stdout.strip().split("\n") if line.strip()]
-            matching_processes = []
-
-            for line in output_lines:
-                if line.startswith("{") and line.endswith("}"):
-                    try:
-                        proc_info = json.loads(line)
-                        matching_processes.append(proc_info)
-                    except json.JSONDecodeError:
-                        continue
-
-            if matching_processes:
-                return {"status": "running", "running": True, "processes": matching_processes, "command": command, "tab_name": tab_name}
-            else:
-                return {"status": "not_running", "running": False, "processes": [], "command": command, "tab_name": tab_name}
-        else:
-            return {"status": "error", "error": f"Command failed: {result.stderr}", "running": False, "command": command, "tab_name": tab_name}
-
-    except subprocess.TimeoutExpired:
-        logger.error(f"Timeout checking command status for tab '{tab_name}'")
-        return {"status": "timeout", "error": "Timeout checking process status", "running": False, "command": command, "tab_name": tab_name}
+        if snapshot is None:
+            snapshot = ProcessSnapshot.take()
+        matching_processes = snapshot.match_command(command)
+        if matching_processes:
+            return {"status": "running", "running": True, "processes": matching_processes, "command": command, "tab_name": tab_name}
+        return {"status": "not_running", "running": False, "processes": [], "command": command, "tab_name": tab_name}
     except Exception as e:
         logger.error(f"Error checking command status for tab '{tab_name}': {e}")
         return {"status": "error", "error": str(e), "running": False, "command": command, "tab_name": tab_name}
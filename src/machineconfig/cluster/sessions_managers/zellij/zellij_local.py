@@ -9,6 +9,7 @@ from machineconfig.utils.schemas.layouts.layout_types import LayoutConfig
 from machineconfig.cluster.sessions_managers.zellij.zellij_utils.monitoring_types import ComprehensiveStatus, CommandStatus
 from machineconfig.cluster.sessions_managers.zellij.zellij_utils.zellij_local_helper import validate_layout_config, create_tab_section, check_command_status, check_zellij_session_status
 from machineconfig.cluster.sessions_managers.zellij.zellij_utils.zellij_local_helper_restart import restart_tab_process
+from machineconfig.cluster.sessions_managers.helpers.process_snapshot import ProcessSnapshot
 
 
 logging.basicConfig(level=logging.INFO)
@@ -68,15 +69,16 @@ class ZellijLayoutGenerator:
         console.print(f"[bold green]✅ Layout created successfully:[/bold green] [cyan]{self.layout_path}[/cyan]")
         return True
 
-    def check_all_commands_status(self) -> dict[str, CommandStatus]:
+    def check_all_commands_status(self, snapshot: Optional[ProcessSnapshot] = None) -> dict[str, CommandStatus]:
         if not self.layout_config:
             logger.warning("No layout config tracked. Make sure to create a layout first.")
             return {}
 
+        snapshot = snapshot or ProcessSnapshot.take()
         status_report: dict[str, CommandStatus] = {}
         for tab in self.layout_config["layoutTabs"]:
             tab_name = tab["tabName"]
-            status_report[tab_name] = check_command_status(tab_name, self.layout_config)
+            status_report[tab_name] = check_command_status(tab_name, self.layout_config, snapshot)
 
         return status_report
 
@@ -14,6 +14,8 @@ from machineconfig.utils.scheduler import Scheduler
 from machineconfig.cluster.sessions_managers.zellij.zellij_local import ZellijLayoutGenerator
 from machineconfig.utils.schemas.layouts.layout_types import LayoutConfig
 from machineconfig.cluster.sessions_managers.zellij.zellij_utils import zellij_local_manager_helper as helper
+from machineconfig.cluster.sessions_managers.helpers.process_snapshot import ProcessSnapshot
+from machineconfig.cluster.sessions_managers.helpers.bin_packing import record_tab_runtimes
 
 
 logging.basicConfig(level=logging.INFO)
@@ -178,6 +180,7 @@ class ZellijLocalManager:
     def check_all_sessions_status(self) -> dict[str, SessionReport]:
         """Check the status of all sessions and their commands."""
         status_report: dict[str, SessionReport] = {}
+        snapshot = ProcessSnapshot.take()  # one process table for every tab of every session in this cycle.
 
         for manager in self.managers:
             session_name = manager.session_name
@@ -187,7 +190,7 @@ class ZellijLocalManager:
             session_status = check_zellij_session_status(session_name)
 
             # Get commands status for this session
-            commands_status = manager.check_all_commands_status()
+            commands_status = manager.check_all_commands_status(snapshot)
 
             # Calculate summary for this session
             running_count = sum(1 for status in commands_status.values() if status.get("running", False))
@@ -263,13 +266,15 @@ class ZellijLocalManager:
 
         runtime_seconds_by_key: dict[tuple[str, str], float] = {}
         last_runtime_update = time.monotonic()
+        last_status: dict[str, SessionReport] = {}
 
         def routine(scheduler: Scheduler) -> None:
-            nonlocal last_runtime_update
+            nonlocal last_runtime_update, last_status
             print(f"\n⏰ Monitoring cycle {scheduler.cycle} at {datetime.now()}")
             print("-" * 50)
 
             all_status = self.check_all_sessions_status()
+            last_status = all_status
             now = time.monotonic()
             elapsed_seconds = max(0.0, now - last_runtime_update)
             last_runtime_update = now
@@ -320,7 +325,10 @@ class ZellijLocalManager:
         from machineconfig.utils.scheduler import LoggerTemplate
         from typing import cast
         sched = Scheduler(routine=routine, wait_ms=wait_ms, logger=cast(LoggerTemplate, logger))
-        sched.run()
+        try:
+            sched.run()
+        finally:
+            record_tab_runtimes(dict(last_status), runtime_seconds_by_key)  # feeds `balance-load --learn-weights`.
 
     def save(self, session_id: Optional[str]) -> str:
         """Save the manager state to disk."""
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
 import uuid
@@ -55,10 +56,9 @@ class ZellijSessionManager:
     def run_monitoring_routine(self) -> None:
         def routine(scheduler: Scheduler):
             if scheduler.cycle % 2 == 0:
-                statuses = []
-                for _idx, an_m in enumerate(self.managers):
-                    a_status = an_m.process_monitor.check_all_commands_status(an_m.layout_config)
-                    statuses.append(a_status)
+                # One batched probe per machine, all machines at once.
+                with ThreadPoolExecutor(max_workers=max(1, len(self.managers)), thread_name_prefix="zellij-probe") as pool:
+                    statuses = list(pool.map(lambda an_m: an_m.process_monitor.check_all_commands_status(an_m.layout_config), self.managers))
                 keys = []
                 for item in statuses:
                     keys.extend(item.keys())
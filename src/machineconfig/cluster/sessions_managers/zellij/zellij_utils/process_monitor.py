@@ -12,6 +12,8 @@ from machineconfig.utils.schemas.layouts.layout_types import LayoutConfig
 from machineconfig.cluster.sessions_managers.zellij.zellij_utils.monitoring_types import CommandStatus, ProcessInfo
 
 logger = logging.getLogger(__name__)
+REMOTE_PYTHON = "$HOME/.local/bin/devops self python"
+BATCH_PROBE_MARKER = "mc_batch_probe"  # present in the probe's own cmdline, so it never matches itself or its ssh wrapper shell.
 
 
 class ProcessMonitor:
@@ -53,7 +55,7 @@ class ProcessMonitor:
         command = tab_config["command"]
         try:
             check_script = self._create_process_check_script(command)
-            remote_cmd = f"$HOME/.local/bin devops self python -c {shlex.quote(check_script)}"
+            remote_cmd = f"{REMOTE_PYTHON} -c {shlex.quote(check_script)}"
             result = self.remote_executor.run_command(remote_cmd, timeout=15)
             if result.returncode == 0:
                 try:
@@ -139,7 +141,7 @@ if __name__ == "__main__":
             check_timestamp = timestamp_result.stdout.strip() if timestamp_result.returncode == 0 else "unknown"
 
             check_script = self._create_fresh_check_script(command)
-            remote_cmd = f"$HOME/.local/bin/devops self python -c {shlex.quote(check_script)}"
+            remote_cmd = f"{REMOTE_PYTHON} -c {shlex.quote(check_script)}"
             result = self.remote_executor.run_command(remote_cmd, timeout=15)
 
             if result.returncode == 0:
@@ -273,14 +275,75 @@ if __name__ == "__main__":
 
         return status
 
+    def _create_batch_check_script(self, commands: Dict[str, str]) -> str:
+        """Create one Python script that walks the remote process table once and matches every tab command against it."""
+        payload = json.dumps(commands)
+        return f"""
+import json, os, time
+import psutil
+
+{BATCH_PROBE_MARKER} = json.loads({payload!r})
+own_pids = {{os.getpid(), os.getppid()}}
+check_time = time.time()
+live = []
+for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'status', 'create_time']):
+    info = proc.info
+    if info['pid'] in own_pids or not info['cmdline'] or info['status'] in ('zombie', 'dead'):
+        continue
+    cmdline_str = ' '.join(info['cmdline'])
+    if '{BATCH_PROBE_MARKER}' in cmdline_str:
+        continue
+    live.append({{"pid": info['pid'], "name": info['name'], "cmdline": info['cmdline'], "status": info['status'], "cmdline_str": cmdline_str, "create_time": info['create_time'], "verified_alive": True}})
+
+tabs = {{}}
+for tab_name, full_command in {BATCH_PROBE_MARKER}.items():
+    cmd_parts = [part for part in full_command.split() if len(part) > 2]
+    primary_cmd = cmd_parts[0] if cmd_parts else ''
+    matching = []
+    for proc in live:
+        cmdline_str = proc['cmdline_str']
+        matches_primary = primary_cmd != '' and primary_cmd in cmdline_str
+        matches_parts = sum(1 for part in cmd_parts[1:] if part in cmdline_str)
+        if (matches_primary and matches_parts >= 2) or full_command in cmdline_str:
+            matching.append(proc)
+    tabs[tab_name] = matching
+print(json.dumps({{"check_timestamp": check_time, "tabs": tabs}}))
+"""
+
     def check_all_commands_status(self, layout_config: LayoutConfig) -> Dict[str, CommandStatus]:
-        """Check status of all commands in the layout configuration."""
+        """
+        Check status of all commands in the layout configuration with a single remote invocation:
+        one SSH round-trip and one process-table walk per machine, however many tabs it runs.
+        """
         if not layout_config or not layout_config.get("layoutTabs"):
             logger.warning("No layout configuration provided.")
             return {}
 
-        status_report = {}
-        for tab in layout_config["layoutTabs"]:
-            tab_name = tab["tabName"]
-            status_report[tab_name] = self.check_command_status(tab_name, layout_config, True)
+        commands = {tab["tabName"]: tab["command"] for tab in layout_config["layoutTabs"]}
+        remote = self.remote_executor.remote_name
+        try:
+            remote_cmd = f"{REMOTE_PYTHON} -c {shlex.quote(self._create_batch_check_script(commands))}"
+            result = self.remote_executor.run_command(remote_cmd, timeout=30)
+            if result.returncode != 0:
+                error = f"Remote command failed: {result.stderr}"
+                return {tab_name: {"status": "error", "error": error, "running": False, "processes": [], "command": command, "tab_name": tab_name, "remote": remote} for tab_name, command in commands.items()}
+            check_result = json.loads(result.stdout.strip().splitlines()[-1])
+        except Exception as e:
+            logger.error(f"Error in batched process check on {remote}: {e}")
+            return {tab_name: {"status": "error", "error": str(e), "running": False, "processes": [], "command": command, "tab_name": tab_name, "remote": remote} for tab_name, command in commands.items()}
+
+        status_report: Dict[str, CommandStatus] = {}
+        for tab_name, command in commands.items():
+            matching_processes: list[ProcessInfo] = check_result["tabs"].get(tab_name, [])  # runtime JSON provides shape
+            status_report[tab_name] = {
+                "status": "running" if matching_processes else "not_running",
+                "running": bool(matching_processes),
+                "processes": matching_processes,
+                "command": command,
+                "tab_name": tab_name,
+                "remote": remote,
+                "check_timestamp": check_result["check_timestamp"],
+                "method": "batched_check",
+                "verification_method": "single_process_walk",
+            }
         return status_report
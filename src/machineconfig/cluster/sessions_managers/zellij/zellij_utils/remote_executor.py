@@ -6,6 +6,7 @@ Remote command execution utilities for SSH operations.
 import subprocess
 import logging
 from typing import Dict, Any
+from machineconfig.utils.ssh_utils.multiplex import ssh_multiplex_options
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +19,7 @@ class RemoteExecutor:
 
     def run_command(self, command: str, timeout: int) -> subprocess.CompletedProcess[str]:
         """Execute a command on the remote machine via SSH."""
-        ssh_cmd = ["ssh", self.remote_name, command]
+        ssh_cmd = ["ssh", *ssh_multiplex_options(), self.remote_name, command]
         try:
             result = subprocess.run(ssh_cmd, capture_output=True, text=True, timeout=timeout)
             return result
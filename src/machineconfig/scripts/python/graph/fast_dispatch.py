@@ -0,0 +1,476 @@
+"""
+Fast path for the console entry points, driven by `cli_graph.json`.
+
+Building the typer app tree (and importing typer and rich at all) costs more than most commands need. Here argv is
+resolved against a compact, precompiled form of the CLI graph: `--help` and shell completion are answered straight
+from it, and a command below a nested group imports only the module whose app owns that command. Anything the graph
+cannot answer, or answers from source files newer than the graph, goes through the regular typer `main`.
+Set `MCFG_NO_FAST_PATH=1` to always take the regular path.
+
+The typer apps are built with `add_completion=False`, so completion lives here: `<prog> --install-completion [SHELL]`
+and `<prog> --show-completion [SHELL]` install or print typer's completion script, whose requests this module answers.
+"""
+
+from typing import Any, Optional
+from pathlib import Path
+import os
+import sys
+
+from machineconfig.scripts.python.graph.graph_index import GRAPH_INDEX_PATH, load_dispatch_nodes
+
+
+GRAPH_PATH = Path(__file__).resolve().with_name("cli_graph.json")
+DISABLE_ENV_VAR = "MCFG_NO_FAST_PATH"
+STALE_TOLERANCE_NS = 2_000_000_000  # files of one checkout / install land within this of each other.
+_PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+_HELP_LINE = ("--help", "Show this message and exit.")
+_COMPLETION_LINES = (
+    ("--install-completion", "Install completion for the current shell (or SHELL)."),
+    ("--show-completion", "Show completion for the current shell (or SHELL), to copy it or customize the installation."),
+)
+_SHELLS = ("bash", "zsh", "fish", "powershell", "pwsh")
+
+# console script -> (path of its node below the graph root, module whose `main` is the regular entry point)
+ENTRY_POINTS: dict[str, tuple[tuple[str, ...], str]] = {
+    "mcfg": ((), "machineconfig.scripts.python.mcfg_entry"),
+    "devops": (("devops",), "machineconfig.scripts.python.devops"),
+    "cloud": (("cloud",), "machineconfig.scripts.python.cloud"),
+    "sessions": (("sessions",), "machineconfig.scripts.python.sessions"),
+    "agents": (("agents",), "machineconfig.scripts.python.agents"),
+    "utils": (("utils",), "machineconfig.scripts.python.utils"),
+}
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Compiling the graph
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def _choices(type_text: str) -> list[str]:
+    """Values of a `Literal[...]` annotation (possibly inside Optional / a union); empty for anything else."""
+    import ast
+
+    try:
+        tree = ast.parse(type_text, mode="eval")
+    except SyntaxError:
+        return []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Subscript) and isinstance(node.value, ast.Name) and node.value.id == "Literal":
+            elts = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+            return [str(elt.value) for elt in elts if isinstance(elt, ast.Constant)]
+    return []
+
+
+def _base_type(type_text: str) -> str:
+    parts = [part.strip() for part in type_text.replace("Optional[", "").replace("]", "").split("|")]
+    parts = [part for part in parts if part not in ("None", "")]
+    return parts[0] if len(parts) == 1 else type_text
+
+
+def _compile_param(param: dict[str, Any]) -> Optional[dict[str, Any]]:
+    type_text = str(param.get("type") or "")
+    if "Context" in type_text:
+        return None
+    typer_meta = param.get("typer") or {}
+    base = _base_type(type_text)
+    if typer_meta:
+        kind = typer_meta["kind"]
+        flags = [*typer_meta.get("long_flags", []), *typer_meta.get("short_flags", [])]
+    else:  # plain parameter: typer makes it an argument when required, an option otherwise.
+        kind = "argument" if param.get("required") else "option"
+        flags = [] if kind == "argument" else ["--" + param["name"].replace("_", "-")]
+    if kind == "option" and len(flags) == 0:
+        flags = ["--" + param["name"].replace("_", "-")]
+    choices = _choices(type_text)
+    is_flag = kind == "option" and base == "bool"
+    if is_flag:
+        metavar = ""
+    elif choices:
+        metavar = "<" + "|".join(choices) + ">"
+    else:
+        metavar = "<" + (base.lower() if base in ("str", "int", "float", "bool", "Path") else "str") + ">"
+    default = param.get("default")
+    return {
+        "kind": kind,
+        "name": param["name"],
+        "flags": flags,
+        "metavar": metavar,
+        "is_flag": is_flag,
+        "choices": choices,
+        "required": bool(param.get("required")),
+        "default": default if isinstance(default, (str, int, float)) and not isinstance(default, bool) and default != "" else None,
+        "help": str(typer_meta.get("help") or ""),
+    }
+
+
+def _module_file(module: str) -> str:
+    return module.replace(".", "/") + ".py"
+
+
+def _summary(node: dict[str, Any]) -> str:
+    text = node.get("short_help") or node.get("help") or node.get("doc") or ""
+    return text.strip().splitlines()[0] if text.strip() else ""
+
+
+def compile_graph(graph: dict[str, Any]) -> list[dict[str, Any]]:
+    """Flatten the graph into a list of nodes (root first) that only hold what dispatch, help and completion read."""
+    nodes: list[dict[str, Any]] = []
+
+    def add(node: dict[str, Any]) -> int:
+        source = node.get("source", {})
+        files = [str(source.get("file", "")).removeprefix("src/")]
+        factory = source.get("dispatches_to") or source.get("app_factory")
+        if node["kind"] != "command" and factory:
+            factory_module, _, factory_attr = factory.rpartition(".")
+            files.append(_module_file(factory_module))
+        else:
+            factory_module, factory_attr = "", ""
+        idx = len(nodes)
+        app = node.get("app", {})
+        context_settings = node.get("command_context_settings") or {}
+        entry: dict[str, Any] = {
+            "kind": node["kind"],
+            "name": node["name"],
+            "help": (app.get("help") if node["kind"] != "command" else None) or node.get("help") or node.get("doc") or "",
+            "summary": _summary(node),
+            "factory": f"{factory_module}:{factory_attr}" if factory_module else "",
+            "no_args_is_help": bool((app if node["kind"] != "command" else node.get("typer", {})).get("no_args_is_help", False)),
+            "add_help_option": bool(app.get("add_help_option", True)) if node["kind"] != "command" else "--help" in context_settings.get("help_option_names", ["--help"]),
+            "files": sorted({f for f in files if f}),
+            "params": [p for p in (_compile_param(param) for param in node.get("signature", {}).get("parameters", [])) if p is not None],
+            "children": {},
+            "listing": [],
+        }
+        nodes.append(entry)
+        for child in node.get("children", []):
+            child_idx = add(child)
+            entry["children"][child["name"]] = child_idx
+            # A graph from before `hidden` was recorded would list hidden commands: fail here (see `graph_index`).
+            if not child["hidden"]:
+                entry["listing"].append([child["name"], child_idx])
+            for alias in child.get("aliases", []):
+                entry["children"].setdefault(alias["name"], child_idx)
+                if not alias.get("hidden", False):
+                    entry["listing"].append([alias["name"], child_idx])
+        return idx
+
+    add(graph["root"])
+    return nodes
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Help and completion
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def _rows(rows: list[tuple[str, ...]]) -> list[str]:
+    """Rows aligned into columns; a column that is empty on every row takes no space."""
+    widths = [max(len(row[col]) for row in rows) for col in range(len(rows[0]) - 1)]
+    return ["   " + "".join(cell.ljust(width + 2) for cell, width in zip(row, widths) if width) + row[-1] for row in rows]
+
+
+def _describe(param: dict[str, Any]) -> str:
+    text = param["help"]
+    if param["required"]:
+        text += " [required]"
+    elif param["default"] is not None:
+        text += f" [default: {param['default']}]"
+    return text.strip()
+
+
+def render_help(nodes: list[dict[str, Any]], node: dict[str, Any], prog: str, is_entry: bool) -> str:
+    """Plain-text help with the sections typer shows (usage, description, arguments, options, commands); the entry
+    point's own help also lists the completion options."""
+    arguments = [p for p in node["params"] if p["kind"] == "argument"]
+    options = [p for p in node["params"] if p["kind"] == "option"]
+    if node["kind"] == "command":
+        usage = f"{prog} [OPTIONS]" + "".join(f" {p['name'].upper()}" if p["required"] else f" [{p['name']}]" for p in arguments)
+    else:
+        usage = f"{prog} [OPTIONS] COMMAND [ARGS]..."
+    lines = ["", f" Usage: {usage}", ""]
+    if node["help"]:
+        lines.extend([f" {line}".rstrip() for line in node["help"].strip().splitlines()] + [""])
+    if arguments:
+        lines.append(" Arguments:")
+        lines.extend(_rows([(p["name"], p["metavar"], _describe(p)) for p in arguments]))
+        lines.append("")
+    option_rows = [(", ".join(f for f in p["flags"] if f.startswith("--")), ", ".join(f for f in p["flags"] if not f.startswith("--")), p["metavar"], _describe(p)) for p in options]
+    if is_entry:
+        option_rows.extend((flag, "", "[SHELL]", text) for flag, text in _COMPLETION_LINES)
+    if node["add_help_option"]:
+        option_rows.append((_HELP_LINE[0], "", "", _HELP_LINE[1]))
+    if option_rows:
+        lines.append(" Options:")
+        lines.extend(_rows(option_rows))
+        lines.append("")
+    if node["listing"]:
+        lines.append(" Commands:")
+        lines.extend(_rows([(name, nodes[idx]["summary"]) for name, idx in node["listing"]]))
+        lines.append("")
+    return "\n".join(lines)
+
+
+def completion_candidates(nodes: list[dict[str, Any]], start: int, args: list[str], incomplete: str) -> list[tuple[str, str]]:
+    """(value, help) pairs for the word being completed, following click's rules for groups, options and choices."""
+    node = nodes[start]
+    position = 0
+    used: set[str] = set()
+    pending: Optional[dict[str, Any]] = None  # option whose value is the next word
+    for arg in args:
+        if pending is not None:
+            pending = None
+        elif node["kind"] != "command":
+            if arg in node["children"]:
+                node = nodes[node["children"][arg]]
+            elif not arg.startswith("-"):
+                return []  # not in the graph: let the shell fall back to its default completion.
+        elif arg.startswith("-"):
+            option = next((p for p in node["params"] if p["kind"] == "option" and arg in p["flags"]), None)
+            if option is not None:
+                used.update(option["flags"])
+                pending = None if option["is_flag"] else option
+        else:
+            position += 1
+    if pending is not None:
+        return [(choice, "") for choice in pending["choices"] if choice.startswith(incomplete)]
+    candidates: list[tuple[str, str]] = []
+    if node["kind"] != "command":
+        candidates.extend((name, nodes[idx]["summary"]) for name, idx in node["listing"] if name.startswith(incomplete))
+    if incomplete and not incomplete[0].isalnum():
+        for param in node["params"]:
+            if param["kind"] == "option" and not used.intersection(param["flags"]):
+                candidates.extend((flag, param["help"]) for flag in param["flags"] if flag.startswith(incomplete))
+        if node["add_help_option"] and _HELP_LINE[0].startswith(incomplete):
+            candidates.append(_HELP_LINE)
+    elif node["kind"] == "command":
+        arguments = [p for p in node["params"] if p["kind"] == "argument"]
+        if position < len(arguments):
+            candidates.extend((choice, "") for choice in arguments[position]["choices"] if choice.startswith(incomplete))
+    return candidates
+
+
+def _split_arg_string(string: str) -> list[str]:
+    """Same splitting as click's `split_arg_string`: an unterminated quote keeps the partial word."""
+    import shlex
+
+    lexer = shlex.shlex(string, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    words: list[str] = []
+    try:
+        for word in lexer:
+            words.append(word)
+    except ValueError:
+        words.append(lexer.token)
+    return words
+
+
+def _completion_request(shell: str) -> tuple[list[str], str]:
+    """(completed words after the program name, word being completed), read from the variables typer's scripts set."""
+    if shell == "bash":
+        words = _split_arg_string(os.environ["COMP_WORDS"])
+        cword = int(os.environ["COMP_CWORD"])
+        return words[1:cword], words[cword] if cword < len(words) else ""
+    completion_args = os.environ.get("_TYPER_COMPLETE_ARGS", "")
+    words = _split_arg_string(completion_args)
+    if shell in ("powershell", "pwsh"):
+        incomplete = os.environ.get("_TYPER_COMPLETE_WORD_TO_COMPLETE", "")
+        return (words[1:-1] if incomplete else words[1:]), incomplete
+    args = words[1:]
+    if args and not completion_args.endswith(" "):
+        return args[:-1], args[-1]
+    return args, ""
+
+
+def _setup_completion(prog: str, args: list[str]) -> int:
+    """`--install-completion [SHELL]` / `--show-completion [SHELL]`, as typer's own options do it; the shell is detected
+    when not given."""
+    from typer import Exit
+    from typer._completion_shared import _get_shell_name, get_completion_script, install
+
+    complete_var = f"_{prog}_COMPLETE".replace("-", "_").upper()
+    shell = args[1] if len(args) > 1 else (_get_shell_name() or "")
+    try:
+        if args[0] == "--show-completion":
+            print(get_completion_script(prog_name=prog, complete_var=complete_var, shell=shell))
+        else:
+            shell, path = install(shell=shell, prog_name=prog, complete_var=complete_var)
+            print(f"{shell} completion installed in {path}")
+            print("Completion will take effect once you restart the terminal")
+    except Exit as ex:
+        return ex.exit_code
+    return 0
+
+
+def _format_completions(shell: str, candidates: list[tuple[str, str]]) -> tuple[str, int]:
+    """Output and exit code in the format of typer's completion classes."""
+    if shell == "bash":
+        return "\n".join(value for value, _ in candidates), 0
+    if shell == "zsh":
+        def escape(s: str) -> str:
+            return s.replace('"', '""').replace("'", "''").replace("$", "\\$").replace("`", "\\`").replace(":", r"\\:")
+        items = [f'"{escape(value)}":"{escape(text)}"' if text else f'"{escape(value)}"' for value, text in candidates]
+        return (f"_arguments '*: :(({chr(10).join(items)}))'" if items else "_files"), 0
+    if shell == "fish":
+        items = [f"{value}\t{' '.join(text.split())}" if text else value for value, text in candidates]
+        action = os.environ.get("_TYPER_COMPLETE_FISH_ACTION", "")
+        if action == "is-args":
+            return "", 0 if items else 1
+        return ("\n".join(items) if action == "get-args" else ""), 0
+    return "\n".join(f"{value}:::{text or ' '}" for value, text in candidates), 0
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Dispatch
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def _find(nodes: list[dict[str, Any]], path: tuple[str, ...]) -> Optional[int]:
+    idx = 0
+    for token in path:
+        child = nodes[idx]["children"].get(token)
+        if child is None:
+            return None
+        idx = child
+    return idx
+
+
+def _is_stale(nodes: list[dict[str, Any]], indices: list[int], graph_path: Path) -> bool:
+    """True when a source file behind these nodes was edited after the graph was generated."""
+    limit = os.stat(graph_path).st_mtime_ns + STALE_TOLERANCE_NS
+    for file in {f for idx in indices for f in nodes[idx]["files"]}:
+        try:
+            if os.stat(os.path.join(_PACKAGE_PARENT, file)).st_mtime_ns > limit:
+                return True
+        except OSError:
+            return True
+    return False
+
+
+def _fast_path(entry: str, argv: list[str]) -> bool:
+    """Serve `argv` from the graph; False when the regular typer entry point must handle it."""
+    prog = os.path.basename(argv[0]) if argv else entry
+    args = argv[1:]
+    try:
+        nodes = load_dispatch_nodes(GRAPH_PATH)
+    except (OSError, ValueError, KeyError):  # missing or unreadable graph: the regular path still works.
+        return False
+    if nodes is None:  # the graph predates the fields the fast path relies on.
+        return False
+    start = _find(nodes, ENTRY_POINTS[entry][0])
+    if start is None:
+        return False
+
+    if args[:1] in (["--install-completion"], ["--show-completion"]) and len(args) <= 2:
+        sys.exit(_setup_completion(prog, args))
+
+    instruction = os.environ.get(f"_{prog}_COMPLETE".replace("-", "_").upper())
+    if instruction is not None:
+        action, _, shell = instruction.partition("_")
+        if action not in ("source", "complete") or shell not in _SHELLS:
+            return False
+        if action == "source":  # click's `eval "$(_DEVOPS_COMPLETE=source_bash devops)"` style.
+            sys.exit(_setup_completion(prog, ["--show-completion", shell]))
+        words, incomplete = _completion_request(shell)
+        output, code = _format_completions(shell, completion_candidates(nodes, start, words, incomplete))
+        print(output)
+        sys.exit(code)
+
+    visited = [start]
+    consumed = 0
+    while nodes[visited[-1]]["kind"] != "command" and consumed < len(args) and args[consumed] in nodes[visited[-1]]["children"]:
+        visited.append(nodes[visited[-1]]["children"][args[consumed]])
+        consumed += 1
+    if _is_stale(nodes, visited, GRAPH_PATH):
+        return False
+    node = nodes[visited[-1]]
+    rest = args[consumed:]
+
+    wants_help = rest == ["--help"] and node["add_help_option"]
+    if wants_help or (len(rest) == 0 and node["no_args_is_help"]):
+        # A nested app is invoked without a prog name, so typer names it after the executable alone.
+        names = [prog] + ([args[consumed - 1]] if node["kind"] == "command" and consumed > 0 else [])
+        print(render_help(nodes, node, " ".join(names), is_entry=consumed == 0))
+        sys.exit(0 if wants_help else 2)
+
+    # Hand the rest of argv to the innermost group's own app, skipping the apps (and imports) of the groups above it.
+    depth = max(i for i, idx in enumerate(visited) if nodes[idx]["kind"] != "command")
+    if depth == 0:
+        return False
+    import importlib
+
+    module, _, attr = nodes[visited[depth]]["factory"].partition(":")
+    app = getattr(importlib.import_module(module), attr)()
+    app(args[depth:])
+    return True
+
+
+def run_entry(entry: str) -> None:
+    handled = os.environ.get(DISABLE_ENV_VAR, "") in ("", "0") and _fast_path(entry, sys.argv)
+    if not handled:
+        import importlib
+
+        importlib.import_module(ENTRY_POINTS[entry][1]).main()
+
+
+def mcfg() -> None:
+    run_entry("mcfg")
+
+
+def devops() -> None:
+    run_entry("devops")
+
+
+def cloud() -> None:
+    run_entry("cloud")
+
+
+def sessions() -> None:
+    run_entry("sessions")
+
+
+def agents() -> None:
+    run_entry("agents")
+
+
+def utils() -> None:
+    run_entry("utils")
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def benchmark(argv: list[str], runs: int = 10) -> None:
+    """Cold and warm wall time of `devops <argv>` through the fast path and through the regular typer path."""
+    import statistics
+    import subprocess
+    import tempfile
+    import time
+    from rich.console import Console
+    from rich.table import Table
+
+    code = "import sys; sys.argv[0] = 'devops'; from machineconfig.scripts.python.graph.fast_dispatch import devops; devops()"
+
+    def timed(env: dict[str, str]) -> float:
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code, *argv], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        return time.perf_counter() - started
+
+    table = Table(title=f"⏱️ devops {' '.join(argv)} ({runs} warm runs)", show_header=True, header_style="bold cyan")
+    for column in ("Path", "Cold ms", "Warm median ms", "Warm min ms"):
+        table.add_column(column, justify="left" if column == "Path" else "right")
+    for label, extra in (("typer (before)", {DISABLE_ENV_VAR: "1"}), ("fast path (after)", {})):
+        env = {key: value for key, value in {**os.environ, **extra}.items() if key != "PYTHONDONTWRITEBYTECODE"}
+        with tempfile.TemporaryDirectory() as pycache:
+            # Cold: nothing compiled yet, neither bytecode nor the graph index.
+            GRAPH_INDEX_PATH.unlink(missing_ok=True)
+            cold = timed({**env, "PYTHONPYCACHEPREFIX": pycache})
+            warm = [timed({**env, "PYTHONPYCACHEPREFIX": pycache}) for _ in range(runs)]
+        table.add_row(label, f"{cold * 1000:.0f}", f"{statistics.median(warm) * 1000:.0f}", f"{min(warm) * 1000:.0f}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    benchmark(sys.argv[1:] or ["--help"])
@@ -136,6 +136,7 @@ def build_cli_graph() -> dict[str, Any]:
                 "short_help": "Short help string (if set)",
                 "doc": "Docstring text for leaf commands or wrapper functions",
                 "aliases": "List of alias objects with name/hidden/help/short_help",
+                "hidden": "True when every registration of the command is hidden (e.g. deprecated names); set on every child node",
                 "source": "Where the callable or Typer app is defined",
                 "registered_in": "Where the command was registered if different from source",
                 "command_context_settings": "Typer context_settings used when registering the command",
@@ -177,9 +178,11 @@ def build_children(app_model: AppModel) -> list[dict[str, Any]]:
         primary = choose_primary(regs)
         aliases = build_aliases(regs, primary)
         if key[0] == "group":
-            children.append(build_group_node(app_model, primary, aliases))
+            node = build_group_node(app_model, primary, aliases)
         else:
-            children.append(build_command_node(app_model, primary, aliases))
+            node = build_command_node(app_model, primary, aliases)
+        node["hidden"] = primary.hidden
+        children.append(node)
     return children
 
 
@@ -0,0 +1,195 @@
+"""
+Compact binary index of `cli_graph.json`, shared by every reader of the graph.
+
+The JSON keeps every command's raw signature lines, so readers that only want the tree pay for parsing all of it and
+for rebuilding nested dicts. The index is built once per version of the graph and holds what each reader needs:
+- the dispatch nodes the console entry points resolve argv against (`fast_dispatch.compile_graph`);
+- a flat table for the navigator, `build_graph` and `search`: one row per node in pre-order with the offset of its
+  parent row, and every string stored once in a token list that rows point into;
+- the full JSON text of each command, which only `search` shows, read on demand.
+
+It lives under CONFIG_ROOT (the package directory may be read-only) and is valid for exactly one graph file: the stamp
+at its head records the graph's path, mtime and size and the interpreter version, and any difference rebuilds it.
+
+File layout: header (`_HEADER`), stamp, marshalled dispatch nodes, marshalled (tokens, rows), marshalled entry texts.
+"""
+
+from typing import Any, Optional
+from pathlib import Path
+import marshal
+import os
+import struct
+import sys
+
+from machineconfig.utils.source_of_truth import CONFIG_ROOT
+
+
+GRAPH_INDEX_PATH = CONFIG_ROOT.joinpath("cli_graph_index.marshal")
+GRAPH_INDEX_VERSION = 2
+_MAGIC = b"MCFGIDX\0"
+_HEADER = struct.Struct("<8sIIII")  # magic, version, stamp bytes, dispatch bytes, table bytes; entries run to the end
+_NO_PARENT = -1
+_EMPTY = 0  # token id of "", used for absent fields
+
+# Row: (parent offset, token id of each of these fields, alias token ids, parameter tuples).
+_STRING_FIELDS = ("kind", "name", "help", "short_help", "doc", "app_help", "file", "module", "callable", "dispatches_to", "app_factory")
+
+
+class _Tokens:
+    def __init__(self) -> None:
+        self.values: list[str] = [""]
+        self.ids: dict[str, int] = {"": _EMPTY}
+
+    def __call__(self, value: Any) -> int:
+        text = value if isinstance(value, str) else ""
+        if text not in self.ids:
+            self.ids[text] = len(self.values)
+            self.values.append(text)
+        return self.ids[text]
+
+
+def _param_row(param: dict[str, Any], tokens: _Tokens) -> tuple[Any, ...]:
+    typer_meta = param.get("typer")
+    meta = typer_meta or {}
+    return (
+        tokens(param.get("name")),
+        tokens(param.get("type")),
+        tokens(meta.get("kind")),
+        tokens(meta.get("help")),
+        bool(param.get("required", False)),
+        tuple(tokens(flag) for flag in meta.get("long_flags") or []),
+        tuple(tokens(flag) for flag in meta.get("short_flags") or []),
+        tuple(tokens(decl) for decl in meta.get("param_decls") or []),
+        typer_meta is not None,
+    )
+
+
+def _flatten(graph: dict[str, Any]) -> tuple[list[str], list[tuple[Any, ...]], list[Optional[str]]]:
+    import json
+
+    tokens = _Tokens()
+    rows: list[tuple[Any, ...]] = []
+    entries: list[Optional[str]] = []
+    stack: list[tuple[dict[str, Any], int]] = [(graph.get("root") or {}, _NO_PARENT)]
+    while stack:
+        node, parent = stack.pop()
+        values = {**(node.get("source") or {}), **node, "app_help": (node.get("app") or {}).get("help")}
+        aliases = tuple(tokens(alias.get("name")) for alias in node.get("aliases") or [] if isinstance(alias, dict))
+        params = tuple(_param_row(param, tokens) for param in (node.get("signature") or {}).get("parameters", []))
+        rows.append((parent, *(tokens(values.get(field)) for field in _STRING_FIELDS), aliases, params))
+        entry = {key: value for key, value in node.items() if key != "children"}
+        entries.append(json.dumps(entry, ensure_ascii=False, indent=2) if node.get("kind") == "command" else None)
+        row = len(rows) - 1
+        stack.extend((child, row) for child in reversed(node.get("children") or []))
+    return tokens.values, rows, entries
+
+
+def _stamp(graph_path: Path) -> bytes:
+    stat = os.stat(graph_path)
+    return marshal.dumps((sys.version_info[:2], os.path.abspath(graph_path), stat.st_mtime_ns, stat.st_size))
+
+
+def _read_sections(graph_path: Path, count: int) -> Optional[tuple[list[Any], int]]:
+    """The first `count` sections (dispatch nodes, table) of the index if it was built from `graph_path` as it is now,
+    and the offset of the entries section. Raises OSError if the graph itself cannot be read."""
+    stamp = _stamp(graph_path)
+    try:
+        with open(GRAPH_INDEX_PATH, "rb") as f:
+            magic, version, stamp_len, dispatch_len, table_len = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC or version != GRAPH_INDEX_VERSION or f.read(stamp_len) != stamp:
+                return None
+            sections = [marshal.loads(f.read(length)) for length in (dispatch_len, table_len)[:count]]
+    except (OSError, struct.error, EOFError, ValueError, TypeError):
+        return None
+    return sections, _HEADER.size + stamp_len + dispatch_len + table_len
+
+
+def _rebuild(graph_path: Path) -> tuple[Optional[list[dict[str, Any]]], list[str], list[tuple[Any, ...]], list[Optional[str]]]:
+    """Build every section from the JSON and save them (best effort: a read-only home keeps them in memory only)."""
+    import json
+    from machineconfig.scripts.python.graph.fast_dispatch import compile_graph
+
+    stamp = _stamp(graph_path)  # taken before reading, so a graph edited meanwhile leaves the index stale, not wrong.
+    graph = json.loads(Path(graph_path).read_bytes())
+    try:
+        dispatch: Optional[list[dict[str, Any]]] = compile_graph(graph)
+    except KeyError:  # a graph from before `hidden` was recorded: the fast path must not serve it.
+        dispatch = None
+    tokens, rows, entries = _flatten(graph)
+    blobs = [marshal.dumps(dispatch), marshal.dumps((tokens, rows)), marshal.dumps(entries)]
+    try:
+        GRAPH_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = GRAPH_INDEX_PATH.with_suffix(GRAPH_INDEX_PATH.suffix + f".{os.getpid()}.tmp")
+        with tmp_path.open("wb") as f:
+            f.write(_HEADER.pack(_MAGIC, GRAPH_INDEX_VERSION, len(stamp), len(blobs[0]), len(blobs[1])))
+            f.write(stamp)
+            for blob in blobs:
+                f.write(blob)
+        tmp_path.replace(GRAPH_INDEX_PATH)
+    except OSError:
+        pass
+    return dispatch, tokens, rows, entries
+
+
+class GraphIndex:
+    """Rows of the index, in pre-order (a node always comes after its parent, children in their original order)."""
+
+    def __init__(self, tokens: list[str], rows: list[tuple[Any, ...]], entries: Optional[list[Optional[str]]], entries_offset: int) -> None:
+        self.tokens = tokens
+        self.rows = rows
+        self._entries = entries
+        self._entries_offset = entries_offset
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def parent(self, row: int) -> int:
+        """Offset of the parent row; -1 for the root."""
+        return self.rows[row][0]
+
+    def node(self, row: int) -> dict[str, Any]:
+        """The row as a JSON-shaped node without `children`: the same keys `cli_graph.json` uses, absent fields left out."""
+        t = self.tokens
+        values = dict(zip(_STRING_FIELDS, (t[i] for i in self.rows[row][1:1 + len(_STRING_FIELDS)])))
+        aliases, params = self.rows[row][-2], self.rows[row][-1]
+        node: dict[str, Any] = {key: values[key] for key in ("kind", "name", "help", "short_help", "doc") if values[key]}
+        node["source"] = {key: values[key] for key in ("file", "module", "callable", "dispatches_to", "app_factory") if values[key]}
+        if values["app_help"]:
+            node["app"] = {"help": values["app_help"]}
+        if aliases:
+            node["aliases"] = [{"name": t[alias]} for alias in aliases]
+        if params:
+            parameters: list[dict[str, Any]] = []
+            for name, type_, typer_kind, help_, required, long_flags, short_flags, param_decls, has_typer in params:
+                parameter: dict[str, Any] = {"name": t[name], "type": t[type_] or None, "required": required}
+                if has_typer:
+                    parameter["typer"] = {"kind": t[typer_kind], "help": t[help_], "long_flags": [t[i] for i in long_flags], "short_flags": [t[i] for i in short_flags], "param_decls": [t[i] for i in param_decls]}
+                parameters.append(parameter)
+            node["signature"] = {"parameters": parameters}
+        return node
+
+    def entry_text(self, row: int) -> Optional[str]:
+        """Full JSON text (indented) of a command node; None for groups. The first call reads the entries section."""
+        if self._entries is None:
+            with GRAPH_INDEX_PATH.open("rb") as f:
+                f.seek(self._entries_offset)
+                self._entries = marshal.loads(f.read())
+        return self._entries[row]
+
+
+def open_graph_index(graph_path: Path) -> GraphIndex:
+    """Table of `graph_path`, from the index when it is current, otherwise rebuilt."""
+    found = _read_sections(graph_path, count=2)
+    if found is not None:
+        (_dispatch, (tokens, rows)), entries_offset = found
+        return GraphIndex(tokens=tokens, rows=rows, entries=None, entries_offset=entries_offset)
+    _dispatch, tokens, rows, entries = _rebuild(graph_path)
+    return GraphIndex(tokens=tokens, rows=rows, entries=entries, entries_offset=0)
+
+
+def load_dispatch_nodes(graph_path: Path) -> Optional[list[dict[str, Any]]]:
+    """Dispatch nodes of `graph_path` (see `fast_dispatch.compile_graph`); None when the graph is too old to serve."""
+    found = _read_sections(graph_path, count=1)
+    if found is not None:
+        return found[0][0]
+    return _rebuild(graph_path)[0]
@@ -17,26 +17,16 @@ def tree(
 
         render_tree(show_help=show_help, show_aliases=show_aliases, max_depth=max_depth)
 
-    from machineconfig.utils.ssh_utils.abc import MACHINECONFIG_VERSION
-    from machineconfig.utils.code import get_shell_script_running_lambda_function, exit_then_run_shell_script
+    from machineconfig.utils.dependency_launcher import run_with_dependencies
 
-    if Path.home().joinpath("code", "machineconfig").exists():
-        uv_with: list[str] = ["plotly", "kaleido"]
-        uv_project_dir = str(Path.home().joinpath("code", "machineconfig"))
-    else:
-        uv_with = [MACHINECONFIG_VERSION, "plotly", "kaleido"]
-        uv_project_dir = None
-
-    shell_script, _pyfile = get_shell_script_running_lambda_function(
+    run_with_dependencies(
         lambda: func(
             show_help=show_help,
             show_aliases=show_aliases,
             max_depth=max_depth,
         ),
-        uv_with=uv_with,
-        uv_project_dir=uv_project_dir,
+        hand_over=True,
     )
-    exit_then_run_shell_script(str(shell_script), strict=False)
 
 
 def dot(
@@ -58,26 +48,16 @@ def dot(
             output_path.write_text(dot_text, encoding="utf-8")
             print(f"Wrote {output_path}")
 
-    from machineconfig.utils.ssh_utils.abc import MACHINECONFIG_VERSION
-    from machineconfig.utils.code import get_shell_script_running_lambda_function, exit_then_run_shell_script
-
-    if Path.home().joinpath("code", "machineconfig").exists():
-        uv_with: list[str] = ["plotly", "kaleido"]
-        uv_project_dir = str(Path.home().joinpath("code", "machineconfig"))
-    else:
-        uv_with = [MACHINECONFIG_VERSION]
-        uv_project_dir = None
+    from machineconfig.utils.dependency_launcher import run_with_dependencies
 
-    shell_script, _pyfile = get_shell_script_running_lambda_function(
+    run_with_dependencies(
         lambda: func(
             output_str=str(output) if output else None,
             include_help=include_help,
             max_depth=max_depth,
         ),
-        uv_with=uv_with,
-        uv_project_dir=uv_project_dir,
+        hand_over=True,
     )
-    exit_then_run_shell_script(str(shell_script), strict=False)
 
 
 def sunburst(
@@ -108,17 +88,12 @@ def sunburst(
             max_depth=max_depth,
         )
 
-    from machineconfig.utils.ssh_utils.abc import MACHINECONFIG_VERSION
-    from machineconfig.utils.code import get_shell_script_running_lambda_function, exit_then_run_shell_script
-
-    if Path.home().joinpath("code", "machineconfig").exists():
-        uv_with = ["plotly", "kaleido"]
-        uv_project_dir = str(Path.home().joinpath("code", "machineconfig"))
-    else:
-        uv_with = [MACHINECONFIG_VERSION, "plotly", "kaleido"]
-        uv_project_dir = None
+    from machineconfig.scripts.python.graph.visualize.plotly_views import IMAGE_EXTENSIONS
+    from machineconfig.utils.dependency_launcher import run_with_dependencies
 
-    shell_script, _pyfile = get_shell_script_running_lambda_function(
+    # plotly loads kaleido itself, and only to write static images.
+    extra_modules = ("kaleido",) if output is not None and output.suffix.lower() in IMAGE_EXTENSIONS else ()
+    run_with_dependencies(
         lambda: func(
             output_str=str(output) if output else None,
             max_depth=max_depth,
@@ -126,10 +101,9 @@ def sunburst(
             height=height,
             width=width,
         ),
-        uv_with=uv_with,
-        uv_project_dir=uv_project_dir,
+        extra_modules=extra_modules,
+        hand_over=True,
     )
-    exit_then_run_shell_script(str(shell_script), strict=False)
 
 
 def treemap(
@@ -160,17 +134,12 @@ def treemap(
             max_depth=max_depth,
         )
 
-    from machineconfig.utils.ssh_utils.abc import MACHINECONFIG_VERSION
-    from machineconfig.utils.code import get_shell_script_running_lambda_function, exit_then_run_shell_script
+    from machineconfig.scripts.python.graph.visualize.plotly_views import IMAGE_EXTENSIONS
+    from machineconfig.utils.dependency_launcher import run_with_dependencies
 
-    if Path.home().joinpath("code", "machineconfig").exists():
-        uv_with = ["plotly", "kaleido"]
-        uv_project_dir = str(Path.home().joinpath("code", "machineconfig"))
-    else:
-        uv_with = [MACHINECONFIG_VERSION, "plotly", "kaleido"]
-        uv_project_dir = None
-
-    shell_script, _pyfile = get_shell_script_running_lambda_function(
+    # plotly loads kaleido itself, and only to write static images.
+    extra_modules = ("kaleido",) if output is not None and output.suffix.lower() in IMAGE_EXTENSIONS else ()
+    run_with_dependencies(
         lambda: func(
             output_str=str(output) if output else None,
             max_depth=max_depth,
@@ -178,10 +147,9 @@ def treemap(
             height=height,
             width=width,
         ),
-        uv_with=uv_with,
-        uv_project_dir=uv_project_dir,
+        extra_modules=extra_modules,
+        hand_over=True,
     )
-    exit_then_run_shell_script(str(shell_script), strict=False)
 
 
 def icicle(
@@ -212,17 +180,12 @@ def icicle(
             max_depth=max_depth,
         )
 
-    from machineconfig.utils.ssh_utils.abc import MACHINECONFIG_VERSION
-    from machineconfig.utils.code import get_shell_script_running_lambda_function, exit_then_run_shell_script
-
-    if Path.home().joinpath("code", "machineconfig").exists():
-        uv_with = ["plotly", "kaleido"]
-        uv_project_dir = str(Path.home().joinpath("code", "machineconfig"))
-    else:
-        uv_with = [MACHINECONFIG_VERSION, "plotly", "kaleido"]
-        uv_project_dir = None
+    from machineconfig.scripts.python.graph.visualize.plotly_views import IMAGE_EXTENSIONS
+    from machineconfig.utils.dependency_launcher import run_with_dependencies
 
-    shell_script, _pyfile = get_shell_script_running_lambda_function(
+    # plotly loads kaleido itself, and only to write static images.
+    extra_modules = ("kaleido",) if output is not None and output.suffix.lower() in IMAGE_EXTENSIONS else ()
+    run_with_dependencies(
         lambda: func(
             output_str=str(output) if output else None,
             max_depth=max_depth,
@@ -230,36 +193,18 @@ def icicle(
             height=height,
             width=width,
         ),
-        uv_with=uv_with,
-        uv_project_dir=uv_project_dir,
+        extra_modules=extra_modules,
+        hand_over=True,
     )
-    exit_then_run_shell_script(str(shell_script), strict=False)
 
 
 def navigate():
     """📚 NAVIGATE command structure with TUI"""
-    from machineconfig.utils.ssh_utils.abc import MACHINECONFIG_VERSION
-    # import machineconfig.scripts.python.graph.visualize.helpers_navigator as navigator
-    # path = Path(navigator.__file__).resolve().parent.joinpath("devops_navigator.py")
-    # from machineconfig.utils.code import exit_then_run_shell_script
-    # if Path.home().joinpath("code", "machineconfig").exists():
-    #     executable = f"""--project "{str(Path.home().joinpath("code/machineconfig"))}" --with textual"""
-    # else:
-    #     executable = f"""--with "{MACHINECONFIG_VERSION},textual" """
-    # exit_then_run_shell_script(f"""uv run {executable} {path}""")
     def func():
         from machineconfig.scripts.python.graph.visualize.helpers_navigator.devops_navigator import main as main_devops_navigator
         main_devops_navigator()
-    from machineconfig.utils.code import get_shell_script_running_lambda_function, exit_then_run_shell_script
-    if Path.home().joinpath("code", "machineconfig").exists():
-        uv_with = ["textual"]
-        uv_project_dir = str(Path.home().joinpath("code/machineconfig"))
-    else:
-        uv_with = [MACHINECONFIG_VERSION, "textual"]
-        uv_project_dir = None
-    shell_script, _pyfile = get_shell_script_running_lambda_function(lambda: func(),
-            uv_with=uv_with, uv_project_dir=uv_project_dir)
-    exit_then_run_shell_script(str(shell_script), strict=False)
+    from machineconfig.utils.dependency_launcher import run_with_dependencies
+    run_with_dependencies(lambda: func(), hand_over=True)
 
 
 def search(
@@ -267,54 +212,47 @@ def search(
 ) -> None:
     """🔎 Search cli_graph.json entries and print the full selected entry."""
     def func(graph_path_str: str | None) -> None:
-        import json
         from rich.console import Console
         from rich.panel import Panel
         from rich.syntax import Syntax
+        from machineconfig.scripts.python.graph.graph_index import open_graph_index
         from machineconfig.scripts.python.graph.visualize.graph_paths import DEFAULT_GRAPH_PATH
         from machineconfig.utils.options_utils.tv_options import choose_from_dict_with_preview
         from machineconfig.utils.installer_utils.installer_cli import install_if_missing
         install_if_missing(which="tv")
         graph_file = Path(graph_path_str) if graph_path_str else DEFAULT_GRAPH_PATH
-        graph_data = json.loads(graph_file.read_text(encoding="utf-8"))
-        root = graph_data.get("root")
-        if not isinstance(root, dict):
-            raise ValueError(f"Invalid graph root in {graph_file}")
-
-        entries: list[tuple[str, str, dict[str, object]]] = []
-
-        def walk(node: dict[str, object], parent_tokens: list[str]) -> None:
-            node_name = node.get("name")
-            node_name_str = node_name if isinstance(node_name, str) else ""
-            tokens = parent_tokens + ([node_name_str] if node_name_str else [])
-            source = node.get("source")
-            if node.get("kind") == "command" and isinstance(source, dict):
-                source_file = source.get("file")
-                if isinstance(source_file, str) and source_file.endswith(".py"):
-                    command_path = " ".join(tokens).strip() or source_file
-                    entries.append((source_file, command_path, node))
-            children = node.get("children")
-            if isinstance(children, list):
-                for child in children:
-                    if isinstance(child, dict):
-                        walk(child, tokens)
-
-        walk(root, [])
+        index = open_graph_index(graph_file)
+
+        # (source file, command path, row); rows come parents-first, so a row's tokens extend its parent's.
+        entries: list[tuple[str, str, int]] = []
+        tokens_by_row: list[list[str]] = []
+        for row in range(len(index)):
+            node = index.node(row)
+            parent = index.parent(row)
+            node_name = node.get("name", "")
+            tokens = (tokens_by_row[parent] if parent >= 0 else []) + ([node_name] if node_name else [])
+            tokens_by_row.append(tokens)
+            source_file = node["source"].get("file", "")
+            if node.get("kind") == "command" and source_file.endswith(".py"):
+                command_path = " ".join(tokens).strip() or source_file
+                entries.append((source_file, command_path, row))
         if not entries:
             raise ValueError(f"No .py command entries found in {graph_file}")
 
         entries.sort(key=lambda item: (item[0], item[1]))
         entry_preview_mapping: dict[str, str] = {}
-        entry_lookup: dict[str, tuple[str, str, dict[str, object]]] = {}
-        for source_file, command_path, entry in entries:
+        entry_lookup: dict[str, tuple[str, str, str]] = {}
+        for source_file, command_path, row in entries:
+            entry = index.node(row)
+            entry_text = index.entry_text(row) or "{}"
             summary = str(entry.get("short_help") or entry.get("help") or entry.get("doc") or "").strip()
             display_command = command_path if command_path else str(entry.get("name", "command"))
             option_key = f"{display_command}    [{source_file}]"
-            entry_lookup[option_key] = (source_file, display_command, entry)
+            entry_lookup[option_key] = (source_file, display_command, entry_text)
             if summary:
-                entry_preview_mapping[option_key] = f"Source: {source_file}\nSummary: {summary}\n\n" + json.dumps(entry, ensure_ascii=False, indent=2)
+                entry_preview_mapping[option_key] = f"Source: {source_file}\nSummary: {summary}\n\n" + entry_text
             else:
-                entry_preview_mapping[option_key] = f"Source: {source_file}\n\n" + json.dumps(entry, ensure_ascii=False, indent=2)
+                entry_preview_mapping[option_key] = f"Source: {source_file}\n\n" + entry_text
 
         selected_entry_key = choose_from_dict_with_preview(
             options_to_preview_mapping=entry_preview_mapping,
@@ -334,28 +272,19 @@ def search(
             )
             console.print(
                 Panel(
-                    Syntax(json.dumps(selected_entry, ensure_ascii=False, indent=2), "json", line_numbers=True),
+                    Syntax(selected_entry, "json", line_numbers=True),
                     title="📦 Full cli_graph.json Entry",
                     border_style="cyan",
                 )
             )
             
 
-    from machineconfig.utils.ssh_utils.abc import MACHINECONFIG_VERSION
-    from machineconfig.utils.code import get_shell_script_running_lambda_function, exit_then_run_shell_script
+    from machineconfig.utils.dependency_launcher import run_with_dependencies
 
-    if Path.home().joinpath("code", "machineconfig").exists():
-        uv_with = []
-        uv_project_dir = str(Path.home().joinpath("code/machineconfig"))
-    else:
-        uv_with = [MACHINECONFIG_VERSION]
-        uv_project_dir = None
-    shell_script, _pyfile = get_shell_script_running_lambda_function(
+    run_with_dependencies(
         lambda: func(graph_path_str=str(graph_path) if graph_path else None),
-        uv_with=uv_with,
-        uv_project_dir=uv_project_dir,
+        hand_over=True,
     )
-    exit_then_run_shell_script(str(shell_script), strict=False)
 
 
 def get_app() -> typer.Typer:
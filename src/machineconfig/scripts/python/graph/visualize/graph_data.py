@@ -5,6 +5,7 @@ import json
 from pathlib import Path
 from typing import Any, Iterator
 
+from machineconfig.scripts.python.graph.graph_index import open_graph_index
 from machineconfig.scripts.python.graph.visualize.graph_paths import DEFAULT_GRAPH_PATH
 
 
@@ -32,12 +33,28 @@ def load_cli_graph(path: Path | None = None) -> dict[str, Any]:
 
 
 def build_graph(path: Path | None = None) -> GraphNode:
-    data = load_cli_graph(path)
-    root = data.get("root") or {}
-    root_name = root.get("name") or "root"
-    node = _build_node(root, parent_tokens=[], depth=0, fallback_name=root_name)
-    _compute_leaf_counts(node)
-    return node
+    index = open_graph_index(path or DEFAULT_GRAPH_PATH)
+    built: list[GraphNode] = []
+    tokens_by_row: list[list[str]] = []
+    for row in range(len(index)):
+        node = index.node(row)
+        parent = index.parent(row)
+        if parent < 0:
+            parent_tokens: list[str] = []
+            depth = 0
+            fallback_name = node.get("name") or "root"
+        else:
+            parent_tokens = tokens_by_row[parent]
+            depth = built[parent].depth + 1
+            fallback_name = f"node-{depth}"
+        graph_node = _build_node(node, parent_tokens=parent_tokens, depth=depth, fallback_name=fallback_name)
+        built.append(graph_node)
+        tokens_by_row.append(parent_tokens + ([graph_node.name] if graph_node.name else []))
+        if parent >= 0:
+            built[parent].children.append(graph_node)
+    root = built[0]
+    _compute_leaf_counts(root)
+    return root
 
 
 def iter_nodes(root: GraphNode) -> Iterator[tuple[GraphNode, GraphNode | None]]:
@@ -56,6 +73,7 @@ def _build_node(
     depth: int,
     fallback_name: str,
 ) -> GraphNode:
+    """A node without its children; `build_graph` links rows to their parents."""
     kind = node.get("kind") or "command"
     name = node.get("name") or fallback_name
     tokens = parent_tokens + ([name] if name else [])
@@ -66,12 +84,6 @@ def _build_node(
     long_description = _node_long_description(node, description)
     aliases = _node_aliases(node)
 
-    children_data = node.get("children") or []
-    children = [
-        _build_node(child, parent_tokens=tokens, depth=depth + 1, fallback_name=f"node-{depth + 1}")
-        for child in children_data
-    ]
-
     return GraphNode(
         id=node_id,
         name=name,
@@ -81,7 +93,6 @@ def _build_node(
         long_description=long_description,
         aliases=aliases,
         depth=depth,
-        children=children,
     )
 
 
@@ -11,6 +11,7 @@ from machineconfig.scripts.python.graph.visualize.helpers_navigator.data_models
     CommandInfo,
     ArgumentInfo,
 )
+from machineconfig.scripts.python.graph.graph_index import open_graph_index
 from machineconfig.scripts.python.graph.visualize.graph_paths import DEFAULT_GRAPH_PATH
 
 
@@ -28,6 +29,28 @@ def load_cli_graph(path: Path | None = None) -> dict[str, Any]:
         return json.load(handle)
 
 
+def load_command_nodes(path: Path | None = None, *, include_root: bool = False) -> list[CommandNode]:
+    """Same nodes as `build_command_nodes(load_cli_graph(path))`, read from the graph's binary index."""
+    index = open_graph_index(path or DEFAULT_GRAPH_PATH)
+    built: list[CommandNode] = []
+    tokens_by_row: list[list[str]] = []
+    for row in range(len(index)):
+        node = index.node(row)
+        parent = index.parent(row)
+        if parent < 0:
+            root_name = node.get("name") if include_root else None
+            tokens_by_row.append([root_name] if root_name else [])
+            built.append(CommandNode(info=CommandInfo(name=root_name or "", description="", command=""), children=[]))
+            continue
+        parent_tokens = tokens_by_row[parent]
+        parent_name = built[parent].info.name if parent > 0 else (parent_tokens[0] if parent_tokens else None)
+        command_node = CommandNode(info=_command_info(node, parent_tokens, parent_name), children=[])
+        built.append(command_node)
+        tokens_by_row.append(parent_tokens + ([command_node.info.name] if command_node.info.name else []))
+        built[parent].children.append(command_node)
+    return built[0].children if built else []
+
+
 def build_command_nodes(graph: dict[str, Any], *, include_root: bool = False) -> list[CommandNode]:
     """Build command nodes from the CLI graph."""
     root = graph.get("root", {})
@@ -38,6 +61,16 @@ def build_command_nodes(graph: dict[str, Any], *, include_root: bool = False) ->
 
 
 def _build_node(node: dict[str, Any], parent_tokens: list[str], parent_name: str | None) -> CommandNode:
+    info = _command_info(node, parent_tokens, parent_name)
+    tokens = parent_tokens + ([info.name] if info.name else [])
+    children = [
+        _build_node(child, tokens, parent_name=info.name)
+        for child in node.get("children", [])
+    ]
+    return CommandNode(info=info, children=children)
+
+
+def _command_info(node: dict[str, Any], parent_tokens: list[str], parent_name: str | None) -> CommandInfo:
     kind = node.get("kind", "command")
     name = node.get("name", "")
     tokens = parent_tokens + ([name] if name else [])
@@ -49,7 +82,7 @@ def _build_node(node: dict[str, Any], parent_tokens: list[str], parent_name: str
     arguments = _parse_signature(node.get("signature"))
     help_text = _build_usage(command, arguments) if (command and not is_group) else ""
 
-    info = CommandInfo(
+    return CommandInfo(
         name=name,
         description=description,
         command=command,
@@ -59,14 +92,9 @@ def _build_node(node: dict[str, Any], parent_tokens: list[str], parent_name: str
         module_path=module_path,
         arguments=arguments,
         long_description=long_description,
+        aliases=[alias["name"] for alias in node.get("aliases") or [] if isinstance(alias, dict) and alias.get("name")],
     )
 
-    children = [
-        _build_node(child, tokens, parent_name=name)
-        for child in node.get("children", [])
-    ]
-    return CommandNode(info=info, children=children)
-
 
 def _node_description(node: dict[str, Any]) -> str:
     if node.get("kind") == "group":
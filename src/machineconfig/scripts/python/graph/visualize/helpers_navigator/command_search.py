@@ -0,0 +1,179 @@
+"""
+Incremental fuzzy search over the navigator's commands.
+
+Built once when the tree is mounted: a prefix index maps every prefix of every word of a command's name, aliases,
+path and help to the commands it starts a word of (with the best score it earns there), and a character index maps
+each character to the commands containing it. Each whitespace-separated term of a query must match every command
+returned, by word prefix, substring or, failing both, as an in-order subsequence of the command path (fuzzy); scores
+add up over terms.
+A query that extends the previous one only re-scores the previous matches.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Generic, Optional, TypeVar
+import re
+
+from machineconfig.scripts.python.graph.visualize.helpers_navigator.data_models import CommandInfo
+
+
+T = TypeVar("T")
+
+# Score of a term by where it matches; a term takes the best one.
+NAME_EXACT = 100.0
+ALIAS_EXACT = 90.0
+NAME_PREFIX = 70.0
+ALIAS_PREFIX = 60.0
+PATH_WORD_PREFIX = 50.0
+PATH_SUBSTRING = 35.0
+HELP_WORD_PREFIX = 25.0
+HELP_SUBSTRING = 15.0
+PATH_FUZZY = 10.0  # scaled by how tightly the characters cluster; help text is too long for subsequences to mean much
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+@dataclass(frozen=True)
+class SearchHit(Generic[T]):
+    item: T
+    score: float
+
+
+@dataclass(frozen=True)
+class _Doc:
+    path: str  # command path, lowercased
+    help: str  # description and long description, lowercased
+    depth: int
+
+
+def _fuzzy_span(term: str, text: str) -> Optional[int]:
+    """Length of the shortest-start greedy window of `text` holding `term`'s characters in order; None if absent."""
+    start = text.find(term[0])
+    if start < 0:
+        return None
+    position = start
+    for char in term[1:]:
+        position = text.find(char, position + 1)
+        if position < 0:
+            return None
+    return position - start + 1
+
+
+class CommandSearchIndex(Generic[T]):
+    """Ranks `items` (e.g. tree nodes) by how well their `CommandInfo` matches a query."""
+
+    def __init__(self, entries: list[tuple[CommandInfo, T]]) -> None:
+        self._items = [item for _, item in entries]
+        self._docs: list[_Doc] = []
+        self._prefixes: dict[str, dict[int, float]] = {}
+        self._chars: dict[str, set[int]] = {}
+        for doc_id, (info, _) in enumerate(entries):
+            help_text = f"{info.description} {info.long_description}".lower()
+            self._docs.append(_Doc(path=info.command.lower(), help=help_text, depth=len(info.command.split())))
+            self._add_prefixes(doc_id, info.name.lower(), NAME_EXACT, NAME_PREFIX)
+            for alias in info.aliases:
+                self._add_prefixes(doc_id, alias.lower(), ALIAS_EXACT, ALIAS_PREFIX)
+            for word in _WORD_RE.findall(info.command.lower()):
+                self._add_prefixes(doc_id, word, PATH_WORD_PREFIX, PATH_WORD_PREFIX)
+            for word in _WORD_RE.findall(help_text):
+                self._add_prefixes(doc_id, word, HELP_WORD_PREFIX, HELP_WORD_PREFIX)
+            for char in set(info.command.lower() + help_text + "".join(info.aliases).lower()):
+                self._chars.setdefault(char, set()).add(doc_id)
+        self._all = set(range(len(self._docs)))
+        self._last_query = ""
+        self._last_matches = self._all
+
+    def _add_prefixes(self, doc_id: int, word: str, exact_score: float, prefix_score: float) -> None:
+        for end in range(1, len(word) + 1):
+            scores = self._prefixes.setdefault(word[:end], {})
+            score = exact_score if end == len(word) else prefix_score
+            if score > scores.get(doc_id, 0.0):
+                scores[doc_id] = score
+
+    def _term_score(self, doc_id: int, term: str) -> Optional[float]:
+        doc = self._docs[doc_id]
+        score = self._prefixes.get(term, {}).get(doc_id, 0.0)
+        if score < PATH_SUBSTRING and term in doc.path:
+            score = PATH_SUBSTRING
+        if score < HELP_SUBSTRING and term in doc.help:
+            score = HELP_SUBSTRING
+        if score > 0:
+            return score
+        span = _fuzzy_span(term, doc.path)
+        return None if span is None else PATH_FUZZY * len(term) / span
+
+    def search(self, query: str) -> list[SearchHit[T]]:
+        """Matches of `query`, best first (shallower commands first among equal scores); empty for a blank query."""
+        normalized = " ".join(query.lower().split())
+        terms = normalized.split(" ") if normalized else []
+        if len(terms) == 0:
+            self._last_query, self._last_matches = "", self._all
+            return []
+        # Whatever a term matches, its prefixes match in the same field, so extending the query only drops matches.
+        candidates = self._last_matches if self._last_query and normalized.startswith(self._last_query) else self._all
+        for char in set(normalized.replace(" ", "")):
+            candidates = candidates & self._chars.get(char, set())
+        scored: list[tuple[float, int]] = []
+        for doc_id in candidates:
+            total = 0.0
+            for term in terms:
+                score = self._term_score(doc_id, term)
+                if score is None:
+                    break
+                total += score
+            else:
+                scored.append((total, doc_id))
+        self._last_query, self._last_matches = normalized, {doc_id for _, doc_id in scored}
+        scored.sort(key=lambda pair: (-pair[0], self._docs[pair[1]].depth, pair[1]))
+        return [SearchHit(item=self._items[doc_id], score=score) for score, doc_id in scored]
+
+
+def benchmark_keystrokes(query: str = "repos sync", rounds: int = 3) -> None:
+    """Type `query` into the navigator's search box under textual's pilot and report per-keystroke latency:
+    the index lookup alone, and the whole round trip until the screen has been updated."""
+    import asyncio
+    import statistics
+    import time
+    from rich.console import Console
+    from rich.table import Table
+    from machineconfig.scripts.python.graph.visualize.helpers_navigator.command_tree import CommandTree
+    from machineconfig.scripts.python.graph.visualize.helpers_navigator.main_app import CommandNavigatorApp
+
+    lookups: list[float] = []
+    round_trips: list[float] = []
+
+    async def run() -> None:
+        app = CommandNavigatorApp()
+        async with app.run_test(size=(160, 50)) as pilot:
+            index = app.query_one(CommandTree).search_index
+            search = index.search
+
+            def timed_search(text: str) -> list[SearchHit[Any]]:
+                started = time.perf_counter()
+                hits = search(text)
+                lookups.append(time.perf_counter() - started)
+                return hits
+
+            index.search = timed_search  # type: ignore[method-assign]
+            for _ in range(rounds):
+                await pilot.press("/")
+                for char in query:
+                    started = time.perf_counter()
+                    await pilot.press("space" if char == " " else char)
+                    await pilot.pause()
+                    round_trips.append(time.perf_counter() - started)
+                for _ in query:
+                    await pilot.press("backspace")
+                await pilot.pause()
+
+    asyncio.run(run())
+    table = Table(title=f"⌨️ Navigator search: '{query}' x {rounds}", show_header=True, header_style="bold cyan")
+    for column in ("Measure", "Samples", "Median ms", "p90 ms", "Max ms"):
+        table.add_column(column, justify="right")
+    for label, samples in (("index lookup", lookups), ("keystroke round trip", round_trips)):
+        ordered = sorted(samples)
+        table.add_row(label, str(len(ordered)), f"{statistics.median(ordered) * 1000:.2f}", f"{ordered[max(0, int(len(ordered) * 0.9) - 1)] * 1000:.2f}", f"{ordered[-1] * 1000:.2f}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    benchmark_keystrokes()
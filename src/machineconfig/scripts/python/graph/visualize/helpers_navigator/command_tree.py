@@ -3,12 +3,13 @@ Command tree widget for displaying command hierarchy.
 """
 
 from textual.widgets import Tree
+from textual.widgets.tree import TreeNode
 
 from machineconfig.scripts.python.graph.visualize.helpers_navigator.cli_graph_loader import (
     CommandNode,
-    build_command_nodes,
-    load_cli_graph,
+    load_command_nodes,
 )
+from machineconfig.scripts.python.graph.visualize.helpers_navigator.command_search import CommandSearchIndex, SearchHit
 from machineconfig.scripts.python.graph.visualize.helpers_navigator.data_models import CommandInfo
 
 
@@ -19,13 +20,15 @@ class CommandTree(Tree[CommandInfo]):
         """Build the command tree when mounted."""
         self.show_root = False
         self.guide_depth = 2
+        self._search_expanded: set[TreeNode[CommandInfo]] = set()
+        self._search_entries: list[tuple[CommandInfo, TreeNode[CommandInfo]]] = []
         self._build_command_tree()
+        self.search_index = CommandSearchIndex(self._search_entries)
 
     def _build_command_tree(self) -> None:
         """Build the hierarchical command structure from the CLI graph."""
         try:
-            graph = load_cli_graph()
-            nodes = build_command_nodes(graph)
+            nodes = load_command_nodes()
         except Exception as exc:
             self.root.add(f"Error loading CLI graph: {exc}", data=None)
             return
@@ -36,6 +39,7 @@ class CommandTree(Tree[CommandInfo]):
     def _add_command_node(self, parent, node: CommandNode) -> None:  # type: ignore
         label = self._format_label(node.info)
         tree_node = parent.add(label, data=node.info)
+        self._search_entries.append((node.info, tree_node))
         for child in node.children:
             self._add_command_node(tree_node, child)
 
@@ -43,3 +47,29 @@ class CommandTree(Tree[CommandInfo]):
         if info.description and info.description != info.name:
             return f"{info.name} - {info.description}"
         return info.name
+
+    def show_matches(self, hits: list[SearchHit[TreeNode[CommandInfo]]]) -> None:
+        """Expand the ancestors of every hit, fold what the previous search opened, and put the cursor on the best hit."""
+        needed: set[TreeNode[CommandInfo]] = set()
+        for hit in hits:
+            parent = hit.item.parent
+            while parent is not None and parent is not self.root and parent not in needed:
+                needed.add(parent)
+                parent = parent.parent
+        with self.app.batch_update():
+            for node in self._search_expanded - needed:
+                node.collapse()
+            for node in needed - self._search_expanded:
+                node.expand()
+            self._search_expanded = needed
+            if hits:
+                self.move_cursor(hits[0].item)
+
+    def clear_matches(self) -> None:
+        """Fold what searching opened and show the top-level groups again."""
+        with self.app.batch_update():
+            for node in self._search_expanded:
+                node.collapse()
+            self._search_expanded = set()
+            for node in self.root.children:
+                node.expand()
@@ -33,3 +33,4 @@ class CommandInfo:
     module_path: str = ""
     arguments: Optional[list[ArgumentInfo]] = None
     long_description: str = ""
+    aliases: list[str] = field(default_factory=list)
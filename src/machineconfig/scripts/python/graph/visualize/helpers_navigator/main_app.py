@@ -144,37 +144,15 @@ class CommandNavigatorApp(App[None]):
         if event.input.id != "search-input":
             return
 
-        search_term = event.value.lower()
         tree = self.query_one(CommandTree)
-
-        if not search_term:
-            # Show all nodes - expand all root children
-            for node in tree.root.children:
-                node.expand()
+        if not event.value.strip():
+            tree.search_index.search("")
+            tree.clear_matches()
+            self.sub_title = "Navigate and explore all available commands"
             return
-
-        # Filter nodes based on search term
-        def filter_tree(node):  # type: ignore
-            if node.data and not node.data.is_group:
-                match = (search_term in node.data.name.lower() or
-                        search_term in node.data.description.lower() or
-                        search_term in node.data.command.lower())
-                return match
-            return False
-
-        # Expand parents of matching nodes by walking through all nodes
-        def walk_nodes(node):  # type: ignore
-            """Recursively walk through tree nodes."""
-            yield node
-            for child in node.children:
-                yield from walk_nodes(child)
-
-        for node in walk_nodes(tree.root):
-            if filter_tree(node):
-                parent = node.parent
-                while parent and parent != tree.root:
-                    parent.expand()
-                    parent = parent.parent  # type: ignore
+        hits = tree.search_index.search(event.value)
+        tree.show_matches(hits)
+        self.sub_title = f"{len(hits)} matching commands" if hits else f"No commands match '{event.value.strip()}'"
 
     def action_copy_command(self) -> None:
         """Copy the selected command to clipboard."""
@@ -0,0 +1,166 @@
+"""In-process, concurrent executor for `devops data sync` backup / retrieve items."""
+
+from typing import Literal, Optional
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import json
+import os
+import subprocess
+import threading
+import time
+
+from machineconfig.utils.source_of_truth import CONFIG_ROOT
+
+
+BACKUP_REPORTS_DIR = CONFIG_ROOT.joinpath("backup_reports")
+DEFAULT_BACKUP_WORKERS = 4
+DIRECTION = Literal["BACKUP", "RETRIEVE"]
+
+
+@dataclass(frozen=True)
+class BackupJob:
+    display_name: str
+    group_name: str
+    path_local: str
+    path_cloud: str  # explicit remote path, or the deduce symbol `^`.
+    zip: bool
+    encrypt: bool
+    rel2home: bool
+    overwrite: bool
+    incremental: bool
+
+
+@dataclass
+class BackupItemReport:
+    name: str
+    direction: str
+    status: Literal["ok", "failed"]
+    local_path: str
+    remote_path: str
+    bytes: int
+    seconds: float
+    error: Optional[str]  # for incremental jobs `bytes` counts only the chunks actually transferred.
+
+
+def _local_size(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    if path.is_dir():
+        return sum(item.stat().st_size for item in path.rglob("*") if item.is_file())
+    return 0
+
+
+def resolve_remote_path(job: BackupJob, root: str) -> str:
+    """Same resolution `cloud copy` applies to a backup line: `^` is deduced from the local path, then `.zip`/`.enc` are appended."""
+    from machineconfig.scripts.python.helpers.helpers_cloud.helpers2 import ES
+    from machineconfig.utils.path_extended import PathExtended
+
+    if job.path_cloud == ES:
+        local_obj = Path(job.path_local).expanduser().absolute()
+        remote = PathExtended(local_obj).get_remote_path(os_specific=False, root=root, rel2home=job.rel2home, strict=False).as_posix()
+    else:
+        remote = job.path_cloud
+    if job.incremental:  # content-addressed store: the entry gets a `.cas` manifest folder instead of one .zip/.enc blob.
+        return remote
+    if job.zip and ".zip" not in remote:
+        remote += ".zip"
+    if job.encrypt and ".enc" not in remote:
+        remote += ".enc"
+    return remote
+
+
+def prepare_rclone(cloud: str) -> None:
+    """Resolve rclone's config file and check `cloud` once, so every transfer below reuses them instead of re-discovering."""
+    if os.environ.get("RCLONE_CONFIG") is None:
+        completed = subprocess.run(["rclone", "config", "file"], capture_output=True, text=True, check=False)
+        candidates = [line.strip() for line in completed.stdout.splitlines() if line.strip().endswith(".conf")]
+        if completed.returncode == 0 and len(candidates) > 0:
+            os.environ["RCLONE_CONFIG"] = candidates[-1]
+    completed = subprocess.run(["rclone", "listremotes"], capture_output=True, text=True, check=False)
+    if completed.returncode != 0:
+        raise RuntimeError(f"💥 rclone is not usable: {completed.stderr.strip()}")
+    remotes = {line.strip().rstrip(":") for line in completed.stdout.splitlines() if line.strip()}
+    if cloud not in remotes:
+        raise RuntimeError(f"💥 Cloud `{cloud}` is not configured in rclone. Known remotes: {', '.join(sorted(remotes)) or 'none'}")
+
+
+def _run_job(job: BackupJob, direction: DIRECTION, cloud: str, root: str) -> BackupItemReport:
+    from machineconfig.utils.path_extended import PathExtended
+
+    local_obj = Path(job.path_local).expanduser().absolute()
+    remote = resolve_remote_path(job, root=root)
+    start = time.perf_counter()
+    try:
+        if job.incremental:
+            from machineconfig.scripts.python.helpers.helpers_devops.backup_incremental import CAS_CHUNKS_DIRNAME, backup_incremental, restore_incremental
+            chunks_root = f"{root}/{CAS_CHUNKS_DIRNAME}"
+            run_incremental = backup_incremental if direction == "BACKUP" else restore_incremental
+            outcome = run_incremental(local_path=local_obj, cloud=cloud, entry_remote=remote, chunks_root=chunks_root, compress=job.zip, encrypt=job.encrypt)
+            size = outcome.bytes_transferred
+        elif direction == "BACKUP":
+            size = _local_size(local_obj)
+            PathExtended(local_obj).to_cloud(cloud=cloud, remotepath=remote, zip=job.zip, encrypt=job.encrypt, rel2home=job.rel2home, root=root, strict=False, verbose=False, show_progress=False)
+        else:
+            res = PathExtended(local_obj).from_cloud(
+                cloud=cloud, remotepath=remote, unzip=job.zip, decrypt=job.encrypt, rel2home=job.rel2home, root=root, strict=False, overwrite=job.overwrite, verbose=False, show_progress=False
+            )
+            if res is None:
+                raise RuntimeError(f"download of {cloud}:{remote} failed")
+            size = _local_size(local_obj)
+    except Exception as err:  # one bad item must not abort the rest of the batch; it is reported instead.
+        return BackupItemReport(name=job.display_name, direction=direction, status="failed", local_path=str(local_obj), remote_path=f"{cloud}:{remote}", bytes=0, seconds=time.perf_counter() - start, error=str(err))
+    return BackupItemReport(name=job.display_name, direction=direction, status="ok", local_path=str(local_obj), remote_path=f"{cloud}:{remote}", bytes=size, seconds=time.perf_counter() - start, error=None)
+
+
+def write_report(reports: list[BackupItemReport], direction: DIRECTION, cloud: str, wall_seconds: float) -> Path:
+    BACKUP_REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+    path = BACKUP_REPORTS_DIR.joinpath(f"{direction.lower()}_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.json")
+    payload = {"direction": direction, "cloud": cloud, "wall_seconds": wall_seconds, "items": [asdict(item) for item in reports]}
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    return path
+
+
+def execute_backup_jobs(jobs: list[BackupJob], direction: DIRECTION, cloud: str, root: str, max_workers: int) -> list[BackupItemReport]:
+    """Run all jobs through a bounded pool inside this process, with one combined progress view and a JSON timing/bytes report."""
+    from rich.console import Console
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+    from rich.table import Table
+
+    console = Console()
+    prepare_rclone(cloud=cloud)
+    reports: list[BackupItemReport] = []
+    reports_lock = threading.Lock()
+    start = time.perf_counter()
+    with Progress(SpinnerColumn(), TextColumn("{task.description}"), BarColumn(), TextColumn("{task.completed}/{task.total}"), TimeElapsedColumn(), console=console) as progress:
+        overall = progress.add_task(f"[bold blue]{direction} via {cloud} ({max_workers} workers)", total=len(jobs))
+        item_tasks = {job.display_name: progress.add_task(f"⏳ {job.display_name}", total=1, start=False) for job in jobs}
+
+        def run_one(job: BackupJob) -> None:
+            task_id = item_tasks[job.display_name]
+            progress.start_task(task_id)
+            progress.update(task_id, description=f"🚚 {job.display_name}")
+            report = _run_job(job, direction=direction, cloud=cloud, root=root)
+            icon = "✅" if report.status == "ok" else "❌"
+            progress.update(task_id, description=f"{icon} {job.display_name} ({report.bytes / 2**20:.1f} MB, {report.seconds:.1f}s)", completed=1)
+            progress.advance(overall)
+            with reports_lock:
+                reports.append(report)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="backup") as pool:
+            list(pool.map(run_one, jobs))
+    wall_seconds = time.perf_counter() - start
+    order = {job.display_name: index for index, job in enumerate(jobs)}
+    reports.sort(key=lambda item: order[item.name])
+
+    table = Table(title=f"{direction} report")
+    for column in ("Item", "Status", "MB", "Seconds", "Remote"):
+        table.add_column(column)
+    for item in reports:
+        table.add_row(item.name, "✅" if item.status == "ok" else f"❌ {item.error}", f"{item.bytes / 2**20:.1f}", f"{item.seconds:.1f}", item.remote_path)
+    console.print(table)
+    report_path = write_report(reports, direction=direction, cloud=cloud, wall_seconds=wall_seconds)
+    total_seconds = sum(item.seconds for item in reports)
+    console.print(f"⏱️  {len(reports)} items in {wall_seconds:.1f}s wall ({total_seconds:.1f}s of transfer work). Report: {report_path}")
+    return reports
@@ -0,0 +1,354 @@
+"""Incremental, content-addressed backups: content-defined chunks, a hash manifest per entry, and manifest-driven restore.
+
+Remote layout (relative to the rclone remote):
+    <root>/.cas_chunks/<id[:2]>/<id>           sealed (optionally zlib'd, optionally encrypted) chunk, shared by every entry
+    <entry remote path>.cas/manifest-latest    sealed manifest of the newest snapshot
+    <entry remote path>.cas/manifest-<stamp>   sealed manifest history
+"""
+
+from typing import Any, Iterator, Optional
+from pathlib import Path
+from dataclasses import dataclass, asdict
+from datetime import datetime
+import hashlib
+import hmac
+import io
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import zlib
+
+from machineconfig.utils.source_of_truth import CONFIG_ROOT
+
+
+MANIFESTS_DIR = CONFIG_ROOT.joinpath("backup_manifests")
+CAS_CHUNKS_DIRNAME = ".cas_chunks"
+CAS_ENTRY_SUFFIX = ".cas"
+MANIFEST_VERSION = 1
+MIN_CHUNK_BYTES = 256 * 1024
+MAX_CHUNK_BYTES = 4 * 1024 * 1024
+_AVG_CHUNK_BITS = 20  # ~1 MiB average chunk
+_CUT_MASK = ((1 << _AVG_CHUNK_BITS) - 1) << (64 - _AVG_CHUNK_BITS)  # high bits: they depend on the longest window of recent bytes.
+_U64 = 0xFFFFFFFFFFFFFFFF
+# fixed, machine-independent gear table; boundaries (and hence chunk ids) must agree on every machine and every run.
+_GEAR = tuple(int.from_bytes(hashlib.sha256(b"machineconfig-gear" + bytes([index])).digest()[:8], "big") for index in range(256))
+RCLONE_TRANSFERS = 16
+_SCAN_BLOCK_BYTES = 64 * 1024  # `_find_cut` hashes this much at a time: stays in cache, and an early boundary doesn't pay for the whole buffer.
+STAGING_FLUSH_BYTES = 512 * 1024 * 1024  # new chunks are pushed in batches, so local scratch space stays bounded.
+
+_INDEX_LOCK = threading.Lock()  # entries of one batch run concurrently and share the chunk index file.
+
+
+@dataclass
+class FileRecord:
+    path: str  # posix, relative to the entry root ("" when the entry itself is a file)
+    size: int
+    mtime_ns: int
+    mode: int
+    chunks: list[str]
+
+
+@dataclass
+class IncrementalReport:
+    files: int
+    changed_files: int
+    chunks_total: int
+    chunks_transferred: int
+    bytes_transferred: int
+
+
+def _find_cut_python(buffer: bytes | bytearray, limit: int) -> int:
+    """Reference implementation of `_find_cut`, used when numpy is unavailable. About 4 MB/s (vs ~100 MB/s vectorised),
+    i.e. minutes per changed GB: install numpy before backing up large trees incrementally."""
+    gear, mask = _GEAR, _CUT_MASK
+    fingerprint = 0
+    for index in range(MIN_CHUNK_BYTES, limit):
+        fingerprint = ((fingerprint << 1) + gear[buffer[index]]) & _U64
+        if not fingerprint & mask:
+            return index + 1
+    return limit
+
+
+def _find_cut(buffer: bytes | bytearray, limit: int) -> int:
+    """Gear-hash content-defined boundary in buffer[:limit]; scanning starts at MIN_CHUNK_BYTES (FastCDC-style skip).
+
+    The fingerprint at i is sum(gear[b[i - j]] << j) over the bytes since MIN_CHUNK_BYTES (terms with j >= 64 vanish mod
+    2**64), so it is computed for a whole block at once by doubling the window: F_2k(i) = F_k(i) + F_k(i - k) << k.
+    Blocks are scanned in order and the first hit wins, giving exactly the boundaries of `_find_cut_python`."""
+    if limit <= MIN_CHUNK_BYTES:
+        return limit
+    try:
+        import numpy as np
+    except ImportError:
+        return _find_cut_python(buffer, limit)
+    gear = np.array(_GEAR, dtype=np.uint64)
+    mask = np.uint64(_CUT_MASK)
+    for block_start in range(MIN_CHUNK_BYTES, limit, _SCAN_BLOCK_BYTES):
+        context_start = max(MIN_CHUNK_BYTES, block_start - 63)  # the 63 bytes before the block complete its first windows.
+        # copied out, so no buffer export outlives the call (the caller resizes `buffer`).
+        block = np.frombuffer(bytes(buffer[context_start:min(limit, block_start + _SCAN_BLOCK_BYTES)]), dtype=np.uint8)
+        fingerprint = gear[block]
+        width = 1
+        while width < 64:
+            fingerprint[width:] += fingerprint[:-width] << np.uint64(width)
+            width *= 2
+        hits = np.flatnonzero((fingerprint[block_start - context_start:] & mask) == 0)
+        if hits.size > 0:
+            return block_start + int(hits[0]) + 1
+    return limit
+
+
+def iter_chunks(path: Path) -> Iterator[bytes]:
+    """Yield content-defined chunks of a file; an insertion only changes the chunks around it, not everything after it."""
+    buffer = bytearray()
+    with open(path, "rb") as fh:
+        eof = False
+        while True:
+            while not eof and len(buffer) < MAX_CHUNK_BYTES:
+                piece = fh.read(MAX_CHUNK_BYTES)
+                if not piece:
+                    eof = True
+                    break
+                buffer += piece
+            if len(buffer) == 0:
+                return
+            cut = _find_cut(buffer, limit=min(len(buffer), MAX_CHUNK_BYTES))
+            yield bytes(buffer[:cut])
+            del buffer[:cut]
+
+
+def _load_key(key: Optional[bytes]) -> bytes:
+    return key if key is not None else Path.home().joinpath("dotfiles/creds/data/encrypted_files_key.bytes").read_bytes()
+
+
+def chunk_id(data: bytes, id_key: Optional[bytes], compress: bool) -> str:
+    """Name of the sealed chunk in the shared store. Entries with different `zip`/`encrypt` settings share the store but
+    seal the same content differently, so both settings are part of the name: keyed when encrypting (which also keeps
+    the names from revealing which well-known files you have), and domain-separated when compressing."""
+    digest = hmac.new(id_key, digestmod=hashlib.sha256) if id_key is not None else hashlib.sha256()
+    if compress:
+        digest.update(b"machineconfig-cas-zlib\0")
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def _seal(data: bytes, compress: bool, key: Optional[bytes]) -> bytes:
+    payload = zlib.compress(data, 6) if compress else data
+    if key is None:
+        return payload
+    from machineconfig.utils.io import ChunkedEncryptWriter
+    sink = io.BytesIO()
+    writer = ChunkedEncryptWriter(sink=sink, key=key, pwd=None)
+    writer.write(payload)
+    writer.close()
+    return sink.getvalue()
+
+
+def _unseal(blob: bytes, compress: bool, key: Optional[bytes]) -> bytes:
+    payload = blob
+    if key is not None:
+        from machineconfig.utils.io import decrypt_chunked_stream
+        sink = io.BytesIO()
+        decrypt_chunked_stream(source=io.BytesIO(blob), sink=sink, key=key, pwd=None)
+        payload = sink.getvalue()
+    return zlib.decompress(payload) if compress else payload
+
+
+def _chunk_rel_path(an_id: str) -> str:
+    return f"{an_id[:2]}/{an_id}"
+
+
+def _rclone(args: list[str]) -> subprocess.CompletedProcess[str]:
+    completed = subprocess.run(["rclone", *args], capture_output=True, text=True, check=False)
+    if completed.returncode != 0:
+        raise RuntimeError(f"💥 rclone {args[0]} failed ({completed.returncode}): {completed.stderr.strip()}")
+    return completed
+
+
+def _state_path(cloud: str, entry_remote: str) -> Path:
+    token = hashlib.sha256(f"{cloud}:{entry_remote}".encode("utf-8")).hexdigest()[:16]
+    return MANIFESTS_DIR.joinpath(f"{Path(entry_remote).name}_{token}.json")
+
+
+def _chunk_index_path(cloud: str, chunks_root: str) -> Path:
+    token = hashlib.sha256(f"{cloud}:{chunks_root}".encode("utf-8")).hexdigest()[:16]
+    return MANIFESTS_DIR.joinpath(f"chunk_index_{token}.txt")
+
+
+def _known_remote_chunks(cloud: str, chunks_root: str) -> set[str]:
+    index_path = _chunk_index_path(cloud, chunks_root)
+    with _INDEX_LOCK:
+        if index_path.exists():
+            return set(index_path.read_text(encoding="utf-8").split())
+    listing = subprocess.run(["rclone", "lsf", "-R", "--files-only", f"{cloud}:{chunks_root}"], capture_output=True, text=True, check=False)
+    known = {Path(line.strip()).name for line in listing.stdout.splitlines() if line.strip()} if listing.returncode == 0 else set()
+    _save_known_chunks(cloud, chunks_root, known)
+    return known
+
+
+def _save_known_chunks(cloud: str, chunks_root: str, known: set[str]) -> None:
+    index_path = _chunk_index_path(cloud, chunks_root)
+    with _INDEX_LOCK:
+        merged = set(known)
+        if index_path.exists():
+            merged |= set(index_path.read_text(encoding="utf-8").split())
+        MANIFESTS_DIR.mkdir(parents=True, exist_ok=True)
+        index_path.write_text("\n".join(sorted(merged)), encoding="utf-8")
+
+
+def _scan(local_path: Path) -> list[tuple[Path, str]]:
+    if local_path.is_file():
+        return [(local_path, "")]
+    return sorted(((a_path, a_path.relative_to(local_path).as_posix()) for a_path in local_path.rglob("*") if a_path.is_file() and not a_path.is_symlink()), key=lambda item: item[1])
+
+
+def backup_incremental(local_path: Path, cloud: str, entry_remote: str, chunks_root: str, compress: bool, encrypt: bool, key: Optional[bytes] = None) -> IncrementalReport:
+    """Chunk changed files, upload only chunks the remote store lacks, then upload a new manifest for the entry."""
+    seal_key = _load_key(key) if encrypt else None
+    id_key = hashlib.sha256(b"machineconfig-cas-id" + seal_key).digest() if seal_key is not None else None
+    state_path = _state_path(cloud, entry_remote)
+    previous: dict[str, FileRecord] = {}
+    if state_path.exists():
+        previous = {item["path"]: FileRecord(**item) for item in json.loads(state_path.read_text(encoding="utf-8"))["files"]}
+    known = _known_remote_chunks(cloud, chunks_root)
+    records: list[FileRecord] = []
+    changed_files, new_bytes = 0, 0
+    new_ids: list[str] = []
+    with tempfile.TemporaryDirectory(prefix="cas_upload_") as staging_str:
+        staging = Path(staging_str)
+        staged_bytes = 0
+
+        def flush() -> None:  # one rclone process per batch, with its own parallel transfers.
+            _rclone(["copy", str(staging), f"{cloud}:{chunks_root}", f"--transfers={RCLONE_TRANSFERS}", "--no-traverse"])
+            for a_dir in list(staging.iterdir()):
+                shutil.rmtree(a_dir)
+
+        for a_path, rel in _scan(local_path):
+            st = a_path.stat()
+            old = previous.get(rel)
+            if old is not None and old.size == st.st_size and old.mtime_ns == st.st_mtime_ns:
+                records.append(FileRecord(path=rel, size=st.st_size, mtime_ns=st.st_mtime_ns, mode=st.st_mode & 0o7777, chunks=old.chunks))
+                continue
+            changed_files += 1
+            ids: list[str] = []
+            for chunk in iter_chunks(a_path):
+                an_id = chunk_id(chunk, id_key=id_key, compress=compress)
+                ids.append(an_id)
+                if an_id in known:
+                    continue
+                sealed = _seal(chunk, compress=compress, key=seal_key)
+                target = staging.joinpath(_chunk_rel_path(an_id))
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(sealed)
+                known.add(an_id)
+                new_ids.append(an_id)
+                new_bytes += len(sealed)
+                staged_bytes += len(sealed)
+                if staged_bytes >= STAGING_FLUSH_BYTES:
+                    flush()
+                    staged_bytes = 0
+            records.append(FileRecord(path=rel, size=st.st_size, mtime_ns=st.st_mtime_ns, mode=st.st_mode & 0o7777, chunks=ids))
+        if staged_bytes > 0:
+            flush()
+    manifest: dict[str, Any] = {"version": MANIFEST_VERSION, "kind": "file" if local_path.is_file() else "dir", "created": datetime.now().isoformat(), "files": [asdict(record) for record in records]}
+    _upload_manifest(manifest, cloud=cloud, entry_remote=entry_remote, compress=compress, key=seal_key)
+    MANIFESTS_DIR.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps(manifest), encoding="utf-8")
+    _save_known_chunks(cloud, chunks_root, known)
+    return IncrementalReport(files=len(records), changed_files=changed_files, chunks_total=sum(len(record.chunks) for record in records), chunks_transferred=len(new_ids), bytes_transferred=new_bytes)
+
+
+def _upload_manifest(manifest: dict[str, Any], cloud: str, entry_remote: str, compress: bool, key: Optional[bytes]) -> None:
+    from machineconfig.utils.path_extended import PathExtended
+
+    sealed = _seal(json.dumps(manifest).encode("utf-8"), compress=compress, key=key)
+    stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    with tempfile.TemporaryDirectory(prefix="cas_manifest_") as tmp_dir:
+        manifest_path = PathExtended(tmp_dir).joinpath("manifest")
+        manifest_path.write_bytes(sealed)
+        for name in (f"manifest-{stamp}", "manifest-latest"):
+            manifest_path.to_cloud(cloud=cloud, remotepath=f"{entry_remote}{CAS_ENTRY_SUFFIX}/{name}", verbose=False, show_progress=False)
+
+
+def restore_incremental(local_path: Path, cloud: str, entry_remote: str, chunks_root: str, compress: bool, encrypt: bool, key: Optional[bytes] = None) -> IncrementalReport:
+    """Fetch the latest manifest, download only chunks of files that differ locally, and reassemble them in place."""
+    from machineconfig.utils.path_extended import PathExtended
+
+    seal_key = _load_key(key) if encrypt else None
+    with tempfile.TemporaryDirectory(prefix="cas_restore_") as tmp_dir:
+        tmp = Path(tmp_dir)
+        fetched = PathExtended(tmp.joinpath("manifest")).from_cloud(cloud=cloud, remotepath=f"{entry_remote}{CAS_ENTRY_SUFFIX}/manifest-latest", verbose=False, show_progress=False)
+        if fetched is None:
+            raise RuntimeError(f"💥 No incremental manifest at {cloud}:{entry_remote}{CAS_ENTRY_SUFFIX}/manifest-latest")
+        manifest = json.loads(_unseal(Path(fetched).read_bytes(), compress=compress, key=seal_key).decode("utf-8"))
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise RuntimeError(f"💥 Unsupported incremental manifest version: {manifest.get('version')}")
+        records = [FileRecord(**item) for item in manifest["files"]]
+
+        def target_of(record: FileRecord) -> Path:
+            return local_path if manifest["kind"] == "file" else local_path.joinpath(record.path)
+
+        to_restore: list[FileRecord] = []
+        for record in records:
+            target = target_of(record)
+            if target.is_file():
+                st = target.stat()
+                if st.st_size == record.size and st.st_mtime_ns == record.mtime_ns:
+                    continue
+            to_restore.append(record)
+        needed = sorted({an_id for record in to_restore for an_id in record.chunks})
+        chunk_dir = tmp.joinpath("chunks")
+        transferred_bytes = 0
+        if len(needed) > 0:
+            files_from = tmp.joinpath("files_from.txt")
+            files_from.write_text("\n".join(_chunk_rel_path(an_id) for an_id in needed), encoding="utf-8")
+            _rclone(["copy", f"{cloud}:{chunks_root}", str(chunk_dir), f"--files-from={files_from}", f"--transfers={RCLONE_TRANSFERS}", "--no-traverse"])
+            transferred_bytes = sum(chunk_dir.joinpath(_chunk_rel_path(an_id)).stat().st_size for an_id in needed)
+        for record in to_restore:
+            target = target_of(record)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            part = target.with_name(target.name + ".part")
+            with open(part, "wb") as fh:
+                for an_id in record.chunks:
+                    fh.write(_unseal(chunk_dir.joinpath(_chunk_rel_path(an_id)).read_bytes(), compress=compress, key=seal_key))
+            os.replace(part, target)
+            os.chmod(target, record.mode)
+            os.utime(target, ns=(record.mtime_ns, record.mtime_ns))
+    state_path = _state_path(cloud, entry_remote)
+    MANIFESTS_DIR.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps(manifest), encoding="utf-8")  # restored tree == snapshot, so the next backup starts incremental.
+    return IncrementalReport(files=len(records), changed_files=len(to_restore), chunks_total=sum(len(record.chunks) for record in records), chunks_transferred=len(needed), bytes_transferred=transferred_bytes)
+
+
+def check_mixed_settings_roundtrip() -> None:
+    """Back up the same content as four entries (zip x encrypt) into one chunk store, restore each, compare bytes.
+
+    Uses rclone's on-the-fly `:local` backend in a temporary directory, so it needs rclone but no configured remote."""
+    import base64
+    with tempfile.TemporaryDirectory(prefix="cas_check_") as tmp_dir:
+        tmp = Path(tmp_dir)
+        remote_root = tmp.joinpath("remote").as_posix()
+        key = base64.urlsafe_b64encode(os.urandom(32))
+        shared = os.urandom(3 * MAX_CHUNK_BYTES // 2) + b"machineconfig" * (MAX_CHUNK_BYTES // 8)
+        settings = {"zip": (True, False), "plain": (False, False), "zip_enc": (True, True), "enc": (False, True)}
+        for name, (compress, encrypt) in settings.items():
+            source = tmp.joinpath("source", name)
+            source.joinpath("sub").mkdir(parents=True)
+            source.joinpath("sub", "shared.bin").write_bytes(shared)
+            source.joinpath("own.txt").write_text(name, encoding="utf-8")
+            backup_incremental(source, cloud=":local", entry_remote=f"{remote_root}/{name}", chunks_root=f"{remote_root}/{CAS_CHUNKS_DIRNAME}", compress=compress, encrypt=encrypt, key=key)
+        for name, (compress, encrypt) in settings.items():
+            target = tmp.joinpath("restored", name)
+            restore_incremental(target, cloud=":local", entry_remote=f"{remote_root}/{name}", chunks_root=f"{remote_root}/{CAS_CHUNKS_DIRNAME}", compress=compress, encrypt=encrypt, key=key)
+            if target.joinpath("sub", "shared.bin").read_bytes() != shared or target.joinpath("own.txt").read_text(encoding="utf-8") != name:
+                raise RuntimeError(f"💥 Round trip of the '{name}' entry (zip={compress}, encrypt={encrypt}) returned different bytes.")
+            _state_path(":local", f"{remote_root}/{name}").unlink(missing_ok=True)
+        _chunk_index_path(":local", f"{remote_root}/{CAS_CHUNKS_DIRNAME}").unlink(missing_ok=True)
+    print(f"✅ Incremental round trip OK for {', '.join(settings)} sharing one chunk store.")
+
+
+if __name__ == "__main__":
+    check_mixed_settings_roundtrip()
@@ -2,7 +2,7 @@
 
 import re
 from platform import system
-from typing import Literal, Optional
+from typing import Optional
 from pathlib import Path
 
 from rich.console import Console
@@ -10,17 +10,16 @@ from rich.panel import Panel
 
 from machineconfig.utils.io import read_ini
 from machineconfig.utils.source_of_truth import DEFAULTS_PATH
-from machineconfig.utils.code import print_code
+from machineconfig.utils.ve import read_default_cloud_config
 from machineconfig.utils.options import choose_cloud_interactively
 from machineconfig.scripts.python.helpers.helpers_cloud.helpers2 import ES
 from machineconfig.scripts.python.helpers.helpers_devops.backup_config import (
     BackupConfig, BackupGroup, VALID_OS, USER_BACKUP_PATH, DEFAULT_BACKUP_HEADER,
     normalize_os_name, os_applies, read_backup_config,
 )
+from machineconfig.scripts.python.helpers.helpers_devops.backup_executor import DIRECTION, DEFAULT_BACKUP_WORKERS, BackupJob, execute_backup_jobs
 from machineconfig.profile.create_links_export import REPO_LOOSE
 
-DIRECTION = Literal["BACKUP", "RETRIEVE"]
-
 
 def _sanitize_entry_name(value: str) -> str:
     token = value.strip().replace(".", "_").replace("-", "_")
@@ -146,7 +145,7 @@ def register_backup_entry(
     return USER_BACKUP_PATH, entry_name, replaced
 
 
-def main_backup_retrieve(direction: DIRECTION, which: Optional[str], cloud: Optional[str], repo: REPO_LOOSE) -> None:
+def main_backup_retrieve(direction: DIRECTION, which: Optional[str], cloud: Optional[str], repo: REPO_LOOSE, max_workers: int = DEFAULT_BACKUP_WORKERS, incremental: bool = False) -> None:
     console = Console()
     if cloud is None or not cloud.strip():
         try:
@@ -217,8 +216,8 @@ def main_backup_retrieve(direction: DIRECTION, which: Optional[str], cloud: Opti
         if unknown:
             raise ValueError(f"Unknown backup entries: {', '.join(unknown)}")
         console.print(Panel(f"📋 PROCESSING SELECTED ENTRIES\n🔢 Total entries to process: {sum(len(item) for item in items.values())}", title="[bold blue]Process Selected Entries[/bold blue]", border_style="blue"))
-    program = ""
-    console.print(Panel(f"🚀 GENERATING {direction} SCRIPT\n🌥️  Cloud: {cloud}\n🗂️  Items: {sum(len(item) for item in items.values())}", title="[bold blue]Script Generation[/bold blue]", border_style="blue"))
+    jobs: list[BackupJob] = []
+    console.print(Panel(f"🚀 PLANNING {direction}\n🌥️  Cloud: {cloud}\n🗂️  Items: {sum(len(item) for item in items.values())}", title="[bold blue]Plan[/bold blue]", border_style="blue"))
     for group_name, group_items in items.items():
         for item_name, item in group_items.items():
             display_name = f"{group_name}.{item_name}"
@@ -234,7 +233,6 @@ def main_backup_retrieve(direction: DIRECTION, which: Optional[str], cloud: Opti
             else:
                 remote_path = Path(item["path_cloud"]).as_posix()
                 remote_display = remote_path
-            remote_spec = f"{cloud}:{remote_path}"
             console.print(Panel(
                 f"📦 PROCESSING: {display_name}\n"
                 f"📂 Local path: {local_path}\n"
@@ -243,24 +241,22 @@ def main_backup_retrieve(direction: DIRECTION, which: Optional[str], cloud: Opti
                 title=f"[bold blue]Processing Item: {display_name}[/bold blue]",
                 border_style="blue",
             ))
-            flag_arg = f" -{flags}" if flags else ""
-            if direction == "BACKUP":
-                program += f"""\ncloud copy "{local_path}" "{remote_spec}"{flag_arg}\n"""
-            elif direction == "RETRIEVE":
-                program += f"""\ncloud copy "{remote_spec}" "{local_path}"{flag_arg}\n"""
-            else:
+            if direction not in ("BACKUP", "RETRIEVE"):
                 console.print(Panel('❌ ERROR: INVALID DIRECTION\n⚠️  Direction must be either "BACKUP" or "RETRIEVE"', title="[bold red]Error: Invalid Direction[/bold red]", border_style="red"))
                 raise RuntimeError(f"Unknown direction: {direction}")
-            if group_name == "dotfiles" and system_raw == "Linux":
-                program += """\nchmod 700 ~/.ssh/*\n"""
-                console.print(Panel("🔒 SPECIAL HANDLING: SSH PERMISSIONS\n🛠️  Setting secure permissions for SSH files\n📝 Command: chmod 700 ~/.ssh/*", title="[bold blue]Special Handling: SSH Permissions[/bold blue]", border_style="blue"))
-    print_code(code=program, lexer="shell", desc=f"{direction} script")
-    console.print(Panel(f"✅ {direction} SCRIPT GENERATION COMPLETE\n🚀 Ready to execute the operations", title="[bold green]Script Generation Complete[/bold green]", border_style="green"))
-    # import subprocess
-    # subprocess.run(program, shell=True, check=True)
-    from machineconfig.utils.code import run_shell_script
-    run_shell_script(program, display_script=True, clean_env=False)
-
+            # `o` is the same switch the old `cloud copy -o` line carried (overwrite), so remote paths of existing backups are unchanged.
+            jobs.append(BackupJob(display_name=display_name, group_name=group_name, path_local=local_path, path_cloud=remote_path, zip=item["zip"], encrypt=item["encrypt"], rel2home=item["rel2home"], overwrite="o" in flags, incremental=incremental))
+    reports = execute_backup_jobs(jobs=jobs, direction=direction, cloud=cloud, root=read_default_cloud_config()["root"], max_workers=max_workers)
+    if system_raw == "Linux" and any(job.group_name == "dotfiles" for job in jobs):
+        ssh_dir = Path.home().joinpath(".ssh")
+        for ssh_item in ssh_dir.glob("*") if ssh_dir.is_dir() else []:
+            ssh_item.chmod(0o700)
+        console.print(Panel("🔒 SPECIAL HANDLING: SSH PERMISSIONS\n🛠️  Set secure permissions (700) on ~/.ssh/*", title="[bold blue]Special Handling: SSH Permissions[/bold blue]", border_style="blue"))
+    failed = [report for report in reports if report.status == "failed"]
+    if failed:
+        console.print(Panel(f"❌ {len(failed)} of {len(reports)} items failed: {', '.join(report.name for report in failed)}", title=f"[bold red]{direction} incomplete[/bold red]", border_style="red"))
+        raise RuntimeError(f"{direction} failed for: {', '.join(report.name for report in failed)}")
+    console.print(Panel(f"✅ {direction} COMPLETE\n📦 {len(reports)} items processed", title=f"[bold green]{direction} Complete[/bold green]", border_style="green"))
 
 if __name__ == "__main__":
     pass
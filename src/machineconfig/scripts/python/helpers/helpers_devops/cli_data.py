@@ -12,6 +12,8 @@ def sync(
         Optional[str], typer.Option("--which", "-w", help="📝 Comma-separated list of items to BACKUP (from backup.toml), or 'all' for all items")
     ] = None,
     repo: Annotated[REPO_LOOSE, typer.Option("--repo", "-r", help="📁 Which backup configuration to use: 'library' or 'user'")] = "all",
+    jobs: Annotated[int, typer.Option("--jobs", "-j", help="🧵 Number of items transferred concurrently")] = 4,
+    incremental: Annotated[bool, typer.Option("--incremental", "-i", help="🧩 Content-addressed mode: only new/changed chunks plus a manifest are transferred")] = False,
     # interactive: Annotated[bool, typer.Option("--interactive", "-i", help="🤔 Prompt the selection of which items to process")] = False,
 ):
     from machineconfig.scripts.python.helpers.helpers_devops.cli_backup_retrieve import main_backup_retrieve
@@ -23,7 +25,7 @@ def sync(
         case _:
             typer.echo("Error: Invalid direction. Use 'up' or 'down'.")
             raise typer.Exit(code=1)
-    main_backup_retrieve(direction=direction_resolved, which=which, cloud=cloud, repo=repo)
+    main_backup_retrieve(direction=direction_resolved, which=which, cloud=cloud, repo=repo, max_workers=jobs, incremental=incremental)
 
 
 def register_data(
@@ -66,6 +66,7 @@ def _check_shell_profile_status() -> dict[str, Any]:
 def _check_repos_status() -> dict[str, Any]:
     """Check configured repositories status."""
     from machineconfig.utils.io import read_ini
+    from machineconfig.scripts.python.helpers.helpers_repos.repo_status_cache import is_repo_dirty, flush_cache
 
     try:
         repos_str = read_ini(DEFAULTS_PATH)["general"]["repos"]
@@ -87,13 +88,14 @@ def _check_repos_status() -> dict[str, Any]:
                         "name": repo_path.name,
                         "exists": True,
                         "is_repo": True,
-                        "clean": not repo.is_dirty(untracked_files=True),
+                        "clean": not is_repo_dirty(repo_path, persist=False),
                         "branch": repo.active_branch.name if not repo.head.is_detached else "DETACHED",
                     }
                 )
             except Exception:
                 repos_info.append({"path": str(repo_path), "name": repo_path.name, "exists": True, "is_repo": False})
 
+        flush_cache()
         return {"configured": True, "count": len(repos_info), "repos": repos_info}
     except (FileNotFoundError, KeyError, IndexError):
         return {"configured": False, "count": 0, "repos": []}
@@ -1,6 +1,5 @@
 """Update repositories with fancy output"""
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import git
@@ -9,6 +8,7 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from machineconfig.scripts.python.helpers.helpers_repos.git_scheduler import print_latency_summary, run_git_jobs
 from machineconfig.scripts.python.helpers.helpers_repos.update import RepositoryUpdateResult, run_uv_sync, update_repository
 from machineconfig.utils.io import read_ini
 from machineconfig.utils.source_of_truth import DEFAULTS_PATH
@@ -32,38 +32,42 @@ def _process_single_repo(expanded_path: Path, allow_password_prompt: bool) -> tu
         return result, repo_path
 
     except Exception as ex:
-        # Create a result for failed repos
-        error_result: RepositoryUpdateResult = {
-            "repo_path": str(expanded_path),
-            "status": "error",
-            "had_uncommitted_changes": False,
-            "uncommitted_files": [],
-            "commit_before": "",
-            "commit_after": "",
-            "commits_changed": False,
-            "pyproject_changed": False,
-            "dependencies_changed": False,
-            "uv_sync_ran": False,
-            "uv_sync_success": False,
-            "remotes_processed": [],
-            "remotes_skipped": [],
-            "error_message": str(ex),
-            "is_machineconfig_repo": False,
-            "permissions_updated": False,
-        }
-        console.print(
-            Panel(
-                "\n".join(
-                    [
-                        f"❌ Repository error: {expanded_path}",
-                        f"Exception: {ex}",
-                    ]
-                ),
-                border_style="red",
-                padding=(1, 2),
-            )
+        return _error_result(expanded_path, ex), None
+
+
+def _error_result(expanded_path: Path, ex: BaseException) -> RepositoryUpdateResult:
+    """Create a result for a failed repo."""
+    error_result: RepositoryUpdateResult = {
+        "repo_path": str(expanded_path),
+        "status": "error",
+        "had_uncommitted_changes": False,
+        "uncommitted_files": [],
+        "commit_before": "",
+        "commit_after": "",
+        "commits_changed": False,
+        "pyproject_changed": False,
+        "dependencies_changed": False,
+        "uv_sync_ran": False,
+        "uv_sync_success": False,
+        "remotes_processed": [],
+        "remotes_skipped": [],
+        "error_message": str(ex),
+        "is_machineconfig_repo": False,
+        "permissions_updated": False,
+    }
+    console.print(
+        Panel(
+            "\n".join(
+                [
+                    f"❌ Repository error: {expanded_path}",
+                    f"Exception: {ex}",
+                ]
+            ),
+            border_style="red",
+            padding=(1, 2),
         )
-        return error_result, None
+    )
+    return error_result
 
 
 def _display_summary(results: list[RepositoryUpdateResult]) -> None:
@@ -242,27 +246,24 @@ def main(verbose: bool = True, allow_password_prompt: bool = False) -> None:
 
 
 def update_repos(repos: list[Path], allow_password_prompt: bool) -> None:
-    # Process repositories in parallel
+    # Process repositories in parallel, capped per remote host (a throttled fetch or pull is retried on its own)
     results: list[RepositoryUpdateResult] = []
     repos_with_changes = []
-    with ThreadPoolExecutor(max_workers=min(len(repos), 8)) as executor:
-        # Submit all tasks
-        future_to_repo = {
-            executor.submit(_process_single_repo, expanded_path, allow_password_prompt): expanded_path 
-            for expanded_path in repos
-        }
-        
-        # Collect results as they complete
-        for future in as_completed(future_to_repo):
-            result, repo_path = future.result()
-            results.append(result)
-            if repo_path is not None:
-                repos_with_changes.append(repo_path)
+    outcomes = run_git_jobs(repos, lambda expanded_path: _process_single_repo(expanded_path, allow_password_prompt), max_workers=8)
+    for outcome in outcomes:
+        if outcome.result is None:
+            results.append(_error_result(outcome.path, outcome.error or RuntimeError("unknown error")))
+            continue
+        result, repo_path = outcome.result
+        results.append(result)
+        if repo_path is not None:
+            repos_with_changes.append(repo_path)
     # Run uv sync for repositories where pyproject.toml changed but sync wasn't run yet
     for repo_path in repos_with_changes:
         run_uv_sync(repo_path)
     # Generate and display summary
     _display_summary(results)
+    print_latency_summary(outcomes)
 
 
 if __name__ == "__main__":
@@ -6,50 +6,27 @@ import platform
 
 def parse_pyfile(file_path: str):
     print(f"🔍 Loading {file_path} ...")
-    from typing import NamedTuple
+    from machineconfig.scripts.python.helpers.helpers_search.symbol_index import ArgSpec, file_symbols
 
-    args_spec = NamedTuple("args_spec", [("name", str), ("type", str), ("default", Optional[str])])
-    func_args: list[list[args_spec]] = [[]]  # this firt prepopulated dict is for the option 'RUN AS MAIN' which has no args
-    import ast
+    func_args: list[list[ArgSpec]] = [[]]  # this firt prepopulated dict is for the option 'RUN AS MAIN' which has no args
+    module__doc__, symbols, error = file_symbols(file_path)  # served from the symbol index unless the file changed
+    if error is not None:
+        import ast
 
-    parsed_ast = ast.parse(Path(file_path).read_text(encoding="utf-8"))
-    functions = [node for node in ast.walk(parsed_ast) if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))]
-    module__doc__ = ast.get_docstring(parsed_ast)
+        ast.parse(Path(file_path).read_text(encoding="utf-8"))  # raise the real exception
+        raise ValueError(f"Could not parse {file_path}: {error}")
     main_option = f"RUN AS MAIN -- {module__doc__ if module__doc__ is not None else 'NoDocs'}"
     options = [main_option]
-    for function in functions:
-        if function.name.startswith("__") and function.name.endswith("__"):
+    for function in symbols:
+        if function.type != "function":
             continue
-        if any(arg.arg == "self" for arg in function.args.args):
+        if function.name.startswith("__") and function.name.endswith("__"):
             continue
-        if any(arg.arg == "self" for arg in function.args.args):
+        if any(arg.name == "self" for arg in function.args):
             continue
-        doc_string_tmp: str | None = ast.get_docstring(function)
-        if doc_string_tmp is None:
-            doc_string = "NoDocs"
-        else:
-            doc_string = doc_string_tmp.replace("\n", " ")
-        options.append(f"{function.name} -- {', '.join([arg.arg for arg in function.args.args])} -- {doc_string}")
-        tmp = []
-        for idx, arg in enumerate(function.args.args):
-            if arg.annotation is not None:
-                try:
-                    type_ = arg.annotation.__dict__["id"]
-                except KeyError as ke:
-                    type_ = "Any"  # e.g. a callable object
-                    _ = ke
-            else:
-                type_ = "Any"
-            default_tmp = function.args.defaults[idx] if idx < len(function.args.defaults) else None
-            if default_tmp is None:
-                default = None
-            else:
-                if hasattr(default_tmp, "__dict__"):
-                    default = default_tmp.__dict__.get("value", None)
-                else:
-                    default = None
-            tmp.append(args_spec(name=arg.arg, type=type_, default=default))
-        func_args.append(tmp)
+        doc_string = "NoDocs" if function.docstring is None else function.docstring.replace("\n", " ")
+        options.append(f"{function.name} -- {', '.join([arg.name for arg in function.args])} -- {doc_string}")
+        func_args.append(function.args)
     return options, func_args
 
 
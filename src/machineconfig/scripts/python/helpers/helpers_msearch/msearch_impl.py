@@ -14,7 +14,7 @@ def machineconfig_search(
         _install_dependencies()
         return
     if symantic:
-        _run_symantic_search(extension=extension)
+        _run_symantic_search(directory=path, extension=extension)
         return
     if ast:
         _run_ast_search(directory=path)
@@ -139,14 +139,33 @@ tv `
         raise RuntimeError(f"Unsupported platform, {platform.system()}")
     return code
 
-def _run_symantic_search(extension: str) -> None:
-    """Run symantic search."""
-    script = ""
-    for an_ex in extension.split(","):
-        script = script + f"""\nparse *.{an_ex} """
-    from machineconfig.utils.code import run_shell_script
+def _run_symantic_search(directory: str, extension: str) -> None:
+    """Run symantic search: refresh the local embedding index of `directory`, then answer queries until an empty one."""
+    import os
+    from pathlib import Path
+    from machineconfig.scripts.python.helpers.helpers_search.repo_rag import DEFAULT_EXTENSIONS, EMBEDDER_ENV_VAR, SemanticIndex, get_embedder
+    from machineconfig.utils.options import choose_from_options
 
-    run_shell_script(script=script, display_script=True, clean_env=False)
+    extensions = tuple(an_ex.strip() if an_ex.strip().startswith(".") else f".{an_ex.strip()}" for an_ex in extension.split(",") if an_ex.strip()) or DEFAULT_EXTENSIONS
+    index = SemanticIndex(root=Path(directory), embedder=get_embedder(os.environ.get(EMBEDDER_ENV_VAR, "auto")))
+    index.update(extensions=extensions)
+    while True:
+        query = input("🔎 Query (empty to quit): ").strip()
+        if query == "":
+            return
+        hits = index.search(query, k=20)
+        if len(hits) == 0:
+            print("❓ No results.")
+            continue
+        labels = [f"{hit.score:.3f} │ {hit.path}:{hit.start_line}-{hit.end_line} │ {hit.text[:100].replace(chr(10), ' ')}" for hit in hits]
+        choice = choose_from_options(options=labels, msg="Select a result:", tv=True, multi=False)
+        if choice is None:
+            continue
+        hit = hits[labels.index(choice)]
+        from rich.console import Console
+        from rich.syntax import Syntax
+
+        Console().print(Syntax(hit.text, Syntax.guess_lexer(hit.path, code=hit.text), line_numbers=True, start_line=hit.start_line), f"📄 {Path(index.root, hit.path)}:{hit.start_line}")
 
 
 def _run_ast_search(directory: str) -> None:
@@ -2,10 +2,10 @@ from machineconfig.scripts.python.helpers.helpers_repos.action_helper import Git
 from machineconfig.utils.path_extended import PathExtended
 from machineconfig.utils.accessories import randstr
 from machineconfig.scripts.python.helpers.helpers_repos.update import update_repository
+from machineconfig.scripts.python.helpers.helpers_repos.git_scheduler import GitThrottledError, is_throttled, print_latency_summary, retry_throttled, run_git_jobs, ssh_command_env
 
-from typing import Optional, Dict, Any, List, cast
-import concurrent.futures
-import os
+from pathlib import Path
+from typing import Optional, Dict, Any, List
 
 from rich import print as pprint
 
@@ -69,9 +69,19 @@ def git_action(path: PathExtended, action: GitAction, mess: Optional[str], r: bo
             success = True
             failed_remotes = []
             for remote in repo.remotes:
+
+                def _push() -> None:
+                    try:
+                        with repo.git.custom_environment(**ssh_command_env()):
+                            remote.push(repo.active_branch.name)
+                    except Exception as e:
+                        if is_throttled(str(e)):
+                            raise GitThrottledError(f"push to {remote.name} was throttled: {e}") from e
+                        raise
+
                 try:
                     print(f"🚀 Pushing to {remote.url}")
-                    remote.push(repo.active_branch.name)
+                    retry_throttled(_push)
                     print(f"✅ Pushed to {remote.name}")
                 except Exception as e:
                     print(f"❌ Failed to push to {remote.name}: {e}")
@@ -119,11 +129,13 @@ def perform_git_operations(repos_root: PathExtended, pull: bool, commit: bool, p
     # Collect all candidate paths first
     paths = list(repos_root.glob("*"))
 
-    def _process_path(a_path: PathExtended) -> Dict[str, Any]:
+    def _process_path(path: Path) -> Dict[str, Any]:
         """Worker that processes a single path and returns metadata and results."""
         from git.exc import InvalidGitRepositoryError
         from git.repo import Repo
 
+        a_path = PathExtended(path)
+
         result_payload: Dict[str, Any] = {"path": a_path, "is_git": False, "results": [], "repo_remotes_count": 0}
         print(f"{('Handling ' + str(a_path)).center(80, '-')}")
 
@@ -138,7 +150,7 @@ def perform_git_operations(repos_root: PathExtended, pull: bool, commit: bool, p
         result_payload["is_git"] = True
         result_payload["repo_remotes_count"] = len(repo.remotes)
 
-        # Perform configured operations sequentially for this repo (the repo-level work is done concurrently between repos)
+        # Perform configured operations sequentially for this repo (the scheduler runs repos concurrently, capped per remote host)
         try:
             if pull:
                 r = git_action(path=a_path, action=GitAction.pull, mess=None, r=recursive, auto_uv_sync=auto_uv_sync)
@@ -155,55 +167,56 @@ def perform_git_operations(repos_root: PathExtended, pull: bool, commit: bool, p
 
         return result_payload
 
-    # Choose a reasonable number of workers
-    max_workers = min(32, (os.cpu_count() or 1) * 5, len(paths) or 1)
-
-    # Run the workers in parallel and aggregate results
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as exc:
-        future_to_path = {exc.submit(_process_path, p): p for p in paths}
-        for fut in concurrent.futures.as_completed(future_to_path):
-            payload = fut.result()
-            a_path = cast(PathExtended, payload.get("path"))
-            summary.total_paths_processed += 1
-
-            if not payload.get("is_git"):
-                summary.non_git_paths += 1
-                continue
-
-            # git repo found
-            summary.git_repos_found += 1
-            if payload.get("repo_remotes_count", 0) == 0:
-                summary.repos_without_remotes.append(a_path)
-
-            for r in payload.get("results", []):
-                action_name = r.action if hasattr(r, "action") else ""
-                # Pull
-                if action_name == "pull":
-                    summary.pulls_attempted += 1
-                    if r.success:
-                        summary.pulls_successful += 1
-                    else:
-                        summary.pulls_failed += 1
-                        summary.failed_operations.append(r)
-                # Commit
-                elif action_name == "commit":
-                    summary.commits_attempted += 1
-                    if r.success:
-                        if getattr(r, "had_changes", False):
-                            summary.commits_successful += 1
-                        else:
-                            summary.commits_no_changes += 1
-                    else:
-                        summary.commits_failed += 1
-                        summary.failed_operations.append(r)
-                # Push
-                elif action_name == "push":
-                    summary.pushes_attempted += 1
-                    if r.success:
-                        summary.pushes_successful += 1
+    outcomes = run_git_jobs(paths, _process_path)
+    for outcome in outcomes:
+        a_path = outcome.path
+        if outcome.result is None:  # the job itself raised
+            pprint(f"❌ Error processing {a_path}: {outcome.error}")
+            failed = [GitOperationResult(repo_path=a_path, action=name, success=False, message=f"Error: {outcome.error}") for name in operations_performed]
+            payload: Dict[str, Any] = {"path": a_path, "is_git": True, "results": failed, "repo_remotes_count": 1}
+        else:
+            payload = outcome.result
+        summary.total_paths_processed += 1
+
+        if not payload.get("is_git"):
+            summary.non_git_paths += 1
+            continue
+
+        # git repo found
+        summary.git_repos_found += 1
+        if payload.get("repo_remotes_count", 0) == 0:
+            summary.repos_without_remotes.append(a_path)
+
+        for r in payload.get("results", []):
+            action_name = r.action if hasattr(r, "action") else ""
+            # Pull
+            if action_name == "pull":
+                summary.pulls_attempted += 1
+                if r.success:
+                    summary.pulls_successful += 1
+                else:
+                    summary.pulls_failed += 1
+                    summary.failed_operations.append(r)
+            # Commit
+            elif action_name == "commit":
+                summary.commits_attempted += 1
+                if r.success:
+                    if getattr(r, "had_changes", False):
+                        summary.commits_successful += 1
                     else:
-                        summary.pushes_failed += 1
-                        summary.failed_operations.append(r)
+                        summary.commits_no_changes += 1
+                else:
+                    summary.commits_failed += 1
+                    summary.failed_operations.append(r)
+            # Push
+            elif action_name == "push":
+                summary.pushes_attempted += 1
+                if r.success:
+                    summary.pushes_successful += 1
+                else:
+                    summary.pushes_failed += 1
+                    summary.failed_operations.append(r)
 
     # Print the detailed summary
     print_git_operations_summary(summary, operations_performed)
+    print_latency_summary(outcomes)
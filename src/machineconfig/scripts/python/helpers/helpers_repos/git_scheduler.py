@@ -0,0 +1,290 @@
+"""
+Host-aware scheduling of network git operations over many repositories.
+
+Repositories are grouped by the host of their preferred remote. Each host has its own concurrency cap, which grows by one
+after every success and halves when the host throttles us (AIMD), plus a backoff window during which nothing is sent
+to it. The first job for a host reached over ssh runs alone, so that it opens the ControlMaster socket every later job
+reuses. A throttled fetch, pull or push is retried on its own through `retry_throttled`, which waits out the host's
+backoff; the rest of the job is not re-run. Per-repository latency and attempt counts are kept for the summary table.
+"""
+
+from typing import Any, Callable, Generic, Optional, TypeVar
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import urlsplit
+import os
+import random
+import shlex
+import subprocess
+import threading
+import time
+
+from machineconfig.utils.ssh_utils.multiplex import ssh_multiplex_options
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+LOCAL_HOST = "local"
+DEFAULT_HOST_CONCURRENCY = 4
+HOST_CONCURRENCY: dict[str, int] = {"github.com": 4, "gitlab.com": 4, "bitbucket.org": 3, LOCAL_HOST: 16}
+MAX_WORKERS = 16
+MAX_ATTEMPTS = 4
+BASE_BACKOFF_SECONDS = 2.0
+MAX_BACKOFF_SECONDS = 60.0
+# Only signals that the host is refusing us for load. Generic transport errors (reset connections, a remote that hung
+# up) also come from real failures, which must fail at once rather than be retried and shrink the host's window.
+THROTTLE_INDICATORS = (
+    "rate limit",
+    "too many requests",
+    "returned error: 429",
+    "kex_exchange_identification",  # sshd dropping the handshake past MaxStartups
+    "ssh_exchange_identification",  # the same, as OpenSSH before 8.2 words it
+)
+
+
+class GitThrottledError(RuntimeError):
+    """A git operation was refused in a way that is worth retrying later (HTTP 429 / rate limit, or sshd's MaxStartups dropping the handshake)."""
+
+
+def is_throttled(output: str) -> bool:
+    lowered = output.lower()
+    return any(indicator in lowered for indicator in THROTTLE_INDICATORS)
+
+
+def ssh_command_env() -> dict[str, str]:
+    """`GIT_SSH_COMMAND` routing ssh through the shared ControlMaster of its host; empty when the user set their own ssh command."""
+    if "GIT_SSH_COMMAND" in os.environ or "GIT_SSH" in os.environ:
+        return {}
+    options = ssh_multiplex_options()
+    return {"GIT_SSH_COMMAND": shlex.join(["ssh", *options])} if options else {}
+
+
+def git_network_env(allow_password_prompt: bool) -> dict[str, str]:
+    """Environment for git subprocesses that talk to a remote."""
+    env = {**os.environ, **ssh_command_env()}
+    if not allow_password_prompt:
+        env["GIT_TERMINAL_PROMPT"] = "0"
+        env["GIT_ASKPASS"] = "echo"  # Returns empty string for any credential request
+    return env
+
+
+def _is_scp_like(url: str) -> bool:
+    head, sep, _ = url.partition(":")
+    return bool(sep) and "/" not in head and len(head) > 1  # `user@host:path`; a one-letter head is a Windows drive.
+
+
+def host_of_url(url: str) -> str:
+    if "://" in url:
+        parts = urlsplit(url)
+        return LOCAL_HOST if parts.scheme == "file" or not parts.hostname else parts.hostname.lower()
+    if _is_scp_like(url):
+        return url.partition(":")[0].rpartition("@")[2].lower()
+    return LOCAL_HOST
+
+
+def uses_ssh(url: str) -> bool:
+    if "://" in url:
+        return urlsplit(url).scheme in ("ssh", "git+ssh", "ssh+git")
+    return _is_scp_like(url)
+
+
+def remote_url(repo_path: Path) -> Optional[str]:
+    """URL of `origin` (or of the first remote); None for repositories without one."""
+    result = subprocess.run(["git", "-C", str(repo_path), "config", "--get-regexp", r"^remote\..*\.url$"], capture_output=True, text=True, check=False)
+    urls: dict[str, str] = {}
+    for line in result.stdout.splitlines():
+        key, _, url = line.partition(" ")
+        urls.setdefault(key.removeprefix("remote.").removesuffix(".url"), url)
+    if len(urls) == 0:
+        return None
+    return urls.get("origin", next(iter(urls.values())))
+
+
+@dataclass
+class GitJobOutcome(Generic[T]):
+    path: Path
+    host: str
+    result: Optional[T] = None
+    error: Optional[BaseException] = None
+    attempts: int = 0
+    seconds: float = 0.0  # time spent running the job, summed over attempts (waiting in the queue excluded)
+
+
+@dataclass
+class _HostState:
+    max_limit: int
+    limit: float
+    warmed: bool
+    queue: deque[GitJobOutcome] = field(default_factory=deque)
+    in_flight: int = 0
+    resume_at: float = 0.0
+    backoff: float = BASE_BACKOFF_SECONDS
+
+    def capacity(self) -> int:
+        return max(1, int(self.limit)) if self.warmed else 1
+
+
+_active = threading.local()  # (scheduler, outcome) of the job running on this thread, if any.
+
+
+class GitScheduler(Generic[T]):
+    """Runs `job(path)` for every path with per-host caps; a job that still raises `GitThrottledError` fails and backs its host off."""
+
+    def __init__(self, job: Callable[[Path], T], max_workers: int = MAX_WORKERS, host_concurrency: Optional[dict[str, int]] = None) -> None:
+        self.job = job
+        self.max_workers = max_workers
+        self.host_concurrency = HOST_CONCURRENCY if host_concurrency is None else host_concurrency
+        self._cond = threading.Condition()
+        self._hosts: dict[str, _HostState] = {}
+        self._remaining = 0
+
+    def _host_state(self, host: str) -> _HostState:
+        if host not in self._hosts:
+            cap = self.host_concurrency.get(host, DEFAULT_HOST_CONCURRENCY)
+            self._hosts[host] = _HostState(max_limit=cap, limit=float(cap), warmed=True)
+        return self._hosts[host]
+
+    def _pick(self, now: float) -> Optional[GitJobOutcome[T]]:
+        # Least-loaded host first, so that every host makes progress and a slow one cannot hog the workers.
+        for state in sorted(self._hosts.values(), key=lambda state: state.in_flight):
+            if state.queue and now >= state.resume_at and state.in_flight < state.capacity():
+                state.in_flight += 1
+                return state.queue.popleft()
+        return None
+
+    def _next_wakeup(self, now: float) -> Optional[float]:
+        waits = [state.resume_at - now for state in self._hosts.values() if state.queue and state.resume_at > now]
+        return min(waits) if waits else None
+
+    @staticmethod
+    def _back_off(state: _HostState) -> None:
+        state.limit = max(1.0, state.limit / 2)
+        state.resume_at = max(state.resume_at, time.monotonic() + state.backoff * random.uniform(0.8, 1.2))
+        state.backoff = min(MAX_BACKOFF_SECONDS, state.backoff * 2)
+
+    def throttled(self, outcome: GitJobOutcome[T]) -> float:
+        """Record a throttled operation of a running job and back its host off; seconds until the host may be contacted again."""
+        with self._cond:
+            state = self._hosts[outcome.host]
+            self._back_off(state)
+            outcome.attempts += 1
+            return max(0.0, state.resume_at - time.monotonic())
+
+    def _finish(self, outcome: GitJobOutcome[T], throttled: bool) -> None:
+        state = self._hosts[outcome.host]
+        state.in_flight -= 1
+        if throttled:
+            self._back_off(state)
+        else:
+            state.warmed = True
+            state.limit = min(float(state.max_limit), state.limit + 1)
+            state.backoff = BASE_BACKOFF_SECONDS
+        self._remaining -= 1
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._remaining == 0:
+                        return
+                    outcome = self._pick(time.monotonic())
+                    if outcome is not None:
+                        break
+                    self._cond.wait(timeout=self._next_wakeup(time.monotonic()))
+            throttled = False
+            started = time.perf_counter()
+            _active.job = (self, outcome)
+            try:
+                outcome.result = self.job(outcome.path)
+            except GitThrottledError as ex:  # still throttled after `retry_throttled` gave up.
+                outcome.error = ex
+                throttled = True
+            except Exception as ex:
+                outcome.error = ex
+            finally:
+                _active.job = None
+            outcome.attempts += 1
+            outcome.seconds += time.perf_counter() - started
+            with self._cond:
+                self._finish(outcome, throttled)
+                self._cond.notify_all()
+
+    def run(self, paths: list[Path]) -> list[GitJobOutcome[T]]:
+        """Outcomes in the order of `paths`."""
+        urls = [remote_url(path) for path in paths]
+        outcomes: list[GitJobOutcome[T]] = [GitJobOutcome(path=path, host=LOCAL_HOST if url is None else host_of_url(url)) for path, url in zip(paths, urls)]
+        with self._cond:
+            for outcome, url in zip(outcomes, urls):
+                state = self._host_state(outcome.host)
+                state.queue.append(outcome)
+                if url is not None and uses_ssh(url):  # https and local paths open no ControlMaster, so need no warm-up.
+                    state.warmed = False
+            self._remaining = len(outcomes)
+        workers = [threading.Thread(target=self._worker, daemon=True) for _ in range(min(self.max_workers, len(outcomes)))]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return outcomes
+
+
+def retry_throttled(operation: Callable[[], R]) -> R:
+    """Run one network git operation (a fetch, pull or push raising `GitThrottledError` when refused), re-running just
+    that operation with backoff, up to MAX_ATTEMPTS times. Inside a scheduler job the wait is the host's shared backoff."""
+    active: Optional[tuple[GitScheduler[Any], GitJobOutcome[Any]]] = getattr(_active, "job", None)
+    backoff = BASE_BACKOFF_SECONDS
+    attempt = 1
+    while True:
+        try:
+            return operation()
+        except GitThrottledError as ex:
+            if attempt >= MAX_ATTEMPTS:
+                raise
+            if active is not None:
+                wait = active[0].throttled(active[1])
+            else:
+                wait = backoff * random.uniform(0.8, 1.2)
+                backoff = min(MAX_BACKOFF_SECONDS, backoff * 2)
+            print(f"⏳ {ex}; retrying in {wait:.1f}s (attempt {attempt + 1}/{MAX_ATTEMPTS})")
+            time.sleep(wait)
+            attempt += 1
+
+
+def run_git_jobs(paths: list[Path], job: Callable[[Path], T], max_workers: int = MAX_WORKERS) -> list[GitJobOutcome[T]]:
+    return GitScheduler(job=job, max_workers=max_workers).run(paths)
+
+
+def print_latency_summary(outcomes: list[GitJobOutcome[T]], top: int = 10) -> None:
+    """Per-host totals and the slowest repositories."""
+    from rich.console import Console
+    from rich.table import Table
+
+    if len(outcomes) == 0:
+        return
+    by_host: dict[str, list[GitJobOutcome[T]]] = {}
+    for outcome in outcomes:
+        by_host.setdefault(outcome.host, []).append(outcome)
+    host_table = Table(title="🌐 Git hosts", show_header=True, header_style="bold cyan")
+    for column in ("Host", "Repos", "Failed", "Retries", "Total s", "Slowest s"):
+        host_table.add_column(column, justify="left" if column == "Host" else "right")
+    for host, items in sorted(by_host.items(), key=lambda item: -sum(o.seconds for o in item[1])):
+        host_table.add_row(
+            host,
+            str(len(items)),
+            str(sum(1 for o in items if o.error is not None)),
+            str(sum(o.attempts - 1 for o in items)),
+            f"{sum(o.seconds for o in items):.1f}",
+            f"{max(o.seconds for o in items):.1f}",
+        )
+    slow_table = Table(title=f"🐢 Slowest {min(top, len(outcomes))} repositories", show_header=True, header_style="bold cyan")
+    slow_table.add_column("Repository")
+    slow_table.add_column("Host")
+    slow_table.add_column("Attempts", justify="right")
+    slow_table.add_column("Seconds", justify="right")
+    for outcome in sorted(outcomes, key=lambda o: -o.seconds)[:top]:
+        slow_table.add_row(outcome.path.name, outcome.host, str(outcome.attempts), f"{outcome.seconds:.2f}")
+    console = Console()
+    console.print(host_table)
+    console.print(slow_table)
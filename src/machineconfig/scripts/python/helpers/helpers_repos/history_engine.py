@@ -0,0 +1,183 @@
+"""
+Incremental Python-size history of a git repository.
+
+One `git log --raw --numstat` stream (parents before children) yields, for every commit, the `.py` blobs it changed
+relative to its first parent and the lines it inserted. Each commit's `.py` tree is rebuilt from its parent's, so a
+blob is decoded once, when it first appears, through a single `git cat-file --batch` process. Per-blob line counts
+and per-commit results are memoised on disk; a rerun only reads blobs it has never seen.
+"""
+
+from typing import Any, Optional, TypedDict
+from pathlib import Path
+import hashlib
+import json
+import subprocess
+import threading
+
+from machineconfig.utils.source_of_truth import CONFIG_ROOT
+
+
+HISTORY_CACHE_DIR = CONFIG_ROOT.joinpath("repo_history_cache")
+HISTORY_CACHE_VERSION = 1
+UNREADABLE = -1  # blob that is not valid UTF-8: skipped, as the GitPython-based counter did.
+_SUBMODULE_MODE = "160000"
+
+
+class CommitLineCount(TypedDict):
+    hash: str
+    committed_date: int  # epoch seconds
+    lines: int  # lines across all readable `.py` files in the commit's tree
+    files: int  # number of readable `.py` files
+    py_insertions: int  # lines inserted into `.py` files relative to the first parent
+
+
+class _LoggedCommit(TypedDict):
+    hash: str
+    parents: list[str]
+    committed_date: int
+    changes: list[tuple[str, Optional[str]]]  # (path, new blob or None when deleted)
+    py_insertions: int
+
+
+def _git(repo_path: Path, *args: str) -> str:
+    return subprocess.run(["git", "-C", str(repo_path), *args], capture_output=True, text=True, check=True).stdout
+
+
+def _cache_path(repo_path: Path) -> Path:
+    common_dir = Path(_git(repo_path, "rev-parse", "--path-format=absolute", "--git-common-dir").strip())
+    return HISTORY_CACHE_DIR.joinpath(hashlib.sha1(str(common_dir).encode("utf-8")).hexdigest()[:16] + ".json")
+
+
+def _load_memo(path: Path) -> dict[str, Any]:
+    try:
+        memo = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        memo = {}
+    if not isinstance(memo, dict) or memo.get("version") != HISTORY_CACHE_VERSION:
+        memo = {"version": HISTORY_CACHE_VERSION, "blob_lines": {}, "commits": {}}
+    return memo
+
+
+def _save_memo(path: Path, memo: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(memo), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def _is_python(path: str) -> bool:
+    return path.removesuffix('"').endswith(".py")  # paths with control characters or quotes come C-quoted.
+
+
+def _stream_log(repo_path: Path, rev: str) -> list[_LoggedCommit]:
+    """Parse one `git log` over `rev`, oldest first, keeping only `.py` paths."""
+    # No `-- '*.py'` pathspec: it would turn on history simplification and drop commits that do not touch Python files.
+    cmd = ["git", "-c", "core.quotePath=false", "-C", str(repo_path), "log", "--topo-order", "--reverse", "--root", "--no-renames", "--diff-merges=first-parent", "--raw", "--numstat", "--no-abbrev", "--format=@@%H %ct %P", rev, "--"]
+    commits: list[_LoggedCommit] = []
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True, encoding="utf-8", errors="surrogateescape") as proc:
+        assert proc.stdout is not None
+        current: Optional[_LoggedCommit] = None
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if line.startswith("@@"):
+                sha, committed, *parents = line[2:].split(" ")
+                current = {"hash": sha, "parents": [p for p in parents if p], "committed_date": int(committed), "changes": [], "py_insertions": 0}
+                commits.append(current)
+            elif current is None or line == "":
+                continue
+            elif line.startswith(":"):
+                meta, _, path = line.partition("\t")
+                _old_mode, new_mode, _old_blob, new_blob, status = meta[1:].split(" ")
+                if not _is_python(path) or new_mode == _SUBMODULE_MODE:
+                    continue
+                current["changes"].append((path, None if status == "D" else new_blob))
+            else:
+                added, _deleted, path = line.split("\t", 2)
+                if _is_python(path) and added != "-":  # "-" is a binary file; GitPython's stats counted it as 0.
+                    current["py_insertions"] += int(added)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+    return commits
+
+
+def _count_blob_lines(repo_path: Path, blobs: list[str]) -> dict[str, int]:
+    """Line count of each blob through one `git cat-file --batch` process."""
+    if len(blobs) == 0:
+        return {}
+    counts: dict[str, int] = {}
+    with subprocess.Popen(["git", "-C", str(repo_path), "cat-file", "--batch"], stdin=subprocess.PIPE, stdout=subprocess.PIPE) as proc:
+        assert proc.stdin is not None and proc.stdout is not None
+        stdin = proc.stdin
+
+        def feed() -> None:  # writer thread: keeps git from blocking on a full stdout pipe while we read.
+            for blob in blobs:
+                stdin.write(f"{blob}\n".encode("ascii"))
+            stdin.close()
+
+        writer = threading.Thread(target=feed, daemon=True)
+        writer.start()
+        for blob in blobs:
+            header = proc.stdout.readline().decode("ascii").split()
+            if len(header) < 3:  # "<sha> missing"
+                counts[blob] = UNREADABLE
+                continue
+            content = proc.stdout.read(int(header[2]))
+            proc.stdout.read(1)  # trailing newline
+            try:
+                counts[blob] = len(content.decode("utf-8").splitlines())
+            except UnicodeDecodeError:
+                counts[blob] = UNREADABLE
+        writer.join()
+    return counts
+
+
+def python_line_history(repo_path: str, rev: str) -> list[CommitLineCount]:
+    """Per-commit `.py` size and insertions for every commit reachable from `rev`, parents before children."""
+    repo = Path(repo_path).expanduser().absolute()
+    cache_path = _cache_path(repo)
+    memo = _load_memo(cache_path)
+    blob_lines: dict[str, int] = memo["blob_lines"]
+    done: dict[str, list[int]] = memo["commits"]
+
+    log = _stream_log(repo, rev)
+    if all(commit["hash"] in done for commit in log):
+        return [{"hash": c["hash"], "committed_date": c["committed_date"], "lines": done[c["hash"]][0], "files": done[c["hash"]][1], "py_insertions": done[c["hash"]][2]} for c in log]
+
+    new_blobs = list(dict.fromkeys(blob for commit in log for _, blob in commit["changes"] if blob is not None and blob not in blob_lines))
+    blob_lines.update(_count_blob_lines(repo, new_blobs))
+
+    # Replay trees. A parent's state is handed over to its last remaining child and copied for the others.
+    pending_children: dict[str, int] = {}
+    for commit in log:
+        if commit["parents"]:
+            pending_children[commit["parents"][0]] = pending_children.get(commit["parents"][0], 0) + 1
+    states: dict[str, tuple[dict[str, str], int, int]] = {}
+    history: list[CommitLineCount] = []
+    for commit in log:
+        first_parent = commit["parents"][0] if commit["parents"] else None
+        if first_parent is not None and first_parent in states:
+            tree, lines, files = states[first_parent]
+            pending_children[first_parent] -= 1
+            if pending_children[first_parent] == 0:
+                del states[first_parent]
+            else:
+                tree = dict(tree)
+        else:
+            tree, lines, files = {}, 0, 0  # root commit (or a parent outside `rev`, e.g. a shallow boundary)
+        for path, blob in commit["changes"]:
+            old_blob = tree.pop(path, None)
+            if old_blob is not None and blob_lines.get(old_blob, UNREADABLE) != UNREADABLE:
+                lines -= blob_lines[old_blob]
+                files -= 1
+            if blob is not None:
+                tree[path] = blob
+                if blob_lines.get(blob, UNREADABLE) != UNREADABLE:
+                    lines += blob_lines[blob]
+                    files += 1
+        if pending_children.get(commit["hash"], 0) > 0:
+            states[commit["hash"]] = (tree, lines, files)
+        done[commit["hash"]] = [lines, files, commit["py_insertions"]]
+        history.append({"hash": commit["hash"], "committed_date": commit["committed_date"], "lines": lines, "files": files, "py_insertions": commit["py_insertions"]})
+
+    _save_memo(cache_path, memo)
+    return history
@@ -4,11 +4,20 @@ from machineconfig.utils.schemas.repos.repos_types import GitVersionInfo, RepoRe
 
 from machineconfig.utils.schemas.repos.repos_types import RepoRecordFile
 from machineconfig.utils.io import save_json
+from machineconfig.scripts.python.helpers.helpers_repos.repo_status_cache import is_repo_dirty, flush_cache, read_ref, resolve_git_dirs
 
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import re
 
 from rich import print as pprint
-from rich.progress import Progress, TaskID, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn, MofNCompleteColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn, MofNCompleteColumn
+
+
+RECORD_WORKERS = min(32, (os.cpu_count() or 4) * 4)  # recording is mostly waiting on `git status`, so oversubscribe the CPUs.
+_SECTION_RE = re.compile(r'^\s*\[\s*([A-Za-z0-9.-]+)(?:\s+"([^"\\]*)")?\s*\]\s*$')
+_KEY_RE = re.compile(r"^\s*([A-Za-z][A-Za-z0-9-]*)\s*(?:=\s*(.*?))?\s*$")
 
 
 def build_tree_structure(repos: list[RepoRecordDict], repos_root: Path) -> str:
@@ -82,19 +91,22 @@ def build_tree_structure(repos: list[RepoRecordDict], repos_root: Path) -> str:
     return "\n".join(tree_lines)
 
 
+def _filter_preferred_remote(remotes: list[RepoRemote], preferred_remote: Optional[str]) -> list[RepoRemote]:
+    if preferred_remote is None:
+        return remotes
+    if preferred_remote in [remote["name"] for remote in remotes]:
+        return [remote for remote in remotes if remote["name"] == preferred_remote]
+    print(f"⚠️ `{preferred_remote=}` not found in {remotes}.")
+    return remotes
+
+
 def record_a_repo(path: PathExtended, search_parent_directories: bool, preferred_remote: Optional[str]) -> RepoRecordDict:
     from git.repo import Repo
 
     repo = Repo(path, search_parent_directories=search_parent_directories)  # get list of remotes using git python
     repo_root = PathExtended(repo.working_dir).absolute()
     # remotes: = {remote.name: remote.url for remote in repo.remotes}
-    remotes: list[RepoRemote] = [{"name": remote.name, "url": remote.url} for remote in repo.remotes]
-    if preferred_remote is not None:
-        if preferred_remote in [remote["name"] for remote in remotes]:
-            remotes = [remote for remote in remotes if remote["name"] == preferred_remote]
-        else:
-            print(f"⚠️ `{preferred_remote=}` not found in {remotes}.")
-            preferred_remote = None
+    remotes: list[RepoRemote] = _filter_preferred_remote([{"name": remote.name, "url": remote.url} for remote in repo.remotes], preferred_remote)
     try:
         commit = repo.head.commit.hexsha
     except ValueError:  # look at https://github.com/gitpython-developers/GitPython/issues/1016
@@ -108,7 +120,7 @@ def record_a_repo(path: PathExtended, search_parent_directories: bool, preferred
         current_branch = "DETACHED"
 
     # Check if repo is dirty (has uncommitted changes)
-    is_dirty = repo.is_dirty(untracked_files=True)
+    is_dirty = is_repo_dirty(Path(repo.working_dir))
 
     version_info: GitVersionInfo = {"branch": current_branch, "commit": commit}
 
@@ -116,73 +128,118 @@ def record_a_repo(path: PathExtended, search_parent_directories: bool, preferred
     return res
 
 
-def count_git_repositories(repos_root: str, r: bool) -> int:
-    """Count total git repositories for accurate progress tracking."""
-    path_obj = PathExtended(repos_root).expanduser().absolute()
-    if path_obj.is_file():
-        return 0
-
-    search_res = path_obj.search("*", files=False, folders=True)
-    count = 0
-
-    for a_search_res in search_res:
-        if a_search_res.joinpath(".git").exists():
-            count += 1
-        elif r:
-            count += count_git_repositories(str(a_search_res), r=r)
-
-    return count
-
-
-def count_total_directories(repos_root: str, r: bool) -> int:
-    """Count total directories to scan for accurate progress tracking."""
-    path_obj = PathExtended(repos_root).expanduser().absolute()
-    if path_obj.is_file():
-        return 0
-
-    search_res = path_obj.search("*", files=False, folders=True)
-    count = len(search_res)
-
-    if r:
-        for a_search_res in search_res:
-            if not a_search_res.joinpath(".git").exists():
-                count += count_total_directories(str(a_search_res), r=r)
-
-    return count
-
-
-def record_repos_recursively(repos_root: str, r: bool, progress: Progress | None, scan_task_id: TaskID | None, process_task_id: TaskID | None) -> list[RepoRecordDict]:
-    path_obj = PathExtended(repos_root).expanduser().absolute()
-    if path_obj.is_file():
-        return []
+def find_git_repositories(repos_root: Path, r: bool) -> tuple[list[Path], int]:
+    """
+    One `os.scandir` walk returning (repositories, directories scanned). A directory holding `.git` is a repository
+    and is not descended into; hidden directories (`.cache`, `.venv`, ...) are skipped, and symlinked directories are
+    followed once (by device/inode) so link cycles terminate.
+    """
+    repos: list[Path] = []
+    scanned = 0
+    seen: set[tuple[int, int]] = set()
+    stack = [str(repos_root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                children = [entry for entry in entries if not entry.name.startswith(".") and entry.is_dir()]
+        except OSError:
+            continue
+        for entry in children:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            if (stat.st_dev, stat.st_ino) in seen:
+                continue
+            seen.add((stat.st_dev, stat.st_ino))
+            scanned += 1
+            if os.path.lexists(os.path.join(entry.path, ".git")):
+                repos.append(Path(entry.path))
+            elif r:
+                stack.append(entry.path)
+    return sorted(repos), scanned
+
+
+def _read_remotes(common_dir: Path) -> Optional[list[RepoRemote]]:
+    """Remotes in config order, or None when the config uses something only git should interpret (includes, URL rewrites, escapes)."""
+    remotes: list[RepoRemote] = []
+    section: Optional[str] = None
+    remote_name: Optional[str] = None
+    for raw_line in common_dir.joinpath("config").read_text(encoding="utf-8").splitlines():
+        line = raw_line.strip()
+        if line == "" or line.startswith(("#", ";")):
+            continue
+        section_match = _SECTION_RE.match(line)
+        if section_match is not None:
+            section, remote_name = section_match.group(1).lower(), section_match.group(2)
+            if section in ("include", "includeif"):
+                return None
+            continue
+        if line.lstrip().startswith("["):
+            return None
+        key_match = _KEY_RE.match(line)
+        if key_match is None or section is None:
+            return None
+        key, value = key_match.group(1).lower(), key_match.group(2) or ""
+        if key in ("insteadof", "pushinsteadof") or any(char in value for char in '\\"#;'):
+            return None
+        if section == "remote" and remote_name is not None and key == "url":
+            if any(remote["name"] == remote_name for remote in remotes):
+                return None  # several urls for one remote: let git decide which one counts.
+            remotes.append({"name": remote_name, "url": value})
+    return remotes
+
+
+def record_a_repo_fast(path: Path, preferred_remote: Optional[str]) -> RepoRecordDict:
+    """
+    Read branch, commit and remotes straight from `.git` (HEAD, loose / packed refs, config); only the dirty check runs git, and only when `repo_status_cache` sees a change.
+    Anything unusual (reftable, include directives, URL rewrites, unreadable files) falls back to `record_a_repo`.
+    """
+    try:
+        dirs = resolve_git_dirs(path)
+        if dirs is None:
+            raise ValueError("unrecognised .git")
+        git_dir, common_dir = dirs
+        head = git_dir.joinpath("HEAD").read_text(encoding="utf-8").strip()
+        remotes = _read_remotes(common_dir)
+        if remotes is None or head.endswith("/.invalid"):  # `.invalid` marks the reftable backend.
+            raise ValueError("needs git to interpret")
+    except (OSError, UnicodeDecodeError, ValueError):
+        return record_a_repo(PathExtended(path), search_parent_directories=False, preferred_remote=preferred_remote)
+
+    if head.startswith("ref:"):
+        ref = head.removeprefix("ref:").strip()
+        current_branch = ref.removeprefix("refs/heads/")
+        commit = read_ref(git_dir, common_dir, ref)
+        if commit is None:
+            print(f"⚠️ Failed to get latest commit of {path}")
+            commit = "UNKNOWN"
+    else:
+        print(f"⁉️ Failed to get current branch of {path}. It is probably in a detached state.")
+        current_branch = "DETACHED"
+        commit = head
 
-    search_res = path_obj.search("*", files=False, folders=True)
-    res: list[RepoRecordDict] = []
+    remotes = _filter_preferred_remote(remotes, preferred_remote)
+    version_info: GitVersionInfo = {"branch": current_branch, "commit": commit}
+    return {"name": path.name, "parentDir": PathExtended(path.parent).collapseuser().as_posix(), "currentBranch": current_branch, "remotes": remotes, "version": version_info, "isDirty": is_repo_dirty(path, persist=False)}
 
-    for a_search_res in search_res:
-        if progress and scan_task_id:
-            progress.update(scan_task_id, description=f"Scanning: {a_search_res.name}")
 
-        if a_search_res.joinpath(".git").exists():
+def record_repos(repo_paths: list[Path], max_workers: int, progress: Optional[Progress]) -> list[RepoRecordDict]:
+    """Record repositories on a bounded thread pool; results keep the order of `repo_paths`."""
+    records: dict[Path, RepoRecordDict] = {}
+    task_id = progress.add_task("Recording repositories...", total=len(repo_paths)) if progress is not None else None
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="repo-record") as pool:
+        futures = {pool.submit(record_a_repo_fast, a_path, None): a_path for a_path in repo_paths}
+        for future in as_completed(futures):
+            a_path = futures[future]
             try:
-                if progress and process_task_id:
-                    progress.update(process_task_id, description=f"Recording: {a_search_res.name}")
-
-                repo_record = record_a_repo(a_search_res, search_parent_directories=False, preferred_remote=None)
-                res.append(repo_record)
-
-                if progress and process_task_id:
-                    progress.update(process_task_id, advance=1, description=f"Recorded: {repo_record['name']}")
+                records[a_path] = future.result()
             except Exception as e:
-                print(f"⚠️ Failed to record {a_search_res}: {e}")
-        else:
-            if r:
-                res += record_repos_recursively(str(a_search_res), r=r, progress=progress, scan_task_id=scan_task_id, process_task_id=process_task_id)
-
-        if progress and scan_task_id:
-            progress.update(scan_task_id, advance=1)
-
-    return res
+                print(f"⚠️ Failed to record {a_path}: {e}")
+            if progress is not None and task_id is not None:
+                progress.update(task_id, advance=1, description=f"Recorded: {a_path.name}")
+    flush_cache()
+    return [records[a_path] for a_path in repo_paths if a_path in records]
 
 
 def _resolve_directory(directory: Optional[str]) -> Path:
@@ -197,18 +254,13 @@ def main_record(repos_root_str: Optional[str]) -> Path:
     print("\n📝 Recording repositories...")
     repos_root = _resolve_directory(directory=repos_root_str)
     
-    # Count total directories and repositories for accurate progress tracking
+    # A single directory walk finds every repository up front, which also gives the progress bar its total
     print("🔍 Analyzing directory structure...")
-    total_dirs = count_total_directories(str(repos_root), r=True)
-    total_repos = count_git_repositories(str(repos_root), r=True)
-    print(f"📊 Found {total_dirs} directories to scan and {total_repos} git repositories to record")
+    repo_paths, total_dirs = find_git_repositories(repos_root, r=True)
+    print(f"📊 Scanned {total_dirs} directories and found {len(repo_paths)} git repositories to record")
 
-    # Setup progress bars
     with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), BarColumn(), MofNCompleteColumn(), TimeElapsedColumn()) as progress:
-        scan_task = progress.add_task("Scanning directories...", total=total_dirs)
-        process_task = progress.add_task("Recording repositories...", total=total_repos)
-
-        repo_records = record_repos_recursively(repos_root=str(repos_root), r=True, progress=progress, scan_task_id=scan_task, process_task_id=process_task)
+        repo_records = record_repos(repo_paths, max_workers=RECORD_WORKERS, progress=progress)
 
     res: RepoRecordFile = {"version": "0.1", "repos": repo_records}
 
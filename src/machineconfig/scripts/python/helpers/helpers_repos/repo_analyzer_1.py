@@ -3,47 +3,25 @@
 import subprocess
 
 from git import Repo
-from collections import defaultdict
 from datetime import datetime, date
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, List, Optional, Union
 from pathlib import Path
 
 
 
 def count_historical_line_edits(repo_path: str) -> int:
-
-    repo = Repo(repo_path)
-    last_commit = next(repo.iter_commits())
-    total_lines, total_files = count_python_lines(last_commit)
-    print(f"Total lines of Python code in latest commit ({last_commit.hexsha[:8]}): {total_lines} across {total_files} files")
+    from machineconfig.scripts.python.helpers.helpers_repos.history_engine import python_line_history
 
     gitcs_viz(repo_path=repo_path, pull_full_history=True)
 
-    file_line_counts: "Dict[str, int]" = defaultdict(int)
-    total_commits: int = sum(1 for _ in repo.iter_commits())
-    print(f"Total commits to process: {total_commits}")
-    for i, commit in enumerate(repo.iter_commits(), 1):
-        if i % 100 == 0 or i == total_commits:
-            print(f"Processing commit {i}/{total_commits} ({i / total_commits:.1%})")
-        try:
-            # Handle initial commits that have no parents
-            if not commit.parents:
-                # For initial commit, count all lines in Python files
-                for file in commit.stats.files:
-                    if str(file).endswith(".py"):
-                        file_line_counts[str(file)] += commit.stats.files[file]["insertions"]
-            else:
-                # For commits with parents, use stats
-                for file in commit.stats.files:
-                    if str(file).endswith(".py"):
-                        file_line_counts[str(file)] += commit.stats.files[file]["insertions"]
-        except Exception:
-            # If stats fail (e.g., corrupted parent), skip this commit
-            print(f"Warning: Could not get stats for commit {commit.hexsha[:8]}, skipping")
-            continue
-
-    print(f"\nProcessed files: {len(file_line_counts)}")
-    res = sum(file_line_counts.values())
+    history = python_line_history(repo_path, "HEAD")  # one `git log` stream; blob line counts are cached across runs.
+    if len(history) == 0:
+        print("No commits to process")
+        return 0
+    latest = history[-1]
+    print(f"Total lines of Python code in latest commit ({latest['hash'][:8]}): {latest['lines']} across {latest['files']} files")
+    print(f"Total commits processed: {len(history)}")
+    res = sum(row["py_insertions"] for row in history)
     print(f"Total historical lines of Python code: {res}")
     return res
 
@@ -57,23 +35,6 @@ def count_lines_changed_in_commit(commit: "Any") -> int:
             _blob = commit.tree / _file
             _total_lines += len(_blob.data_stream.read().decode("utf-8").splitlines())
     return _total_lines
-def count_python_lines(commit: "Any") -> tuple[int, int]:
-    """Count total lines in Python files for a specific commit"""
-    total_lines = 0
-    total_files = 0
-    try:
-        for blob in commit.tree.traverse():
-            if blob.path.endswith(".py"):
-                try:
-                    content = blob.data_stream.read().decode("utf-8")
-                    total_lines += len(content.splitlines())
-                    total_files += 1
-                except Exception as _e:
-                    continue
-    except Exception as e:
-        print(f"Error traversing commit {commit.hexsha[:8]}: {e}")
-        pass
-    return total_lines, total_files
 
 
 def get_default_branch(repo: Repo) -> str:
@@ -1,5 +1,5 @@
 from git import Repo
-from machineconfig.scripts.python.helpers.helpers_repos.repo_analyzer_1 import count_python_lines, get_default_branch
+from machineconfig.scripts.python.helpers.helpers_repos.repo_analyzer_1 import get_default_branch
 from datetime import datetime
 import polars as pl
 from pathlib import Path
@@ -183,21 +183,22 @@ def print_python_files_by_size_impl(repo_path: str) -> pl.DataFrame | Exception:
 
 def analyze_over_time(repo_path: str):
     """Analyze a git repository to track Python code size over time with visualization."""
+    from machineconfig.scripts.python.helpers.helpers_repos.history_engine import python_line_history
+
     repo: Repo = Repo(repo_path)
     branch_name: str = get_default_branch(repo)
     print(f"🔍 Using branch: {branch_name}")
-    commit_data: list[CommitDataRow] = []
     print("⏳ Analyzing commits...")
     try:
-        commits = list(repo.iter_commits(branch_name))
         from datetime import timezone
-        from rich.progress import track
-        for commit in track(commits, description="Processing commits..."):
-            lines, _files = count_python_lines(commit)
-            commit_data.append({"hash": commit.hexsha, "dtmExit": datetime.fromtimestamp(commit.committed_date, tz=timezone.utc), "lines": lines})
+        history = python_line_history(repo_path, branch_name)
+        commit_data: list[CommitDataRow] = [{"hash": row["hash"], "dtmExit": datetime.fromtimestamp(row["committed_date"], tz=timezone.utc), "lines": row["lines"]} for row in history]
     except Exception as e:
         print(f"❌ Error analyzing commits: {str(e)}")
         return
+    if len(commit_data) == 0:
+        print("❌ No commits found")
+        return
 
     import polars as pl
     import plotly.graph_objects as go
@@ -0,0 +1,205 @@
+"""
+Cached dirty-state of git working trees.
+
+`git status` has to stat every tracked file, read every directory for untracked files and often rehash content, and it
+is spawned once per repository. Here each repository gets a fingerprint (HEAD and the ref it points to, the index's
+stat, the size and mtime of every tracked file, as git's own index records them, and the mtimes of the directories
+holding tracked or untracked files) and the previous verdict is reused while the fingerprint is unchanged: a hit costs
+only stat calls and no process. Ignored directories are never looked at, so a large `.venv` costs nothing and edits
+inside it do not invalidate anything. Editing a tracked file changes its stat; creating, deleting or renaming a file shows
+in its directory's mtime. Filling an untracked directory that was empty when last checked does not, and is picked up
+once the verdict ages out. The list of tracked files is re-read from git only when the index changed.
+Repositories that already run git's fsmonitor skip the cache: their `git status` is cheap on its own."""
+
+from typing import Any, Optional
+from pathlib import Path
+import json
+import os
+import posixpath
+import subprocess
+import threading
+import time
+
+from machineconfig.utils.source_of_truth import CONFIG_ROOT
+
+
+REPO_STATUS_CACHE_PATH = CONFIG_ROOT.joinpath("repo_status_cache.json")
+DEFAULT_STATUS_MAX_AGE_SECONDS = 15 * 60.0  # a verdict is re-derived from git at least this often, whatever the fingerprint says.
+
+_CACHE_LOCK = threading.Lock()
+_memory_cache: Optional[dict[str, dict[str, Any]]] = None
+_cache_dirty = False
+
+
+def resolve_git_dirs(repo_path: Path) -> Optional[tuple[Path, Path]]:
+    """(git dir, common dir). `.git` may be a `gitdir:` pointer file (worktrees, submodules); worktrees keep refs and config in the common dir."""
+    dot_git = repo_path.joinpath(".git")
+    if dot_git.is_dir():
+        git_dir = dot_git
+    else:
+        content = dot_git.read_text(encoding="utf-8").strip()
+        if not content.startswith("gitdir:"):
+            return None
+        git_dir = repo_path.joinpath(content.removeprefix("gitdir:").strip()).resolve()
+    common_file = git_dir.joinpath("commondir")
+    common_dir = git_dir.joinpath(common_file.read_text(encoding="utf-8").strip()).resolve() if common_file.is_file() else git_dir
+    return git_dir, common_dir
+
+
+def read_ref(git_dir: Path, common_dir: Path, ref: str) -> Optional[str]:
+    for base in (git_dir, common_dir):
+        loose = base.joinpath(ref)
+        if loose.is_file():
+            return loose.read_text(encoding="utf-8").strip()
+    packed = common_dir.joinpath("packed-refs")
+    if packed.is_file():
+        for line in packed.read_text(encoding="utf-8").splitlines():
+            if line.startswith(("#", "^")):
+                continue
+            sha, _, name = line.partition(" ")
+            if name.strip() == ref:
+                return sha
+    return None
+
+
+def _uses_fsmonitor(common_dir: Path) -> bool:
+    try:
+        config = common_dir.joinpath("config").read_text(encoding="utf-8").lower()
+    except OSError:
+        return False
+    return any(line.strip().startswith("fsmonitor") and not line.strip().endswith("false") for line in config.splitlines())
+
+
+def _git_state(repo_path: Path) -> Optional[dict[str, Any]]:
+    """HEAD, the commit it resolves to and the index's stat; None when the state must come from git every time
+    (unreadable .git, or fsmonitor already makes status cheap)."""
+    try:
+        dirs = resolve_git_dirs(repo_path)
+        if dirs is None:
+            return None
+        git_dir, common_dir = dirs
+        if _uses_fsmonitor(common_dir):
+            return None
+        head = git_dir.joinpath("HEAD").read_text(encoding="utf-8").strip()
+        head_commit = read_ref(git_dir, common_dir, head.removeprefix("ref:").strip()) if head.startswith("ref:") else head
+        index = git_dir.joinpath("index")
+        index_stat = index.stat() if index.exists() else None
+    except (OSError, UnicodeDecodeError):
+        return None
+    return {"head": head, "head_commit": head_commit, "index": [index_stat.st_mtime_ns, index_stat.st_size] if index_stat is not None else None}
+
+
+def _directory_mtimes(repo_path: Path, directories: list[str]) -> dict[str, Optional[int]]:
+    """mtime of each directory (relative, posix); None for one that is gone."""
+    mtimes: dict[str, Optional[int]] = {}
+    for directory in directories:
+        try:
+            mtimes[directory] = os.stat(os.path.join(repo_path, directory)).st_mtime_ns
+        except OSError:
+            mtimes[directory] = None
+    return mtimes
+
+
+def _file_stats(repo_path: Path, files: list[str]) -> dict[str, Optional[list[int]]]:
+    """[mtime, size] of each file (relative, posix; not following symlinks, like git); None for one that is gone."""
+    stats: dict[str, Optional[list[int]]] = {}
+    for file in files:
+        try:
+            stat = os.lstat(os.path.join(repo_path, file))
+            stats[file] = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            stats[file] = None
+    return stats
+
+
+def _tracked_files(repo_path: Path) -> list[str]:
+    """Every indexed path. Ignored directories (`.venv`, `node_modules`, build output) never hold one, so nothing below
+    them is looked at."""
+    cmd = ["git", "-C", str(repo_path), "ls-files", "-z"]
+    result = subprocess.run(cmd, capture_output=True, check=True)
+    return [path for path in result.stdout.decode("utf-8", "surrogateescape").split("\0") if path]
+
+
+def _parent_directories(files: list[str]) -> list[str]:
+    """The work tree's root and every directory holding one of `files`."""
+    directories = {""}
+    for path in files:
+        parent = posixpath.dirname(path)
+        while parent not in directories:
+            directories.add(parent)
+            parent = posixpath.dirname(parent)
+    return sorted(directories)
+
+
+def _git_status(repo_path: Path) -> tuple[bool, set[str]]:
+    """(dirty, directories holding untracked files). Untracked files are listed one by one rather than collapsed into
+    their top directory, so that emptying a nested one shows in a directory that is watched."""
+    # untrackedCache lets git skip directories whose mtime has not changed since it last listed them.
+    cmd = ["git", "-c", "core.untrackedCache=true", "-C", str(repo_path), "status", "--porcelain", "-z", "--untracked-files=all"]
+    result = subprocess.run(cmd, capture_output=True, check=True)
+    records = [record for record in result.stdout.decode("utf-8", "surrogateescape").split("\0") if record]
+    untracked = {posixpath.dirname(record[3:]) for record in records if record.startswith("?? ")}
+    return len(records) > 0, untracked
+
+
+def _load_cache() -> dict[str, dict[str, Any]]:
+    global _memory_cache
+    if _memory_cache is None:
+        try:
+            data = json.loads(REPO_STATUS_CACHE_PATH.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            data = {}
+        _memory_cache = data if isinstance(data, dict) else {}
+    return _memory_cache
+
+
+def flush_cache() -> None:
+    """Persist verdicts computed since the last flush (one write per batch, not per repository)."""
+    global _cache_dirty
+    with _CACHE_LOCK:
+        if not _cache_dirty or _memory_cache is None:
+            return
+        REPO_STATUS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = REPO_STATUS_CACHE_PATH.with_suffix(REPO_STATUS_CACHE_PATH.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(_memory_cache), encoding="utf-8")
+        tmp_path.replace(REPO_STATUS_CACHE_PATH)
+        _cache_dirty = False
+
+
+def is_repo_dirty(repo_path: Path, max_age_seconds: float = DEFAULT_STATUS_MAX_AGE_SECONDS, persist: bool = True) -> bool:
+    """
+    Same verdict as `git status --porcelain` being non-empty (tracked changes or untracked files), reused while the
+    repository's fingerprint is unchanged. Raises `subprocess.CalledProcessError` if git fails.
+    """
+    global _cache_dirty
+    key = str(repo_path.expanduser().absolute())
+    before = _git_state(repo_path)
+    with _CACHE_LOCK:
+        entry = _load_cache().get(key)
+    if before is not None and entry is not None and entry.get("git") == before and time.time() - entry.get("checked_at", 0.0) <= max_age_seconds:
+        directories: dict[str, Optional[int]] = entry.get("directories", {})
+        files: dict[str, Optional[list[int]]] = entry.get("files", {})
+        if _directory_mtimes(repo_path, list(directories)) == directories and _file_stats(repo_path, list(files)) == files:
+            return bool(entry["dirty"])
+    if before is None:
+        return _git_status(repo_path)[0]
+
+    # The tracked paths live in the index: while its stat is unchanged, the list from the last check still holds.
+    same_index = entry is not None and "files" in entry and (entry.get("git") or {}).get("index") == before["index"]
+    tracked_files = list(entry["files"]) if entry is not None and same_index else _tracked_files(repo_path)
+    # Stats are taken before `git status` runs, so a change racing with it invalidates the verdict.
+    file_stats = _file_stats(repo_path, tracked_files)
+    tracked = _directory_mtimes(repo_path, _parent_directories(tracked_files))
+    dirty, untracked = _git_status(repo_path)
+    # `git status` may rewrite the index (stat refresh, untracked cache), which only touches the index stat.
+    # Keep the post-status state when nothing else moved, so the next call can hit the cache.
+    after = _git_state(repo_path)
+    git_state = after if after is not None and {**after, "index": None} == {**before, "index": None} else before
+    # Directories holding untracked files are watched too: emptying one makes a dirty repository clean again.
+    directories = {**tracked, **_directory_mtimes(repo_path, sorted(untracked - tracked.keys()))}
+    with _CACHE_LOCK:
+        _load_cache()[key] = {"git": git_state, "directories": directories, "files": file_stats, "dirty": dirty, "checked_at": time.time()}
+        _cache_dirty = True
+    if persist:
+        flush_cache()
+    return dirty
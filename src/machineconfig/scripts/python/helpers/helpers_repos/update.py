@@ -3,6 +3,8 @@ from typing import TypedDict
 import subprocess
 import git
 
+from machineconfig.scripts.python.helpers.helpers_repos.git_scheduler import GitThrottledError, git_network_env, is_throttled, retry_throttled
+
 
 class RepositoryUpdateResult(TypedDict):
     """Result of updating a single repository."""
@@ -66,7 +68,7 @@ def get_file_hash(file_path: Path) -> str | None:
 
 
 def update_repository(repo: git.Repo, auto_uv_sync: bool, allow_password_prompt: bool) -> RepositoryUpdateResult:
-    """Update a single repository and return detailed information about what happened."""
+    """Update a single repository and return detailed information about what happened. A throttled fetch or pull is retried on its own (see `retry_throttled`)."""
     repo_path = Path(repo.working_dir)
     print(f"🔄 {'Updating ' + str(repo_path):.^80}")
 
@@ -134,25 +136,24 @@ def update_repository(repo: git.Repo, auto_uv_sync: bool, allow_password_prompt:
             try:
                 print(f"📥 Fetching from {remote.name}...")
 
-                # Set up environment for git commands
-                env = None
-                if not allow_password_prompt:
-                    # Disable interactive prompts
-                    import os
-
-                    env = os.environ.copy()
-                    env["GIT_TERMINAL_PROMPT"] = "0"
-                    env["GIT_ASKPASS"] = "echo"  # Returns empty string for any credential request
+                # Set up environment for git commands (shared ssh connection per host, no prompts unless allowed)
+                env = git_network_env(allow_password_prompt)
+
+                def _fetch() -> subprocess.CompletedProcess[str]:
+                    completed = subprocess.run(
+                        ["git", "fetch", remote.name, "--verbose"],
+                        cwd=repo_path,
+                        capture_output=True,
+                        text=True,
+                        env=env,
+                        timeout=30,  # Add timeout to prevent hanging
+                    )
+                    if completed.returncode != 0 and is_throttled((completed.stderr or "") + (completed.stdout or "")):
+                        raise GitThrottledError(f"fetch from {remote.name} was throttled: {completed.stderr.strip()}")
+                    return completed
 
                 # First fetch to see what's available
-                fetch_result = subprocess.run(
-                    ["git", "fetch", remote.name, "--verbose"],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                    env=env,
-                    timeout=30,  # Add timeout to prevent hanging
-                )
+                fetch_result = retry_throttled(_fetch)
 
                 # Check if fetch failed due to authentication
                 if fetch_result.returncode != 0 and not allow_password_prompt:
@@ -179,7 +180,14 @@ def update_repository(repo: git.Repo, auto_uv_sync: bool, allow_password_prompt:
 
                 # Now pull with verbose output
                 print(f"📥 Pulling from {remote.name}/{repo.active_branch.name}...")
-                pull_result = subprocess.run(["git", "pull", remote.name, repo.active_branch.name, "--verbose"], cwd=repo_path, capture_output=True, text=True, env=env, timeout=30)
+
+                def _pull() -> subprocess.CompletedProcess[str]:
+                    completed = subprocess.run(["git", "pull", remote.name, repo.active_branch.name, "--verbose"], cwd=repo_path, capture_output=True, text=True, env=env, timeout=30)
+                    if completed.returncode != 0 and is_throttled((completed.stderr or "") + (completed.stdout or "")):
+                        raise GitThrottledError(f"pull from {remote.name} was throttled: {completed.stderr.strip()}")
+                    return completed
+
+                pull_result = retry_throttled(_pull)
 
                 # Check if pull failed due to authentication
                 if pull_result.returncode != 0 and not allow_password_prompt:
@@ -218,7 +226,7 @@ def update_repository(repo: git.Repo, auto_uv_sync: bool, allow_password_prompt:
                     result["remotes_skipped"].append(remote.name)
                     print(f"❌ Pull failed with return code {pull_result.returncode}")
 
-            except Exception as e:
+            except Exception as e:  # including a `GitThrottledError` that outlived its retries
                 result["remotes_skipped"].append(remote.name)
                 print(f"⚠️  Failed to pull from {remote.name}: {e}")
                 continue
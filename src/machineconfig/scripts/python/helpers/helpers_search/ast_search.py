@@ -1,5 +1,3 @@
-
-import ast
 import os
 from typing import TypedDict
 
@@ -14,61 +12,16 @@ class SymbolInfo(TypedDict):
     docstring: str
 
 
-def _get_docstring(node: ast.AsyncFunctionDef | ast.FunctionDef | ast.ClassDef | ast.Module) -> str:
-    """Extract docstring from an AST node."""
-    return ast.get_docstring(node) or ""
-
-
-def _extract_symbols(tree: ast.AST, module_path: str, source: str) -> list[SymbolInfo]:
-    """Extract symbols from an AST tree."""
-    symbols: list[SymbolInfo] = []
-    
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-            symbol: SymbolInfo = {
-                "type": "function",
-                "name": node.name,
-                "path": f"{module_path}.{node.name}",
-                "docstring": _get_docstring(node),
-            }
-            symbols.append(symbol)
-        elif isinstance(node, ast.ClassDef):
-            symbol: SymbolInfo = {
-                "type": "class",
-                "name": node.name,
-                "path": f"{module_path}.{node.name}",
-                "docstring": _get_docstring(node),
-            }
-            symbols.append(symbol)
-    
-    return symbols
-
-
 def get_repo_symbols(repo_path: str) -> list[SymbolInfo]:
-    skip_dirs = {'.venv', 'venv', '__pycache__', '.mypy_cache', '.pytest_cache', '.git'}
-    results: list[SymbolInfo] = []
-    counter: int = 0
-    for root, dirs, files in os.walk(repo_path):
-        dirs[:] = [d for d in dirs if d not in skip_dirs and not d.startswith('.')]
-        for file in files:
-            if not file.endswith(".py"):
-                continue
-            file_path = os.path.join(root, file)
-            module_path = (
-                os.path.relpath(file_path, repo_path)
-                .replace(os.sep, ".")
-                .removesuffix(".py")
-            )
-            try:
-                if counter % 100 == 0: print(f"🔍 Parsing {counter}: {file_path}...")
-                with open(file_path, encoding="utf-8") as f:
-                    source = f.read()
-                tree = ast.parse(source, filename=file_path)
-                symbols = _extract_symbols(tree, module_path, source)
-                results.extend(symbols)
-            except Exception as e:
-                print(f"⚠️ Error parsing {file_path}: {e}")
-                continue
-            counter += 1
+    """Every class and function below `repo_path`, served from the persistent symbol index (only changed files are re-parsed)."""
+    from machineconfig.scripts.python.helpers.helpers_search.symbol_index import directory_symbols
 
+    root = os.path.abspath(repo_path)
+    symbols, errors = directory_symbols(root)
+    for file_path, error in errors.items():
+        print(f"⚠️ Error parsing {file_path}: {error}")
+    results: list[SymbolInfo] = []
+    for symbol in symbols:
+        module_path = os.path.relpath(symbol.file_path, root).replace(os.sep, ".").removesuffix(".py")
+        results.append({"type": symbol.type, "name": symbol.name, "path": f"{module_path}.{symbol.name}", "docstring": symbol.docstring or ""})
     return results
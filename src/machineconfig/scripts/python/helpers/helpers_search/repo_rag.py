@@ -1,325 +1,368 @@
-# #!/usr/bin/env python3
-# from pathlib import Path
-# from typing import Annotated
-# import subprocess
-# import typer
-# from rich.console import Console
-# from rich.progress import Progress, SpinnerColumn, TextColumn
-# from rich.table import Table
-# from rich.syntax import Syntax
-
-# import chromadb
-# from chromadb.config import Settings
-# from sentence_transformers import SentenceTransformer
-
-
-# app = typer.Typer(help="Semantic search over your repository using local RAG")
-# console = Console()
-
-
-# DEFAULT_EXTENSIONS = [".py", ".sh", ".ps1", ".md", ".toml", ".yaml", ".yml", ".json"]
-# DEFAULT_MODEL = "all-MiniLM-L6-v2"
-# DEFAULT_DB_PATH = Path.home() / ".cache" / "repo_rag"
-
-
-# class RepoRAG:
-#     def __init__(self, db_path: Path, model_name: str = DEFAULT_MODEL) -> None:
-#         self.db_path = db_path
-#         self.db_path.mkdir(parents=True, exist_ok=True)
-        
-#         with console.status(f"[bold green]Loading embedding model: {model_name}..."):
-#             self.model = SentenceTransformer(model_name)
-        
-#         self.client = chromadb.PersistentClient(
-#             path=str(db_path),
-#             settings=Settings(anonymized_telemetry=False)
-#         )
-        
-#     def _get_or_create_collection(self, repo_path: Path) -> chromadb.Collection:
-#         collection_name = f"repo_{repo_path.name}".replace("-", "_").replace(".", "_")
-#         return self.client.get_or_create_collection(
-#             name=collection_name,
-#             metadata={"repo_path": str(repo_path)}
-#         )
-    
-#     def _chunk_file_content(self, content: str, chunk_size: int = 500, overlap: int = 50) -> list[str]:
-#         lines = content.split("\n")
-#         chunks: list[str] = []
-#         current_chunk: list[str] = []
-#         current_size = 0
-        
-#         for line in lines:
-#             line_size = len(line)
-#             if current_size + line_size > chunk_size and current_chunk:
-#                 chunks.append("\n".join(current_chunk))
-#                 overlap_lines = current_chunk[-overlap:] if len(current_chunk) > overlap else current_chunk
-#                 current_chunk = overlap_lines
-#                 current_size = sum(len(line_text) for line_text in current_chunk)
-            
-#             current_chunk.append(line)
-#             current_size += line_size
-        
-#         if current_chunk:
-#             chunks.append("\n".join(current_chunk))
-        
-#         return chunks if chunks else [content]
-    
-#     def index_repo(self, repo_path: Path, extensions: list[str], max_file_size_kb: int = 500) -> None:
-#         collection = self._get_or_create_collection(repo_path)
-        
-#         files_to_index: list[Path] = []
-#         for ext in extensions:
-#             files_to_index.extend(repo_path.rglob(f"*{ext}"))
-        
-#         files_to_index = [
-#             f for f in files_to_index 
-#             if not any(part.startswith('.') for part in f.relative_to(repo_path).parts[:-1])
-#             and f.stat().st_size < max_file_size_kb * 1024
-#         ]
-        
-#         console.print(f"[bold cyan]Found {len(files_to_index)} files to index")
-        
-#         with Progress(
-#             SpinnerColumn(),
-#             TextColumn("[progress.description]{task.description}"),
-#             console=console
-#         ) as progress:
-#             task = progress.add_task("Indexing files...", total=len(files_to_index))
-            
-#             for file_path in files_to_index:
-#                 try:
-#                     content = file_path.read_text(encoding="utf-8", errors="ignore")
-#                     rel_path = str(file_path.relative_to(repo_path))
-                    
-#                     chunks = self._chunk_file_content(content)
-                    
-#                     for i, chunk in enumerate(chunks):
-#                         doc_id = f"{rel_path}::chunk_{i}"
-#                         embedding = self.model.encode(chunk).tolist()
-                        
-#                         collection.upsert(
-#                             ids=[doc_id],
-#                             embeddings=[embedding],
-#                             documents=[chunk],
-#                             metadatas=[{
-#                                 "file_path": rel_path,
-#                                 "chunk_index": i,
-#                                 "total_chunks": len(chunks),
-#                                 "extension": file_path.suffix
-#                             }]
-#                         )
-                    
-#                 except Exception as e:
-#                     console.print(f"[yellow]Warning: Failed to index {file_path}: {e}")
-                
-#                 progress.advance(task)
-        
-#         console.print("[bold green]✓ Indexing complete!")
-    
-#     def search(self, repo_path: Path, query: str, n_results: int = 20) -> list[dict[str, str | dict[str, str | int]]]:
-#         collection = self._get_or_create_collection(repo_path)
-        
-#         with console.status("[bold green]Searching..."):
-#             query_embedding = self.model.encode(query).tolist()
-#             results = collection.query(
-#                 query_embeddings=[query_embedding],
-#                 n_results=n_results
-#             )
-        
-#         if not results["ids"] or not results["ids"][0]:
-#             return []
-        
-#         search_results: list[dict[str, str | dict[str, str | int]]] = []
-#         for i, doc_id in enumerate(results["ids"][0]):
-#             search_results.append({
-#                 "id": doc_id,
-#                 "file_path": results["metadatas"][0][i]["file_path"],
-#                 "content": results["documents"][0][i],
-#                 "distance": results["distances"][0][i] if results.get("distances") else 0.0,
-#                 "metadata": results["metadatas"][0][i]
-#             })
-        
-#         return search_results
-    
-#     def delete_index(self, repo_path: Path) -> None:
-#         collection_name = f"repo_{repo_path.name}".replace("-", "_").replace(".", "_")
-#         try:
-#             self.client.delete_collection(name=collection_name)
-#             console.print(f"[bold green]✓ Deleted index for {repo_path.name}")
-#         except Exception as e:
-#             console.print(f"[bold red]Error deleting index: {e}")
-
-
-# @app.command()
-# def index(
-#     repo_path: Annotated[Path, typer.Argument(help="Path to repository to index")] = Path.cwd(),
-#     extensions: Annotated[str, typer.Option("--ext", "-e", help="Comma-separated list of extensions")] = ",".join(DEFAULT_EXTENSIONS),
-#     model: Annotated[str, typer.Option("--model", "-m", help="Sentence transformer model name")] = DEFAULT_MODEL,
-#     db_path: Annotated[Path, typer.Option("--db", help="Database path")] = DEFAULT_DB_PATH,
-#     max_size_kb: Annotated[int, typer.Option("--max-size", help="Max file size in KB")] = 500,
-# ) -> None:
-#     repo_path = repo_path.resolve()
-    
-#     if not repo_path.exists():
-#         console.print(f"[bold red]Error: Repository path does not exist: {repo_path}")
-#         raise typer.Exit(1)
-    
-#     ext_list = [ext.strip() if ext.startswith(".") else f".{ext.strip()}" for ext in extensions.split(",")]
-    
-#     console.print(f"[bold cyan]Repository:[/] {repo_path}")
-#     console.print(f"[bold cyan]Extensions:[/] {', '.join(ext_list)}")
-#     console.print(f"[bold cyan]Model:[/] {model}")
-#     console.print(f"[bold cyan]Database:[/] {db_path}")
-#     console.print()
-    
-#     rag = RepoRAG(db_path, model)
-#     rag.index_repo(repo_path, ext_list, max_size_kb)
-
-
-# @app.command()
-# def search(
-#     query: Annotated[str, typer.Argument(help="Search query")],
-#     repo_path: Annotated[Path, typer.Option("--repo", "-r", help="Path to repository")] = Path.cwd(),
-#     n_results: Annotated[int, typer.Option("--num", "-n", help="Number of results")] = 20,
-#     model: Annotated[str, typer.Option("--model", "-m", help="Sentence transformer model name")] = DEFAULT_MODEL,
-#     db_path: Annotated[Path, typer.Option("--db", help="Database path")] = DEFAULT_DB_PATH,
-#     use_fzf: Annotated[bool, typer.Option("--fzf", help="Use fzf for interactive selection")] = True,
-#     show_content: Annotated[bool, typer.Option("--content", "-c", help="Show content snippets")] = True,
-# ) -> None:
-#     repo_path = repo_path.resolve()
-    
-#     if not repo_path.exists():
-#         console.print(f"[bold red]Error: Repository path does not exist: {repo_path}")
-#         raise typer.Exit(1)
-    
-#     rag = RepoRAG(db_path, model)
-#     results = rag.search(repo_path, query, n_results)
-    
-#     if not results:
-#         console.print("[yellow]No results found")
-#         raise typer.Exit(0)
-    
-#     if use_fzf:
-#         _search_with_fzf(results, repo_path, show_content)
-#     else:
-#         _display_results(results, show_content)
-
-
-# def _display_results(results: list[dict[str, str | dict[str, str | int]]], show_content: bool) -> None:
-#     table = Table(title="Search Results", show_header=True, header_style="bold magenta")
-#     table.add_column("#", style="cyan", width=4)
-#     table.add_column("File", style="green")
-#     table.add_column("Chunk", style="yellow", width=8)
-#     table.add_column("Score", style="blue", width=8)
-#     if show_content:
-#         table.add_column("Content Preview", style="white", width=60)
-    
-#     for i, result in enumerate(results, 1):
-#         file_path = str(result["file_path"])
-#         metadata = result["metadata"]
-#         chunk_info = f"{int(metadata['chunk_index']) + 1}/{int(metadata['total_chunks'])}"
-#         score = f"{float(result['distance']):.3f}"
-        
-#         row = [str(i), file_path, chunk_info, score]
-        
-#         if show_content:
-#             content = str(result["content"])
-#             preview = content[:200].replace("\n", " ") + ("..." if len(content) > 200 else "")
-#             row.append(preview)
-        
-#         table.add_row(*row)
-    
-#     console.print(table)
-
-
-# def _search_with_fzf(results: list[dict[str, str | dict[str, str | int]]], repo_path: Path, show_content: bool) -> None:
-#     try:
-#         fzf_input_lines: list[str] = []
-#         for i, result in enumerate(results, 1):
-#             file_path = str(result["file_path"])
-#             metadata = result["metadata"]
-#             chunk_info = f"{int(metadata['chunk_index']) + 1}/{int(metadata['total_chunks'])}"
-#             score = f"{float(result['distance']):.3f}"
-            
-#             if show_content:
-#                 content = str(result["content"]).replace("\n", " ")[:100]
-#                 line = f"{i:3d} │ {score:6s} │ {chunk_info:5s} │ {file_path:60s} │ {content}"
-#             else:
-#                 line = f"{i:3d} │ {score:6s} │ {chunk_info:5s} │ {file_path}"
-            
-#             fzf_input_lines.append(line)
-        
-#         fzf_input = "\n".join(fzf_input_lines)
-        
-#         result = subprocess.run(
-#             ["fzf", "--ansi", "--multi", "--reverse", "--header=Select files to open (TAB for multi-select)"],
-#             input=fzf_input.encode(),
-#             capture_output=True
-#         )
-        
-#         if result.returncode != 0:
-#             console.print("[yellow]Selection cancelled")
-#             return
-        
-#         selected_lines = result.stdout.decode().strip().split("\n")
-        
-#         for line in selected_lines:
-#             if not line:
-#                 continue
-            
-#             parts = line.split("│")
-#             if len(parts) < 4:
-#                 continue
-            
-#             file_path_str = parts[3].strip().split()[0]
-            
-#             idx = int(parts[0].strip()) - 1
-#             if idx < len(results):
-#                 content = str(results[idx]["content"])
-                
-#                 console.print(f"\n[bold green]File:[/] {file_path_str}")
-#                 console.print("[bold cyan]Content:[/]")
-                
-#                 syntax = Syntax(content, "python", theme="monokai", line_numbers=True)
-#                 console.print(syntax)
-#                 console.print("\n" + "─" * 80 + "\n")
-    
-#     except FileNotFoundError:
-#         console.print("[bold red]Error: fzf not found. Install fzf or use --no-fzf flag")
-#         _display_results(results, show_content)
-
-
-# @app.command()
-# def delete(
-#     repo_path: Annotated[Path, typer.Argument(help="Path to repository")] = Path.cwd(),
-#     db_path: Annotated[Path, typer.Option("--db", help="Database path")] = DEFAULT_DB_PATH,
-#     model: Annotated[str, typer.Option("--model", "-m", help="Sentence transformer model name")] = DEFAULT_MODEL,
-# ) -> None:
-#     repo_path = repo_path.resolve()
-#     rag = RepoRAG(db_path, model)
-#     rag.delete_index(repo_path)
-
-
-# @app.command()
-# def info() -> None:
-#     console.print("[bold cyan]Repo RAG - Semantic Code Search[/]\n")
-    
-#     info_table = Table(show_header=False, box=None)
-#     info_table.add_column("Key", style="cyan")
-#     info_table.add_column("Value", style="white")
-    
-#     info_table.add_row("Embedding Model", DEFAULT_MODEL)
-#     info_table.add_row("Vector Store", "ChromaDB (embedded)")
-#     info_table.add_row("Default Extensions", ", ".join(DEFAULT_EXTENSIONS))
-#     info_table.add_row("Database Path", str(DEFAULT_DB_PATH))
-    
-#     console.print(info_table)
-    
-#     console.print("\n[bold green]Quick Start:[/]")
-#     console.print("1. Index your repo:     [yellow]repo-rag index[/]")
-#     console.print("2. Search semantically: [yellow]repo-rag search 'your query'[/]")
-#     console.print("3. Delete index:        [yellow]repo-rag delete[/]")
-
-
-# if __name__ == "__main__":
-#     app()
+"""
+Local, CPU-only semantic search over a repository.
+
+Files are cut into overlapping line windows; chunks of every changed file are embedded together in large batches and
+appended to a float32 matrix on disk that queries memory-map. Chunk metadata and per-file content hashes live in SQLite,
+so re-indexing only embeds files whose content changed (a replaced file's rows become tombstones, compacted once they
+pile up). Past IVF_MIN_ROWS vectors an inverted-file index (spherical k-means centroids + row lists per centroid)
+limits a query to the rows of its `nprobe` nearest centroids instead of scanning the whole matrix.
+
+The embedding model is pluggable: anything with `name`, `dim` and `embed(texts) -> (n, dim) float32, L2-normalised`.
+`HashingEmbedder` needs only numpy (lexical, deterministic; handy for tests), `SentenceTransformerEmbedder` wraps a
+local sentence-transformers model.
+"""
+
+from typing import TYPE_CHECKING, Iterator, NamedTuple, Protocol
+from contextlib import closing, contextmanager
+from pathlib import Path
+import hashlib
+import math
+import os
+import re
+import shutil
+import sqlite3
+
+from machineconfig.utils.source_of_truth import CONFIG_ROOT
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+
+SEMANTIC_INDEX_ROOT = CONFIG_ROOT.joinpath("semantic_index")
+DEFAULT_EXTENSIONS = (".py", ".sh", ".ps1", ".md", ".toml", ".yaml", ".yml", ".json")
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+EMBEDDER_ENV_VAR = "MSEARCH_EMBEDDER"  # "auto" (default), "hashing", "hashing:<dim>" or a sentence-transformers model name
+SKIP_DIRS = {".venv", "venv", "node_modules", "__pycache__", ".mypy_cache", ".pytest_cache", ".git"}
+MAX_FILE_BYTES = 512 * 1024
+CHUNK_LINES = 40
+CHUNK_OVERLAP = 10
+EMBED_BATCH = 256
+IVF_MIN_ROWS = 20_000  # below this an exact scan over the memory-mapped matrix is already a few milliseconds.
+IVF_RETRAIN_GROWTH = 0.5  # retrain centroids once the index grew by this fraction since they were trained.
+KMEANS_SAMPLE = 65_536
+KMEANS_ITERATIONS = 10
+ASSIGN_BATCH = 65_536
+DEFAULT_NPROBE = 24
+COMPACT_DEAD_FRACTION = 0.3
+SCHEMA_VERSION = 1
+_TOKEN_RE = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+
+
+class Embedder(Protocol):
+    name: str
+    dim: int
+
+    def embed(self, texts: list[str]) -> "npt.NDArray[np.float32]": ...
+
+
+class SearchHit(NamedTuple):
+    path: str  # relative to the indexed root
+    start_line: int
+    end_line: int
+    score: float  # cosine similarity
+    text: str
+
+
+def _normalize_rows(matrix: "npt.NDArray[np.float32]") -> "npt.NDArray[np.float32]":
+    import numpy as np
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+class HashingEmbedder:
+    """Signed feature hashing of identifier sub-tokens and their bigrams, with sublinear term frequency."""
+
+    def __init__(self, dim: int = 1024) -> None:
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+        self._buckets: dict[str, tuple[int, float]] = {}
+
+    def _bucket(self, feature: str) -> tuple[int, float]:
+        bucket = self._buckets.get(feature)
+        if bucket is None:
+            value = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+            bucket = (value % self.dim, -1.0 if value >> 63 else 1.0)
+            self._buckets[feature] = bucket
+        return bucket
+
+    def embed(self, texts: list[str]) -> "npt.NDArray[np.float32]":
+        import numpy as np
+
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = [token.lower() for token in _TOKEN_RE.findall(text)]
+            features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+            if len(features) == 0:
+                continue
+            buckets = [self._bucket(feature) for feature in features]
+            np.add.at(out[row], np.fromiter((b[0] for b in buckets), dtype=np.intp, count=len(buckets)), np.fromiter((b[1] for b in buckets), dtype=np.float32, count=len(buckets)))
+        np.copysign(np.log1p(np.abs(out)), out, out=out)
+        return _normalize_rows(out)
+
+
+class SentenceTransformerEmbedder:
+    def __init__(self, model_name: str) -> None:
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.name = f"st-{model_name}"
+        self.dim = int(self.model.get_sentence_embedding_dimension() or 0)
+
+    def embed(self, texts: list[str]) -> "npt.NDArray[np.float32]":
+        import numpy as np
+
+        vectors = self.model.encode(texts, batch_size=64, normalize_embeddings=True, convert_to_numpy=True, show_progress_bar=False)
+        return np.ascontiguousarray(vectors, dtype=np.float32)
+
+
+def get_embedder(spec: str) -> Embedder:
+    """`auto` prefers DEFAULT_MODEL and falls back to hashing when sentence-transformers is not installed."""
+    if spec == "hashing" or spec.startswith("hashing:"):
+        return HashingEmbedder(dim=int(spec.partition(":")[2] or 1024))
+    if spec == "auto":
+        try:
+            return SentenceTransformerEmbedder(DEFAULT_MODEL)
+        except ImportError:
+            print("ℹ️  sentence-transformers is not installed; using the lexical hashing embedder.")
+            return HashingEmbedder()
+    return SentenceTransformerEmbedder(spec)
+
+
+def chunk_text(text: str) -> list[tuple[int, int, str]]:
+    """(first line, last line, text) windows of CHUNK_LINES lines overlapping by CHUNK_OVERLAP; blank windows dropped."""
+    lines = text.splitlines()
+    chunks: list[tuple[int, int, str]] = []
+    for start in range(0, len(lines), CHUNK_LINES - CHUNK_OVERLAP):
+        end = min(len(lines), start + CHUNK_LINES)
+        body = "\n".join(lines[start:end])
+        if body.strip():
+            chunks.append((start + 1, end, body))
+        if end == len(lines):
+            break
+    return chunks
+
+
+def _walk_files(root: Path, extensions: tuple[str, ...]) -> Iterator[Path]:
+    for directory, dirs, names in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS and not d.startswith(".")]
+        for name in names:
+            if name.endswith(extensions):
+                yield Path(directory, name)
+
+
+class SemanticIndex:
+    def __init__(self, root: Path, embedder: Embedder) -> None:
+        self.root = root.expanduser().resolve()
+        self.embedder = embedder
+        self.index_dir = SEMANTIC_INDEX_ROOT.joinpath(hashlib.sha1(str(self.root).encode("utf-8")).hexdigest()[:16])
+        self.vectors_path = self.index_dir.joinpath("vectors.f32")
+        self.db_path = self.index_dir.joinpath("meta.sqlite")
+
+    # ------------------------------------------------------------------ storage
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                with conn:
+                    conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+                    conn.execute("CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, sha256 TEXT NOT NULL)")
+                    conn.execute("CREATE TABLE IF NOT EXISTS chunks (row INTEGER PRIMARY KEY, path TEXT NOT NULL, start_line INTEGER NOT NULL, end_line INTEGER NOT NULL, text TEXT NOT NULL)")
+                    conn.execute("CREATE INDEX IF NOT EXISTS chunks_path ON chunks (path)")
+                    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            yield conn
+
+    def _meta(self, conn: sqlite3.Connection, key: str, default: str) -> str:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return default if row is None else row[0]
+
+    def _set_meta(self, conn: sqlite3.Connection, **values: object) -> None:
+        conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", [(key, str(value)) for key, value in values.items()])
+
+    def _row_count(self) -> int:
+        return self.vectors_path.stat().st_size // (4 * self.embedder.dim) if self.vectors_path.exists() else 0
+
+    def _vectors(self, rows: int) -> "np.memmap":
+        import numpy as np
+
+        return np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(rows, self.embedder.dim))
+
+    def _ivf_path(self, part: str) -> Path:
+        return self.index_dir.joinpath(f"ivf_{part}.npy")
+
+    def _save_array(self, part: str, array: "npt.NDArray") -> None:
+        import numpy as np
+
+        tmp_path = self._ivf_path(part).with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, array)
+        tmp_path.replace(self._ivf_path(part))
+
+    def _drop_if_incompatible(self) -> None:
+        if not self.db_path.exists():
+            return
+        with self._connect() as conn:
+            stored = self._meta(conn, "embedder", self.embedder.name)
+        if stored != self.embedder.name:
+            print(f"♻️  Index was built with `{stored}`; rebuilding it with `{self.embedder.name}`.")
+            shutil.rmtree(self.index_dir)
+
+    # ------------------------------------------------------------------ indexing
+    def update(self, extensions: tuple[str, ...]) -> None:
+        """Embed new and changed files, drop deleted ones, then refresh the IVF lists (retraining centroids when needed)."""
+        import numpy as np
+        from rich.progress import Progress
+
+        self._drop_if_incompatible()
+        with self._connect() as conn:
+            known = {path: (mtime_ns, size, sha) for path, mtime_ns, size, sha in conn.execute("SELECT path, mtime_ns, size, sha256 FROM files")}
+            seen: set[str] = set()
+            touched: list[tuple[str, int, int, str]] = []
+            pending: list[tuple[str, int, int, str]] = []  # (path, start, end, text)
+            for file_path in _walk_files(self.root, extensions):
+                rel_path = file_path.relative_to(self.root).as_posix()
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                if stat.st_size > MAX_FILE_BYTES:
+                    continue
+                seen.add(rel_path)
+                previous = known.get(rel_path)
+                if previous is not None and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                data = file_path.read_bytes()
+                sha = hashlib.sha256(data).hexdigest()
+                touched.append((rel_path, stat.st_mtime_ns, stat.st_size, sha))
+                if previous is not None and previous[2] == sha:
+                    continue  # touched but identical: refresh the stat, keep the vectors.
+                pending.extend((rel_path, start, end, text) for start, end, text in chunk_text(data.decode("utf-8", errors="ignore")))
+            replaced = {path for path, _, _, sha in touched if path in known and known[path][2] != sha} | set(known).difference(seen)
+
+            first_row = self._row_count()
+            if pending:
+                with Progress() as progress:
+                    task = progress.add_task(f"Embedding {len(pending)} chunks", total=len(pending))
+                    with open(self.vectors_path, "ab") as f:
+                        for start in range(0, len(pending), EMBED_BATCH):
+                            batch = pending[start : start + EMBED_BATCH]
+                            vectors = self.embedder.embed([f"{path}\n{text}" for path, _, _, text in batch])
+                            f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+                            progress.advance(task, len(batch))
+            with conn:
+                dead = sum(conn.execute("SELECT COUNT(*) FROM chunks WHERE path = ?", (path,)).fetchone()[0] for path in replaced)
+                conn.executemany("DELETE FROM chunks WHERE path = ?", [(path,) for path in replaced])
+                conn.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in set(known).difference(seen)])
+                conn.executemany("INSERT INTO chunks VALUES (?, ?, ?, ?, ?)", [(first_row + i, path, start, end, text) for i, (path, start, end, text) in enumerate(pending)])
+                conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", touched)
+                self._set_meta(conn, embedder=self.embedder.name, dim=self.embedder.dim, dead_rows=int(self._meta(conn, "dead_rows", "0")) + dead)
+            print(f"📚 Indexed {len(seen)} files: {len(pending)} new chunks, {dead} stale chunks retired, {self._row_count()} rows in total.")
+            self._maybe_compact(conn)
+            self._refresh_ivf(conn)
+
+    def _maybe_compact(self, conn: sqlite3.Connection) -> None:
+        """Rewrite the matrix without tombstoned rows once they make up COMPACT_DEAD_FRACTION of it."""
+        import numpy as np
+
+        total, dead = self._row_count(), int(self._meta(conn, "dead_rows", "0"))
+        if total == 0 or dead < COMPACT_DEAD_FRACTION * total:
+            return
+        live = np.fromiter((row for (row,) in conn.execute("SELECT row FROM chunks ORDER BY row")), dtype=np.int64)
+        tmp_path = self.vectors_path.with_suffix(".tmp")
+        vectors = self._vectors(total)
+        with open(tmp_path, "wb") as f:
+            for start in range(0, len(live), ASSIGN_BATCH):
+                f.write(np.ascontiguousarray(vectors[live[start : start + ASSIGN_BATCH]]).tobytes())
+        del vectors
+        with conn:
+            # Rows only move down and are renumbered in ascending order, so no two ever collide.
+            conn.executemany("UPDATE chunks SET row = ? WHERE row = ?", [(new, int(old)) for new, old in enumerate(live) if new != old])
+            self._set_meta(conn, dead_rows=0, ivf_trained_rows=0)
+            tmp_path.replace(self.vectors_path)
+        print(f"🧹 Compacted the index: {total} → {len(live)} rows.")
+
+    def _refresh_ivf(self, conn: sqlite3.Connection) -> None:
+        import numpy as np
+
+        total = self._row_count()
+        trained_rows = int(self._meta(conn, "ivf_trained_rows", "0"))
+        if total < IVF_MIN_ROWS:
+            return
+        vectors = self._vectors(total)
+        if trained_rows == 0 or total > (1 + IVF_RETRAIN_GROWTH) * trained_rows or not self._ivf_path("centroids").exists():
+            centroids = self._train_centroids(vectors)
+            list_ids = self._assign(vectors, centroids, 0, total)
+            trained_rows = total
+        else:
+            centroids = np.load(self._ivf_path("centroids"))
+            offsets = np.load(self._ivf_path("offsets"))
+            rows = np.load(self._ivf_path("rows"))
+            previous = np.empty(len(rows), dtype=np.int32)
+            previous[rows] = np.repeat(np.arange(len(offsets) - 1, dtype=np.int32), np.diff(offsets))
+            list_ids = np.concatenate([previous, self._assign(vectors, centroids, len(rows), total)])  # only rows appended since
+        order = np.argsort(list_ids, kind="stable").astype(np.int64)  # rows ascending within a list: sequential reads at query time.
+        offsets = np.searchsorted(list_ids[order], np.arange(len(centroids) + 1)).astype(np.int64)
+        self._save_array("centroids", centroids)
+        self._save_array("offsets", offsets)
+        self._save_array("rows", order)
+        with conn:
+            self._set_meta(conn, ivf_trained_rows=trained_rows)
+
+    def _train_centroids(self, vectors: "np.memmap") -> "npt.NDArray[np.float32]":
+        """Spherical k-means on a sample; sqrt(n) lists keeps both the centroid scan and each list short."""
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        n = len(vectors)
+        n_lists = max(16, int(math.sqrt(n)))
+        sample = np.asarray(vectors[np.sort(rng.choice(n, size=min(n, max(KMEANS_SAMPLE, 16 * n_lists)), replace=False))])
+        centroids = sample[rng.choice(len(sample), size=n_lists, replace=False)].copy()
+        for _ in range(KMEANS_ITERATIONS):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            empty = ~sums.any(axis=1)
+            sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()), replace=False)]  # re-seed empty lists
+            centroids = _normalize_rows(sums)
+        return centroids
+
+    def _assign(self, vectors: "np.memmap", centroids: "npt.NDArray[np.float32]", start: int, stop: int) -> "npt.NDArray[np.int32]":
+        import numpy as np
+
+        parts = [np.argmax(np.asarray(vectors[lo : min(stop, lo + ASSIGN_BATCH)]) @ centroids.T, axis=1).astype(np.int32) for lo in range(start, stop, ASSIGN_BATCH)]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int32)
+
+    # ------------------------------------------------------------------ querying
+    def search(self, query: str, k: int = 20, nprobe: int = DEFAULT_NPROBE) -> list[SearchHit]:
+        import numpy as np
+
+        total = self._row_count()
+        if total == 0:
+            return []
+        q = self.embedder.embed([query])[0]
+        vectors = self._vectors(total)
+        if total >= IVF_MIN_ROWS and self._ivf_path("rows").exists():
+            centroids = np.load(self._ivf_path("centroids"), mmap_mode="r")
+            offsets = np.load(self._ivf_path("offsets"), mmap_mode="r")
+            rows = np.load(self._ivf_path("rows"), mmap_mode="r")
+            probe = np.argpartition(-(centroids @ q), min(nprobe, len(centroids)) - 1)[:nprobe]
+            candidates = np.sort(np.concatenate([rows[offsets[i] : offsets[i + 1]] for i in probe] + [np.arange(int(offsets[-1]), total)]))  # rows newer than the lists too
+            scores = vectors[candidates] @ q
+        else:
+            candidates = np.arange(total)
+            scores = np.concatenate([vectors[lo : lo + ASSIGN_BATCH] @ q for lo in range(0, total, ASSIGN_BATCH)])
+        wanted = min(len(scores), 4 * k)  # tombstoned rows are filtered below, so over-fetch
+        if wanted == 0:
+            return []
+        top = np.argpartition(-scores, wanted - 1)[:wanted]
+        top = top[np.argsort(-scores[top])]
+        with self._connect() as conn:
+            row_ids = [int(candidates[i]) for i in top]
+            meta = {row: (path, start, end, text) for row, path, start, end, text in conn.execute(f"SELECT row, path, start_line, end_line, text FROM chunks WHERE row IN ({','.join('?' * len(row_ids))})", row_ids)}
+        hits = [SearchHit(*meta[row][:3], float(scores[i]), meta[row][3]) for i, row in zip(top, row_ids) if row in meta]
+        return hits[:k]
@@ -0,0 +1,181 @@
+"""
+Persistent index of the classes and functions defined in Python files.
+
+Rows are keyed by absolute file path and remember the file's mtime and size; a query re-parses only files whose stat
+changed (on a process pool when there are many) and reads everything else straight from SQLite. Deleted files are
+dropped when their directory is indexed again.
+"""
+
+from typing import Iterator, NamedTuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing, contextmanager
+import ast
+import json
+import os
+import sqlite3
+
+from machineconfig.utils.source_of_truth import CONFIG_ROOT
+
+
+SYMBOL_INDEX_PATH = CONFIG_ROOT.joinpath("symbol_index.sqlite")
+SCHEMA_VERSION = 1
+PROCESS_POOL_MIN_FILES = 64  # below this, starting worker processes costs more than parsing in-process.
+SKIP_DIRS = {".venv", "venv", "__pycache__", ".mypy_cache", ".pytest_cache", ".git"}
+
+
+class ArgSpec(NamedTuple):
+    name: str
+    type: str
+    default: Optional[str]
+
+
+class IndexedSymbol(NamedTuple):
+    file_path: str
+    type: str  # "function" | "class"
+    name: str
+    docstring: Optional[str]
+    args: list[ArgSpec]  # empty for classes
+
+
+class _ParsedFile(NamedTuple):
+    path: str
+    mtime_ns: int
+    size: int
+    module_doc: Optional[str]
+    symbols: list[tuple[str, str, Optional[str], str]]  # (type, name, docstring, args as json)
+    error: Optional[str]
+
+
+def _arg_specs(function: ast.FunctionDef | ast.AsyncFunctionDef) -> list[list[object]]:
+    specs: list[list[object]] = []
+    for idx, arg in enumerate(function.args.args):
+        type_ = arg.annotation.id if isinstance(arg.annotation, ast.Name) else "Any"
+        # Positional index into `defaults`, as the fire picker always did; only literal defaults survive serialisation.
+        default_node = function.args.defaults[idx] if idx < len(function.args.defaults) else None
+        default = default_node.value if isinstance(default_node, ast.Constant) and isinstance(default_node.value, (str, int, float, bool)) else None
+        specs.append([arg.arg, type_, default])
+    return specs
+
+
+def _parse_file(path: str) -> _ParsedFile:
+    """Top-level so that it can run in a worker process."""
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        return _ParsedFile(path=path, mtime_ns=0, size=-1, module_doc=None, symbols=[], error=f"{type(e).__name__}: {e}")
+    try:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except Exception as e:
+        return _ParsedFile(path=path, mtime_ns=stat.st_mtime_ns, size=stat.st_size, module_doc=None, symbols=[], error=f"{type(e).__name__}: {e}")
+    symbols: list[tuple[str, str, Optional[str], str]] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            symbols.append(("function", node.name, ast.get_docstring(node), json.dumps(_arg_specs(node))))
+        elif isinstance(node, ast.ClassDef):
+            symbols.append(("class", node.name, ast.get_docstring(node), "[]"))
+    return _ParsedFile(path=path, mtime_ns=stat.st_mtime_ns, size=stat.st_size, module_doc=ast.get_docstring(tree), symbols=symbols, error=None)
+
+
+@contextmanager
+def _connect() -> Iterator[sqlite3.Connection]:
+    SYMBOL_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with closing(sqlite3.connect(SYMBOL_INDEX_PATH, timeout=30)) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS files")
+                conn.execute("DROP TABLE IF EXISTS symbols")
+                conn.execute("CREATE TABLE files (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, module_doc TEXT, error TEXT)")
+                conn.execute("CREATE TABLE symbols (file_path TEXT NOT NULL, seq INTEGER NOT NULL, type TEXT NOT NULL, name TEXT NOT NULL, docstring TEXT, args TEXT NOT NULL, PRIMARY KEY (file_path, seq))")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        yield conn
+
+
+def _prefix_bounds(directory: str) -> tuple[str, str]:
+    """[low, high) range of every path string below `directory`."""
+    prefix = directory.rstrip(os.sep) + os.sep
+    return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+
+def _store(conn: sqlite3.Connection, parsed: list[_ParsedFile]) -> None:
+    with conn:
+        conn.executemany("DELETE FROM symbols WHERE file_path = ?", [(p.path,) for p in parsed])
+        conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)", [(p.path, p.mtime_ns, p.size, p.module_doc, p.error) for p in parsed])
+        conn.executemany("INSERT INTO symbols VALUES (?, ?, ?, ?, ?, ?)", [(p.path, seq, *symbol) for p in parsed for seq, symbol in enumerate(p.symbols)])
+
+
+def _parse_many(paths: list[str]) -> list[_ParsedFile]:
+    if len(paths) < PROCESS_POOL_MIN_FILES:
+        return [_parse_file(path) for path in paths]
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(_parse_file, paths, chunksize=max(1, len(paths) // ((os.cpu_count() or 1) * 8))))
+
+
+def _walk_python_files(directory: str) -> list[str]:
+    files: list[str] = []
+    for root, dirs, names in os.walk(directory):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS and not d.startswith(".")]
+        files.extend(os.path.join(root, name) for name in names if name.endswith(".py"))
+    return files
+
+
+def _stale(paths: list[str], known: dict[str, tuple[int, int]]) -> list[str]:
+    stale: list[str] = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if known.get(path) != (stat.st_mtime_ns, stat.st_size):
+            stale.append(path)
+    return stale
+
+
+def index_directory(directory: str) -> list[str]:
+    """Bring the index up to date for every `.py` file below `directory`; returns them in `os.walk` order."""
+    root = os.path.abspath(directory)
+    files = _walk_python_files(root)
+    low, high = _prefix_bounds(root)
+    with _connect() as conn:
+        known = {path: (mtime_ns, size) for path, mtime_ns, size in conn.execute("SELECT path, mtime_ns, size FROM files WHERE path >= ? AND path < ?", (low, high))}
+        stale = _stale(files, known)
+        if stale:
+            print(f"🔍 Indexing {len(stale)} new or changed of {len(files)} Python files...")
+            _store(conn, _parse_many(stale))
+        gone = set(known).difference(files)
+        if gone:
+            with conn:
+                conn.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in gone])
+                conn.executemany("DELETE FROM symbols WHERE file_path = ?", [(path,) for path in gone])
+    return files
+
+
+def _rows_to_symbols(rows: list[tuple[str, str, str, Optional[str], str]]) -> list[IndexedSymbol]:
+    return [IndexedSymbol(file_path=file_path, type=type_, name=name, docstring=docstring, args=[ArgSpec(*spec) for spec in json.loads(args)]) for file_path, type_, name, docstring, args in rows]
+
+
+def directory_symbols(directory: str) -> tuple[list[IndexedSymbol], dict[str, str]]:
+    """Symbols of every `.py` file below `directory` (files in `os.walk` order, symbols in `ast.walk` order), and parse errors by file."""
+    files = index_directory(directory)
+    low, high = _prefix_bounds(os.path.abspath(directory))
+    with _connect() as conn:
+        by_file: dict[str, list[IndexedSymbol]] = {}
+        for symbol in _rows_to_symbols(conn.execute("SELECT file_path, type, name, docstring, args FROM symbols WHERE file_path >= ? AND file_path < ? ORDER BY file_path, seq", (low, high)).fetchall()):
+            by_file.setdefault(symbol.file_path, []).append(symbol)
+        listed = set(files)  # files under skipped directories may be indexed too, through `file_symbols`.
+        errors = {path: error for path, error in conn.execute("SELECT path, error FROM files WHERE path >= ? AND path < ? AND error IS NOT NULL", (low, high)) if path in listed}
+    return [symbol for path in files for symbol in by_file.get(path, [])], errors
+
+
+def file_symbols(file_path: str) -> tuple[Optional[str], list[IndexedSymbol], Optional[str]]:
+    """(module docstring, symbols in `ast.walk` order, parse error) of a single file, re-parsed only if it changed."""
+    path = os.path.abspath(file_path)
+    with _connect() as conn:
+        known = {row[0]: (row[1], row[2]) for row in conn.execute("SELECT path, mtime_ns, size FROM files WHERE path = ?", (path,))}
+        if _stale([path], known) or path not in known:
+            _store(conn, [_parse_file(path)])
+        module_doc, error = conn.execute("SELECT module_doc, error FROM files WHERE path = ?", (path,)).fetchone()
+        symbols = _rows_to_symbols(conn.execute("SELECT file_path, type, name, docstring, args FROM symbols WHERE file_path = ? ORDER BY seq", (path,)).fetchall())
+    return module_doc, symbols, error
+
@@ -2,21 +2,97 @@
 
 from collections import deque
 from pathlib import Path
+import json
+import os
+import select
+import shlex
+import shutil
 import subprocess
 import tempfile
 import time
-from typing import Literal, TypedDict
+from typing import Any, Literal, TypedDict
 
 from machineconfig.cluster.sessions_managers.zellij.zellij_utils.zellij_local_helper import parse_command, format_args_for_kdl
-from machineconfig.cluster.sessions_managers.zellij.zellij_utils.zellij_local_helper import check_command_status
 from machineconfig.cluster.sessions_managers.zellij.zellij_local_manager import ZellijLocalManager
+from machineconfig.cluster.sessions_managers.helpers.process_snapshot import ProcessSnapshot
 from machineconfig.utils.schemas.layouts.layout_types import LayoutConfig, TabConfig
 
 
+COMPLETION_EVENTS_ROOT = Path.home().joinpath("tmp_results/sessions/dynamic_events")
+DOORBELL_NAME = "doorbell"
+
+
 class DynamicTabTask(TypedDict):
     index: int
     runtime_tab_name: str
-    tab: TabConfig
+    tab: TabConfig  # runtime tab; its command is the completion-reporting wrapper.
+
+
+class _CompletionChannel:
+    """
+    Each wrapped tab drops `<index>.json` (exit code and timing) atomically into a private directory,
+    then writes its index to a FIFO doorbell. The runner blocks on the FIFO, so a finished tab is
+    noticed immediately and no process table is scanned while events keep arriving.
+    """
+
+    def __init__(self, session_name: str) -> None:
+        COMPLETION_EVENTS_ROOT.mkdir(parents=True, exist_ok=True)
+        self.directory = Path(tempfile.mkdtemp(prefix=f"{session_name}_", dir=COMPLETION_EVENTS_ROOT))
+        self.doorbell = self.directory.joinpath(DOORBELL_NAME)
+        os.mkfifo(self.doorbell)
+        # O_RDWR: the runner's own writer end keeps the FIFO from reporting EOF between tabs.
+        self._fd = os.open(self.doorbell, os.O_RDWR | os.O_NONBLOCK)
+
+    def wrap(self, index: int, command: str) -> str:
+        """A bash script that runs `command` in its own bash and then reports how it ended."""
+        sentinel = shlex.quote(str(self.directory.joinpath(f"{index}.json")))
+        sentinel_tmp = shlex.quote(str(self.directory.joinpath(f"{index}.json.tmp")))
+        clock = '"${EPOCHREALTIME:-$(date +%s)}"'
+        return (
+            f"__mc_start={clock}; bash -c {shlex.quote(command)}; __mc_rc=$?; "
+            f"printf '{{\"exit_code\": %d, \"started_at\": %s, \"finished_at\": %s}}' \"$__mc_rc\" \"$__mc_start\" {clock} > {sentinel_tmp} && mv {sentinel_tmp} {sentinel}; "
+            f"(printf '{index} ' > {shlex.quote(str(self.doorbell))}) 2>/dev/null & "
+            f"exit $__mc_rc"
+        )
+
+    def wait(self, timeout: float) -> dict[int, dict[str, Any]]:
+        """Block until a tab rings or `timeout` passes; return every completion report not yet collected, by task index."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if ready:
+            try:
+                while os.read(self._fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+        reports: dict[int, dict[str, Any]] = {}
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                payload = json.loads(Path(entry.path).read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                payload = {}
+            Path(entry.path).unlink(missing_ok=True)
+            reports[int(entry.name.removesuffix(".json"))] = payload if isinstance(payload, dict) else {}
+        return reports
+
+    def live_indices(self, snapshot: ProcessSnapshot) -> set[int]:
+        """Indices whose wrapper shell is still alive; the wrapper's own argv names its sentinel, so no command heuristics are needed."""
+        marker = str(self.directory) + os.sep
+        live: set[int] = set()
+        for record in snapshot.by_pid.values():
+            for token in record.cmdline:
+                start = token.find(marker)
+                while start != -1:
+                    name = token[start + len(marker):].split(".", 1)[0]
+                    if name.isdigit():
+                        live.add(int(name))
+                    start = token.find(marker, start + 1)
+        return live
+
+    def close(self) -> None:
+        os.close(self._fd)
+        shutil.rmtree(self.directory, ignore_errors=True)
 
 
 def _build_runtime_tab_name(original_tab_name: str, index: int) -> str:
@@ -37,14 +113,12 @@ def _create_single_tab_layout_file(task: DynamicTabTask) -> str:
     tab = task["tab"]
     tab_name = task["runtime_tab_name"].replace('"', '\\"')
     tab_cwd = tab["startDir"].replace('"', '\\"')
-    command_text = tab["command"]
-    _, _args = parse_command(command_text)
-    args_for_bash = ["-lc", command_text]
-    args_kdl = format_args_for_kdl(args_for_bash)
+    cmd, args = parse_command(tab["command"])
+    args_kdl = format_args_for_kdl(args)
     layout_content = (
         f"layout {{\n"
         f"  tab name=\"{tab_name}\" cwd=\"{tab_cwd}\" {{\n"
-        f"    pane command=\"/bin/bash\" {{\n"
+        f"    pane command=\"{cmd}\" {{\n"
         f"      args {args_kdl}\n"
         f"    }}\n"
         f"  }}\n"
@@ -111,12 +185,11 @@ def _start_tmux_initial_session(session_name: str, initial_tasks: list[DynamicTa
         _spawn_tab_tmux(session_name=session_name, task=task)
 
 
-def _is_task_running(task: DynamicTabTask) -> bool:
-    tab = task["tab"]
-    tab_for_check: TabConfig = {"tabName": task["runtime_tab_name"], "startDir": tab["startDir"], "command": tab["command"]}
-    layout_for_check: LayoutConfig = {"layoutName": "dynamic-check", "layoutTabs": [tab_for_check]}
-    status = check_command_status(tab_name=task["runtime_tab_name"], layout_config=layout_for_check)
-    return status.get("running", False)
+def _format_report(report: dict[str, Any]) -> str:
+    exit_code = report.get("exit_code")
+    started_at, finished_at = report.get("started_at"), report.get("finished_at")
+    duration = f", {float(finished_at) - float(started_at):.1f}s" if isinstance(started_at, (int, float)) and isinstance(finished_at, (int, float)) else ""
+    return f"exit {exit_code if exit_code is not None else '?'}{duration}"
 
 
 def _validate_backend(backend: Literal["zellij", "z", "tmux", "t", "auto", "a"]) -> Literal["zellij", "tmux"]:
@@ -152,10 +225,12 @@ def run_dynamic(
     if len(layout["layoutTabs"]) == 0:
         raise ValueError("Selected layout has no tabs.")
 
+    channel = _CompletionChannel(session_name=layout["layoutName"].replace(" ", "_"))
     all_tasks: list[DynamicTabTask] = []
     for index, tab in enumerate(layout["layoutTabs"]):
         runtime_tab_name = _build_runtime_tab_name(original_tab_name=tab["tabName"], index=index)
-        runtime_tab: TabConfig = {"tabName": runtime_tab_name, "startDir": tab["startDir"], "command": tab["command"]}
+        runtime_command = f"bash -lc {shlex.quote(channel.wrap(index=index, command=tab['command']))}"
+        runtime_tab: TabConfig = {"tabName": runtime_tab_name, "startDir": tab["startDir"], "command": runtime_command}
         all_tasks.append({"index": index, "runtime_tab_name": runtime_tab_name, "tab": runtime_tab})
 
     first_count = min(max_parallel_tabs, len(all_tasks))
@@ -178,44 +253,69 @@ def run_dynamic(
 
     failures = {name: result for name, result in start_results.items() if not result.get("success", False)}
     if len(failures) > 0:
+        channel.close()
         details = "; ".join(f"{name}: {result.get('error', 'unknown error')}" for name, result in failures.items())
         raise ValueError(f"Failed to start dynamic session: {details}")
 
     if len(session_names) != 1:
+        channel.close()
         raise ValueError("Expected exactly one session for dynamic tab runner.")
     session_name = session_names[0]
 
-    active_tasks: dict[str, DynamicTabTask] = {task["runtime_tab_name"]: task for task in initial_tasks}
+    active_tasks: dict[int, DynamicTabTask] = {task["index"]: task for task in initial_tasks}
+    unseen_sweeps: dict[int, int] = {}
+    failed_tabs: list[str] = []
     completed_count = 0
     total_count = len(all_tasks)
 
     print(f"🚀 Dynamic tab runner started for '{layout['layoutName']}' with concurrency={max_parallel_tabs} and total_tabs={total_count}.")
-    while len(active_tasks) > 0:
-        finished_names: list[str] = []
-        for runtime_tab_name, task in list(active_tasks.items()):
-            if not _is_task_running(task=task):
-                finished_names.append(runtime_tab_name)
-
-        for runtime_tab_name in finished_names:
-            finished_task = active_tasks.pop(runtime_tab_name)
-            completed_count += 1
-            print(f"✅ Finished tab {completed_count}/{total_count}: {finished_task['runtime_tab_name']}")
-            if kill_finished_tabs:
-                if backend_resolved == "zellij":
-                    _close_tab(session_name=session_name, runtime_tab_name=runtime_tab_name)
-                else:
-                    _close_tab_tmux(session_name=session_name, runtime_tab_name=runtime_tab_name)
-
-            if len(pending_tasks) > 0:
-                next_task = pending_tasks.popleft()
-                if backend_resolved == "zellij":
-                    _spawn_tab(session_name=session_name, task=next_task)
+    try:
+        while len(active_tasks) > 0:
+            reports = channel.wait(timeout=poll_seconds)
+            if len(reports) == 0:
+                # Fallback for tabs that died without reporting (closed by hand, killed shell): one shared process
+                # snapshot per quiet interval, and a tab counts as gone only after two consecutive misses.
+                live = channel.live_indices(snapshot=ProcessSnapshot.take())
+                for index in active_tasks:
+                    if index in live:
+                        unseen_sweeps.pop(index, None)
+                        continue
+                    unseen_sweeps[index] = unseen_sweeps.get(index, 0) + 1
+                    if unseen_sweeps[index] >= 2:
+                        reports[index] = {"exit_code": None}
+
+            for index, report in sorted(reports.items()):
+                finished_task = active_tasks.pop(index, None)
+                if finished_task is None:
+                    continue
+                unseen_sweeps.pop(index, None)
+                completed_count += 1
+                runtime_tab_name = finished_task["runtime_tab_name"]
+                exit_code = report.get("exit_code")
+                if exit_code == 0:
+                    print(f"✅ Finished tab {completed_count}/{total_count}: {runtime_tab_name} ({_format_report(report)})")
                 else:
-                    _spawn_tab_tmux(session_name=session_name, task=next_task)
-                active_tasks[next_task["runtime_tab_name"]] = next_task
-                print(f"🆕 Started tab: {next_task['runtime_tab_name']}")
-
-        if len(active_tasks) > 0:
-            time.sleep(poll_seconds)
-
+                    failed_tabs.append(runtime_tab_name)
+                    print(f"❌ Finished tab {completed_count}/{total_count}: {runtime_tab_name} ({_format_report(report)})")
+
+                # Fill the freed slot before closing the finished tab so the session never loses its last tab/window.
+                if len(pending_tasks) > 0:
+                    next_task = pending_tasks.popleft()
+                    if backend_resolved == "zellij":
+                        _spawn_tab(session_name=session_name, task=next_task)
+                    else:
+                        _spawn_tab_tmux(session_name=session_name, task=next_task)
+                    active_tasks[next_task["index"]] = next_task
+                    print(f"🆕 Started tab: {next_task['runtime_tab_name']}")
+
+                if kill_finished_tabs:
+                    if backend_resolved == "zellij":
+                        _close_tab(session_name=session_name, runtime_tab_name=runtime_tab_name)
+                    else:
+                        _close_tab_tmux(session_name=session_name, runtime_tab_name=runtime_tab_name)
+    finally:
+        channel.close()
+
+    if len(failed_tabs) > 0:
+        print(f"⚠️ {len(failed_tabs)}/{total_count} tabs did not exit cleanly: {', '.join(failed_tabs)}")
     print("🎉 Dynamic tab runner completed all tabs.")
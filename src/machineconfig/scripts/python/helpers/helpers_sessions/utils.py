@@ -8,6 +8,8 @@ def balance_load(
     thresh_type: Literal["number", "n", "weight", "w"],
     breaking_method: Literal["moreLayouts", "ml", "combineTabs", "ct"],
     output_path: Optional[str],
+    strategy: Literal["greedy", "lpt", "ffd"],
+    learn_weights: bool,
 ) -> None:
     """Adjust layout file to limit max tabs per layout, etc."""
     thresh_type_resolved: dict[str, Literal["number", "weight"]] = {"number": "number", "n": "number", "weight": "weight", "w": "weight"}
@@ -20,7 +22,11 @@ def balance_load(
     layoutfile: LayoutsFile = json.loads(layout_path_obj.read_text())
     layout_configs = layoutfile["layouts"]
     from machineconfig.cluster.sessions_managers.utils.load_balancer import limit_tab_num
-    new_layouts = limit_tab_num(layout_configs=layout_configs, max_thresh=max_thresh, threshold_type=thresh_type_resolved[thresh_type], breaking_method=breaking_method_resolved[breaking_method])
+    from machineconfig.cluster.sessions_managers.helpers.bin_packing import load_tab_runtimes
+    learned_runtimes = load_tab_runtimes() if learn_weights else None
+    if learned_runtimes is not None:
+        print(f"Using recorded runtimes for {sum(1 for a_layout in layout_configs for tab in a_layout['layoutTabs'] if tab['command'] in learned_runtimes)} tabs.")
+    new_layouts = limit_tab_num(layout_configs=layout_configs, max_thresh=max_thresh, threshold_type=thresh_type_resolved[thresh_type], breaking_method=breaking_method_resolved[breaking_method], strategy=strategy, learned_runtimes=learned_runtimes)
     layoutfile["layouts"] = new_layouts
     target_file = Path(output_path) if output_path is not None else layout_path_obj.parent / f"{layout_path_obj.stem}_adjusted_{max_thresh}_{thresh_type}_{breaking_method}.json"
     target_file.parent.mkdir(parents=True, exist_ok=True)
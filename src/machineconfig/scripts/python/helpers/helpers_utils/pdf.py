@@ -35,12 +35,8 @@ def merge_pdfs(
                 pass
         writer.write(output_path)
         print(f"✅ Merged PDF saved to: {output_path}")
-    from machineconfig.utils.meta import lambda_to_python_script
-    code = lambda_to_python_script(lambda : merge_pdfs_internal(pdfs=pdfs, output=output, compress=compress),
-                                   in_global=True, import_module=False)
-    from machineconfig.utils.code import run_shell_script, get_uv_command_executing_python_script
-    uv_command, _py_file = get_uv_command_executing_python_script(python_script=code, uv_with=["pypdf"], uv_project_dir=None)
-    run_shell_script(uv_command, display_script=True, clean_env=False)
+    from machineconfig.utils.dependency_launcher import run_with_dependencies
+    run_with_dependencies(lambda : merge_pdfs_internal(pdfs=pdfs, output=output, compress=compress), distributions=("pypdf",))
 
 
 def compress_pdf(
@@ -84,13 +80,9 @@ def compress_pdf(
             print(f"   Reduction: {ratio:.1f}%")
         finally:
             doc.close()
-    from machineconfig.utils.meta import lambda_to_python_script
-    code = lambda_to_python_script(
+    from machineconfig.utils.dependency_launcher import run_with_dependencies
+    run_with_dependencies(
         lambda: compress_pdf_internal(pdf_input=pdf_input, output=output, quality=quality, image_dpi=image_dpi, compress_streams=compress_streams, use_objstms=use_objstms),
-        in_global=True,
-        import_module=False,
+        distributions=("pymupdf",),
     )
-    from machineconfig.utils.code import run_shell_script, get_uv_command_executing_python_script
-    uv_command, _py_file = get_uv_command_executing_python_script(python_script=code, uv_with=["pymupdf"], uv_project_dir=None)
-    run_shell_script(uv_command, display_script=True, clean_env=False)
 
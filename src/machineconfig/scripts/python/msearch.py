@@ -7,7 +7,7 @@ from typing import Annotated
 def machineconfig_search(
     path: Annotated[str, typer.Argument(help="The directory/file to search")] = ".",
     ast: Annotated[bool, typer.Option(..., "--ast", "-a", help="The abstract syntax tree search/ tree sitter search of symbols")] = False,
-    symantic: Annotated[bool, typer.Option(..., "--symantic", "-s", help="The symantic search of symbols")] = False,
+    symantic: Annotated[bool, typer.Option(..., "--symantic", "-s", help="Semantic search over the directory with a local embedding index (set MSEARCH_EMBEDDER to pick the model)")] = False,
     extension: Annotated[str, typer.Option(..., "--extension", "-E", help="File extension to filter by (e.g., .py, .js)")] = "",
     file: Annotated[bool, typer.Option(..., "--file", "-f", help="File search using fzf")] = False,
     no_dotfiles: Annotated[bool, typer.Option(..., "--no-dotfiles", "-D", help="Exclude dotfiles from search")] = False,
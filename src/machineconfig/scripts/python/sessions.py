@@ -10,10 +10,12 @@ def balance_load(
     thresh_type: Annotated[Literal["number", "n", "weight", "w"], typer.Option(..., "--threshold-type", "-t", help="Threshold type")] = "number",
     breaking_method: Annotated[Literal["moreLayouts", "ml", "combineTabs", "ct"], typer.Option(..., "--breaking-method", "-b", help="Breaking method")] = "moreLayouts",
     output_path: Annotated[Optional[str], typer.Option(..., "--output-path", "-o", help="Path to write the adjusted layout.json file")] = None,
+    strategy: Annotated[Literal["greedy", "lpt", "ffd"], typer.Option(..., "--strategy", "-s", help="Packing strategy: greedy keeps list order; lpt and ffd balance tab weights")] = "lpt",
+    learn_weights: Annotated[bool, typer.Option(..., "--learn-weights", "-l", help="Use runtimes recorded by previous monitoring runs as tab weights where available")] = False,
 ) -> None:
     """Adjust layout file to limit max tabs per layout, etc."""
     from machineconfig.scripts.python.helpers.helpers_sessions.utils import balance_load as impl
-    impl(layout_path=layout_path, max_thresh=max_thresh, thresh_type=thresh_type, breaking_method=breaking_method, output_path=output_path)
+    impl(layout_path=layout_path, max_thresh=max_thresh, thresh_type=thresh_type, breaking_method=breaking_method, output_path=output_path, strategy=strategy, learn_weights=learn_weights)
 
 
 def run(
@@ -29,7 +31,7 @@ def run(
     max_layouts: Annotated[int, typer.Option(..., "--max-parallel-layouts", "-P", help="A Sanity checker that throws an error if the total number of *parallel layouts exceeds this number.")] = 25,
     backend: Annotated[Literal["zellij", "z", "windows-terminal", "wt", "tmux", "t", "auto", "a"], typer.Option(..., "--backend", "-b", help="Backend terminal multiplexer or emulator to use")] = "tmux",
     max_parallel_tabs: Annotated[Optional[int], typer.Option("--max-parallel-tabs", help="Enable dynamic tab scheduling and cap active tabs to this value.")] = None,
-    poll_seconds: Annotated[float, typer.Option("--poll-seconds", help="Dynamic mode only: polling interval in seconds used to detect finished tabs.")] = 2.0,
+    poll_seconds: Annotated[float, typer.Option("--poll-seconds", help="Dynamic mode only: tabs report completion as they exit; after this many quiet seconds, a process check catches tabs that were killed without reporting.")] = 2.0,
 
     kill_finished_tabs: Annotated[bool, typer.Option("--kill-finished-tabs", help="Dynamic mode only: close each tab once its command is finished.")] = False,
     all_file: Annotated[bool, typer.Option("--all-file", help="Dynamic mode only: merge tabs from all layouts in the file into one dynamic run.")] = False,
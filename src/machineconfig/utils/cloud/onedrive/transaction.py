@@ -10,6 +10,7 @@ Key Features:
 - Direct OAuth2 setup without rclone dependency
 - Upload/download files with progress tracking
 - Support for both small and large file uploads
+- Pooled HTTP session, parallel ranged downloads and concurrent folder transfers
 
 Requirements:
     pip install requests
@@ -36,9 +37,15 @@ import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Any
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from urllib.parse import quote
 import json
+import posixpath
+import queue
+import threading
+import time
 
 
 def get_rclone_token(section: str):
@@ -181,6 +188,96 @@ def get_access_token() -> Optional[str]:
     return token.get("access_token")
 
 
+# Transfer tuning. Upload-session fragments must be multiples of 320 KiB and at most 60 MiB (Graph API rule).
+UPLOAD_CHUNK_UNIT = 320 * 1024
+MAX_UPLOAD_CHUNK_SIZE = 192 * UPLOAD_CHUNK_UNIT
+DEFAULT_UPLOAD_CHUNK_SIZE = 32 * UPLOAD_CHUNK_UNIT  # 10 MiB
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+DEFAULT_TRANSFER_WORKERS = 8
+SIMPLE_UPLOAD_LIMIT = 4 * 1024 * 1024
+READ_PIECE_BYTES = 1024 * 1024
+TRANSFER_RETRIES = 3
+PART_SUFFIX = ".part"
+_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class GraphSession:
+    """
+    Pooled HTTP session shared by every request in the process.
+
+    Keep-alive connections are reused across calls and threads, and the access token is
+    resolved once, then refreshed only when Graph rejects it with a 401.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_TRANSFER_WORKERS) -> None:
+        from requests.adapters import HTTPAdapter
+
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size + 2)
+        self.http.mount("https://", adapter)
+        self.http.mount("http://", adapter)
+        self._token: Optional[str] = None
+        self._token_lock = threading.Lock()
+
+    def access_token(self) -> str:
+        with self._token_lock:
+            if self._token is None:
+                self._token = get_access_token()
+            if not self._token:
+                raise Exception("Failed to get valid access token")
+            return self._token
+
+    def _refresh_rejected_token(self, rejected_token: str) -> None:
+        with self._token_lock:
+            if self._token != rejected_token:  # another thread already refreshed it
+                return
+            refreshed_token = refresh_access_token()
+            self._token = refreshed_token["access_token"] if refreshed_token else None
+
+    def send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Pooled request without the Graph token (upload and download URLs are pre-authenticated). Retries throttling and 5xx."""
+        attempt = 0
+        while True:
+            try:
+                response = self.http.request(method, url, **kwargs)
+            except requests.ConnectionError:
+                if attempt >= TRANSFER_RETRIES:
+                    raise
+                delay = 2.0**attempt
+            else:
+                if response.status_code not in _RETRY_STATUS_CODES or attempt >= TRANSFER_RETRIES:
+                    return response
+                retry_after = response.headers.get("Retry-After", "")
+                delay = float(retry_after) if retry_after.isdigit() else 2.0**attempt
+                response.close()
+            attempt += 1
+            time.sleep(delay)
+
+    def graph(self, method: str, endpoint: str, **kwargs: Any) -> requests.Response:
+        """Authenticated Graph call. `endpoint` is relative to GRAPH_API_BASE, or an absolute `@odata.nextLink`."""
+        url = endpoint if endpoint.startswith(("https://", "http://")) else f"{GRAPH_API_BASE}/{endpoint.lstrip('/')}"
+        extra_headers = kwargs.pop("headers", {})
+        token = self.access_token()
+        response = self.send(method, url, headers={**extra_headers, "Authorization": f"Bearer {token}"}, **kwargs)
+        if response.status_code == 401:
+            self._refresh_rejected_token(token)
+            response = self.send(method, url, headers={**extra_headers, "Authorization": f"Bearer {self.access_token()}"}, **kwargs)
+        return response
+
+
+_graph_session: Optional[GraphSession] = None
+_graph_session_lock = threading.Lock()
+
+
+def get_graph_session() -> GraphSession:
+    """Get the process-wide GraphSession, creating it on first use."""
+    global _graph_session
+    with _graph_session_lock:
+        if _graph_session is None:
+            _graph_session = GraphSession()
+        return _graph_session
+
+
 def make_graph_request(method: str, endpoint: str, **kwargs: Any) -> requests.Response:
     """
     Make authenticated request to Microsoft Graph API.
@@ -196,21 +293,15 @@ def make_graph_request(method: str, endpoint: str, **kwargs: Any) -> requests.Re
     Raises:
         Exception: If authentication fails or request fails
     """
-    token = get_access_token()
-    if not token:
-        raise Exception("Failed to get valid access token")
+    return get_graph_session().graph(method, endpoint, **kwargs)
 
-    headers = kwargs.get("headers", {})
-    headers["Authorization"] = f"Bearer {token}"
-    kwargs["headers"] = headers
 
-    url = f"{GRAPH_API_BASE}/{endpoint.lstrip('/')}"
-    response = requests.request(method, url, **kwargs)
+def _check_upload_chunk_size(chunk_size: int) -> None:
+    if chunk_size <= 0 or chunk_size % UPLOAD_CHUNK_UNIT != 0 or chunk_size > MAX_UPLOAD_CHUNK_SIZE:
+        raise ValueError(f"chunk_size must be a multiple of {UPLOAD_CHUNK_UNIT} bytes (320 KiB) and at most {MAX_UPLOAD_CHUNK_SIZE} bytes, got {chunk_size}")
 
-    return response
 
-
-def push_to_onedrive(local_path: str, remote_path: str) -> bool:
+def push_to_onedrive(local_path: str, remote_path: str, chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE, create_parents: bool = True) -> bool:
     """
     Push a file from local system to OneDrive.
 
@@ -218,10 +309,13 @@ def push_to_onedrive(local_path: str, remote_path: str) -> bool:
         local_path: Path to the local file
         remote_path: Path where the file should be stored in OneDrive
                     (e.g., "/Documents/myfile.txt")
+        chunk_size: Fragment size for resumable uploads, a multiple of 320 KiB
+        create_parents: Create missing remote parent folders first
 
     Returns:
         True if successful, False otherwise
     """
+    _check_upload_chunk_size(chunk_size)
     local_file = Path(local_path)
 
     if not local_file.exists():
@@ -238,17 +332,17 @@ def push_to_onedrive(local_path: str, remote_path: str) -> bool:
 
     # Create parent directories if they don't exist
     remote_dir = os.path.dirname(remote_path)
-    if remote_dir and remote_dir != "/":
+    if create_parents and remote_dir and remote_dir != "/":
         create_remote_directory(remote_dir)
 
     try:
         file_size = local_file.stat().st_size
 
         # For small files (< 4MB), use simple upload
-        if file_size < 4 * 1024 * 1024:
+        if file_size < SIMPLE_UPLOAD_LIMIT:
             return simple_upload(local_file, remote_path)
         else:
-            return resumable_upload(local_file, remote_path)
+            return resumable_upload(local_file, remote_path, chunk_size=chunk_size)
 
     except Exception as e:
         print(f"Error uploading file: {e}")
@@ -280,8 +374,9 @@ def simple_upload(local_file: Path, remote_path: str) -> bool:
         return False
 
 
-def resumable_upload(local_file: Path, remote_path: str) -> bool:
-    """Upload large files using resumable upload."""
+def resumable_upload(local_file: Path, remote_path: str, chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE) -> bool:
+    """Upload large files using resumable upload; the next fragment is read from disk while the current one is sent."""
+    _check_upload_chunk_size(chunk_size)
     try:
         # Create upload session using specific drive
         encoded_path = quote(remote_path, safe="/")
@@ -298,31 +393,65 @@ def resumable_upload(local_file: Path, remote_path: str) -> bool:
 
         upload_url = response.json()["uploadUrl"]
         file_size = local_file.stat().st_size
-        chunk_size = 320 * 1024  # 320KB chunks
-
-        with open(local_file, "rb") as f:
-            bytes_uploaded = 0
-
+        session = get_graph_session()
+
+        # Fragments of one upload session must arrive in order, so the overlap is disk-read vs. network-send.
+        fragments: queue.Queue[bytes] = queue.Queue(maxsize=2)
+        read_errors: list[Exception] = []
+        stop_reading = threading.Event()
+
+        def read_ahead() -> None:
+            try:
+                with open(local_file, "rb") as f:
+                    while not stop_reading.is_set():
+                        chunk_data = f.read(chunk_size)
+                        fragments.put(chunk_data)
+                        if not chunk_data:
+                            return
+            except Exception as err:
+                read_errors.append(err)
+                fragments.put(b"")
+
+        reader = threading.Thread(target=read_ahead, daemon=True)
+        reader.start()
+        start = time.perf_counter()
+        bytes_uploaded = 0
+        try:
             while bytes_uploaded < file_size:
-                chunk_data = f.read(chunk_size)
+                chunk_data = fragments.get()
                 if not chunk_data:
                     break
 
-                chunk_end = min(bytes_uploaded + len(chunk_data) - 1, file_size - 1)
+                chunk_end = bytes_uploaded + len(chunk_data) - 1
 
                 headers = {"Content-Range": f"bytes {bytes_uploaded}-{chunk_end}/{file_size}", "Content-Length": str(len(chunk_data))}
 
-                chunk_response = requests.put(upload_url, data=chunk_data, headers=headers)
+                chunk_response = session.send("PUT", upload_url, data=chunk_data, headers=headers)
 
                 if chunk_response.status_code in [202, 200, 201]:
                     bytes_uploaded += len(chunk_data)
                     progress = (bytes_uploaded / file_size) * 100
-                    print(f"Upload progress: {progress:.1f}%")
+                    print(f"Upload progress: {progress:.1f}% ({local_file.name})")
                 else:
                     print(f"Chunk upload failed: {chunk_response.status_code} - {chunk_response.text}")
+                    session.send("DELETE", upload_url)  # cancel the upload session instead of leaving it to expire
                     return False
+        finally:
+            stop_reading.set()
+            while reader.is_alive():  # unblock a reader waiting on a full queue
+                try:
+                    fragments.get_nowait()
+                except queue.Empty:
+                    reader.join(timeout=0.05)
+
+        if read_errors:
+            raise read_errors[0]
+        if bytes_uploaded < file_size:
+            print(f"Local file shrank while uploading: {local_file}")
+            return False
 
-        print(f"Successfully uploaded: {local_file} -> {remote_path}")
+        elapsed = time.perf_counter() - start
+        print(f"Successfully uploaded: {local_file} -> {remote_path} ({file_size / 2**20:.1f} MB in {elapsed:.1f}s)")
         return True
 
     except Exception as e:
@@ -330,13 +459,99 @@ def resumable_upload(local_file: Path, remote_path: str) -> bool:
         return False
 
 
-def pull_from_onedrive(remote_path: str, local_path: str) -> bool:
+@dataclass
+class _PendingDownload:
+    download_url: str
+    local_file: Path
+    size: int
+    remaining_ranges: int
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @property
+    def part_file(self) -> Path:
+        return self.local_file.with_name(self.local_file.name + PART_SUFFIX)
+
+
+def _fetch_range(session: GraphSession, pending: _PendingDownload, first: int, last: int) -> bool:
+    """Write bytes [first, last] of one file in place into its `.part` file; True once that file is complete."""
+    whole_file = first == 0 and last == pending.size - 1
+    headers = {} if whole_file else {"Range": f"bytes={first}-{last}"}
+    with session.send("GET", pending.download_url, headers=headers, stream=True) as response:
+        expected_status = 200 if whole_file else 206
+        if response.status_code != expected_status:
+            raise Exception(f"GET bytes {first}-{last} returned {response.status_code}, expected {expected_status}")
+        with open(pending.part_file, "r+b") as f:
+            f.seek(first)
+            for piece in response.iter_content(chunk_size=READ_PIECE_BYTES):
+                f.write(piece)
+            written = f.tell() - first
+    if written != last - first + 1:
+        raise Exception(f"GET bytes {first}-{last} returned {written} bytes")
+    with pending.lock:
+        pending.remaining_ranges -= 1
+        finished = pending.remaining_ranges == 0
+    if finished:
+        os.replace(pending.part_file, pending.local_file)
+    return finished
+
+
+def _download_files(files: list[tuple[str, Path, int]], chunk_size: int, max_workers: int) -> list[tuple[Path, Exception]]:
+    """
+    Download (download_url, local_file, size) triples as one flat pool of byte ranges.
+
+    Large files are split into `chunk_size` ranges and small files are a single GET, so
+    `max_workers` pooled connections stay busy whether there is one big file or many small
+    ones. Each file lands in a preallocated `.part` file and is renamed when complete.
+
+    Returns:
+        (local_file, error) for every file that failed
+    """
+    pending_files: list[_PendingDownload] = []
+    ranges: list[tuple[_PendingDownload, int, int]] = []
+    for download_url, local_file, size in files:
+        local_file.parent.mkdir(parents=True, exist_ok=True)
+        offsets = range(0, size, chunk_size)
+        pending = _PendingDownload(download_url=download_url, local_file=local_file, size=size, remaining_ranges=len(offsets))
+        with open(pending.part_file, "wb") as f:
+            f.truncate(size)
+        if size == 0:
+            os.replace(pending.part_file, local_file)
+            continue
+        pending_files.append(pending)
+        ranges.extend((pending, offset, min(offset + chunk_size, size) - 1) for offset in offsets)
+
+    session = get_graph_session()
+    errors: dict[Path, Exception] = {}
+    errors_lock = threading.Lock()
+
+    def fetch(job: tuple[_PendingDownload, int, int]) -> None:
+        pending, first, last = job
+        if pending.local_file in errors:  # a sibling range already failed
+            return
+        try:
+            if _fetch_range(session, pending, first, last) and len(files) > 1:
+                print(f"Downloaded: {pending.local_file}")
+        except Exception as err:
+            with errors_lock:
+                errors.setdefault(pending.local_file, err)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ranges) or 1)), thread_name_prefix="onedrive-download") as pool:
+        list(pool.map(fetch, ranges))
+    for pending in pending_files:
+        if pending.local_file in errors:
+            pending.part_file.unlink(missing_ok=True)
+    return list(errors.items())
+
+
+def pull_from_onedrive(remote_path: str, local_path: str, chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE, max_workers: int = DEFAULT_TRANSFER_WORKERS) -> bool:
     """
     Pull a file from OneDrive to local system.
 
     Args:
         remote_path: Path to the file in OneDrive (e.g., "/Documents/myfile.txt")
         local_path: Path where the file should be saved locally
+        chunk_size: Byte range fetched per request; larger files are downloaded in parallel ranges
+        max_workers: Number of concurrent ranged requests
 
     Returns:
         True if successful, False otherwise
@@ -373,28 +588,15 @@ def pull_from_onedrive(remote_path: str, local_path: str) -> bool:
             print("No download URL available")
             return False
 
-        # Create local directory if it doesn't exist
-        local_file = Path(local_path)
-        local_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Download the file
-        download_response = requests.get(download_url, stream=True)
-        download_response.raise_for_status()
-
         file_size = int(file_info.get("size", 0))
-        bytes_downloaded = 0
-
-        with open(local_file, "wb") as f:
-            for chunk in download_response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    bytes_downloaded += len(chunk)
-
-                    if file_size > 0:
-                        progress = (bytes_downloaded / file_size) * 100
-                        print(f"Download progress: {progress:.1f}%")
+        start = time.perf_counter()
+        errors = _download_files([(download_url, Path(local_path), file_size)], chunk_size=chunk_size, max_workers=max_workers)
+        if errors:
+            print(f"Error downloading file: {errors[0][1]}")
+            return False
 
-        print(f"Successfully downloaded: {remote_path} -> {local_path}")
+        elapsed = time.perf_counter() - start
+        print(f"Successfully downloaded: {remote_path} -> {local_path} ({file_size / 2**20:.1f} MB in {elapsed:.1f}s)")
         return True
 
     except Exception as e:
@@ -464,6 +666,115 @@ def create_remote_directory(remote_path: str) -> bool:
         return False
 
 
+def list_remote_files(remote_dir: str) -> list[dict[str, Any]]:
+    """
+    Recursively list the files under a OneDrive folder, following `@odata.nextLink` paging.
+
+    Args:
+        remote_dir: Path to the folder in OneDrive
+
+    Returns:
+        Graph driveItem dictionaries, each with an added "relative_path" key (posix, relative to remote_dir)
+    """
+    remote_dir = "/" + remote_dir.strip("/")
+    drive_id = get_drive_id()
+    files: list[dict[str, Any]] = []
+    folders: list[tuple[str, str]] = [(remote_dir, "")]
+    while folders:
+        folder, relative_folder = folders.pop()
+        endpoint: Optional[str] = f"drives/{drive_id}/root:{quote(folder, safe='/')}:/children" if folder != "/" else f"drives/{drive_id}/root/children"
+        while endpoint is not None:
+            response = make_graph_request("GET", endpoint)
+            if response.status_code != 200:
+                raise Exception(f"Failed to list folder {folder}: {response.status_code} - {response.text}")
+            payload = response.json()
+            for item in payload.get("value", []):
+                relative_path = f"{relative_folder}/{item['name']}" if relative_folder else item["name"]
+                if "folder" in item:
+                    folders.append((f"{folder.rstrip('/')}/{item['name']}", relative_path))
+                else:
+                    files.append({**item, "relative_path": relative_path})
+            endpoint = payload.get("@odata.nextLink")
+    return files
+
+
+def push_folder_to_onedrive(local_dir: str, remote_dir: str, max_workers: int = DEFAULT_TRANSFER_WORKERS, chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE) -> bool:
+    """
+    Push every file under a local directory to OneDrive, several files at a time.
+
+    Remote folders are created once, up front, so concurrent uploads never race to create
+    (and with "replace" semantics, recreate) the same folder.
+
+    Args:
+        local_dir: Local directory to upload
+        remote_dir: OneDrive folder that will mirror local_dir
+        max_workers: Number of files uploaded concurrently
+        chunk_size: Fragment size for resumable uploads, a multiple of 320 KiB
+
+    Returns:
+        True if every file was uploaded, False otherwise
+    """
+    _check_upload_chunk_size(chunk_size)
+    local_root = Path(local_dir)
+    if not local_root.is_dir():
+        print(f"Local directory does not exist: {local_dir}")
+        return False
+
+    remote_root = "/" + remote_dir.strip("/")
+    jobs = [(a_file, f"{remote_root.rstrip('/')}/{a_file.relative_to(local_root).as_posix()}") for a_file in sorted(local_root.rglob("*")) if a_file.is_file()]
+    for a_remote_dir in sorted({posixpath.dirname(remote_file) for _, remote_file in jobs} | {remote_root}):
+        if not create_remote_directory(a_remote_dir):
+            return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="onedrive-push") as pool:
+        results = list(pool.map(lambda job: push_to_onedrive(str(job[0]), job[1], chunk_size=chunk_size, create_parents=False), jobs))
+
+    failed = results.count(False)
+    total_bytes = sum(a_file.stat().st_size for a_file, _ in jobs)
+    elapsed = time.perf_counter() - start
+    print(f"{'✅' if failed == 0 else '❌'} Pushed {len(jobs) - failed}/{len(jobs)} files ({total_bytes / 2**20:.1f} MB) in {elapsed:.1f}s: {local_dir} -> {remote_root}")
+    return failed == 0
+
+
+def pull_folder_from_onedrive(remote_dir: str, local_dir: str, max_workers: int = DEFAULT_TRANSFER_WORKERS, chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE) -> bool:
+    """
+    Pull every file under a OneDrive folder to a local directory.
+
+    Download URLs come straight from the folder listing, so there is no per-file metadata
+    request; all files share one pool of ranged downloads.
+
+    Args:
+        remote_dir: Path to the folder in OneDrive
+        local_dir: Local directory that will mirror remote_dir
+        max_workers: Number of concurrent ranged requests
+        chunk_size: Byte range fetched per request
+
+    Returns:
+        True if every file was downloaded, False otherwise
+    """
+    try:
+        items = list_remote_files(remote_dir)
+    except Exception as e:
+        print(f"Error listing folder: {e}")
+        return False
+
+    local_root = Path(local_dir)
+    files = [(item["@microsoft.graph.downloadUrl"], local_root.joinpath(item["relative_path"]), int(item.get("size", 0))) for item in items if item.get("@microsoft.graph.downloadUrl")]
+    if len(files) < len(items):
+        print(f"⚠️  {len(items) - len(files)} items have no download URL and were skipped")
+
+    start = time.perf_counter()
+    errors = _download_files(files, chunk_size=chunk_size, max_workers=max_workers)
+    for local_file, err in errors:
+        print(f"Error downloading {local_file}: {err}")
+
+    total_bytes = sum(size for _, _, size in files)
+    elapsed = time.perf_counter() - start
+    print(f"{'✅' if not errors else '❌'} Pulled {len(files) - len(errors)}/{len(files)} files ({total_bytes / 2**20:.1f} MB) in {elapsed:.1f}s: {remote_dir} -> {local_dir}")
+    return not errors and len(files) == len(items)
+
+
 def refresh_access_token() -> Optional[dict[str, Any]]:
     """
     Refresh the access token using the refresh token.
@@ -748,6 +1059,7 @@ if __name__ == "__main__":
     print("\n📚 Available Functions:")
     print("• push_to_onedrive(local_path, remote_path)")
     print("• pull_from_onedrive(remote_path, local_path)")
+    print("• push_folder_to_onedrive(local_dir, remote_dir) / pull_folder_from_onedrive(remote_dir, local_dir)")
     print("• refresh_access_token() - Refresh expired tokens")
     print("• setup_oauth_authentication() - First-time OAuth setup")
     print("• save_token_to_file(token_data) - Save tokens for persistence")
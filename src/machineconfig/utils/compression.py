@@ -0,0 +1,239 @@
+"""Multi-core archive engine: zips whose members are deflated in parallel, parallel zip extraction, and streamed tar / zstd decoding."""
+
+from typing import Any, BinaryIO, Optional
+from pathlib import Path
+from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
+import shutil
+import struct
+import tempfile
+import threading
+import time
+import zlib
+
+
+DEFAULT_COMPRESSION_LEVEL = 6
+DEFAULT_COMPRESSION_THREADS = os.cpu_count() or 1
+READ_PIECE_BYTES = 1024 * 1024
+SPOOL_MAX_BYTES = 32 * 1024 * 1024  # compressed members larger than this spill to a temp file instead of RAM.
+
+_ZIP64_LIMIT = 0xFFFFFFFF  # thresholds; the matching header fields are then set to the 0xFFFF... markers below.
+_ZIP_MAX_ENTRIES = 0xFFFF
+_ZIP64_MARKER_32 = 0xFFFFFFFF
+_ZIP64_MARKER_16 = 0xFFFF
+_METHOD_STORED = 0
+_METHOD_DEFLATED = 8
+_FLAG_UTF8 = 0x800
+
+
+@dataclass
+class _CompressedMember:
+    arcname: str
+    is_dir: bool
+    external_attr: int
+    dos_time: int
+    dos_date: int
+    crc: int
+    size: int
+    compressed_size: int
+    payload: Optional[Any]  # SpooledTemporaryFile positioned at 0, None for directories.
+
+
+def zip_entries(source: Path, content: bool, arcname: Optional[str] = None) -> list[tuple[Path, str]]:
+    """(path, arcname) pairs laid out exactly like `shutil.make_archive` does for `PathExtended.zip` (directories included, posix names)."""
+    source = Path(source)
+    if source.is_file():
+        return [(source, arcname or source.name)]
+    root_name = "" if content else (arcname or source.name)
+    entries: list[tuple[Path, str]] = [] if content else [(source, root_name + "/")]
+    for dirpath, dirnames, filenames in os.walk(source):
+        dirnames.sort()
+        rel_dir = Path(dirpath).relative_to(source).as_posix()
+        prefix = "/".join(part for part in (root_name, "" if rel_dir == "." else rel_dir) if part != "")
+        for a_dir in dirnames:
+            entries.append((Path(dirpath, a_dir), f"{prefix}/{a_dir}/" if prefix else f"{a_dir}/"))
+        for a_file in sorted(filenames):
+            entries.append((Path(dirpath, a_file), f"{prefix}/{a_file}" if prefix else a_file))
+    return entries
+
+
+def _dos_datetime(mtime: float) -> tuple[int, int]:
+    stamp = time.localtime(mtime)
+    if stamp.tm_year < 1980:
+        return 0, (0 << 9) | (1 << 5) | 1
+    dos_time = (stamp.tm_hour << 11) | (stamp.tm_min << 5) | (stamp.tm_sec // 2)
+    dos_date = ((stamp.tm_year - 1980) << 9) | (stamp.tm_mon << 5) | stamp.tm_mday
+    return dos_time, dos_date
+
+
+def _compress_member(path: Path, arcname: str, level: int) -> _CompressedMember:
+    """Runs on a worker thread; zlib releases the GIL while deflating, so N members really do compress on N cores."""
+    st = path.stat()
+    dos_time, dos_date = _dos_datetime(st.st_mtime)
+    if arcname.endswith("/"):
+        return _CompressedMember(arcname=arcname, is_dir=True, external_attr=((st.st_mode & 0xFFFF) << 16) | 0x10, dos_time=dos_time, dos_date=dos_date, crc=0, size=0, compressed_size=0, payload=None)
+    payload = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    crc, size = 0, 0
+    with open(path, "rb") as fh:
+        while piece := fh.read(READ_PIECE_BYTES):
+            crc = zlib.crc32(piece, crc)
+            size += len(piece)
+            payload.write(compressor.compress(piece))
+    payload.write(compressor.flush())
+    compressed_size = payload.tell()
+    payload.seek(0)
+    return _CompressedMember(arcname=arcname, is_dir=False, external_attr=(st.st_mode & 0xFFFF) << 16, dos_time=dos_time, dos_date=dos_date, crc=crc, size=size, compressed_size=compressed_size, payload=payload)
+
+
+class _ZipEmitter:
+    """Minimal zip writer for members whose sizes are known up front: no seeks, so the sink may be a pipe; zip64 when needed."""
+
+    def __init__(self, sink: BinaryIO) -> None:
+        self.sink = sink
+        self.offset = 0
+        self.central: list[bytes] = []
+
+    def _write(self, data: bytes) -> None:
+        self.sink.write(data)
+        self.offset += len(data)
+
+    def add(self, member: _CompressedMember) -> None:
+        name = member.arcname.encode("utf-8")
+        flags = _FLAG_UTF8 if not member.arcname.isascii() else 0
+        method = _METHOD_STORED if member.is_dir else _METHOD_DEFLATED
+        header_offset = self.offset
+        zip64 = member.size >= _ZIP64_LIMIT or member.compressed_size >= _ZIP64_LIMIT or header_offset >= _ZIP64_LIMIT
+        version = 45 if zip64 else 20
+        size32, csize32, offset32 = (_ZIP64_MARKER_32, _ZIP64_MARKER_32, _ZIP64_MARKER_32) if zip64 else (member.size, member.compressed_size, header_offset)
+        local_extra = struct.pack("<HHQQ", 0x0001, 16, member.size, member.compressed_size) if zip64 else b""
+        self._write(struct.pack("<IHHHHHIIIHH", 0x04034B50, version, flags, method, member.dos_time, member.dos_date, member.crc, csize32, size32, len(name), len(local_extra)) + name + local_extra)
+        if member.payload is not None:
+            while piece := member.payload.read(READ_PIECE_BYTES):
+                self._write(piece)
+            member.payload.close()
+        central_extra = struct.pack("<HHQQQ", 0x0001, 24, member.size, member.compressed_size, header_offset) if zip64 else b""
+        self.central.append(
+            struct.pack("<IHHHHHHIIIHHHHHII", 0x02014B50, (3 << 8) | version, version, flags, method, member.dos_time, member.dos_date, member.crc, csize32, size32, len(name), len(central_extra), 0, 0, 0, member.external_attr, offset32)
+            + name
+            + central_extra
+        )
+
+    def finish(self) -> None:
+        cd_offset = self.offset
+        for record in self.central:
+            self._write(record)
+        cd_size = self.offset - cd_offset
+        count = len(self.central)
+        if count > _ZIP_MAX_ENTRIES or cd_offset >= _ZIP64_LIMIT or cd_size >= _ZIP64_LIMIT:
+            eocd64_offset = self.offset
+            self._write(struct.pack("<IQHHIIQQQQ", 0x06064B50, 44, 45, 45, 0, 0, count, count, cd_size, cd_offset))
+            self._write(struct.pack("<IIQI", 0x07064B50, 0, eocd64_offset, 1))
+            count, cd_size, cd_offset = _ZIP64_MARKER_16, _ZIP64_MARKER_32, _ZIP64_MARKER_32
+        self._write(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, count, count, cd_size, cd_offset, 0))
+        self.sink.flush()
+
+
+def write_zip_parallel(entries: list[tuple[Path, str]], sink: BinaryIO, level: Optional[int] = None, threads: Optional[int] = None) -> None:
+    """Deflate members on `threads` workers and emit them to `sink` in order; at most 2x`threads` compressed members are held at once."""
+    level = DEFAULT_COMPRESSION_LEVEL if level is None else level
+    threads = max(1, DEFAULT_COMPRESSION_THREADS if threads is None else threads)
+    emitter = _ZipEmitter(sink=sink)
+    in_flight: deque[Future[_CompressedMember]] = deque()
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="zip-deflate") as pool:
+        for path, arcname in entries:
+            in_flight.append(pool.submit(_compress_member, path, arcname, level))
+            if len(in_flight) >= 2 * threads:
+                emitter.add(in_flight.popleft().result())
+        while in_flight:
+            emitter.add(in_flight.popleft().result())
+    emitter.finish()
+
+
+def extract_zip_parallel(zip_path: Path, destination: Path, threads: Optional[int] = None) -> None:
+    """`ZipFile.extractall` spread over `threads` workers, each with its own handle; members are balanced by uncompressed size."""
+    import zipfile
+
+    threads = max(1, DEFAULT_COMPRESSION_THREADS if threads is None else threads)
+    with zipfile.ZipFile(zip_path, "r") as zip_handle:
+        infos = zip_handle.infolist()
+        file_infos = [an_info for an_info in infos if not an_info.is_dir()]
+        if threads == 1 or len(file_infos) < 2:
+            zip_handle.extractall(str(destination))
+            return
+        for an_info in infos:  # directories (and every parent) up front, so workers never race on makedirs.
+            if an_info.is_dir():
+                zip_handle.extract(an_info, str(destination))
+        parents = {destination.joinpath(*Path(an_info.filename).parts[:-1]) for an_info in file_infos}
+    for a_parent in parents:
+        a_parent.mkdir(parents=True, exist_ok=True)
+    buckets: list[list[zipfile.ZipInfo]] = [[] for _ in range(min(threads, len(file_infos)))]
+    loads = [0] * len(buckets)
+    for an_info in sorted(file_infos, key=lambda item: item.file_size, reverse=True):
+        lightest = loads.index(min(loads))
+        buckets[lightest].append(an_info)
+        loads[lightest] += an_info.file_size
+    errors: list[Exception] = []
+
+    def worker(bucket: list[zipfile.ZipInfo]) -> None:
+        try:
+            with zipfile.ZipFile(zip_path, "r") as own_handle:
+                for an_info in bucket:
+                    own_handle.extract(an_info, str(destination))
+        except Exception as err:
+            errors.append(err)
+
+    workers = [threading.Thread(target=worker, args=(a_bucket,), daemon=True) for a_bucket in buckets]
+    for a_worker in workers:
+        a_worker.start()
+    for a_worker in workers:
+        a_worker.join()
+    if len(errors) > 0:
+        raise errors[0]
+
+
+def _open_zstd(fileobj: BinaryIO) -> BinaryIO:
+    try:
+        from compression import zstd  # type: ignore[import-not-found]  # Python >= 3.14
+        return zstd.ZstdFile(fileobj, mode="rb")
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError as err:
+        raise ImportError("❌ Decompressing .zst needs Python >= 3.14 or the `zstandard` package (`uv add zstandard`).") from err
+    return zstandard.ZstdDecompressor().stream_reader(fileobj)
+
+
+def open_decompressed(path: Path) -> BinaryIO:
+    """Open `path` for reading through the streaming decoder its suffix calls for; memory stays at one read buffer."""
+    name = Path(path).name
+    if name.endswith((".gz", ".tgz")):
+        import gzip
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+    if name.endswith((".bz", ".bz2", ".tbz", ".tbz2")):
+        import bz2
+        return bz2.open(path, "rb")  # type: ignore[return-value]
+    if name.endswith((".xz", ".txz")):
+        import lzma
+        return lzma.open(path, "rb")  # type: ignore[return-value]
+    if name.endswith((".zst", ".tzst")):
+        return _open_zstd(open(path, "rb"))
+    return open(path, "rb")
+
+
+def decompress_file(source: Path, destination: Path) -> None:
+    with open_decompressed(source) as reader, open(destination, "wb") as writer:
+        shutil.copyfileobj(reader, writer, length=READ_PIECE_BYTES)
+
+
+def extract_tar(archive: Path, destination: Path) -> None:
+    """Single pass over a (compressed) tarball: no intermediate `.tar` on disk and no whole-archive `read_bytes()`."""
+    import tarfile
+
+    name = Path(archive).name
+    reader = open_decompressed(archive) if name.endswith((".zst", ".tzst")) else open(archive, "rb")  # tarfile sniffs gz/bz2/xz itself in "r|*".
+    with reader, tarfile.open(fileobj=reader, mode="r|*") as tar_handle:
+        tar_handle.extractall(path=str(destination))
@@ -0,0 +1,289 @@
+"""
+Run a function where its imports resolve: in this process when they already do, otherwise in a cached uv environment.
+
+`uv run --with ...` resolves an environment on every call, even when the function only needs what machineconfig itself
+ships with. Here the function's imports are read from its source and, transitively, from the machineconfig modules it
+imports: their top-level imports, plus the imports inside the functions it actually takes from them (and the module
+functions those call). Imports buried in other functions of an imported module are never followed, so a Windows-only
+branch elsewhere in a module does not turn into a requirement on Linux.
+If every third-party one is importable the function is simply called. Otherwise a virtual environment holding exactly
+the missing packages plus machineconfig is built once per dependency set under `LAUNCHER_ENVS_ROOT`, and the function
+is serialised to a script that runs on that environment's interpreter. Import names map to distributions through the
+installed metadata and machineconfig's declared requirements; a missing module nothing names is reported, not guessed.
+"""
+
+from typing import Any, Callable, Optional
+from pathlib import Path
+import ast
+import functools
+import hashlib
+import importlib.metadata
+import importlib.util
+import inspect
+import json
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import textwrap
+
+from machineconfig.utils.source_of_truth import CONFIG_ROOT, LINUX_INSTALL_PATH
+
+
+LAUNCHER_ENVS_ROOT = CONFIG_ROOT.joinpath("launcher_envs")
+_READY_MARKER = "launcher_requirements.json"
+_LOCAL_REPO = Path.home().joinpath("code", "machineconfig")
+
+
+def _is_optional(handler: ast.ExceptHandler) -> bool:
+    """An `except ImportError` that carries on (rather than re-raising) makes the imports it guards optional."""
+    names = handler.type.elts if isinstance(handler.type, ast.Tuple) else [handler.type]
+    catches = any(isinstance(name, ast.Name) and name.id in ("ImportError", "ModuleNotFoundError") for name in names)
+    return catches and not any(isinstance(node, ast.Raise) for node in ast.walk(handler))
+
+
+def _is_type_checking(test: ast.expr) -> bool:
+    return (isinstance(test, ast.Name) and test.id == "TYPE_CHECKING") or (isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING")
+
+
+def _module_level_nodes(tree: ast.Module) -> list[ast.AST]:
+    """Nodes that run when the module is imported: function bodies and `if TYPE_CHECKING:` blocks are left out."""
+    nodes: list[ast.AST] = []
+    stack: list[ast.AST] = [tree]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+                continue
+            if isinstance(child, ast.If) and _is_type_checking(child.test):
+                stack.extend(child.orelse)
+                continue
+            stack.append(child)
+    return nodes
+
+
+def _called_functions(tree: ast.Module, names: set[str]) -> list[ast.AST]:
+    """The module-level functions among `names`, and the module-level functions those refer to, transitively."""
+    functions = {node.name: node for node in tree.body if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))}
+    pending = [name for name in names if name in functions]
+    seen: set[str] = set()
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        pending.extend(node.id for node in ast.walk(functions[name]) if isinstance(node, ast.Name) and node.id in functions)
+    return [functions[name] for name in seen]
+
+
+def _imports_of(source: str, called: Optional[set[str]]) -> set[tuple[str, Optional[str]]]:
+    """(module, name imported from it or None) for each import in `source` that runs, except optional ones (see
+    `_is_optional`); `from a import b` also yields `a.b`, in case `b` is a module.
+
+    With `called` None all of `source` runs (it is the launched function). Otherwise `source` is a module: what runs
+    is its module level and the functions in `called` that were imported from it. An import inside any other function
+    (e.g. `win32com` on a Windows-only branch) only runs if that function is called."""
+    tree = ast.parse(source)
+    optional: set[int] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Try) and any(_is_optional(handler) for handler in node.handlers):
+            optional.update(id(child) for statement in node.body for child in ast.walk(statement))
+    if called is None:
+        nodes: list[ast.AST] = list(ast.walk(tree))
+    else:
+        nodes = _module_level_nodes(tree) + [node for function in _called_functions(tree, called) for node in ast.walk(function)]
+    imports: set[tuple[str, Optional[str]]] = set()
+    for node in nodes:
+        if id(node) in optional:
+            continue
+        if isinstance(node, ast.Import):
+            imports.update((alias.name, None) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            imports.add((node.module, None))
+            for alias in node.names:
+                if alias.name != "*":
+                    imports.update({(f"{node.module}.{alias.name}", None), (node.module, alias.name)})
+    return imports
+
+
+def _module_source(module: str) -> Optional[str]:
+    """Source of a machineconfig module, found on disk without importing it (or its parents); None if it is not one."""
+    package_root = Path(__file__).resolve().parent.parent
+    base = package_root.joinpath(*module.split(".")[1:])
+    for candidate in (base.with_suffix(".py"), base.joinpath("__init__.py")):
+        if candidate.is_file():
+            return candidate.read_text(encoding="utf-8")
+    return None
+
+
+def third_party_imports(func: Callable[..., Any]) -> set[str]:
+    """Top-level third-party modules `func` imports anywhere in its body, or that the machineconfig modules it imports
+    import when loaded or in the functions `func` takes from them."""
+    pending = _imports_of(textwrap.dedent(inspect.getsource(func)), called=None)
+    seen: set[tuple[str, Optional[str]]] = set()
+    found: set[str] = set()
+    while pending:
+        item = pending.pop()
+        if item in seen:
+            continue
+        seen.add(item)
+        module, name = item
+        top = module.split(".")[0]
+        if top == "machineconfig":
+            source = _module_source(module)
+            if source is not None:
+                pending.update(_imports_of(source, called=set() if name is None else {name}) - seen)
+        elif top not in sys.stdlib_module_names and top != "__future__":
+            found.add(top)
+    return found
+
+
+def _normalize(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+@functools.cache
+def _declared_distributions() -> dict[str, str]:
+    """machineconfig's own requirements, extras included, by normalised name."""
+    try:
+        requirements = importlib.metadata.requires("machineconfig") or []
+    except importlib.metadata.PackageNotFoundError:  # running from a source checkout that was never installed.
+        import tomllib
+        pyproject = Path(__file__).resolve().parents[3].joinpath("pyproject.toml")
+        if not pyproject.is_file():
+            return {}
+        project = tomllib.loads(pyproject.read_text(encoding="utf-8"))["project"]
+        requirements = [*project.get("dependencies", []), *(req for extra in project.get("optional-dependencies", {}).values() for req in extra)]
+    names = (re.match(r"[A-Za-z0-9._-]+", requirement) for requirement in requirements)
+    return {_normalize(name.group(0)): name.group(0) for name in names if name is not None}
+
+
+@functools.cache
+def _installed_distributions() -> dict[str, list[str]]:
+    return dict(importlib.metadata.packages_distributions())
+
+
+def distribution_of(module: str, distributions: tuple[str, ...] = ()) -> Optional[str]:
+    """Distribution providing the top-level import `module`: the installed one that does, else the requirement of
+    machineconfig (or one of `distributions`) with the same name; None when it cannot be named."""
+    installed = _installed_distributions().get(module)
+    if installed:
+        return installed[0]
+    known = {**_declared_distributions(), **{_normalize(distribution): distribution for distribution in distributions}}
+    return known.get(_normalize(module))
+
+
+def missing_requirements(func: Callable[..., Any], extra_modules: tuple[str, ...] = (), distributions: tuple[str, ...] = ()) -> list[str]:
+    """Distributions to install for `func` (and `extra_modules`, used indirectly) that are not importable here.
+
+    `distributions` names what `func` may need beyond machineconfig's own requirements. A missing module no known
+    distribution provides (typically a platform-only one, like `win32com` off Windows) is reported, never installed."""
+    missing = sorted(module for module in third_party_imports(func).union(extra_modules) if importlib.util.find_spec(module) is None)
+    named = {module: distribution_of(module, distributions) for module in missing}
+    unnamed = [module for module, distribution in named.items() if distribution is None]
+    if unnamed:
+        from rich.console import Console
+        Console().print(f"⚠️ [yellow]Not installing[/yellow] [bold]{', '.join(unnamed)}[/bold] [yellow]: no known distribution provides it here.[/yellow]")
+    return sorted({distribution for distribution in named.values() if distribution is not None})
+
+
+def _called_function(lmb: Callable[[], Any]) -> Callable[..., Any]:
+    """The function a `lambda: func(key=value, ...)` calls, looked up in its closure, then its globals."""
+    tree = ast.parse(textwrap.dedent(inspect.getsource(lmb)))
+    call = next(node.body for node in ast.walk(tree) if isinstance(node, ast.Lambda))
+    if not isinstance(call, ast.Call) or not isinstance(call.func, ast.Name):
+        raise ValueError(f"Expected `lambda: func(...)`, got: {ast.unparse(call)}")
+    namespace = dict(lmb.__globals__)
+    namespace.update(zip(lmb.__code__.co_freevars, (cell.cell_contents for cell in lmb.__closure__ or ())))
+    return namespace[call.func.id]
+
+
+def _uv_executable() -> str:
+    installed = Path(LINUX_INSTALL_PATH).joinpath("uv.exe" if platform.system() == "Windows" else "uv")
+    if installed.exists():
+        return str(installed)
+    return shutil.which("uv") or "uv"
+
+
+def _machineconfig_requirement() -> list[str]:
+    if _LOCAL_REPO.exists():
+        return ["--editable", str(_LOCAL_REPO)]
+    from machineconfig.utils.ssh_utils.abc import MACHINECONFIG_VERSION
+    return [MACHINECONFIG_VERSION]
+
+
+def _env_python(env_dir: Path) -> Path:
+    if platform.system() == "Windows":
+        return env_dir.joinpath("Scripts", "python.exe")
+    return env_dir.joinpath("bin", "python")
+
+
+def environment_for(requirements: list[str]) -> Path:
+    """Interpreter of the cached environment with `requirements` and machineconfig installed, built on first use."""
+    machineconfig_requirement = _machineconfig_requirement()
+    python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    key_material = json.dumps([sorted(requirements), machineconfig_requirement, python_version])
+    env_dir = LAUNCHER_ENVS_ROOT.joinpath(hashlib.sha256(key_material.encode("utf-8")).hexdigest()[:16])
+    if env_dir.joinpath(_READY_MARKER).exists():
+        return _env_python(env_dir)
+    from rich.console import Console
+    Console().print(f"📦 [cyan]Creating a cached environment for[/cyan] [bold]{', '.join(requirements)}[/bold] [dim]@ {env_dir}[/dim]")
+    # Built next to its final place and renamed into it, so an interrupted build is never mistaken for a ready one.
+    build_dir = env_dir.with_name(f"{env_dir.name}.building")
+    shutil.rmtree(build_dir, ignore_errors=True)
+    uv = _uv_executable()
+    subprocess.run([uv, "venv", "--quiet", "--python", python_version, str(build_dir)], check=True)
+    subprocess.run([uv, "pip", "install", "--quiet", "--python", str(_env_python(build_dir)), *requirements, *machineconfig_requirement], check=True)
+    build_dir.joinpath(_READY_MARKER).write_text(key_material, encoding="utf-8")
+    try:
+        build_dir.replace(env_dir)
+    except OSError:  # another process finished the same environment first.
+        shutil.rmtree(build_dir, ignore_errors=True)
+    return _env_python(env_dir)
+
+
+def run_with_dependencies(lmb: Callable[[], Any], extra_modules: tuple[str, ...] = (), distributions: tuple[str, ...] = (), hand_over: bool = False) -> None:
+    """Run `lambda: func(key=value, ...)` in-process if everything `func` imports is available, else in a cached environment.
+
+    `extra_modules` names modules `func` needs without importing them itself (e.g. `kaleido`, which plotly loads to write
+    images); `distributions` names the ones machineconfig does not depend on (see `missing_requirements`). With
+    `hand_over`, the out-of-process run is handed to the calling shell via `exit_then_run_shell_script`."""
+    requirements = missing_requirements(_called_function(lmb), extra_modules=extra_modules, distributions=distributions)
+    if not requirements:
+        lmb()
+        return
+    python = environment_for(requirements)
+    from machineconfig.utils.accessories import randstr
+    from machineconfig.utils.code import exit_then_run_shell_script, run_shell_script
+    from machineconfig.utils.meta import lambda_to_python_script
+    python_file = Path.home().joinpath("tmp_results", "tmp_scripts", "python", randstr() + ".py")
+    python_file.parent.mkdir(parents=True, exist_ok=True)
+    python_file.write_text(lambda_to_python_script(lmb, in_global=True, import_module=False), encoding="utf-8")
+    call_operator = "& " if platform.system() == "Windows" else ""
+    shell_script = f'{call_operator}"{python}" "{python_file}"'
+    if hand_over:
+        exit_then_run_shell_script(shell_script, strict=False)
+    else:
+        run_shell_script(shell_script, display_script=True, clean_env=False)
+
+
+def check_graph_search_needs_nothing() -> None:
+    """On a full install (every distribution pinned in the repository's uv.lock present), `graph search` runs in-process:
+    nothing its closure imports, on any code path that runs, is left to install."""
+    import tomllib
+    import types
+    from machineconfig.scripts.python.graph.visualize import cli_graph_app
+
+    lock = tomllib.loads(Path(__file__).resolve().parents[3].joinpath("uv.lock").read_text(encoding="utf-8"))
+    locked = {_normalize(package["name"]) for package in lock["package"]}
+    code = next(const for const in cli_graph_app.search.__code__.co_consts if isinstance(const, types.CodeType) and const.co_name == "func")
+    func = types.FunctionType(code, vars(cli_graph_app))
+    absent = sorted(module for module in third_party_imports(func) if importlib.util.find_spec(module) is None and _normalize(distribution_of(module) or module) not in locked)
+    assert absent == [], f"`graph search` would need {absent} on a full install"
+    print("✅ graph search resolves to no requirements on a full install")
+
+
+if __name__ == "__main__":
+    check_graph_search_needs_nothing()
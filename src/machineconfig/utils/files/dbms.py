@@ -1,15 +1,43 @@
 import time
-from typing import Optional, Any, Callable
+from typing import Optional, Any, Callable, Iterable, Iterator, TYPE_CHECKING, cast
+from contextlib import contextmanager
+from itertools import chain, islice
+import importlib.util
 
 import polars as pl
 
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine, text, inspect as inspect__
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, text, inspect as inspect__, table as table__, column as column__
+from sqlalchemy import BigInteger, Boolean, Column, Date, DateTime, Float, LargeBinary, String, Table
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.sql.schema import MetaData
+from sqlalchemy.types import TypeEngine
 from pathlib import Path as P
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 OPLike = Optional[P] | str | None
+BULK_CHUNK_SIZE = 50_000  # rows per executemany call and per transaction.
+ADBC_DRIVERS = {"sqlite": "adbc_driver_sqlite", "postgresql": "adbc_driver_postgresql"}
+# Relaxed for the duration of a bulk load on SQLite (durability of the batch in flight is traded for throughput).
+SQLITE_BULK_PRAGMAS = {"synchronous": "OFF", "cache_size": "-65536", "temp_store": "MEMORY"}
+
+
+def _sql_type(dtype: pl.DataType) -> TypeEngine[Any]:
+    if dtype == pl.Boolean:
+        return Boolean()
+    if dtype.is_integer():
+        return BigInteger()
+    if dtype.is_float():
+        return Float()
+    if dtype == pl.Date:
+        return Date()
+    if isinstance(dtype, pl.Datetime):
+        return DateTime()
+    if dtype == pl.Binary:
+        return LargeBinary()
+    return String()
 
 
 class DBMS:
@@ -63,10 +91,72 @@ class DBMS:
     #     return result if not df else pl.DataFrame(result)
 
     # ========================== TABLES =====================================
-    def insert_dicts(self, table: str, *mydicts: dict[str, Any]) -> None:
-        cmd = f"""INSERT INTO {table} VALUES """
-        for mydict in mydicts: cmd += f"""({tuple(mydict)}), """
-        self.execute_begin_once(cmd)
+    def insert_dicts(self, table: str, *mydicts: dict[str, Any], sch: Optional[str] = None) -> int:
+        """Insert rows given as dicts; columns absent from some dicts are inserted as NULL."""
+        columns = list(dict.fromkeys(key for mydict in mydicts for key in mydict))
+        return self.insert_rows(table, ({col: mydict.get(col) for col in columns} for mydict in mydicts), sch=sch)
+
+    def _schema_for(self, table: str, sch: Optional[str]) -> Optional[str]:
+        """`sch` as SQLAlchemy constructs should receive it (see `_get_table_identifier`)."""
+        return None if self._get_table_identifier(self.eng, table, sch) == f'"{table}"' else sch
+
+    def _table_clause(self, table: str, columns: list[str], sch: Optional[str]):
+        return table__(table, *[column__(col) for col in columns], schema=self._schema_for(table, sch))
+
+    @contextmanager
+    def _bulk_connection(self) -> Iterator[Connection]:
+        """A connection for bulk loads; on SQLite, `SQLITE_BULK_PRAGMAS` apply until it is returned to the pool."""
+        with self.eng.connect() as conn:
+            if self.eng.dialect.name != "sqlite":
+                yield conn
+                return
+            previous = {pragma: conn.exec_driver_sql(f"PRAGMA {pragma}").scalar() for pragma in SQLITE_BULK_PRAGMAS}
+            for pragma, value in SQLITE_BULK_PRAGMAS.items():
+                conn.exec_driver_sql(f"PRAGMA {pragma} = {value}")
+            conn.commit()
+            try:
+                yield conn
+            finally:
+                for pragma, value in previous.items():
+                    conn.exec_driver_sql(f"PRAGMA {pragma} = {value}")
+                conn.commit()
+
+    def insert_rows(self, table: str, rows: Iterable[dict[str, Any]], sch: Optional[str] = None, chunk_size: int = BULK_CHUNK_SIZE) -> int:
+        """Insert `rows` with bound parameters: one `executemany` and one transaction per `chunk_size` rows.
+        Columns come from the first row and every row must have the same keys. Returns the number of rows inserted."""
+        iterator = iter(rows)
+        first = next(iterator, None)
+        if first is None:
+            return 0
+        statement = self._table_clause(table, list(first), sch).insert()
+        pending = chain([first], iterator)
+        total = 0
+        with self._bulk_connection() as conn:
+            while chunk := list(islice(pending, chunk_size)):
+                with conn.begin():
+                    conn.execute(statement, chunk)
+                total += len(chunk)
+        return total
+
+    def _adbc_uri(self) -> Optional[str]:
+        """Connection URI for polars' ADBC writer, if the driver for this database is installed; None for in-memory SQLite,
+        which a second connection would not see."""
+        driver = ADBC_DRIVERS.get(self.eng.dialect.name)
+        if driver is None or importlib.util.find_spec(driver) is None or self.eng.url.database in (None, "", ":memory:"):
+            return None
+        return self.eng.url.set(drivername=self.eng.dialect.name).render_as_string(hide_password=False)
+
+    def write_frame(self, table: str, frame: "pl.DataFrame | pa.Table", sch: Optional[str] = None, chunk_size: int = BULK_CHUNK_SIZE) -> int:
+        """Append a polars DataFrame or Arrow table to `table`, creating the table if missing. Goes through ADBC
+        (`DataFrame.write_database`) when available, else through `insert_rows`. Returns the number of rows written."""
+        df = frame if isinstance(frame, pl.DataFrame) else cast(pl.DataFrame, pl.from_arrow(frame))
+        uri = self._adbc_uri()
+        if uri is not None:
+            df.write_database(table if sch is None else f"{sch}.{table}", connection=uri, if_table_exists="append", engine="adbc")
+            return df.height
+        columns = [Column(name, _sql_type(dtype)) for name, dtype in df.schema.items()]
+        Table(table, MetaData(), *columns, schema=self._schema_for(table, sch)).create(self.eng, checkfirst=True)
+        return self.insert_rows(table, df.iter_rows(named=True), sch=sch, chunk_size=chunk_size)
 
     def refresh(self, sch: Optional[str] = None) -> dict[str, Any]:
         con = self.eng.connect()
@@ -253,5 +343,43 @@ def get_table_specs(engine: Engine, table_name: str) -> pl.DataFrame:
     df = pl.DataFrame(all_info)
     return df
 
+def benchmark_bulk_insert(rows: int = 1_000_000, path: OPLike = None, baseline_rows: int = 20_000) -> None:
+    """Insert `rows` synthetic rows into a local SQLite file with each bulk path, and `baseline_rows` of them one
+    statement at a time for reference; report throughput."""
+    from rich.console import Console
+    from rich.table import Table as RichTable
+    db_path = P(path) if path is not None else DB_TMP_PATH.with_name("bulk_insert_benchmark.sqlite")
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    db_path.unlink(missing_ok=True)
+    db = DBMS.from_local_db(db_path)
+    frame = pl.DataFrame({"id": pl.int_range(rows, eager=True), "name": [f"row-{i}" for i in range(rows)]}).with_columns(
+        value=pl.col("id").cast(pl.Float64) / 7, flag=pl.col("id") % 3 == 0)
+    dicts = frame.to_dicts()
+    for name in ("row_by_row", "insert_rows", "write_frame"):
+        db.write_frame(name, frame.head(0))
+
+    results: list[tuple[str, int, float]] = []
+    started = time.perf_counter()
+    with db.eng.begin() as conn:
+        statement = text('INSERT INTO "row_by_row" (id, name, value, flag) VALUES (:id, :name, :value, :flag)')
+        for row in dicts[:baseline_rows]:
+            conn.execute(statement, row)
+    results.append(("one execute per row (baseline)", min(rows, baseline_rows), time.perf_counter() - started))
+    started = time.perf_counter()
+    results.append(("insert_rows (executemany, chunked)", db.insert_rows("insert_rows", dicts), time.perf_counter() - started))
+    started = time.perf_counter()
+    written = db.write_frame("write_frame", frame)
+    results.append((f"write_frame ({'ADBC' if db._adbc_uri() else 'insert_rows fallback'})", written, time.perf_counter() - started))
+    db.close(sleep=0)
+
+    baseline_rate = results[0][1] / results[0][2]
+    table = RichTable(title=f"🗄️ Bulk insert into SQLite @ {db_path}", show_header=True, header_style="bold cyan")
+    for col in ("Method", "Rows", "Seconds", "Rows/s", "vs baseline"):
+        table.add_column(col, justify="left" if col == "Method" else "right")
+    for method, count, seconds in results:
+        table.add_row(method, f"{count:,}", f"{seconds:.2f}", f"{count / seconds:,.0f}", f"{count / seconds / baseline_rate:.1f}x")
+    Console().print(table)
+
+
 if __name__ == '__main__':
-    pass
+    benchmark_bulk_insert()
@@ -112,11 +112,9 @@ def get_release_info(
     repo_name: str,
     version: Optional[str] = None,
 ) -> Optional[ReleaseInfo]:
-    """Return sanitized release information for the requested repository."""
-    release_data = fetch_github_release_data(username, repo_name, version)
-    if not release_data:
-        return None
-    return extract_release_info(release_data)
+    """Return sanitized release information for the requested repository (cached, ETag-revalidated; see github_release_resolver)."""
+    from machineconfig.utils.installer_utils.github_release_resolver import resolve_release
+    return resolve_release(username, repo_name, version)
 
 
 def extract_release_info(release_data: Dict[str, Any]) -> Optional[ReleaseInfo]:
@@ -0,0 +1,172 @@
+"""Release-metadata resolver: on-disk TTL cache with ETag revalidation, a concurrent fetcher, and the bundled snapshot as last resort."""
+
+from typing import Any, Optional
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+import json
+import os
+import threading
+import time
+
+import requests
+
+from machineconfig.utils.installer_utils.github_release_bulk import ReleaseInfo, extract_release_info
+from machineconfig.utils.source_of_truth import CONFIG_ROOT
+
+
+RELEASES_CACHE_PATH = CONFIG_ROOT.joinpath("github_releases_cache.json")
+BUNDLED_SNAPSHOT_PATH = Path(__file__).parent.joinpath("github_releases.json")
+DEFAULT_RELEASES_TTL_SECONDS = 6 * 3600.0
+DEFAULT_RESOLVER_WORKERS = 16
+API_ROOT = "https://api.github.com"
+
+ReleaseKey = tuple[str, str, Optional[str]]  # (username, repo_name, version); version None means latest.
+
+_CACHE_LOCK = threading.Lock()
+_memory_cache: Optional[dict[str, dict[str, Any]]] = None
+_cache_dirty = False
+_rate_limited_until = 0.0  # epoch seconds; API calls are skipped until then.
+_session: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _cache_key(username: str, repo_name: str, version: Optional[str]) -> str:
+    requested_version = (version or "").strip()
+    if requested_version.lower() == "latest":
+        requested_version = ""
+    return f"{username}/{repo_name}@{requested_version or 'latest'}".lower()
+
+
+def _load_cache() -> dict[str, dict[str, Any]]:
+    global _memory_cache
+    if _memory_cache is None:
+        try:
+            data = json.loads(RELEASES_CACHE_PATH.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            data = {}
+        _memory_cache = data if isinstance(data, dict) else {}
+    return _memory_cache
+
+
+def flush_cache() -> None:
+    """Persist entries resolved since the last flush (one write per batch, not per repository)."""
+    global _cache_dirty
+    with _CACHE_LOCK:
+        if not _cache_dirty or _memory_cache is None:
+            return
+        RELEASES_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = RELEASES_CACHE_PATH.with_suffix(RELEASES_CACHE_PATH.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(_memory_cache), encoding="utf-8")
+        tmp_path.replace(RELEASES_CACHE_PATH)
+        _cache_dirty = False
+
+
+def _store(key: str, release: ReleaseInfo, etag: Optional[str]) -> None:
+    global _cache_dirty
+    with _CACHE_LOCK:
+        _load_cache()[key] = {"saved_at": time.time(), "etag": etag, "release": release}
+        _cache_dirty = True
+
+
+@lru_cache(maxsize=1)
+def _snapshot_releases() -> dict[str, ReleaseInfo]:
+    """Bundled `github_releases.json`, keyed like the cache. Its assets are bare names, so download URLs are rebuilt from the tag."""
+    try:
+        snapshot = json.loads(BUNDLED_SNAPSHOT_PATH.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return {}
+    releases: dict[str, ReleaseInfo] = {}
+    for repo_url, release in snapshot.get("releases", {}).items():
+        if not release:
+            continue
+        parts = repo_url.rstrip("/").split("/")
+        if len(parts) < 5:
+            continue
+        username, repo_name, tag = parts[3], parts[4], release.get("tag_name", "")
+        assets = [{"name": name, "size": 0, "download_count": 0, "content_type": "", "created_at": "", "updated_at": "", "browser_download_url": f"https://github.com/{username}/{repo_name}/releases/download/{tag}/{name}"} for name in release.get("assets", [])]
+        releases[_cache_key(username, repo_name, None)] = {"tag_name": tag, "name": release.get("name", ""), "published_at": release.get("published_at", ""), "assets": assets, "assets_count": len(assets)}  # type: ignore[typeddict-item]
+    return releases
+
+
+def _get_session() -> requests.Session:
+    global _session
+    with _SESSION_LOCK:
+        if _session is None:
+            from requests.adapters import HTTPAdapter
+
+            _session = requests.Session()
+            _session.mount("https://", HTTPAdapter(pool_maxsize=DEFAULT_RESOLVER_WORKERS))
+            _session.headers["Accept"] = "application/vnd.github+json"
+            token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+            if token:  # authenticated calls get 5000 requests/hour instead of 60.
+                _session.headers["Authorization"] = f"Bearer {token}"
+        return _session
+
+
+def _note_rate_limit(response: requests.Response) -> None:
+    global _rate_limited_until
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        _rate_limited_until = float(response.headers.get("X-RateLimit-Reset", time.time() + 60))
+
+
+def resolve_release(username: str, repo_name: str, version: Optional[str] = None, ttl_seconds: float = DEFAULT_RELEASES_TTL_SECONDS, refresh: bool = False, persist: bool = True) -> Optional[ReleaseInfo]:
+    """
+    Release metadata for `latest` or a tag, cheapest source first:
+    fresh cache entry -> conditional API request (a 304 costs no rate limit) -> HTML scraper -> stale cache or bundled snapshot.
+    """
+    from machineconfig.utils.installer_utils.github_release_scraper import scrape_github_release_page
+
+    key = _cache_key(username, repo_name, version)
+    pinned = not key.endswith("@latest")  # a tagged release does not move, so it never expires.
+    with _CACHE_LOCK:
+        entry = _load_cache().get(key)
+    if entry is not None and not refresh and (pinned or time.time() - entry.get("saved_at", 0.0) <= ttl_seconds):
+        return entry["release"]
+
+    release: Optional[ReleaseInfo] = None
+    if time.time() >= _rate_limited_until:
+        requested_version = key.split("@", 1)[1]
+        url = f"{API_ROOT}/repos/{username}/{repo_name}/releases/latest" if requested_version == "latest" else f"{API_ROOT}/repos/{username}/{repo_name}/releases/tags/{(version or '').strip()}"
+        headers = {"If-None-Match": entry["etag"]} if entry is not None and entry.get("etag") else {}
+        try:
+            response = _get_session().get(url, headers=headers, timeout=30)
+            _note_rate_limit(response)
+            if response.status_code == 304 and entry is not None:
+                _store(key, entry["release"], entry.get("etag"))
+                release = entry["release"]
+            elif response.status_code == 200:
+                release = extract_release_info(response.json())
+                if release is not None:
+                    _store(key, release, response.headers.get("ETag"))
+            else:
+                print(f"⚠️ API failed for {username}/{repo_name}: HTTP {response.status_code}, trying HTML scraper...")
+        except (requests.RequestException, json.JSONDecodeError) as error:
+            print(f"⚠️ API error for {username}/{repo_name}: {error}, trying HTML scraper...")
+    if release is None:
+        scraped = scrape_github_release_page(username, repo_name, version)
+        release = extract_release_info(scraped) if scraped else None
+        if release is not None:
+            _store(key, release, None)
+    if release is None:
+        release = entry["release"] if entry is not None else _snapshot_releases().get(key)
+        if release is not None:
+            print(f"📦 Using cached release metadata for {username}/{repo_name} @ {release['tag_name']}")
+    if persist:
+        flush_cache()
+    return release
+
+
+def resolve_releases(keys: list[ReleaseKey], max_workers: int = DEFAULT_RESOLVER_WORKERS, ttl_seconds: float = DEFAULT_RELEASES_TTL_SECONDS, refresh: bool = False) -> dict[ReleaseKey, Optional[ReleaseInfo]]:
+    """Resolve many repositories concurrently over one pooled session and write the cache once at the end."""
+    unique_keys = list(dict.fromkeys(keys))
+    if len(unique_keys) == 0:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique_keys))), thread_name_prefix="gh-release") as pool:
+        results = list(pool.map(lambda a_key: resolve_release(a_key[0], a_key[1], a_key[2], ttl_seconds=ttl_seconds, refresh=refresh, persist=False), unique_keys))
+    flush_cache()
+    if _rate_limited_until > time.time():
+        reset_at = datetime.fromtimestamp(_rate_limited_until, tz=timezone.utc).astimezone().strftime("%H:%M")
+        print(f"🚫 GitHub API rate limit reached (resets at {reset_at}); set GITHUB_TOKEN for a higher limit.")
+    return dict(zip(unique_keys, results))
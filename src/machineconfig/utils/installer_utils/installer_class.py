@@ -37,6 +37,17 @@ class Installer:
         """Derive executable name from app name by converting to lowercase and removing spaces."""
         return self.installer_data["appName"].lower().replace(" ", "")  # .replace("-", "")
 
+    def uses_github_release(self) -> bool:
+        """Whether `install` goes through a GitHub release asset, rather than a package manager, a script or a direct link."""
+        repo_url = self.installer_data["repoURL"]
+        installer_arch_os = self.installer_data["fileNamePattern"][get_normalized_arch()][get_os_name()]
+        if installer_arch_os is None or not repo_url.startswith("https://github.com/"):
+            return False
+        package_manager_installer = any(pm in installer_arch_os.split(" ") for pm in PACAKGE_MANAGERS)
+        script_installer = installer_arch_os.endswith((".sh", ".py", ".ps1"))
+        binary_download_link = installer_arch_os.startswith("https://") or installer_arch_os.startswith("http://")
+        return not (package_manager_installer or script_installer or binary_download_link)
+
     def install_robust(self, version: Optional[str]) -> str:
         try:
             exe_name = self._get_exe_name()
@@ -2,6 +2,8 @@
 
 from machineconfig.utils.installer_utils.installer_locator_utils import check_if_installed_already
 from machineconfig.utils.installer_utils.installer_class import Installer
+from machineconfig.utils.installer_utils.github_release_bulk import get_repo_name_from_url
+from machineconfig.utils.installer_utils.github_release_resolver import DEFAULT_RESOLVER_WORKERS, ReleaseKey, resolve_releases
 from machineconfig.utils.schemas.installer.installer_types import InstallerData, InstallerDataFiles, get_normalized_arch, get_os_name, OPERATING_SYSTEMS, CPU_ARCHITECTURES
 from machineconfig.jobs.installer.package_groups import PACKAGE_GROUP2NAMES, PACKAGE_NAME
 from machineconfig.utils.path_extended import PathExtended
@@ -11,6 +13,7 @@ from machineconfig.utils.io import read_json
 from rich.console import Console
 from rich.panel import Panel
 from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 import platform
 from joblib import Parallel, delayed
 
@@ -19,7 +22,7 @@ def check_latest():
     console = Console()  # Added console initialization
     console.print(Panel("🔍  CHECKING FOR LATEST VERSIONS", title="Status", expand=False))  # Replaced print with Panel
     installers = get_installers(os=get_os_name(), arch=get_normalized_arch(), which_cats=["termabc"])
-    installers_github = []
+    installers_github: list[Installer] = []
     for inst__ in installers:
         app_name = inst__["appName"]
         repo_url = inst__["repoURL"]
@@ -29,20 +32,23 @@ def check_latest():
         if "github" not in repo_url:
             print(f"⏭️  Skipping {app_name} (not a GitHub release)")
             continue
-        installers_github.append(inst__)
+        installers_github.append(Installer(inst__))
 
     print(f"\n🔍 Checking {len(installers_github)} GitHub-based installers...\n")
+    prefetch_github_releases([inst.installer_data for inst in installers_github])
 
     def func(inst: Installer):
-        exe_name = inst.installer_data.get("exeName", "unknown")
-        repo_url = inst.installer_data.get("repoURL", "")
+        exe_name = inst._get_exe_name()
+        repo_url = inst.installer_data["repoURL"]
         print(f"🔎 Checking {exe_name}...")
         _release_url, version_to_be_installed = inst.get_github_release(repo_url=repo_url, version=None)
         verdict, current_ver, new_ver = check_if_installed_already(exe_name=exe_name, version=version_to_be_installed, use_cache=False)
         return exe_name, verdict, current_ver, new_ver
 
     print("\n⏳ Processing installers...\n")
-    res = [func(inst) for inst in installers_github]
+    # releases are cache hits by now; what is left per tool is mostly the `<exe> --version` subprocess, so overlap those.
+    with ThreadPoolExecutor(max_workers=DEFAULT_RESOLVER_WORKERS) as pool:
+        res = list(pool.map(func, installers_github))
 
     print("\n📊 Generating results table...\n")
 
@@ -71,6 +77,20 @@ def check_latest():
     console.rule(style="bold blue")
 
 
+def prefetch_github_releases(installers_data: list[InstallerData]) -> None:
+    """Resolve the latest release of every installer that downloads GitHub assets concurrently, so later per-tool lookups hit the cache."""
+    keys: list[ReleaseKey] = []
+    for installer_data in installers_data:
+        if not Installer(installer_data).uses_github_release():
+            continue
+        repo_info = get_repo_name_from_url(installer_data["repoURL"])
+        if repo_info is not None:
+            keys.append((repo_info[0], repo_info[1], None))
+    if len(keys) > 0:
+        print(f"🌐 Resolving {len(keys)} GitHub releases...")
+        resolve_releases(keys)
+
+
 def get_installed_cli_apps():
     print("🔍 LISTING INSTALLED CLI APPS 🔍")
     if platform.system() == "Windows":
@@ -134,6 +154,7 @@ def install_bulk(installers_data: list[InstallerData], safe: bool = False, jobs:
     if safe:
         pass
     print(f"🚀 Starting installation of {len(installers_data)} packages...")
+    prefetch_github_releases(installers_data)  # one concurrent pass; joblib workers then read the on-disk cache instead of re-querying.
     print("📦 INSTALLING FIRST PACKAGE 📦")
     Installer(installers_data[0]).install(version=None)
     installers_remaining = installers_data[1:]
@@ -1,5 +1,5 @@
 
-from typing import Any, Union, Optional, Mapping
+from typing import Any, BinaryIO, Union, Optional, Mapping
 from pathlib import Path
 import json
 import pickle
@@ -158,3 +158,170 @@ def decrypt(token: bytes, key: Optional[bytes] = None, pwd: Optional[str] = None
         raise TypeError(f"❌ Key must be either str, P, Path, bytes or None. Recieved: {type(key)}")
     from cryptography.fernet import Fernet
     return Fernet(key=key_resolved).decrypt(token)
+
+
+# ====================================== Chunked (streaming) encryption ======================================
+# Layout: MAGIC | flags(1) | chunk_size(4) | nonce_prefix(7) | [salt(16) | iterations(4)]  then records of  len(4) | AES-GCM(chunk).
+# Each record's nonce is nonce_prefix | counter(4) | is_final(1) and the header is authenticated with every record,
+# so reordering, truncation or appending is detected, and memory stays bounded by one chunk on either side.
+CHUNKED_MAGIC = b"MCSTRM01"
+CHUNKED_DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+_CHUNKED_FLAG_PWD = 0x01
+
+
+def is_chunked_ciphertext(path: PathLike) -> bool:
+    try:
+        with open(path, "rb") as fh:
+            return fh.read(len(CHUNKED_MAGIC)) == CHUNKED_MAGIC
+    except (FileNotFoundError, IsADirectoryError):
+        return False
+
+
+def _fernet_key_to_aes_key(fernet_key: bytes) -> bytes:
+    import base64
+    return base64.urlsafe_b64decode(fernet_key)  # 32 raw bytes, used whole as the AES-256-GCM key.
+
+
+def _resolve_stream_key(key: Optional[bytes], pwd: Optional[str], salt: Optional[bytes], iterations: Optional[int]) -> bytes:
+    if pwd is not None:
+        assert key is None, "❌ You can either pass key or pwd, or none of them, but not both."
+        return pwd2key(password=pwd, salt=salt, iterations=iterations or 10)
+    if type(key) is bytes:
+        return key
+    if key is None:
+        return Path.home().joinpath("dotfiles/creds/data/encrypted_files_key.bytes").read_bytes()
+    if isinstance(key, (str, Path)):
+        return Path(key).read_bytes()
+    raise TypeError(f"❌ Key must be either str, P, Path, bytes or None. Recieved: {type(key)}")
+
+
+class ChunkedEncryptWriter:
+    """Write-only file object: buffers up to `chunk_size` plaintext bytes, then emits one authenticated record to `sink`."""
+
+    def __init__(self, sink: BinaryIO, key: Optional[bytes], pwd: Optional[str], chunk_size: int = CHUNKED_DEFAULT_CHUNK_SIZE):
+        import secrets
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+        salt: Optional[bytes] = None
+        iterations: Optional[int] = None
+        flags = 0
+        if pwd is not None:
+            salt, iterations, flags = secrets.token_bytes(nbytes=16), 100_000 + secrets.randbelow(exclusive_upper_bound=100_000), _CHUNKED_FLAG_PWD
+        self._aead = AESGCM(_fernet_key_to_aes_key(_resolve_stream_key(key=key, pwd=pwd, salt=salt, iterations=iterations)))
+        self._nonce_prefix = secrets.token_bytes(nbytes=7)
+        self._header = CHUNKED_MAGIC + bytes([flags]) + chunk_size.to_bytes(4, "big") + self._nonce_prefix
+        if salt is not None and iterations is not None:
+            self._header += salt + iterations.to_bytes(4, "big")
+        self._sink = sink
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._counter = 0
+        self._position = 0
+        self.closed = False
+        self._sink.write(self._header)
+
+    def _emit(self, plaintext: bytes, final: bool) -> None:
+        nonce = self._nonce_prefix + self._counter.to_bytes(4, "big") + (b"\x01" if final else b"\x00")
+        record = self._aead.encrypt(nonce, plaintext, self._header)
+        self._sink.write(len(record).to_bytes(4, "big"))
+        self._sink.write(record)
+        self._counter += 1
+
+    def write(self, data: bytes) -> int:
+        if self.closed:
+            raise ValueError("write to closed ChunkedEncryptWriter")
+        self._buffer += data
+        while len(self._buffer) >= self._chunk_size:
+            self._emit(bytes(self._buffer[: self._chunk_size]), final=False)
+            del self._buffer[: self._chunk_size]
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:  # zipfile needs tell() (but not seek()) to stream into a non-seekable target.
+        return self._position
+
+    def flush(self) -> None:
+        self._sink.flush()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self._emit(bytes(self._buffer), final=True)
+        self._buffer.clear()
+        self._sink.flush()
+        self.closed = True
+
+    def __enter__(self) -> "ChunkedEncryptWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if exc_type is None:
+            self.close()
+
+
+def decrypt_chunked_stream(source: BinaryIO, sink: BinaryIO, key: Optional[bytes] = None, pwd: Optional[str] = None) -> int:
+    """Inverse of `ChunkedEncryptWriter`; returns the number of plaintext bytes written to `sink`."""
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    def read_exact(num: int) -> bytes:
+        data = source.read(num)
+        if len(data) != num:
+            raise ValueError("❌ Chunked ciphertext is truncated.")
+        return data
+
+    header = read_exact(len(CHUNKED_MAGIC) + 1 + 4 + 7)
+    if header[: len(CHUNKED_MAGIC)] != CHUNKED_MAGIC:
+        raise ValueError("❌ Not a chunked ciphertext (bad magic).")
+    flags = header[len(CHUNKED_MAGIC)]
+    nonce_prefix = header[-7:]
+    salt: Optional[bytes] = None
+    iterations: Optional[int] = None
+    if flags & _CHUNKED_FLAG_PWD:
+        extra = read_exact(16 + 4)
+        header += extra
+        salt, iterations = extra[:16], int.from_bytes(extra[16:], "big")
+        if pwd is None:
+            raise ValueError("❌ This file was encrypted with a password; pass `pwd`.")
+    elif pwd is not None:
+        raise ValueError("❌ This file was encrypted with a key, not a password; pass `key` instead of `pwd`.")
+    aead = AESGCM(_fernet_key_to_aes_key(_resolve_stream_key(key=key, pwd=pwd, salt=salt, iterations=iterations)))
+    counter = 0
+    written = 0
+    while True:
+        length_bytes = source.read(4)
+        if len(length_bytes) != 4:
+            raise ValueError("❌ Chunked ciphertext is truncated (missing final record).")
+        record = read_exact(int.from_bytes(length_bytes, "big"))
+        nonce_base = nonce_prefix + counter.to_bytes(4, "big")
+        try:
+            plaintext = aead.decrypt(nonce_base + b"\x00", record, header)
+            final = False
+        except Exception:
+            plaintext = aead.decrypt(nonce_base + b"\x01", record, header)  # raises InvalidTag on tampering / wrong key.
+            final = True
+        sink.write(plaintext)
+        written += len(plaintext)
+        counter += 1
+        if final:
+            if source.read(1) != b"":
+                raise ValueError("❌ Unexpected data after the final record of chunked ciphertext.")
+            return written
+
+
+def pack_stream(
+    source: Path, sink: BinaryIO, zip_it: bool, encrypt_it: bool, key: Optional[bytes], pwd: Optional[str], content: bool, chunk_size: int = CHUNKED_DEFAULT_CHUNK_SIZE, level: Optional[int] = None, threads: Optional[int] = None
+) -> None:
+    """Zip and/or chunk-encrypt `source` into `sink` in one pass; nothing is staged on disk and memory stays bounded."""
+    import shutil
+
+    target: Any = ChunkedEncryptWriter(sink=sink, key=key, pwd=pwd, chunk_size=chunk_size) if encrypt_it else sink
+    if zip_it:
+        from machineconfig.utils.compression import write_zip_parallel, zip_entries
+        write_zip_parallel(entries=zip_entries(source=Path(source), content=content), sink=target, level=level, threads=threads)
+    else:
+        assert Path(source).is_file(), f"Cannot stream a directory without zipping it. {source}"
+        with open(source, "rb") as fh:
+            shutil.copyfileobj(fh, target, length=chunk_size)
+    if encrypt_it:
+        target.close()
+    sink.flush()
@@ -1,5 +1,5 @@
 from machineconfig.utils.accessories import randstr
-from machineconfig.utils.io import decrypt, encrypt
+from machineconfig.utils.io import decrypt, encrypt, CHUNKED_DEFAULT_CHUNK_SIZE
 
 from datetime import datetime
 import time
@@ -17,7 +17,7 @@ PLike: TypeAlias = Union[str, "PathExtended", Path]
 FILE_MODE: TypeAlias = Literal["r", "w", "x", "a"]
 SHUTIL_FORMATS: TypeAlias = Literal["zip", "tar", "gztar", "bztar", "xztar"]
 DECOMPRESS_SUPPORTED_FORMATS = [".tar.gz", ".tgz", ".tar", ".gz", ".tar.bz", ".tbz", ".tar.xz", ".zip", ".7z",
-                                ".tar.bz2", ".tbz2", ".xz"]
+                                ".tar.bz2", ".tbz2", ".xz", ".tar.zst", ".tzst", ".zst"]
 
 
 def _is_user_admin() -> bool:
@@ -68,6 +68,18 @@ def timestamp(fmt: Optional[str] = None, name: Optional[str] = None) -> str:
     return ((name + "_") if name is not None else "") + datetime.now().strftime(fmt or "%Y-%m-%d-%I-%M-%S-%p-%f")  # isoformat is not compatible with file naming convention, fmt here is.
 
 
+def _upload_stream(source: "PathExtended", cloud: str, remote: str, zip: bool, encrypt: bool, key: Optional[bytes], pwd: Optional[str]) -> None:  # pylint: disable=W0622
+    from machineconfig.utils.io import pack_stream
+    process = subprocess.Popen(["rclone", "rcat", f"{cloud}:{remote}"], stdin=subprocess.PIPE)
+    assert process.stdin is not None
+    try:
+        pack_stream(source=source, sink=process.stdin, zip_it=zip, encrypt_it=encrypt, key=key, pwd=pwd, content=False)
+    finally:
+        process.stdin.close()
+    if process.wait() != 0:
+        raise RuntimeError(f"💥 rclone rcat failed with exit code {process.returncode} while streaming {source} to {cloud}:{remote}")
+
+
 class PathExtended(type(Path()), Path):  # type: ignore # pylint: disable=E0241
     # ============= Path management ==================
     """The default behaviour of methods acting on underlying disk object is to perform the action and return a new path referring to the mutated object in disk drive.
@@ -478,8 +490,11 @@ class PathExtended(type(Path()), Path):  # type: ignore # pylint: disable=E0241
         content: bool = False,
         orig: bool = False,
         mode: FILE_MODE = "w",
+        level: Optional[int] = None,
+        threads: Optional[int] = None,
         **kwargs: Any,
     ) -> "PathExtended":
+        """:param threads: deflate directory members on this many cores (default: all); `threads=1`, `mode="a"` or extra `kwargs` use the stdlib path."""
         path_resolved, slf = self._resolve_path(folder, name, path, self.name).expanduser().resolve(), self.expanduser().resolve()
         arcname_obj = PathExtended(arcname or slf.name)
         if arcname_obj.name != slf.name:
@@ -489,7 +504,14 @@ class PathExtended(type(Path()), Path):  # type: ignore # pylint: disable=E0241
 
             op_zip = str(path_resolved + ".zip" if path_resolved.suffix != ".zip" else path_resolved)
             with zipfile.ZipFile(op_zip, mode=mode) as jungle_zip:
-                jungle_zip.write(filename=str(slf), arcname=str(arcname_obj), compress_type=zipfile.ZIP_DEFLATED, **kwargs)
+                jungle_zip.write(filename=str(slf), arcname=str(arcname_obj), compress_type=zipfile.ZIP_DEFLATED, compresslevel=level, **kwargs)
+            path_resolved = PathExtended(op_zip)
+        elif threads != 1 and mode == "w" and len(kwargs) == 0:
+            from machineconfig.utils.compression import write_zip_parallel, zip_entries
+
+            op_zip = str(path_resolved + ".zip" if path_resolved.suffix != ".zip" else path_resolved)
+            with open(op_zip, "wb") as sink:
+                write_zip_parallel(entries=zip_entries(source=slf, content=content, arcname=None if content else arcname_obj.as_posix()), sink=sink, level=level, threads=threads)
             path_resolved = PathExtended(op_zip)
         else:
             import shutil
@@ -533,6 +555,7 @@ class PathExtended(type(Path()), Path):  # type: ignore # pylint: disable=E0241
         tmp: bool = False,
         pattern: Optional[str] = None,
         merge: bool = False,
+        threads: Optional[int] = None,
     ) -> "PathExtended":
         assert merge is False, "I have not implemented this yet"
         assert path is None, "I have not implemented this yet"
@@ -570,7 +593,8 @@ class PathExtended(type(Path()), Path):  # type: ignore # pylint: disable=E0241
             target_name = None if name is None else PathExtended(name).as_posix()
             with zipfile.ZipFile(str(zipfile__), "r") as zipObj:
                 if target_name is None:
-                    zipObj.extractall(str(folder))
+                    from machineconfig.utils.compression import extract_zip_parallel
+                    extract_zip_parallel(zip_path=Path(str(zipfile__)), destination=Path(str(folder)), threads=threads)
                     result = Path(str(folder))
                 else:
                     zipObj.extract(member=str(target_name), path=str(folder))
@@ -596,10 +620,8 @@ class PathExtended(type(Path()), Path):  # type: ignore # pylint: disable=E0241
 
     def untar(self, folder: OPLike = None, name: Optional[str] = None, path: OPLike = None, inplace: bool = False, orig: bool = False, verbose: bool = True) -> "PathExtended":
         op_path = self._resolve_path(folder, name, path, self.name.replace(".tar", "")).expanduser().resolve()
-        import tarfile
-
-        with tarfile.open(str(self.expanduser().resolve()), "r") as tf:
-            tf.extractall(path=str(op_path))
+        from machineconfig.utils.compression import extract_tar
+        extract_tar(archive=Path(str(self.expanduser().resolve())), destination=Path(str(op_path)))
         msg = f"UNTARRED {repr(self)} ==>  {repr(op_path)}"
         ret = self if orig else PathExtended(op_path)
         delayed_msg = ""
@@ -620,9 +642,8 @@ class PathExtended(type(Path()), Path):  # type: ignore # pylint: disable=E0241
 
     def ungz(self, folder: OPLike = None, name: Optional[str] = None, path: OPLike = None, inplace: bool = False, orig: bool = False, verbose: bool = True) -> "PathExtended":
         op_path = self._resolve_path(folder, name, path, self.name.replace(".gz", "")).expanduser().resolve()
-        import gzip
-
-        PathExtended(str(op_path)).write_bytes(gzip.decompress(PathExtended(str(self.expanduser().resolve())).read_bytes()))
+        from machineconfig.utils.compression import decompress_file
+        decompress_file(source=Path(str(self.expanduser().resolve())), destination=Path(str(op_path)))
         msg = f"UNGZED {repr(self)} ==>  {repr(op_path)}"
         ret = self if orig else PathExtended(op_path)
         delayed_msg = ""
@@ -643,9 +664,8 @@ class PathExtended(type(Path()), Path):  # type: ignore # pylint: disable=E0241
 
     def unxz(self, folder: OPLike = None, name: Optional[str] = None, path: OPLike = None, inplace: bool = False, orig: bool = False, verbose: bool = True) -> "PathExtended":
         op_path = self._resolve_path(folder, name, path, self.name.replace(".xz", "")).expanduser().resolve()
-        import lzma
-
-        PathExtended(str(op_path)).write_bytes(lzma.decompress(PathExtended(str(self.expanduser().resolve())).read_bytes()))
+        from machineconfig.utils.compression import decompress_file
+        decompress_file(source=Path(str(self.expanduser().resolve())), destination=Path(str(op_path)))
         msg = f"UNXZED {repr(self)} ==>  {repr(op_path)}"
         ret = self if orig else PathExtended(op_path)
         delayed_msg = ""
@@ -666,9 +686,8 @@ class PathExtended(type(Path()), Path):  # type: ignore # pylint: disable=E0241
 
     def unbz(self, folder: OPLike = None, name: Optional[str] = None, path: OPLike = None, inplace: bool = False, orig: bool = False, verbose: bool = True) -> "PathExtended":
         op_path = self._resolve_path(folder=folder, name=name, path=path, default_name=self.name.replace(".bz", "").replace(".tbz", ".tar")).expanduser().resolve()
-        import bz2
-
-        PathExtended(str(op_path)).write_bytes(bz2.decompress(PathExtended(str(self.expanduser().resolve())).read_bytes()))
+        from machineconfig.utils.compression import decompress_file
+        decompress_file(source=Path(str(self.expanduser().resolve())), destination=Path(str(op_path)))
         msg = f"UNBZED {repr(self)} ==>  {repr(op_path)}"
         ret = self if orig else PathExtended(op_path)
         delayed_msg = ""
@@ -687,22 +706,52 @@ class PathExtended(type(Path()), Path):  # type: ignore # pylint: disable=E0241
                 print("P._return warning: UnicodeEncodeError, could not print message.")
         return ret
 
-    def decompress(self, folder: OPLike = None, name: Optional[str] = None, path: OPLike = None, inplace: bool = False, orig: bool = False, verbose: bool = True) -> "PathExtended":
-        if str(self).endswith(".tar.gz") or str(self).endswith(".tgz"):
-            # res = self.ungz_untar(folder=folder, path=path, name=name, inplace=inplace, verbose=verbose, orig=orig)
-            return self.ungz(name=f"tmp_{randstr()}.tar", inplace=inplace).untar(folder=folder, name=name, path=path, inplace=True, orig=orig, verbose=verbose)  # this works for .tgz suffix as well as .tar.gz
+    def unzst(self, folder: OPLike = None, name: Optional[str] = None, path: OPLike = None, inplace: bool = False, orig: bool = False, verbose: bool = True) -> "PathExtended":
+        op_path = self._resolve_path(folder, name, path, self.name.replace(".zst", "")).expanduser().resolve()
+        from machineconfig.utils.compression import decompress_file
+        decompress_file(source=Path(str(self.expanduser().resolve())), destination=Path(str(op_path)))
+        msg = f"UNZSTED {repr(self)} ==>  {repr(op_path)}"
+        ret = self if orig else PathExtended(op_path)
+        if inplace:
+            self.delete(sure=True, verbose=False)
+        if verbose:
+            try:
+                print(msg)
+            except UnicodeEncodeError:
+                print("P._return warning: UnicodeEncodeError, could not print message.")
+        return ret
+
+    def _untar_stream(self, default_name: str, folder: OPLike, name: Optional[str], path: OPLike, inplace: bool, orig: bool, verbose: bool) -> "PathExtended":
+        op_path = self._resolve_path(folder, name, path, default_name).expanduser().resolve()
+        from machineconfig.utils.compression import extract_tar
+        extract_tar(archive=Path(str(self.expanduser().resolve())), destination=Path(str(op_path)))
+        msg = f"UNTARRED {repr(self)} ==>  {repr(op_path)}"
+        ret = self if orig else PathExtended(op_path)
+        if inplace:
+            self.delete(sure=True, verbose=False)
+        if verbose:
+            try:
+                print(msg)
+            except UnicodeEncodeError:
+                print("P._return warning: UnicodeEncodeError, could not print message.")
+        return ret
+
+    def decompress(self, folder: OPLike = None, name: Optional[str] = None, path: OPLike = None, inplace: bool = False, orig: bool = False, verbose: bool = True, threads: Optional[int] = None) -> "PathExtended":
+        if str(self).endswith(".tar.gz") or str(self).endswith(".tgz") or str(self).endswith(".tar.bz") or str(self).endswith(".tbz") or str(self).endswith(".tar.bz2"):
+            # decoded and untarred in one streamed pass (used to be a full in-memory decompress into a tmp .tar, then untar).
+            res = self._untar_stream(default_name=f"tmp_{randstr()}", folder=folder, name=name, path=path, inplace=inplace, orig=orig, verbose=verbose)
+        elif str(self).endswith(".tar.xz"):
+            res = self._untar_stream(default_name=self.name.replace(".tar.xz", ""), folder=folder, name=name, path=path, inplace=inplace, orig=orig, verbose=verbose)
+        elif str(self).endswith(".tar.zst") or str(self).endswith(".tzst"):
+            res = self._untar_stream(default_name=self.name.replace(".tar.zst", "").replace(".tzst", ""), folder=folder, name=name, path=path, inplace=inplace, orig=orig, verbose=verbose)
         elif str(self).endswith(".tar"):
             res = self.untar(folder=folder, name=name, path=path, inplace=inplace, orig=orig, verbose=verbose)
         elif str(self).endswith(".gz"):
             res = self.ungz(folder=folder, path=path, name=name, inplace=inplace, verbose=verbose, orig=orig)
-        elif str(self).endswith(".tar.bz") or str(self).endswith(".tbz") or str(self).endswith(".tar.bz2"):
-            res = self.unbz(name=f"tmp_{randstr()}.tar", inplace=inplace)
-            return res.untar(folder=folder, name=name, path=path, inplace=True, orig=orig, verbose=verbose)
-        elif str(self).endswith(".tar.xz"):
-            # res = self.unxz_untar(folder=folder, path=path, name=name, inplace=inplace, verbose=verbose, orig=orig)
-            res = self.unxz(inplace=inplace).untar(folder=folder, name=name, path=path, inplace=True, orig=orig, verbose=verbose)
+        elif str(self).endswith(".zst"):
+            res = self.unzst(folder=folder, path=path, name=name, inplace=inplace, verbose=verbose, orig=orig)
         elif str(self).endswith(".zip"):
-            res = self.unzip(folder=folder, path=path, name=name, inplace=inplace, verbose=verbose, orig=orig)
+            res = self.unzip(folder=folder, path=path, name=name, inplace=inplace, verbose=verbose, orig=orig, threads=threads)
         elif str(self).endswith(".7z"):
             def unzip_7z(archive_path: str, dest_dir: Optional[str] = None) -> Path:
                 """
@@ -767,7 +816,12 @@ class PathExtended(type(Path()), Path):  # type: ignore # pylint: disable=E0241
     def decrypt(self, key: Optional[bytes] = None, pwd: Optional[str] = None, path: OPLike = None, folder: OPLike = None, name: Optional[str] = None, verbose: bool = True, suffix: str = ".enc", inplace: bool = False) -> "PathExtended":
         slf = self.expanduser().resolve()
         path = self._resolve_path(folder=folder, name=name, path=path, default_name=slf.name.replace(suffix, "") if suffix in slf.name else "decrypted_" + slf.name)
-        path.write_bytes(decrypt(token=slf.read_bytes(), key=key, pwd=pwd))
+        from machineconfig.utils.io import is_chunked_ciphertext, decrypt_chunked_stream
+        if is_chunked_ciphertext(slf):  # written by `zip_n_encrypt(stream=True)` / `to_cloud(stream=True)`: decrypt chunk by chunk.
+            with open(slf, "rb") as source, open(path, "wb") as sink:
+                decrypt_chunked_stream(source=source, sink=sink, key=key, pwd=pwd)
+        else:
+            path.write_bytes(decrypt(token=slf.read_bytes(), key=key, pwd=pwd))
         msg = f"🔓🔑 DECRYPTED: {repr(slf)} ==> {repr(path)}."
         ret = PathExtended(path)
         delayed_msg = ""
@@ -786,8 +840,24 @@ class PathExtended(type(Path()), Path):  # type: ignore # pylint: disable=E0241
                 print("P._return warning: UnicodeEncodeError, could not print message.")
         return ret
 
-    def zip_n_encrypt(self, key: Optional[bytes] = None, pwd: Optional[str] = None, inplace: bool = False, verbose: bool = True, orig: bool = False, content: bool = False) -> "PathExtended":
-        return self.zip(inplace=inplace, verbose=verbose, content=content).encrypt(key=key, pwd=pwd, verbose=verbose, inplace=True) if not orig else self
+    def zip_n_encrypt(
+        self, key: Optional[bytes] = None, pwd: Optional[str] = None, inplace: bool = False, verbose: bool = True, orig: bool = False, content: bool = False, stream: bool = False, chunk_size: int = CHUNKED_DEFAULT_CHUNK_SIZE
+    ) -> "PathExtended":
+        """:param stream: write `<name>.zip.enc` in a single pass (chunked authenticated format) instead of zip -> read into memory -> encrypt."""
+        if orig:
+            return self
+        if not stream:
+            return self.zip(inplace=inplace, verbose=verbose, content=content).encrypt(key=key, pwd=pwd, verbose=verbose, inplace=True)
+        from machineconfig.utils.io import pack_stream
+        slf = self.expanduser().resolve()
+        path = PathExtended(slf.parent.joinpath(slf.name + ".zip.enc"))
+        with open(path, "wb") as sink:
+            pack_stream(source=slf, sink=sink, zip_it=True, encrypt_it=True, key=key, pwd=pwd, content=content, chunk_size=chunk_size)
+        if verbose:
+            print(f"🗜️🔒 ZIPPED & ENCRYPTED (streamed): {repr(slf)} ==> {repr(path)}.")
+        if inplace:
+            self.delete(sure=True, verbose=verbose)
+        return path
 
     def decrypt_n_unzip(self, key: Optional[bytes] = None, pwd: Optional[str] = None, inplace: bool = False, verbose: bool = True, orig: bool = False) -> "PathExtended":
         return self.decrypt(key=key, pwd=pwd, verbose=verbose, inplace=inplace).unzip(folder=None, inplace=True, content=False) if not orig else self
@@ -845,23 +915,34 @@ class PathExtended(type(Path()), Path):  # type: ignore # pylint: disable=E0241
         os_specific: bool = False,
         transfers: int = 10,
         root: Optional[str] = "myhome",
+        stream: bool = False,
+        show_progress: bool = True,
     ) -> "PathExtended":
+        """:param stream: with `zip` and/or `encrypt`, pipe the archive straight into `rclone rcat` instead of staging `.zip`/`.enc` copies on disk."""
         _ = transfers
         to_del = []
         localpath = self.expanduser().absolute() if not self.exists() else self
-        if zip:
-            localpath = localpath.zip(inplace=False)
-            to_del.append(localpath)
-        if encrypt:
-            localpath = localpath.encrypt(key=key, pwd=pwd, inplace=False)
-            to_del.append(localpath)
-        if remotepath is None:
-            rp = localpath.get_remote_path(root=root, os_specific=os_specific, rel2home=rel2home, strict=strict)  # if rel2home else (P(root) / localpath if root is not None else localpath)
+        if stream and (zip or encrypt):
+            if remotepath is None:
+                rp = PathExtended(str(localpath.get_remote_path(root=root, os_specific=os_specific, rel2home=rel2home, strict=strict)) + (".zip" if zip else "") + (".enc" if encrypt else ""))
+            else:
+                rp = PathExtended(remotepath)
+            print(f"⬆️ STREAMING {repr(localpath)} TO {cloud}:{rp.as_posix()}`") if verbose else None
+            _upload_stream(source=localpath, cloud=cloud, remote=rp.as_posix(), zip=zip, encrypt=encrypt, key=key, pwd=pwd)
         else:
-            rp = PathExtended(remotepath)
-        from rclone_python import rclone
-        print(f"⬆️ UPLOADING {repr(localpath)} TO {cloud}:{rp.as_posix()}`") if verbose else None
-        rclone.copyto(in_path=localpath.as_posix(), out_path=f"{cloud}:{rp.as_posix()}", )
+            if zip:
+                localpath = localpath.zip(inplace=False)
+                to_del.append(localpath)
+            if encrypt:
+                localpath = localpath.encrypt(key=key, pwd=pwd, inplace=False)
+                to_del.append(localpath)
+            if remotepath is None:
+                rp = localpath.get_remote_path(root=root, os_specific=os_specific, rel2home=rel2home, strict=strict)  # if rel2home else (P(root) / localpath if root is not None else localpath)
+            else:
+                rp = PathExtended(remotepath)
+            from rclone_python import rclone
+            print(f"⬆️ UPLOADING {repr(localpath)} TO {cloud}:{rp.as_posix()}`") if verbose else None
+            rclone.copyto(in_path=localpath.as_posix(), out_path=f"{cloud}:{rp.as_posix()}", show_progress=show_progress)
 
         _ = [item.delete(sure=True) for item in to_del]
         if verbose:
@@ -900,6 +981,7 @@ class PathExtended(type(Path()), Path):  # type: ignore # pylint: disable=E0241
         verbose: bool = True,
         overwrite: bool = True,
         merge: bool = False,
+        show_progress: bool = True,
     ):
         _ = verbose, transfers
         if remotepath is None:
@@ -913,7 +995,7 @@ class PathExtended(type(Path()), Path):  # type: ignore # pylint: disable=E0241
         localpath += ".enc" if decrypt else ""
         from rclone_python import rclone
         try:
-            rclone.copyto(in_path=f"{cloud}:{remotepath.as_posix()}", out_path=localpath.as_posix(), )
+            rclone.copyto(in_path=f"{cloud}:{remotepath.as_posix()}", out_path=localpath.as_posix(), show_progress=show_progress)
         except Exception as e:
             print("to_cloud error", e)
             return None
@@ -8,8 +8,10 @@ import time
 from typing import Any, Callable, Literal, Optional, TypeAlias
 
 from machineconfig.utils.accessories import randstr
+from machineconfig.utils.compression import decompress_file, extract_tar, extract_zip_parallel, write_zip_parallel, zip_entries
 from machineconfig.utils.io import decrypt as io_decrypt
 from machineconfig.utils.io import encrypt as io_encrypt
+from machineconfig.utils.io import CHUNKED_DEFAULT_CHUNK_SIZE, decrypt_chunked_stream, is_chunked_ciphertext, pack_stream
 from machineconfig.utils.path_extended import FILE_MODE, timestamp, validate_name
 
 PathPredicate: TypeAlias = Callable[[Path], bool]
@@ -581,6 +583,8 @@ def zip_path(
     content: bool = False,
     orig: bool = False,
     mode: FILE_MODE = "w",
+    level: Optional[int] = None,
+    threads: Optional[int] = None,
     **kwargs: Any,
 ) -> Path:
     source = _safe_resolve(_expand(path), strict=False)
@@ -593,7 +597,11 @@ def zip_path(
         import zipfile
 
         with zipfile.ZipFile(str(op_zip), mode=mode) as zip_handle:
-            zip_handle.write(filename=str(source), arcname=str(arcname_obj), compress_type=zipfile.ZIP_DEFLATED, **kwargs)
+            zip_handle.write(filename=str(source), arcname=str(arcname_obj), compress_type=zipfile.ZIP_DEFLATED, compresslevel=level, **kwargs)
+        output_path = op_zip
+    elif threads != 1 and mode == "w" and len(kwargs) == 0:
+        with open(op_zip, "wb") as sink:
+            write_zip_parallel(entries=zip_entries(source=source, content=content, arcname=None if content else arcname_obj.as_posix()), sink=sink, level=level, threads=threads)
         output_path = op_zip
     else:
         import shutil
@@ -619,6 +627,8 @@ def zip(
     content: bool = False,
     orig: bool = False,
     mode: FILE_MODE = "w",
+    level: Optional[int] = None,
+    threads: Optional[int] = None,
     **kwargs: Any,
 ) -> Path:
     return zip_path(
@@ -632,6 +642,8 @@ def zip(
         content=content,
         orig=orig,
         mode=mode,
+        level=level,
+        threads=threads,
         **kwargs,
     )
 
@@ -650,6 +662,7 @@ def _unzip_archive(
     tmp: bool = False,
     pattern: Optional[str] = None,
     merge: bool = False,
+    threads: Optional[int] = None,
 ) -> Path:
     _ = pwd, pattern
     assert merge is False, "I have not implemented this yet"
@@ -685,7 +698,7 @@ def _unzip_archive(
     target_name = None if name is None else Path(name).as_posix()
     with zipfile.ZipFile(str(zipfile_path), "r") as zip_obj:
         if target_name is None:
-            zip_obj.extractall(str(output_folder))
+            extract_zip_parallel(zip_path=zipfile_path, destination=Path(str(output_folder)), threads=threads)
             result = Path(str(output_folder))
         else:
             zip_obj.extract(member=str(target_name), path=str(output_folder))
@@ -708,6 +721,7 @@ def unzip(
     tmp: bool = False,
     pattern: Optional[str] = None,
     merge: bool = False,
+    threads: Optional[int] = None,
 ) -> Path:
     return _unzip_archive(
         path=path,
@@ -723,33 +737,27 @@ def unzip(
         tmp=tmp,
         pattern=pattern,
         merge=merge,
+        threads=threads,
     )
 
 
 def untar(path: Path, folder: Optional[Path] = None, name: Optional[str] = None, target_path: Optional[Path] = None, inplace: bool = False, orig: bool = False, verbose: bool = True) -> Path:
     output_path = _safe_resolve(_expand(_resolve_path(_to_path(path), folder, name, target_path, _to_path(path).name.replace(".tar", ""))), strict=False)
-    import tarfile
-
-    with tarfile.open(str(_safe_resolve(_expand(path), strict=False)), "r") as tar_obj:
-        tar_obj.extractall(path=str(output_path))
+    extract_tar(archive=_safe_resolve(_expand(path), strict=False), destination=output_path)
     message = f"UNTARRED {_to_path(path)!r} ==>  {output_path!r}"
     return _finalize_result(_to_path(path), output_path, inplace=inplace, orig=orig, verbose=verbose, message=message)
 
 
 def ungz(path: Path, folder: Optional[Path] = None, name: Optional[str] = None, target_path: Optional[Path] = None, inplace: bool = False, orig: bool = False, verbose: bool = True) -> Path:
     output_path = _safe_resolve(_expand(_resolve_path(_to_path(path), folder, name, target_path, _to_path(path).name.replace(".gz", ""))), strict=False)
-    import gzip
-
-    output_path.write_bytes(gzip.decompress(_safe_resolve(_expand(path), strict=False).read_bytes()))
+    decompress_file(source=_safe_resolve(_expand(path), strict=False), destination=output_path)
     message = f"UNGZED {_to_path(path)!r} ==>  {output_path!r}"
     return _finalize_result(_to_path(path), output_path, inplace=inplace, orig=orig, verbose=verbose, message=message)
 
 
 def unxz(path: Path, folder: Optional[Path] = None, name: Optional[str] = None, target_path: Optional[Path] = None, inplace: bool = False, orig: bool = False, verbose: bool = True) -> Path:
     output_path = _safe_resolve(_expand(_resolve_path(_to_path(path), folder, name, target_path, _to_path(path).name.replace(".xz", ""))), strict=False)
-    import lzma
-
-    output_path.write_bytes(lzma.decompress(_safe_resolve(_expand(path), strict=False).read_bytes()))
+    decompress_file(source=_safe_resolve(_expand(path), strict=False), destination=output_path)
     message = f"UNXZED {_to_path(path)!r} ==>  {output_path!r}"
     return _finalize_result(_to_path(path), output_path, inplace=inplace, orig=orig, verbose=verbose, message=message)
 
@@ -757,28 +765,44 @@ def unxz(path: Path, folder: Optional[Path] = None, name: Optional[str] = None,
 def unbz(path: Path, folder: Optional[Path] = None, name: Optional[str] = None, target_path: Optional[Path] = None, inplace: bool = False, orig: bool = False, verbose: bool = True) -> Path:
     default_name = _to_path(path).name.replace(".bz", "").replace(".tbz", ".tar")
     output_path = _safe_resolve(_expand(_resolve_path(_to_path(path), folder, name, target_path, default_name)), strict=False)
-    import bz2
-
-    output_path.write_bytes(bz2.decompress(_safe_resolve(_expand(path), strict=False).read_bytes()))
+    decompress_file(source=_safe_resolve(_expand(path), strict=False), destination=output_path)
     message = f"UNBZED {_to_path(path)!r} ==>  {output_path!r}"
     return _finalize_result(_to_path(path), output_path, inplace=inplace, orig=orig, verbose=verbose, message=message)
 
 
-def decompress(path: Path, folder: Optional[Path] = None, name: Optional[str] = None, target_path: Optional[Path] = None, inplace: bool = False, orig: bool = False, verbose: bool = True) -> Path:
+def unzst(path: Path, folder: Optional[Path] = None, name: Optional[str] = None, target_path: Optional[Path] = None, inplace: bool = False, orig: bool = False, verbose: bool = True) -> Path:
+    output_path = _safe_resolve(_expand(_resolve_path(_to_path(path), folder, name, target_path, _to_path(path).name.replace(".zst", ""))), strict=False)
+    decompress_file(source=_safe_resolve(_expand(path), strict=False), destination=output_path)
+    message = f"UNZSTED {_to_path(path)!r} ==>  {output_path!r}"
+    return _finalize_result(_to_path(path), output_path, inplace=inplace, orig=orig, verbose=verbose, message=message)
+
+
+def _untar_stream(path: Path, default_name: str, folder: Optional[Path], name: Optional[str], target_path: Optional[Path], inplace: bool, orig: bool, verbose: bool) -> Path:
+    output_path = _safe_resolve(_expand(_resolve_path(_to_path(path), folder, name, target_path, default_name)), strict=False)
+    extract_tar(archive=_safe_resolve(_expand(path), strict=False), destination=output_path)
+    message = f"UNTARRED {_to_path(path)!r} ==>  {output_path!r}"
+    return _finalize_result(_to_path(path), output_path, inplace=inplace, orig=orig, verbose=verbose, message=message)
+
+
+def decompress(
+    path: Path, folder: Optional[Path] = None, name: Optional[str] = None, target_path: Optional[Path] = None, inplace: bool = False, orig: bool = False, verbose: bool = True, threads: Optional[int] = None
+) -> Path:
     path_obj = _to_path(path)
     path_str = str(path_obj)
-    if path_str.endswith(".tar.gz") or path_str.endswith(".tgz"):
-        return untar(ungz(path_obj, name=f"tmp_{randstr()}.tar", inplace=inplace), folder=folder, name=name, target_path=target_path, inplace=True, orig=orig, verbose=verbose)
+    if path_str.endswith((".tar.gz", ".tgz", ".tar.bz", ".tbz", ".tar.bz2")):
+        return _untar_stream(path_obj, default_name=f"tmp_{randstr()}", folder=folder, name=name, target_path=target_path, inplace=inplace, orig=orig, verbose=verbose)
+    if path_str.endswith(".tar.xz"):
+        return _untar_stream(path_obj, default_name=path_obj.name.replace(".tar.xz", ""), folder=folder, name=name, target_path=target_path, inplace=inplace, orig=orig, verbose=verbose)
+    if path_str.endswith((".tar.zst", ".tzst")):
+        return _untar_stream(path_obj, default_name=path_obj.name.replace(".tar.zst", "").replace(".tzst", ""), folder=folder, name=name, target_path=target_path, inplace=inplace, orig=orig, verbose=verbose)
     if path_str.endswith(".tar"):
         return untar(path_obj, folder=folder, name=name, target_path=target_path, inplace=inplace, orig=orig, verbose=verbose)
     if path_str.endswith(".gz"):
         return ungz(path_obj, folder=folder, name=name, target_path=target_path, inplace=inplace, verbose=verbose, orig=orig)
-    if path_str.endswith(".tar.bz") or path_str.endswith(".tbz") or path_str.endswith(".tar.bz2"):
-        return untar(unbz(path_obj, name=f"tmp_{randstr()}.tar", inplace=inplace), folder=folder, name=name, target_path=target_path, inplace=True, orig=orig, verbose=verbose)
-    if path_str.endswith(".tar.xz"):
-        return untar(unxz(path_obj, inplace=inplace), folder=folder, name=name, target_path=target_path, inplace=True, orig=orig, verbose=verbose)
+    if path_str.endswith(".zst"):
+        return unzst(path_obj, folder=folder, name=name, target_path=target_path, inplace=inplace, verbose=verbose, orig=orig)
     if path_str.endswith(".zip"):
-        return unzip(path_obj, folder=folder, target_path=target_path, name=name, inplace=inplace, verbose=verbose, orig=orig)
+        return unzip(path_obj, folder=folder, target_path=target_path, name=name, inplace=inplace, verbose=verbose, orig=orig, threads=threads)
     if path_str.endswith(".7z"):
         import py7zr  # type: ignore
 
@@ -845,7 +869,11 @@ def _decrypt_path(
     source = _safe_resolve(_expand(path_obj), strict=False)
     default_name = source.name.replace(suffix, "") if suffix in source.name else "decrypted_" + source.name
     output_path = _resolve_path(path_obj, folder=folder, name=name, target_path=target_path, default_name=default_name)
-    output_path.write_bytes(io_decrypt(token=source.read_bytes(), key=key, pwd=pwd))
+    if is_chunked_ciphertext(source):
+        with open(source, "rb") as source_fh, open(output_path, "wb") as sink:
+            decrypt_chunked_stream(source=source_fh, sink=sink, key=key, pwd=pwd)
+    else:
+        output_path.write_bytes(io_decrypt(token=source.read_bytes(), key=key, pwd=pwd))
     message = f"🔓🔑 DECRYPTED: {source!r} ==> {output_path!r}."
     delayed_message = ""
     if inplace:
@@ -872,9 +900,28 @@ def decrypt(
     return _decrypt_path(path=path, key=key, pwd=pwd, target_path=target_path, folder=folder, name=name, verbose=verbose, suffix=suffix, inplace=inplace)
 
 
-def zip_n_encrypt(path: Path, key: Optional[bytes] = None, pwd: Optional[str] = None, inplace: bool = False, verbose: bool = True, orig: bool = False, content: bool = False) -> Path:
+def zip_n_encrypt(
+    path: Path,
+    key: Optional[bytes] = None,
+    pwd: Optional[str] = None,
+    inplace: bool = False,
+    verbose: bool = True,
+    orig: bool = False,
+    content: bool = False,
+    stream: bool = False,
+    chunk_size: int = CHUNKED_DEFAULT_CHUNK_SIZE,
+) -> Path:
     path_obj = _to_path(path)
-    return _encrypt_path(zip_path(path_obj, inplace=inplace, verbose=verbose, content=content), key=key, pwd=pwd, verbose=verbose, inplace=True) if not orig else path_obj
+    if orig:
+        return path_obj
+    if not stream:
+        return _encrypt_path(zip_path(path_obj, inplace=inplace, verbose=verbose, content=content), key=key, pwd=pwd, verbose=verbose, inplace=True)
+    source = _safe_resolve(_expand(path_obj), strict=False)
+    output_path = source.parent.joinpath(source.name + ".zip.enc")
+    with open(output_path, "wb") as sink:
+        pack_stream(source=source, sink=sink, zip_it=True, encrypt_it=True, key=key, pwd=pwd, content=content, chunk_size=chunk_size)
+    message = f"🗜️🔒 ZIPPED & ENCRYPTED (streamed): {source!r} ==> {output_path!r}."
+    return _finalize_result(path_obj, output_path, inplace=inplace, orig=False, verbose=verbose, message=message)
 
 
 def decrypt_n_unzip(path: Path, key: Optional[bytes] = None, pwd: Optional[str] = None, inplace: bool = False, verbose: bool = True, orig: bool = False) -> Path:
@@ -906,6 +953,16 @@ def get_remote_path(path: Path, root: Optional[str], os_specific: bool = False,
     return Path(os_part) / reduced
 
 
+def _upload_stream(source: Path, cloud: str, remote: str, zip: bool, encrypt: bool, key: Optional[bytes], pwd: Optional[str]) -> None:
+    process = subprocess.Popen(["rclone", "rcat", f"{cloud}:{remote}"], stdin=subprocess.PIPE)
+    assert process.stdin is not None
+    try:
+        pack_stream(source=source, sink=process.stdin, zip_it=zip, encrypt_it=encrypt, key=key, pwd=pwd, content=False)
+    finally:
+        process.stdin.close()
+    if process.wait() != 0:
+        raise RuntimeError(f"💥 rclone rcat failed with exit code {process.returncode} while streaming {source} to {cloud}:{remote}")
+
 def to_cloud(
     path: Path,
     cloud: str,
@@ -921,26 +978,39 @@ def to_cloud(
     os_specific: bool = False,
     transfers: int = 10,
     root: Optional[str] = "myhome",
+    stream: bool = False,
+    show_progress: bool = True,
 ) -> Path:
     _ = transfers
     source_path = _to_path(path)
     temporary: list[Path] = []
     localpath = source_path.expanduser().absolute() if not source_path.exists() else source_path
-    if zip:
-        localpath = zip_path(localpath, inplace=False)
-        temporary.append(localpath)
-    if encrypt:
-        localpath = _encrypt_path(localpath, key=key, pwd=pwd, inplace=False)
-        temporary.append(localpath)
-    if remotepath is None:
-        remote_obj = get_remote_path(localpath, root=root, os_specific=os_specific, rel2home=rel2home, strict=strict)
+    if stream and (zip or encrypt):
+        if remotepath is None:
+            remote_obj = get_remote_path(localpath, root=root, os_specific=os_specific, rel2home=rel2home, strict=strict)
+            remote_obj = _append_text(remote_obj, ".zip") if zip else remote_obj
+            remote_obj = _append_text(remote_obj, ".enc") if encrypt else remote_obj
+        else:
+            remote_obj = _to_path(remotepath)
+        if verbose:
+            _print_message(f"⬆️ STREAMING {localpath!r} TO {cloud}:{remote_obj.as_posix()}`")
+        _upload_stream(localpath, cloud=cloud, remote=remote_obj.as_posix(), zip=zip, encrypt=encrypt, key=key, pwd=pwd)
     else:
-        remote_obj = _to_path(remotepath)
-    from rclone_python import rclone
+        if zip:
+            localpath = zip_path(localpath, inplace=False)
+            temporary.append(localpath)
+        if encrypt:
+            localpath = _encrypt_path(localpath, key=key, pwd=pwd, inplace=False)
+            temporary.append(localpath)
+        if remotepath is None:
+            remote_obj = get_remote_path(localpath, root=root, os_specific=os_specific, rel2home=rel2home, strict=strict)
+        else:
+            remote_obj = _to_path(remotepath)
+        from rclone_python import rclone
 
-    if verbose:
-        _print_message(f"⬆️ UPLOADING {localpath!r} TO {cloud}:{remote_obj.as_posix()}`")
-    rclone.copyto(in_path=localpath.as_posix(), out_path=f"{cloud}:{remote_obj.as_posix()}")
+        if verbose:
+            _print_message(f"⬆️ UPLOADING {localpath!r} TO {cloud}:{remote_obj.as_posix()}`")
+        rclone.copyto(in_path=localpath.as_posix(), out_path=f"{cloud}:{remote_obj.as_posix()}", show_progress=show_progress)
     for item in temporary:
         delete(item, sure=True)
     if verbose:
@@ -979,6 +1049,7 @@ def from_cloud(
     verbose: bool = True,
     overwrite: bool = True,
     merge: bool = False,
+    show_progress: bool = True,
 ) -> Path | None:
     _ = verbose, transfers
     source_path = _to_path(path)
@@ -994,7 +1065,7 @@ def from_cloud(
     from rclone_python import rclone
 
     try:
-        rclone.copyto(in_path=f"{cloud}:{remote_obj.as_posix()}", out_path=localpath.as_posix())
+        rclone.copyto(in_path=f"{cloud}:{remote_obj.as_posix()}", out_path=localpath.as_posix(), show_progress=show_progress)
     except Exception as err:  # noqa: BLE001
         _print_message(f"to_cloud error {err}")
         return None
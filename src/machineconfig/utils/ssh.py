@@ -1,4 +1,4 @@
-from typing import Callable, Optional, Any, cast, Union, Literal
+from typing import Callable, Optional, Any, cast, Union, Literal, TYPE_CHECKING
 import subprocess
 from pathlib import Path
 import platform
@@ -9,6 +9,10 @@ from machineconfig.utils.terminal import Response
 from machineconfig.utils.accessories import pprint, randstr
 from machineconfig.utils.meta import lambda_to_python_script
 from machineconfig.utils.ssh_utils.abc import DEFAULT_PICKLE_SUBDIR
+from machineconfig.utils.ssh_utils.specs_cache import DEFAULT_SPECS_TTL_SECONDS
+
+if TYPE_CHECKING:
+    import paramiko
 
 
 class SSH:
@@ -25,6 +29,9 @@ class SSH:
         password: Optional[str],
         port: int,
         enable_compression: bool,
+        reuse_connection: bool = True,
+        specs_ttl_seconds: float = DEFAULT_SPECS_TTL_SECONDS,
+        refresh_specs: bool = False,
     ):
         self.password = password
         self.enable_compression = enable_compression
@@ -78,22 +85,116 @@ class SSH:
             raise ValueError("Either host or username and hostname must be provided.")
 
         self.ssh_key_path = str(Path(ssh_key_path).expanduser().absolute()) if ssh_key_path is not None else None
-        self.ssh = paramiko.SSHClient()
-        self.ssh.load_system_host_keys()
-        self.ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        from machineconfig.utils.ssh_utils.pool import SSH_POOL, PoolKey
+
+        self.pool_key = PoolKey(hostname=self.hostname, username=self.username, port=self.port)
+        self.reuse_connection = reuse_connection
+        pooled = SSH_POOL.checkout(self.pool_key) if reuse_connection else None
+        if pooled is not None:
+            self.ssh = pooled.client
+            print(f"♻️  Reusing pooled SSH connection to {self.username}@{self.hostname}:{self.port}")
+        else:
+            self.ssh = self._connect_new_client()
+            if reuse_connection:
+                pooled = SSH_POOL.register(self.pool_key, self.ssh)
+        try:
+            self.sftp: Optional[paramiko.SFTPClient] = self.ssh.open_sftp()
+        except Exception as err:
+            self.sftp = None
+            print(f"""⚠️  WARNING: Failed to open SFTP connection to {self.hostname}. Error Details: {err}\nData transfer may be affected!""")
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, FileSizeColumn, TransferSpeedColumn
+
+        class RichProgressWrapper:
+            def __init__(self, **kwargs: Any):
+                self.kwargs = kwargs
+                self.progress: Optional[Progress] = None
+                self.task: Optional[Any] = None
+
+            def __enter__(self) -> "RichProgressWrapper":
+                self.progress = Progress(
+                    SpinnerColumn(), TextColumn("[bold blue]{task.description}"), BarColumn(), FileSizeColumn(), TransferSpeedColumn()
+                )
+                self.progress.start()
+                self.task = self.progress.add_task("Transferring...", total=0)
+                return self
+
+            def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+                if self.progress:
+                    self.progress.stop()
+
+            def view_bar(self, transferred: int, total: int) -> None:
+                if self.progress and self.task is not None:
+                    self.progress.update(self.task, completed=transferred, total=total)
+
+        self.tqdm_wrap = RichProgressWrapper
+        from machineconfig.scripts.python.helpers.helpers_utils.python import get_machine_specs
+        from machineconfig.utils.ssh_utils import specs_cache
+
+        if SSH_POOL.local_specs is None or refresh_specs:
+            SSH_POOL.local_specs = specs_cache.get_or_probe(
+                fingerprint=specs_cache.local_fingerprint(), section="machine_specs", ttl_seconds=specs_ttl_seconds, refresh=refresh_specs, probe=get_machine_specs
+            )
+        assert SSH_POOL.local_specs is not None
+        self.local_specs: MachineSpecs = SSH_POOL.local_specs
+        self.terminal_responses: list[Response] = []
+        self.host_fingerprint = self.get_host_fingerprint()
+        if pooled is not None and pooled.remote_specs is not None and not refresh_specs:
+            self.remote_specs: MachineSpecs = pooled.remote_specs
+            return
+        probed: list[bool] = []
+
+        def probe_remote_specs() -> MachineSpecs:
+            resp = self.run_shell_cmd_on_remote(
+                command="""~/.local/bin/utils get-machine-specs """,
+                verbose_output=False,
+                description="Getting remote machine specs",
+                strict_stderr=False,
+                strict_return_code=False,
+            )
+            import ast
+
+            probed.append(True)
+            return cast(MachineSpecs, ast.literal_eval(resp.op))
+
+        remote_specs = specs_cache.get_or_probe(
+            fingerprint=self.host_fingerprint, section="machine_specs", ttl_seconds=specs_ttl_seconds, refresh=refresh_specs, probe=probe_remote_specs
+        )
+        assert remote_specs is not None
+        self.remote_specs = remote_specs
+        if pooled is not None:
+            pooled.remote_specs = self.remote_specs
+        if len(probed) > 0:
+            self.print_specs_side_by_side()
+
+    def get_host_fingerprint(self) -> str:
+        from machineconfig.utils.ssh_utils.specs_cache import fingerprint_from_server_key
+
+        transport = self.ssh.get_transport()
+        server_key = transport.get_remote_server_key() if transport is not None else None
+        return fingerprint_from_server_key(
+            hostname=self.hostname, username=self.username, port=self.port, server_key_fingerprint=server_key.get_fingerprint().hex() if server_key is not None else None
+        )
+
+    def _connect_new_client(self) -> "paramiko.SSHClient":
+        import paramiko
+        import getpass
+
+        client = paramiko.SSHClient()
+        client.load_system_host_keys()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         pprint(
             dict(host=self.host, hostname=self.hostname, username=self.username, password="***", port=self.port, key_filename=self.ssh_key_path, proxycommand=self.proxycommand),
             title="SSHing To",
         )
         sock = paramiko.ProxyCommand(self.proxycommand) if self.proxycommand is not None else None
         try:
-            if password is None:
+            if self.password is None:
                 allow_agent = True
                 look_for_keys = True
             else:
                 allow_agent = False
                 look_for_keys = False
-            self.ssh.connect(
+            client.connect(
                 hostname=self.hostname,
                 username=self.username,
                 password=self.password,
@@ -133,7 +234,7 @@ class SSH:
                     pass
             try:
                 self.password = getpass.getpass(f"Enter password for {self.username}@{self.hostname}: ")
-                self.ssh.connect(
+                client.connect(
                     hostname=self.hostname,
                     username=self.username,
                     password=self.password,
@@ -164,52 +265,9 @@ class SSH:
                     sys.stdout.write("\033[?25h")  # Show cursor
                     sys.stdout.write("\033[?1049l")  # Exit alternate screen if entered
                     sys.stdout.flush()
-        try:
-            self.sftp: Optional[paramiko.SFTPClient] = self.ssh.open_sftp()
-        except Exception as err:
-            self.sftp = None
-            print(f"""⚠️  WARNING: Failed to open SFTP connection to {self.hostname}. Error Details: {err}\nData transfer may be affected!""")
-        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, FileSizeColumn, TransferSpeedColumn
-
-        class RichProgressWrapper:
-            def __init__(self, **kwargs: Any):
-                self.kwargs = kwargs
-                self.progress: Optional[Progress] = None
-                self.task: Optional[Any] = None
-
-            def __enter__(self) -> "RichProgressWrapper":
-                self.progress = Progress(
-                    SpinnerColumn(), TextColumn("[bold blue]{task.description}"), BarColumn(), FileSizeColumn(), TransferSpeedColumn()
-                )
-                self.progress.start()
-                self.task = self.progress.add_task("Transferring...", total=0)
-                return self
-
-            def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-                if self.progress:
-                    self.progress.stop()
-
-            def view_bar(self, transferred: int, total: int) -> None:
-                if self.progress and self.task is not None:
-                    self.progress.update(self.task, completed=transferred, total=total)
-
-        self.tqdm_wrap = RichProgressWrapper
-        from machineconfig.scripts.python.helpers.helpers_utils.python import get_machine_specs
-
-        self.local_specs: MachineSpecs = get_machine_specs()
-        resp = self.run_shell_cmd_on_remote(
-            command="""~/.local/bin/utils get-machine-specs """,
-            verbose_output=False,
-            description="Getting remote machine specs",
-            strict_stderr=False,
-            strict_return_code=False,
-        )
-        json_str = resp.op
-        import ast
-
-        self.remote_specs: MachineSpecs = cast(MachineSpecs, ast.literal_eval(json_str))
-        self.terminal_responses: list[Response] = []
+        return client
 
+    def print_specs_side_by_side(self) -> None:
         from rich import inspect
 
         # local_info = dict(distro=self.local_specs.get("distro"), system=self.local_specs.get("system"), home_dir=self.local_specs.get("home_dir"))
@@ -259,7 +317,12 @@ class SSH:
         if self.sftp is not None:
             self.sftp.close()
             self.sftp = None
-        self.ssh.close()
+        if self.reuse_connection:
+            from machineconfig.utils.ssh_utils.pool import SSH_POOL
+
+            SSH_POOL.release(self.pool_key, self.ssh)  # transport stays warm for the next SSH(...) to the same host.
+        else:
+            self.ssh.close()
 
     def restart_computer(self) -> Response:
         return self.run_shell_cmd_on_remote(
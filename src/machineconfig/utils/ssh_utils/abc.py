@@ -3,3 +3,4 @@
 MACHINECONFIG_VERSION = "machineconfig>=8.81"
 DEFAULT_PICKLE_SUBDIR = "tmp_results/tmp_scripts/ssh"
 
+DEFAULT_UPLOAD_CONCURRENCY = 8
@@ -2,7 +2,7 @@ from typing import Optional, TYPE_CHECKING
 from pathlib import Path, PurePosixPath, PureWindowsPath
 from machineconfig.utils.accessories import randstr
 from machineconfig.utils.meta import lambda_to_python_script
-from machineconfig.utils.ssh_utils.abc import DEFAULT_PICKLE_SUBDIR
+from machineconfig.utils.ssh_utils.abc import DEFAULT_PICKLE_SUBDIR, DEFAULT_UPLOAD_CONCURRENCY
 from machineconfig.utils.code import get_uv_command
 
 if TYPE_CHECKING:
@@ -42,25 +42,15 @@ def copy_from_here(
             raise RuntimeError(
                 f"SSH Error: source `{source_obj}` is a directory! Set `recursive=True` for recursive sending or `compress_with_zip=True` to zip it first."
             )
-        file_paths_to_upload: list[Path] = [
-            file_path for file_path in source_obj.rglob("*") if file_path.is_file()
-        ]
-        self.create_parent_dir_and_check_if_exists(
-            path_rel2home=target_rel2home, overwrite_existing=overwrite_existing
+        from machineconfig.utils.ssh_utils.copy_from_here_bulk import upload_directory_bulk
+
+        upload_directory_bulk(
+            self,
+            source_dir=source_obj,
+            target_rel2home=target_rel2home,
+            overwrite_existing=overwrite_existing,
+            max_in_flight=DEFAULT_UPLOAD_CONCURRENCY,
         )
-        for idx, file_path in enumerate(file_paths_to_upload):
-            print(f"   {idx + 1:03d}. {file_path}")
-        for file_path in file_paths_to_upload:
-            remote_file_target = Path(target_rel2home).joinpath(
-                file_path.relative_to(source_obj)
-            )
-            self.copy_from_here(
-                source_path=str(file_path),
-                target_rel2home=str(remote_file_target),
-                compress_with_zip=False,
-                recursive=False,
-                overwrite_existing=overwrite_existing,
-            )
         return None
     if compress_with_zip:
         print("🗜️ ZIPPING ...")
@@ -0,0 +1,124 @@
+from typing import TYPE_CHECKING
+from pathlib import Path
+from dataclasses import dataclass
+import threading
+import time
+
+from machineconfig.utils.ssh_utils.utils import _build_remote_path
+
+if TYPE_CHECKING:
+    import paramiko
+    from machineconfig.utils.ssh import SSH
+
+
+@dataclass
+class BulkUploadReport:
+    files: int
+    bytes: int
+    seconds: float
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.seconds if self.seconds > 0 else float(self.files)
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds > 0 else float(self.bytes)
+
+
+def _format_bytes(num_bytes: float) -> str:
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if abs(num_bytes) < 1024.0:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024.0
+    return f"{num_bytes:.1f} PB"
+
+
+def upload_directory_bulk(self: "SSH", source_dir: Path, target_rel2home: str, overwrite_existing: bool, max_in_flight: int) -> BulkUploadReport:
+    """Upload a directory tree: one remote call for the directory set, then pipelined puts sharing one authenticated transport."""
+    if self.sftp is None:
+        raise RuntimeError(f"SFTP connection not available for {self.hostname}. Cannot transfer files.")
+    file_paths_to_upload: list[Path] = []
+    dirs_rel2root: set[str] = set()
+    for file_path in source_dir.rglob("*"):
+        if file_path.is_file():
+            file_paths_to_upload.append(file_path)
+            parent_rel = file_path.parent.relative_to(source_dir).as_posix()
+            if parent_rel not in {"", "."}:
+                dirs_rel2root.add(parent_rel)
+    total_bytes = sum(file_path.stat().st_size for file_path in file_paths_to_upload)
+    print(f"📦 [BULK UPLOAD] {len(file_paths_to_upload)} files, {len(dirs_rel2root)} directories, {_format_bytes(total_bytes)} from {source_dir}")
+
+    from machineconfig.utils.ssh_utils.utils import create_dir_tree_and_check_if_exists
+    create_dir_tree_and_check_if_exists(self, root_rel2home=target_rel2home, dirs_rel2root=sorted(dirs_rel2root), overwrite_existing=overwrite_existing)
+    if len(file_paths_to_upload) == 0:
+        return BulkUploadReport(files=0, bytes=0, seconds=0.0)
+
+    # paramiko's SFTPClient is not safe to share between threads (a synchronous reply read by the wrong thread is dropped),
+    # so every worker gets its own SFTP channel multiplexed over the single already-authenticated SSH transport.
+    num_workers = max(1, min(max_in_flight, len(file_paths_to_upload)))
+    channels: list["paramiko.SFTPClient"] = [self.sftp]
+    for _ in range(num_workers - 1):
+        try:
+            channels.append(self.ssh.open_sftp())
+        except Exception as err:
+            print(f"⚠️  Could not open an extra SFTP channel, continuing with {len(channels)}: {err}")
+            break
+    pending: list[Path] = sorted(file_paths_to_upload, key=lambda a_path: a_path.stat().st_size)  # popped from the end: largest first
+    pending_lock = threading.Lock()
+    errors: list[tuple[Path, Exception]] = []
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, DownloadColumn, TransferSpeedColumn, TimeElapsedColumn
+
+    start = time.perf_counter()
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(),
+        TextColumn("{task.fields[files_done]}/{task.fields[files_total]} files"),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        TimeElapsedColumn(),
+    ) as progress:
+        task_id = progress.add_task(f"Uploading to {self.get_remote_repr(add_machine=False)}", total=total_bytes, files_done=0, files_total=len(file_paths_to_upload))
+        files_done = [0]
+
+        def worker(sftp: "paramiko.SFTPClient") -> None:
+            while True:
+                with pending_lock:
+                    if len(pending) == 0 or len(errors) > 0:
+                        return
+                    file_path = pending.pop()
+                remote_rel = Path(target_rel2home).joinpath(file_path.relative_to(source_dir)).as_posix()
+                remote_full = _build_remote_path(self, self.remote_specs["home_dir"], remote_rel)
+                last_seen = [0]
+
+                def callback(transferred: int, total: int) -> None:
+                    _ = total
+                    progress.advance(task_id, transferred - last_seen[0])
+                    last_seen[0] = transferred
+
+                try:
+                    sftp.put(localpath=str(file_path), remotepath=remote_full, callback=callback, confirm=False)
+                except Exception as err:
+                    with pending_lock:
+                        errors.append((file_path, err))
+                    return
+                with pending_lock:
+                    files_done[0] += 1
+                    progress.update(task_id, files_done=files_done[0])
+
+        threads = [threading.Thread(target=worker, args=(a_channel,), daemon=True) for a_channel in channels]
+        for a_thread in threads:
+            a_thread.start()
+        for a_thread in threads:
+            a_thread.join()
+    elapsed = time.perf_counter() - start
+    for extra_channel in channels[1:]:
+        extra_channel.close()
+    if len(errors) > 0:
+        failed_path, first_err = errors[0]
+        raise RuntimeError(f"SSH Error: bulk upload failed on `{failed_path}` after {files_done[0]} files: {first_err}") from first_err
+    report = BulkUploadReport(files=files_done[0], bytes=total_bytes, seconds=elapsed)
+    print(f"✅ [BULK UPLOAD] {report.files} files / {_format_bytes(report.bytes)} in {report.seconds:.2f}s  ==>  {report.files_per_second:.1f} files/s, {_format_bytes(report.bytes_per_second)}/s")
+    return report
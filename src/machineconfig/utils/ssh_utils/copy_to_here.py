@@ -5,6 +5,15 @@ from pathlib import Path
 from machineconfig.utils.accessories import randstr
 from machineconfig.utils.meta import lambda_to_python_script
 from machineconfig.utils.ssh_utils.abc import MACHINECONFIG_VERSION, DEFAULT_PICKLE_SUBDIR
+from machineconfig.utils.ssh_utils.utils import collapse_remote_path_to_home
+from machineconfig.utils.ssh_utils.sftp_download import (
+    DEFAULT_DOWNLOAD_CONCURRENCY,
+    DEFAULT_RANGE_CHUNK_BYTES,
+    download_files,
+    list_remote_tree,
+    remote_is_dir,
+    stat_remote_file,
+)
 
 
 def copy_to_here(
@@ -25,119 +34,20 @@ def copy_to_here(
     expanded_source = self.expand_remote_path(source_path=source_obj)
 
     if not compress_with_zip:
-        is_dir = self.check_remote_is_dir(source_path=expanded_source)
+        is_dir = remote_is_dir(self.sftp, expanded_source)
+        if is_dir is None:
+            raise RuntimeError(f"SSH Error: source `{expanded_source}` does not exist on {self.get_remote_repr(add_machine=False)}")
 
         if is_dir:
             if not recursive:
                 raise RuntimeError(
                     f"SSH Error: source `{source_obj}` is a directory! Set recursive=True for recursive transfer or compress_with_zip=True to zip it."
                 )
-
-            def search_files(directory_path: str, json_output_path: str) -> list[str]:
-                from pathlib import Path
-                import json
-
-                file_paths_list = [
-                    file_path.as_posix() for file_path in Path(directory_path).expanduser().absolute().rglob("*") if file_path.is_file()
-                ]
-                json_result_path = Path(json_output_path)
-                json_result_path.parent.mkdir(parents=True, exist_ok=True)
-                json_result_path.write_text(json.dumps(file_paths_list, indent=2), encoding="utf-8")
-                print(json_result_path.as_posix())
-                return file_paths_list
-
-            remote_json_output = Path.home().joinpath(f"{DEFAULT_PICKLE_SUBDIR}/return_{randstr()}.json").as_posix()
-            command = lambda_to_python_script(
-                lambda: search_files(directory_path=expanded_source, json_output_path=remote_json_output),
-        in_global=True, import_module=False
-            )
-            response = self.run_py_remotely(
-                python_code=command,
-                uv_with=[MACHINECONFIG_VERSION],
-                uv_project_dir=None,
-                description="Searching for files in source",
-                verbose_output=False,
-                strict_stderr=False,
-                strict_return_code=False,
-            )
-            remote_json_path = response.op.strip()
-            if not remote_json_path:
-                raise RuntimeError(f"Could not resolve source path {source} - no response from remote")
-
-            local_json = Path.home().joinpath(f"{DEFAULT_PICKLE_SUBDIR}/local_{randstr()}.json")
-            self.simple_sftp_get(remote_path=remote_json_path, local_path=local_json)
-            import json
-
-            try:
-                source_list_str = json.loads(local_json.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, FileNotFoundError) as err:
-                raise RuntimeError(f"Could not resolve source path {source} - invalid JSON response: {err}") from err
-            finally:
-                if local_json.exists():
-                    local_json.unlink()
-            assert isinstance(source_list_str, list), f"Could not resolve source path {source}"
-            file_paths_to_download = [Path(file_path_str) for file_path_str in source_list_str]
-
             if target is None:
-
-                def collapse_to_home_dir(absolute_path: str, json_output_path: str) -> str:
-                    from pathlib import Path
-                    import json
-
-                    source_absolute_path = Path(absolute_path).expanduser().absolute()
-                    try:
-                        relative_to_home = source_absolute_path.relative_to(Path.home())
-                        collapsed_path_posix = (Path("~") / relative_to_home).as_posix()
-                        json_result_path = Path(json_output_path)
-                        json_result_path.parent.mkdir(parents=True, exist_ok=True)
-                        json_result_path.write_text(json.dumps(collapsed_path_posix, indent=2), encoding="utf-8")
-                        print(json_result_path.as_posix())
-                        return collapsed_path_posix
-                    except ValueError:
-                        raise RuntimeError(f"Source path must be relative to home directory: {source_absolute_path}")
-
-                remote_json_output = Path.home().joinpath(f"{DEFAULT_PICKLE_SUBDIR}/return_{randstr()}.json").as_posix()
-                command = lambda_to_python_script(
-                    lambda: collapse_to_home_dir(absolute_path=expanded_source, json_output_path=remote_json_output),
-                    in_global=True,
-                    import_module=False,
-                )
-                response = self.run_py_remotely(
-                    python_code=command,
-                    uv_with=[MACHINECONFIG_VERSION],
-                    uv_project_dir=None,
-                    description="Finding default target via relative source path",
-                    verbose_output=False,
-                    strict_stderr=False,
-                    strict_return_code=False,
-                )
-                remote_json_path_dir = response.op.strip()
-                if not remote_json_path_dir:
-                    raise RuntimeError("Could not resolve target path - no response from remote")
-
-                local_json_dir = Path.home().joinpath(f"{DEFAULT_PICKLE_SUBDIR}/local_{randstr()}.json")
-                self.simple_sftp_get(remote_path=remote_json_path_dir, local_path=local_json_dir)
-                import json
-
-                try:
-                    target_dir_str = json.loads(local_json_dir.read_text(encoding="utf-8"))
-                except (json.JSONDecodeError, FileNotFoundError) as err:
-                    raise RuntimeError(f"Could not resolve target path - invalid JSON response: {err}") from err
-                finally:
-                    if local_json_dir.exists():
-                        local_json_dir.unlink()
-                assert isinstance(target_dir_str, str), "Could not resolve target path"
-                target = Path(target_dir_str)
-
+                target = Path(collapse_remote_path_to_home(self, expanded_source))
             target_dir = Path(target).expanduser().absolute()
-
-            for idx, file_path in enumerate(file_paths_to_download):
-                print(f"   {idx + 1:03d}. {file_path}")
-
-            for file_path in file_paths_to_download:
-                local_file_target = target_dir.joinpath(Path(file_path).relative_to(expanded_source))
-                self.copy_to_here(source=file_path, target=local_file_target, compress_with_zip=False, recursive=False, internal_call=True)
-
+            files_to_download = list_remote_tree(self, self.sftp, remote_root=expanded_source, local_root=target_dir)
+            download_files(self, files=files_to_download, max_workers=DEFAULT_DOWNLOAD_CONCURRENCY, chunk_size=DEFAULT_RANGE_CHUNK_BYTES)
             return None
 
     if compress_with_zip:
@@ -195,55 +105,7 @@ def copy_to_here(
         expanded_source = zipped_path
 
     if target is None:
-
-        def collapse_to_home(absolute_path: str, json_output_path: str) -> str:
-            from pathlib import Path
-            import json
-
-            source_absolute_path = Path(absolute_path).expanduser().absolute()
-            try:
-                relative_to_home = source_absolute_path.relative_to(Path.home())
-                collapsed_path_posix = (Path("~") / relative_to_home).as_posix()
-                json_result_path = Path(json_output_path)
-                json_result_path.parent.mkdir(parents=True, exist_ok=True)
-                json_result_path.write_text(json.dumps(collapsed_path_posix, indent=2), encoding="utf-8")
-                print(json_result_path.as_posix())
-                return collapsed_path_posix
-            except ValueError:
-                raise RuntimeError(f"Source path must be relative to home directory: {source_absolute_path}")
-
-        remote_json_output = Path.home().joinpath(f"{DEFAULT_PICKLE_SUBDIR}/return_{randstr()}.json").as_posix()
-        command = lambda_to_python_script(
-            lambda: collapse_to_home(absolute_path=expanded_source, json_output_path=remote_json_output),
-        in_global=True, import_module=False
-        )
-        response = self.run_py_remotely(
-            python_code=command,
-            uv_with=[MACHINECONFIG_VERSION],
-            uv_project_dir=None,
-            description="Finding default target via relative source path",
-            verbose_output=False,
-            strict_stderr=False,
-            strict_return_code=False,
-        )
-        remote_json_path = response.op.strip()
-        if not remote_json_path:
-            raise RuntimeError("Could not resolve target path - no response from remote")
-
-        local_json = Path.home().joinpath(f"{DEFAULT_PICKLE_SUBDIR}/local_{randstr()}.json")
-        self.simple_sftp_get(remote_path=remote_json_path, local_path=local_json)
-        import json
-
-        try:
-            target_str = json.loads(local_json.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, FileNotFoundError) as err:
-            raise RuntimeError(f"Could not resolve target path - invalid JSON response: {err}") from err
-        finally:
-            if local_json.exists():
-                local_json.unlink()
-        assert isinstance(target_str, str), "Could not resolve target path"
-        target = Path(target_str)
-        assert str(target).startswith("~"), f"If target is not specified, source must be relative to home.\n{target=}"
+        target = Path(collapse_remote_path_to_home(self, expanded_source))
 
     target_obj = Path(target).expanduser().absolute()
     target_obj.parent.mkdir(parents=True, exist_ok=True)
@@ -252,15 +114,10 @@ def copy_to_here(
         target_obj = target_obj.with_suffix(target_obj.suffix + ".zip")
 
     print(f"""📥 [DOWNLOAD] Receiving: {expanded_source}  ==>  Local Path: {target_obj}""")
-    try:
-        with self.tqdm_wrap(ascii=True, unit="b", unit_scale=True) as pbar:
-            if self.sftp is None:  # type: ignore[unreachable]
-                raise RuntimeError(f"SFTP connection lost for {self.hostname}")
-            self.sftp.get(remotepath=expanded_source, localpath=str(target_obj), callback=pbar.view_bar)  # type: ignore
-    except Exception:
-        if target_obj.exists():
-            target_obj.unlink()
-        raise
+    if self.sftp is None:  # type: ignore[unreachable]
+        raise RuntimeError(f"SFTP connection lost for {self.hostname}")
+    remote_file = stat_remote_file(self.sftp, remote_path=expanded_source, local_path=target_obj)
+    download_files(self, files=[remote_file], max_workers=DEFAULT_DOWNLOAD_CONCURRENCY, chunk_size=DEFAULT_RANGE_CHUNK_BYTES)
 
     if compress_with_zip:
         import zipfile
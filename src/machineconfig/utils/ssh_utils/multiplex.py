@@ -0,0 +1,17 @@
+"""OpenSSH connection sharing for the `ssh <alias> <command>` call sites: one handshake per host, reused by every later command."""
+
+from pathlib import Path
+import platform
+
+
+CONTROL_DIR = Path.home().joinpath(".ssh", "machineconfig_cm")
+CONTROL_PERSIST_SECONDS = 600
+
+
+def ssh_multiplex_options() -> list[str]:
+    """`-o` options that route commands through a persistent ControlMaster socket; empty on Windows, whose OpenSSH lacks ControlMaster."""
+    if platform.system() == "Windows":
+        return []
+    CONTROL_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # %C is a hash of (local host, remote host, port, user), which keeps the socket path short enough for AF_UNIX.
+    return ["-o", "ControlMaster=auto", "-o", f"ControlPath={CONTROL_DIR}/%C", "-o", f"ControlPersist={CONTROL_PERSIST_SECONDS}"]
@@ -0,0 +1,129 @@
+from typing import Optional, TYPE_CHECKING
+from dataclasses import dataclass, field
+import threading
+import atexit
+import time
+
+if TYPE_CHECKING:
+    import paramiko
+    from machineconfig.scripts.python.helpers.helpers_utils.python import MachineSpecs
+
+
+POOL_IDLE_TIMEOUT_SECONDS = 300.0
+POOL_KEEPALIVE_SECONDS = 30
+POOL_REAP_INTERVAL_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class PoolKey:
+    hostname: str
+    username: str
+    port: int
+
+
+@dataclass
+class PooledConnection:
+    client: "paramiko.SSHClient"
+    remote_specs: Optional["MachineSpecs"]
+    last_used: float = field(default_factory=time.monotonic)
+    users: int = 0
+
+    def is_alive(self) -> bool:
+        transport = self.client.get_transport()
+        return transport is not None and transport.is_active()
+
+
+class SSHConnectionPool:
+    """Process-wide pool of authenticated paramiko clients keyed by hostname/username/port.
+
+    Every `exec_command` / `open_sftp` opens a fresh channel on the pooled transport, so any number of `SSH` objects
+    can share one handshake. Connections nobody holds are closed after `idle_timeout` seconds.
+    """
+
+    def __init__(self, idle_timeout: float, keepalive_seconds: int, reap_interval: float) -> None:
+        self.idle_timeout = idle_timeout
+        self.keepalive_seconds = keepalive_seconds
+        self.reap_interval = reap_interval
+        self._connections: dict[PoolKey, PooledConnection] = {}
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self.local_specs: Optional["MachineSpecs"] = None
+
+    def checkout(self, key: PoolKey) -> Optional[PooledConnection]:
+        with self._lock:
+            conn = self._connections.get(key)
+            if conn is None:
+                return None
+            if not conn.is_alive():
+                del self._connections[key]
+                conn.client.close()
+                return None
+            conn.users += 1
+            conn.last_used = time.monotonic()
+            return conn
+
+    def register(self, key: PoolKey, client: "paramiko.SSHClient") -> PooledConnection:
+        transport = client.get_transport()
+        if transport is not None:
+            transport.set_keepalive(self.keepalive_seconds)
+        with self._lock:
+            previous = self._connections.get(key)
+            conn = PooledConnection(client=client, remote_specs=previous.remote_specs if previous is not None else None, users=1)
+            self._connections[key] = conn
+            if previous is not None and previous.users == 0:
+                previous.client.close()
+            self._ensure_reaper()
+            return conn
+
+    def release(self, key: PoolKey, client: "paramiko.SSHClient") -> None:
+        with self._lock:
+            conn = self._connections.get(key)
+            if conn is None or conn.client is not client:
+                client.close()  # not (or no longer) pooled, so nobody else is sharing it.
+                return
+            conn.users = max(0, conn.users - 1)
+            conn.last_used = time.monotonic()
+
+    def evict_idle(self) -> int:
+        now = time.monotonic()
+        evicted: list[PooledConnection] = []
+        with self._lock:
+            for key, conn in list(self._connections.items()):
+                if not conn.is_alive() or (conn.users == 0 and now - conn.last_used > self.idle_timeout):
+                    evicted.append(self._connections.pop(key))
+        for conn in evicted:
+            conn.client.close()
+        return len(evicted)
+
+    def close_all(self) -> None:
+        with self._lock:
+            conns = list(self._connections.values())
+            self._connections.clear()
+        for conn in conns:
+            conn.client.close()
+
+    def _ensure_reaper(self) -> None:
+        if self._reaper is not None and self._reaper.is_alive():
+            return
+
+        def reap_forever() -> None:
+            while True:
+                time.sleep(self.reap_interval)
+                self.evict_idle()
+                with self._lock:
+                    if len(self._connections) == 0:
+                        self._reaper = None
+                        return
+
+        self._reaper = threading.Thread(target=reap_forever, name="ssh-pool-reaper", daemon=True)
+        self._reaper.start()
+
+
+SSH_POOL = SSHConnectionPool(idle_timeout=POOL_IDLE_TIMEOUT_SECONDS, keepalive_seconds=POOL_KEEPALIVE_SECONDS, reap_interval=POOL_REAP_INTERVAL_SECONDS)
+
+
+def _close_pool_at_exit() -> None:
+    SSH_POOL.close_all()
+
+
+atexit.register(_close_pool_at_exit)
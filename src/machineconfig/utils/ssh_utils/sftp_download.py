@@ -0,0 +1,232 @@
+from typing import TYPE_CHECKING, Optional
+from pathlib import Path, PurePosixPath, PureWindowsPath
+from dataclasses import dataclass, field
+import json
+import os
+import stat
+import threading
+import time
+
+if TYPE_CHECKING:
+    import paramiko
+    from machineconfig.utils.ssh import SSH
+
+
+DEFAULT_DOWNLOAD_CONCURRENCY = 8
+DEFAULT_RANGE_CHUNK_BYTES = 16 * 1024 * 1024
+READ_PIECE_BYTES = 1024 * 1024
+PART_SUFFIX = ".part"
+PART_STATE_SUFFIX = ".part.json"
+
+
+@dataclass
+class RemoteFile:
+    remote_path: str
+    local_path: Path
+    size: int
+    mtime: int
+
+
+@dataclass
+class _FileState:
+    remote_file: RemoteFile
+    chunk_size: int
+    done_offsets: set[int]
+    pending_chunks: int
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @property
+    def part_path(self) -> Path:
+        return self.remote_file.local_path.with_name(self.remote_file.local_path.name + PART_SUFFIX)
+
+    @property
+    def state_path(self) -> Path:
+        return self.remote_file.local_path.with_name(self.remote_file.local_path.name + PART_STATE_SUFFIX)
+
+    def save(self) -> None:
+        payload = {"size": self.remote_file.size, "mtime": self.remote_file.mtime, "chunk_size": self.chunk_size, "done": sorted(self.done_offsets)}
+        self.state_path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+@dataclass
+class DownloadReport:
+    files: int
+    skipped: int
+    resumed: int
+    bytes: int
+    seconds: float
+
+
+def _join_remote(self: "SSH", parent: str, name: str) -> str:
+    if self.remote_specs["system"] == "Windows":
+        return str(PureWindowsPath(parent) / name)
+    return str(PurePosixPath(parent) / name)
+
+
+def list_remote_tree(self: "SSH", sftp: "paramiko.SFTPClient", remote_root: str, local_root: Path) -> list[RemoteFile]:
+    """Walk a remote directory over SFTP (no remote interpreter), returning size and mtime for every file."""
+    files: list[RemoteFile] = []
+    stack: list[tuple[str, Path]] = [(remote_root, local_root)]
+    while stack:
+        remote_dir, local_dir = stack.pop()
+        for attr in sftp.listdir_attr(remote_dir):
+            remote_child = _join_remote(self, remote_dir, attr.filename)
+            local_child = local_dir.joinpath(attr.filename)
+            if attr.st_mode is not None and stat.S_ISDIR(attr.st_mode):
+                stack.append((remote_child, local_child))
+            elif attr.st_mode is None or stat.S_ISREG(attr.st_mode):
+                files.append(RemoteFile(remote_path=remote_child, local_path=local_child, size=attr.st_size or 0, mtime=int(attr.st_mtime or 0)))
+    return files
+
+
+def stat_remote_file(sftp: "paramiko.SFTPClient", remote_path: str, local_path: Path) -> RemoteFile:
+    attr = sftp.stat(remote_path)
+    return RemoteFile(remote_path=remote_path, local_path=local_path, size=attr.st_size or 0, mtime=int(attr.st_mtime or 0))
+
+
+def _is_up_to_date(remote_file: RemoteFile) -> bool:
+    try:
+        local_stat = remote_file.local_path.stat()
+    except FileNotFoundError:
+        return False
+    return local_stat.st_size == remote_file.size and int(local_stat.st_mtime) == remote_file.mtime
+
+
+def _load_or_init_state(remote_file: RemoteFile, chunk_size: int) -> tuple[_FileState, bool]:
+    offsets = list(range(0, remote_file.size, chunk_size)) or [0]
+    state = _FileState(remote_file=remote_file, chunk_size=chunk_size, done_offsets=set(), pending_chunks=len(offsets))
+    resumed = False
+    if state.state_path.exists() and state.part_path.exists():
+        try:
+            saved = json.loads(state.state_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            saved = {}
+        # a sidecar is only trusted when the remote file is byte-for-byte the same version it was written against.
+        if saved.get("size") == remote_file.size and saved.get("mtime") == remote_file.mtime and saved.get("chunk_size") == chunk_size:
+            state.done_offsets = {int(an_offset) for an_offset in saved.get("done", []) if int(an_offset) in offsets}
+            state.pending_chunks = len(offsets) - len(state.done_offsets)
+            resumed = len(state.done_offsets) > 0
+    if not resumed:
+        remote_file.local_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(state.part_path, "wb") as fh:
+            fh.truncate(remote_file.size)
+        state.save()
+    return state, resumed
+
+
+def _finalize(state: _FileState) -> None:
+    remote_file = state.remote_file
+    os.replace(state.part_path, remote_file.local_path)
+    os.utime(remote_file.local_path, (remote_file.mtime, remote_file.mtime))
+    state.state_path.unlink(missing_ok=True)
+
+
+def download_files(self: "SSH", files: list[RemoteFile], max_workers: int, chunk_size: int) -> DownloadReport:
+    """Fetch files with N concurrent SFTP readers; large files are split into ranged chunks that resume from a `.part` sidecar."""
+    if self.sftp is None:
+        raise RuntimeError(f"SFTP connection not available for {self.hostname}. Cannot transfer files.")
+    to_fetch = [a_file for a_file in files if not _is_up_to_date(a_file)]
+    skipped = len(files) - len(to_fetch)
+    resumed = 0
+    jobs: list[tuple[_FileState, int, int]] = []
+    already_have = 0
+    for remote_file in to_fetch:
+        state, was_resumed = _load_or_init_state(remote_file, chunk_size=chunk_size)
+        resumed += int(was_resumed)
+        if state.pending_chunks == 0:
+            _finalize(state)
+            continue
+        for offset in range(0, max(remote_file.size, 1), chunk_size):
+            if offset in state.done_offsets:
+                already_have += min(chunk_size, remote_file.size - offset)
+                continue
+            jobs.append((state, offset, min(chunk_size, remote_file.size - offset)))
+    total_bytes = sum(a_file.size for a_file in to_fetch)
+    print(f"📥 [DOWNLOAD ENGINE] {len(to_fetch)} files to fetch ({len(jobs)} ranged chunks), {skipped} already up to date, {resumed} resumed")
+    if len(jobs) == 0:
+        return DownloadReport(files=len(to_fetch), skipped=skipped, resumed=resumed, bytes=0, seconds=0.0)
+
+    # largest chunks first so the tail of the transfer isn't a single straggler; popped from the end.
+    jobs.sort(key=lambda a_job: a_job[2])
+    num_workers = max(1, min(max_workers, len(jobs)))
+    channels: list["paramiko.SFTPClient"] = [self.sftp]
+    for _ in range(num_workers - 1):
+        try:
+            channels.append(self.ssh.open_sftp())
+        except Exception as err:
+            print(f"⚠️  Could not open an extra SFTP channel, continuing with {len(channels)}: {err}")
+            break
+    jobs_lock = threading.Lock()
+    errors: list[tuple[str, Exception]] = []
+    files_done = [0]
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, DownloadColumn, TransferSpeedColumn, TimeElapsedColumn
+
+    start = time.perf_counter()
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(),
+        TextColumn("{task.fields[files_done]}/{task.fields[files_total]} files"),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        TimeElapsedColumn(),
+    ) as progress:
+        task_id = progress.add_task(f"Downloading from {self.get_remote_repr(add_machine=False)}", total=total_bytes, completed=already_have, files_done=0, files_total=len(to_fetch))
+
+        def fetch_chunk(sftp: "paramiko.SFTPClient", state: _FileState, offset: int, length: int) -> None:
+            remote_file = state.remote_file
+            if length > 0:
+                pieces = [(piece_offset, min(READ_PIECE_BYTES, offset + length - piece_offset)) for piece_offset in range(offset, offset + length, READ_PIECE_BYTES)]
+                with sftp.open(remote_file.remote_path, "rb") as remote_fh, open(state.part_path, "r+b") as local_fh:
+                    local_fh.seek(offset)
+                    for data in remote_fh.readv(pieces):  # readv pipelines all piece requests before yielding the first one.
+                        local_fh.write(data)
+                        progress.advance(task_id, len(data))
+            with state.lock:
+                state.done_offsets.add(offset)
+                state.pending_chunks -= 1
+                finished = state.pending_chunks == 0
+                if not finished:
+                    state.save()
+            if finished:
+                _finalize(state)
+                with jobs_lock:
+                    files_done[0] += 1
+                    progress.update(task_id, files_done=files_done[0])
+
+        def worker(sftp: "paramiko.SFTPClient") -> None:
+            while True:
+                with jobs_lock:
+                    if len(jobs) == 0 or len(errors) > 0:
+                        return
+                    state, offset, length = jobs.pop()
+                try:
+                    fetch_chunk(sftp, state, offset, length)
+                except Exception as err:
+                    with jobs_lock:
+                        errors.append((state.remote_file.remote_path, err))
+                    return
+
+        threads = [threading.Thread(target=worker, args=(a_channel,), daemon=True) for a_channel in channels]
+        for a_thread in threads:
+            a_thread.start()
+        for a_thread in threads:
+            a_thread.join()
+    elapsed = time.perf_counter() - start
+    for extra_channel in channels[1:]:
+        extra_channel.close()
+    if len(errors) > 0:
+        failed_path, first_err = errors[0]
+        raise RuntimeError(f"SSH Error: download of `{failed_path}` failed; rerun to resume from the `{PART_SUFFIX}` files. {first_err}") from first_err
+    fetched_bytes = total_bytes - already_have
+    print(f"✅ [DOWNLOAD ENGINE] {len(to_fetch)} files / {fetched_bytes / 2**20:.1f} MB in {elapsed:.2f}s  ==>  {fetched_bytes / 2**20 / max(elapsed, 1e-9):.1f} MB/s")
+    return DownloadReport(files=len(to_fetch), skipped=skipped, resumed=resumed, bytes=fetched_bytes, seconds=elapsed)
+
+
+def remote_is_dir(sftp: "paramiko.SFTPClient", remote_path: str) -> Optional[bool]:
+    try:
+        mode = sftp.stat(remote_path).st_mode
+    except FileNotFoundError:
+        return None
+    return mode is not None and stat.S_ISDIR(mode)
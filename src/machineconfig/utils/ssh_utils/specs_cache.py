@@ -0,0 +1,112 @@
+"""On-disk cache of per-host machine specs, keyed by host fingerprint and expired by TTL."""
+
+from typing import Any, Optional, Callable
+from pathlib import Path
+import json
+import threading
+import time
+
+from machineconfig.utils.source_of_truth import CONFIG_ROOT
+
+
+SPECS_CACHE_PATH = CONFIG_ROOT.joinpath("ssh_specs_cache.json")
+DEFAULT_SPECS_TTL_SECONDS = 7 * 24 * 3600.0
+LOCAL_FINGERPRINT_PREFIX = "local:"
+
+_CACHE_LOCK = threading.Lock()
+
+
+def _read_cache_file(path: Path) -> dict[str, dict[str, Any]]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_cache_file(path: Path, data: dict[str, dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def fingerprint_from_server_key(hostname: str, username: str, port: int, server_key_fingerprint: Optional[str]) -> str:
+    base = f"{username}@{hostname}:{port}"
+    return f"{base}#{server_key_fingerprint}" if server_key_fingerprint else base
+
+
+def fingerprint_from_ssh_alias(host: str) -> str:
+    """Fingerprint for hosts reached through the `ssh` binary: ssh config resolution + known_hosts key, no network."""
+    import getpass
+
+    hostname, username, port = host, getpass.getuser(), 22
+    if "@" in hostname:
+        username, hostname = hostname.split("@", 1)
+    try:
+        import paramiko
+
+        config = paramiko.SSHConfig.from_path(str(Path.home().joinpath(".ssh/config")))
+        config_dict = config.lookup(hostname)
+        hostname = config_dict.get("hostname", hostname)
+        username = config_dict.get("user", username)
+        port = int(config_dict.get("port", port))
+    except (ImportError, FileNotFoundError, ValueError):
+        pass
+    key_fingerprint: Optional[str] = None
+    try:
+        import paramiko
+
+        known_hosts = paramiko.HostKeys(str(Path.home().joinpath(".ssh/known_hosts")))
+        entry = known_hosts.lookup(hostname if port == 22 else f"[{hostname}]:{port}")
+        if entry is not None and len(entry) > 0:
+            key_fingerprint = next(iter(entry.values())).get_fingerprint().hex()
+    except Exception:  # missing/unparsable known_hosts just means a weaker, name-only fingerprint.
+        pass
+    return fingerprint_from_server_key(hostname=hostname, username=username, port=port, server_key_fingerprint=key_fingerprint)
+
+
+def local_fingerprint() -> str:
+    import platform
+    import getpass
+
+    return f"{LOCAL_FINGERPRINT_PREFIX}{getpass.getuser()}@{platform.node()}"
+
+
+def read_cached(fingerprint: str, section: str, ttl_seconds: float) -> Optional[Any]:
+    with _CACHE_LOCK:
+        entry = _read_cache_file(SPECS_CACHE_PATH).get(fingerprint, {}).get(section)
+    if not isinstance(entry, dict) or "value" not in entry:
+        return None
+    saved_at = entry.get("saved_at", 0.0)
+    if not isinstance(saved_at, (int, float)) or time.time() - saved_at > ttl_seconds:
+        return None
+    return entry["value"]
+
+
+def write_cached(fingerprint: str, section: str, value: Any) -> None:
+    with _CACHE_LOCK:
+        data = _read_cache_file(SPECS_CACHE_PATH)
+        data.setdefault(fingerprint, {})[section] = {"saved_at": time.time(), "value": value}
+        _write_cache_file(SPECS_CACHE_PATH, data)
+
+
+def invalidate(fingerprint: str) -> None:
+    with _CACHE_LOCK:
+        data = _read_cache_file(SPECS_CACHE_PATH)
+        if data.pop(fingerprint, None) is not None:
+            _write_cache_file(SPECS_CACHE_PATH, data)
+
+
+def get_or_probe[T](fingerprint: str, section: str, ttl_seconds: float, refresh: bool, probe: Callable[[], Optional[T]]) -> Optional[T]:
+    """Return the cached value unless missing, expired or `refresh`; otherwise run `probe` and cache a non-None result."""
+    if not refresh:
+        cached = read_cached(fingerprint=fingerprint, section=section, ttl_seconds=ttl_seconds)
+        if cached is not None:
+            return cached
+    value = probe()
+    if value is not None:
+        write_cached(fingerprint=fingerprint, section=section, value=value)
+    return value
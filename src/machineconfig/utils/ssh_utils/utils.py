@@ -61,6 +61,49 @@ def create_dir_and_check_if_exists(self: "SSH", path_rel2home: str, overwrite_ex
     resp.print(desc=f"Created target dir {path_rel2home}")
 
 
+def create_dir_tree_and_check_if_exists(self: "SSH", root_rel2home: str, dirs_rel2root: list[str], overwrite_existing: bool) -> None:
+    """Helper to create a whole directory tree on remote machine in a single remote call."""
+    root_rel2home_normalized = _normalize_rel_path_for_remote(self, root_rel2home)
+    dirs_normalized = sorted({_normalize_rel_path_for_remote(self, a_dir) for a_dir in dirs_rel2root})
+    def create_target_tree(target_rel2home: str, sub_dirs: list[str], overwrite: bool):
+        from pathlib import Path
+        import shutil
+        target_path_abs = Path(target_rel2home).expanduser()
+        if not target_path_abs.is_absolute():
+            target_path_abs = Path.home().joinpath(target_path_abs)
+        if overwrite and target_path_abs.exists():
+            if str(target_path_abs) == str(Path.home()):
+                raise RuntimeError("Refusing to overwrite home directory!")
+            if target_path_abs.is_dir():
+                shutil.rmtree(target_path_abs)
+            else:
+                target_path_abs.unlink()
+        target_path_abs.mkdir(parents=True, exist_ok=True)
+        for a_sub_dir in sub_dirs:
+            target_path_abs.joinpath(a_sub_dir).mkdir(parents=True, exist_ok=True)
+        print(f"Created {len(sub_dirs) + 1} directories under: {target_path_abs}")
+    command = lambda_to_python_script(
+        lambda: create_target_tree(target_rel2home=root_rel2home_normalized, sub_dirs=dirs_normalized, overwrite=overwrite_existing),
+        in_global=True, import_module=False
+    )
+    tmp_py_file = Path.home().joinpath(f"{DEFAULT_PICKLE_SUBDIR}/create_target_tree_{randstr()}.py")
+    tmp_py_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_py_file.write_text(command, encoding="utf-8")
+    assert self.sftp is not None
+    tmp_remote_path = ".tmp_pyfile.py"
+    remote_tmp_full = _build_remote_path(self, self.remote_specs["home_dir"], tmp_remote_path)
+    self.sftp.put(localpath=str(tmp_py_file), remotepath=remote_tmp_full)
+    tmp_py_file.unlink(missing_ok=True)
+    resp = self.run_shell_cmd_on_remote(
+        command=f"""{get_uv_command(platform=self.remote_specs['system'])} run python {tmp_remote_path}""",
+        verbose_output=False,
+        description=f"Creating target tree {root_rel2home}",
+        strict_stderr=True,
+        strict_return_code=True,
+    )
+    resp.print(desc=f"Created target tree {root_rel2home}")
+
+
 def check_remote_is_dir(self: "SSH", source_path: Union[str, Path]) -> bool:
     """Helper to check if a remote path is a directory."""
 
@@ -126,7 +169,20 @@ def expand_remote_path(self: "SSH", source_path: Union[str, Path]) -> str:
         return posix_path
     return _build_remote_path(self, self.remote_specs["home_dir"], posix_path)
 
-    
+
+def collapse_remote_path_to_home(self: "SSH", remote_path: str) -> str:
+    """Local equivalent of running a `collapse_to_home` script remotely: `~/rel/path` from the cached remote home dir."""
+    if self.remote_specs["system"] == "Windows":
+        path_obj: Union[PureWindowsPath, PurePosixPath] = PureWindowsPath(remote_path)
+        home_obj: Union[PureWindowsPath, PurePosixPath] = PureWindowsPath(self.remote_specs["home_dir"])
+    else:
+        path_obj = PurePosixPath(remote_path)
+        home_obj = PurePosixPath(self.remote_specs["home_dir"])
+    try:
+        relative_to_home = path_obj.relative_to(home_obj)
+    except ValueError as err:
+        raise RuntimeError(f"Source path must be relative to home directory: {remote_path}") from err
+    return (PurePosixPath("~") / PurePosixPath(relative_to_home.as_posix())).as_posix()
 
 
 if __name__ == "__main__":